@@ -21,8 +21,10 @@ from openhands.agent_server.desktop_router import desktop_router
 from openhands.agent_server.desktop_service import get_desktop_service
 from openhands.agent_server.event_router import event_router
 from openhands.agent_server.file_router import file_router
+from openhands.agent_server.io_offload import run_io, shutdown_io_executor
 from openhands.agent_server.middleware import LocalhostCORSMiddleware
 from openhands.agent_server.server_details_router import (
+    get_loop_lag_monitor,
     get_server_info,
     server_details_router,
 )
@@ -30,7 +32,12 @@ from openhands.agent_server.sockets import sockets_router
 from openhands.agent_server.tool_router import tool_router
 from openhands.agent_server.vscode_router import vscode_router
 from openhands.agent_server.vscode_service import get_vscode_service
+from openhands.agent_server.webhook_client import close_webhook_clients
 from openhands.sdk.logger import DEBUG, get_logger
+from openhands.tools.execute_bash.terminal import (
+    configure_terminal_pool,
+    get_terminal_pool,
+)
 
 
 logger = get_logger(__name__)
@@ -38,9 +45,12 @@ logger = get_logger(__name__)
 
 @asynccontextmanager
 async def api_lifespan(api: FastAPI) -> AsyncIterator[None]:
+    config = get_default_config()
     service = get_default_conversation_service()
     vscode_service = get_vscode_service()
     desktop_service = get_desktop_service()
+    loop_lag_monitor = get_loop_lag_monitor()
+    loop_lag_monitor.start()
 
     # Start VSCode service if enabled
     if vscode_service is not None:
@@ -64,15 +74,27 @@ async def api_lifespan(api: FastAPI) -> AsyncIterator[None]:
     else:
         logger.info("Desktop service is disabled")
 
-    async with service:
-        try:
-            yield
-        finally:
-            # Stop services on shutdown
-            if vscode_service is not None:
-                await vscode_service.stop()
-            if desktop_service is not None:
-                await desktop_service.stop()
+    # Start shells for the bash tool of the first conversations in the background
+    configure_terminal_pool(config.terminal_pool_size)
+    terminal_pool = get_terminal_pool()
+    if terminal_pool is not None:
+        await run_io(terminal_pool.prewarm)
+
+    try:
+        async with service:
+            try:
+                yield
+            finally:
+                # Stop services on shutdown
+                if vscode_service is not None:
+                    await vscode_service.stop()
+                if desktop_service is not None:
+                    await desktop_service.stop()
+    finally:
+        await close_webhook_clients()
+        await loop_lag_monitor.stop()
+        await run_io(configure_terminal_pool, 0)
+        shutdown_io_executor()
 
 
 def _create_fastapi_instance() -> FastAPI:
@@ -0,0 +1,144 @@
+import bisect
+from dataclasses import dataclass, field
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class BashEventEntry:
+    """What a bash event file name tells about the event.
+
+    Names have the form `{YYYYMMDDHHMMSS}_{kind}[_{command_id}]_{event_id}`
+    (ids in hex), so sorting names sorts events by timestamp.
+    """
+
+    name: str
+    kind: str
+    command_id: str | None
+    event_id: str
+
+    @classmethod
+    def parse(cls, name: str) -> "BashEventEntry | None":
+        parts = name.split("_")
+        if len(parts) == 4:
+            return cls(name, parts[1], parts[2], parts[3])
+        if len(parts) == 3:
+            return cls(name, parts[1], None, parts[2])
+        return None
+
+
+@dataclass
+class BashEventIndex:
+    """In-memory index of the bash event files in a directory.
+
+    Keeps file names sorted overall, per kind and per command, plus a map
+    from event id to file name, so a search touches only the files on the
+    requested page and an id lookup needs no directory scan. It is kept up
+    to date by `add` / `remove` as files are written and deleted.
+    """
+
+    _names: list[str] = field(default_factory=list)
+    _by_kind: dict[str, list[str]] = field(default_factory=dict)
+    _by_command: dict[str, list[str]] = field(default_factory=dict)
+    _entries: dict[str, BashEventEntry] = field(default_factory=dict)
+    _by_id: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_names(cls, names: list[str]) -> "BashEventIndex":
+        index = cls()
+        for name in sorted(names):
+            entry = BashEventEntry.parse(name)
+            if entry is not None:
+                index.add(entry)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, entry: BashEventEntry) -> None:
+        self._entries[entry.name] = entry
+        self._by_id[entry.event_id] = entry.name
+        bisect.insort(self._names, entry.name)
+        bisect.insort(self._by_kind.setdefault(entry.kind, []), entry.name)
+        if entry.command_id:
+            bisect.insort(self._by_command.setdefault(entry.command_id, []), entry.name)
+
+    def remove(self, name: str) -> None:
+        entry = self._entries.pop(name, None)
+        if entry is None:
+            return
+        if self._by_id.get(entry.event_id) == name:
+            del self._by_id[entry.event_id]
+        _discard(self._names, name)
+        _discard(self._by_kind, name, entry.kind)
+        if entry.command_id:
+            _discard(self._by_command, name, entry.command_id)
+
+    def oldest(self) -> str | None:
+        return self._names[0] if self._names else None
+
+    def names(self) -> list[str]:
+        return list(self._names)
+
+    def find(self, event_id: str) -> str | None:
+        """File name of the event with the given id (hex or hyphenated)."""
+        try:
+            key = UUID(event_id).hex
+        except ValueError:
+            return None
+        return self._by_id.get(key)
+
+    def search(
+        self,
+        kind: str | None = None,
+        command_id: UUID | None = None,
+        name_gte: str | None = None,
+        name_lt: str | None = None,
+        descending: bool = False,
+        page_id: str | None = None,
+        limit: int = 100,
+    ) -> tuple[list[str], str | None]:
+        """File names on one page, plus the name starting the next page.
+
+        `name_gte` / `name_lt` bound file names (timestamp prefixes), and
+        `page_id` is a name returned as the next page by an earlier search
+        with the same filters; the page starts at that position even if the
+        file has since been removed.
+        """
+        if command_id is not None:
+            names = self._by_command.get(command_id.hex, [])
+        elif kind is not None:
+            names = self._by_kind.get(kind, [])
+        else:
+            names = self._names
+
+        lo = bisect.bisect_left(names, name_gte) if name_gte else 0
+        hi = bisect.bisect_left(names, name_lt) if name_lt else len(names)
+        if page_id:
+            if descending:
+                hi = min(hi, bisect.bisect_right(names, page_id))
+            else:
+                lo = max(lo, bisect.bisect_left(names, page_id))
+
+        positions = range(hi - 1, lo - 1, -1) if descending else range(lo, hi)
+        page: list[str] = []
+        for i in positions:
+            name = names[i]
+            if kind is not None and self._entries[name].kind != kind:
+                continue
+            if len(page) == limit:
+                return page, name
+            page.append(name)
+        return page, None
+
+
+def _discard(
+    container: list[str] | dict[str, list[str]], name: str, key: str | None = None
+) -> None:
+    names = container if isinstance(container, list) else container.get(key or "")
+    if not names:
+        return
+    i = bisect.bisect_left(names, name)
+    if i < len(names) and names[i] == name:
+        del names[i]
+    if not names and isinstance(container, dict):
+        del container[key or ""]
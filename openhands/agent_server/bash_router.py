@@ -11,6 +11,7 @@ from fastapi import (
     Query,
     status,
 )
+from fastapi.responses import StreamingResponse
 
 from openhands.agent_server.bash_service import get_default_bash_event_service
 from openhands.agent_server.models import (
@@ -20,6 +21,7 @@ from openhands.agent_server.models import (
     BashEventSortOrder,
     ExecuteBashRequest,
 )
+from openhands.agent_server.pub_sub import encode_json
 
 
 bash_router = APIRouter(prefix="/bash", tags=["Bash"])
@@ -87,6 +89,19 @@ async def start_bash_command(request: ExecuteBashRequest) -> BashCommand:
     return command
 
 
+@bash_router.post("/execute_bash_command/stream")
+async def stream_bash_command(request: ExecuteBashRequest) -> StreamingResponse:
+    """Execute a bash command and stream its events as newline delimited JSON: the
+    BashCommand, then each BashOutput as it is produced. The response ends with
+    the BashOutput holding the exit code."""
+
+    async def lines():
+        async for event in bash_event_service.stream_bash_command(request):
+            yield encode_json(event) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @bash_router.delete("/bash_events")
 async def clear_all_bash_events() -> dict[str, int]:
     """Clear all bash events from storage"""
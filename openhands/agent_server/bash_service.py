@@ -1,11 +1,16 @@
 import asyncio
-import glob
 import json
+import os
+import threading
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from uuid import UUID
 
+from openhands.agent_server.bash_event_index import BashEventEntry, BashEventIndex
+from openhands.agent_server.config import OverflowPolicy
+from openhands.agent_server.io_offload import run_io
 from openhands.agent_server.models import (
     BashCommand,
     BashEventBase,
@@ -15,6 +20,7 @@ from openhands.agent_server.models import (
     ExecuteBashRequest,
 )
 from openhands.agent_server.pub_sub import PubSub, Subscriber
+from openhands.agent_server.utils import utc_now
 from openhands.sdk.logger import get_logger
 
 
@@ -28,14 +34,29 @@ class BashEventService:
     will not be visible to the agent."""
 
     bash_events_dir: Path = field()
+    max_events: int | None = None
+    max_event_age: float | None = None
     _pub_sub: PubSub[BashEventBase] = field(
         default_factory=lambda: PubSub[BashEventBase](), init=False
     )
+    _index: BashEventIndex | None = field(default=None, init=False)
+    # Guards the index. Everything that touches it runs via `run_io`, so the
+    # lock is only ever waited for on I/O threads, never on the event loop
+    _index_lock: threading.RLock = field(default_factory=threading.RLock, init=False)
 
     def _ensure_bash_events_dir(self) -> None:
         """Ensure the bash events directory exists."""
         self.bash_events_dir.mkdir(parents=True, exist_ok=True)
 
+    def _get_index(self) -> BashEventIndex:
+        """The index of stored events, built from a directory listing on first
+        use and maintained as events are saved and removed afterwards. Call it
+        with `_index_lock` held."""
+        if self._index is None:
+            self._ensure_bash_events_dir()
+            self._index = BashEventIndex.from_names(os.listdir(self.bash_events_dir))
+        return self._index
+
     def _timestamp_to_str(self, timestamp: datetime) -> str:
         result = timestamp.strftime("%Y%m%d%H%M%S")
         return result
@@ -50,8 +71,9 @@ class BashEventService:
         return "_".join(result)
 
     def _save_event_to_file(self, event: BashEventBase) -> None:
-        """Save an event to a file."""
-        self._ensure_bash_events_dir()
+        """Save an event to a file, then apply retention. Call via `run_io`."""
+        with self._index_lock:
+            self._get_index()  # Creates the directory on first use
         filename = self._get_event_filename(event)
         filepath = self.bash_events_dir / filename
 
@@ -60,6 +82,12 @@ class BashEventService:
             data = event.model_dump(mode="json")
             f.write(json.dumps(data, indent=2))
 
+        entry = BashEventEntry.parse(filename)
+        assert entry is not None
+        with self._index_lock:
+            self._get_index().add(entry)
+            self._apply_retention()
+
     def _load_event_from_file(self, filepath: Path) -> BashEventBase | None:
         """Load an event from a file."""
         try:
@@ -69,23 +97,57 @@ class BashEventService:
             logger.error(f"Error loading event from {filepath}: {e}")
             return None
 
-    def _get_event_files_by_pattern(self, pattern: str) -> list[Path]:
-        """Get event files matching a glob pattern, sorted by timestamp."""
-        self._ensure_bash_events_dir()
-        files = glob.glob(str(self.bash_events_dir / pattern))
-        return sorted([Path(f) for f in files])
-
-    async def get_bash_event(self, event_id: str) -> BashEventBase | None:
-        """Get the event with the id given, or None if there was no such event."""
-        # Use glob pattern to find files ending with the event_id
-        pattern = f"*_{event_id}"
-        files = self._get_event_files_by_pattern(pattern)
+    def _load_events(self, names: list[str]) -> list[BashEventBase]:
+        events = []
+        for name in names:
+            event = self._load_event_from_file(self.bash_events_dir / name)
+            if event is not None:
+                events.append(event)
+        return events
 
-        if not files:
+    def _remove_event_file(self, name: str) -> bool:
+        """Delete an event file and drop it from the index."""
+        with self._index_lock:
+            self._get_index().remove(name)
+        try:
+            (self.bash_events_dir / name).unlink(missing_ok=True)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting event file {name}: {e}")
+            return False
+
+    def _apply_retention(self) -> int:
+        """Delete the oldest events beyond `max_events` or older than
+        `max_event_age` seconds. Returns the number of events deleted. Call
+        via `run_io`."""
+        cutoff = None
+        if self.max_event_age is not None:
+            cutoff = self._timestamp_to_str(
+                utc_now() - timedelta(seconds=self.max_event_age)
+            )
+        removed = 0
+        with self._index_lock:
+            index = self._get_index()
+            while (oldest := index.oldest()) is not None:
+                over_count = (
+                    self.max_events is not None and len(index) > self.max_events
+                )
+                if not over_count and (cutoff is None or oldest >= cutoff):
+                    break
+                self._remove_event_file(oldest)
+                removed += 1
+        return removed
+
+    def _find_event(self, event_id: str) -> BashEventBase | None:
+        with self._index_lock:
+            name = self._get_index().find(event_id)
+        if name is None:
             return None
+        return self._load_event_from_file(self.bash_events_dir / name)
 
-        # Load and return the first matching event
-        return self._load_event_from_file(files[0])
+    async def get_bash_event(self, event_id: str) -> BashEventBase | None:
+        """Get the event with the id given, or None if there was no such event."""
+        return await run_io(self._find_event, event_id)
 
     async def batch_get_bash_events(
         self, event_ids: list[str]
@@ -109,72 +171,61 @@ class BashEventService:
         limit: int = 100,
     ) -> BashEventPage:
         """Search for events. If an command_id is given, only the observations for the
-        action are returned."""
-
-        # Build the search pattern - we start with a wildcard as we don't
-        # exact match timestamps and filter later
-        search_pattern = ["*"]
-        if kind__eq:
-            search_pattern.append(f"_{kind__eq}_*")
-        if command_id__eq:
-            search_pattern.append(f"_{command_id__eq.hex}_*")
-
-        files = self._get_event_files_by_pattern("".join(search_pattern))
-        files.sort(
-            key=lambda f: f.name,
-            reverse=(sort_order == BashEventSortOrder.TIMESTAMP_DESC),
-        )
-
-        # Timestamp filtering.
-        if timestamp__gte:
-            timestamp_gte_str = self._timestamp_to_str(timestamp__gte)
-            files = [file for file in files if file.name >= timestamp_gte_str]
-        if timestamp__lt:
-            timestamp_lt_str = self._timestamp_to_str(timestamp__lt)
-            files = [file for file in files if file.name < timestamp_lt_str]
-
-        # Handle pagination
-        page_files = []
-        start_index = 0
-
-        # Find the starting point if page_id is provided
-        if page_id:
-            for i, file in enumerate(files):
-                if str(file.name) == page_id:
-                    start_index = i
-                    break
-
-        # Collect items for this page
-        next_page_id = None
-        for i in range(start_index, len(files)):
-            if len(files) >= limit:
-                # We have more items, set next_page_id
-                if i < len(files):
-                    next_page_id = str(files[i].name)
-                break
-            page_files.append(files[i])
-
-        # Load all events from files
-        page_events = []
-        for file_path in files:
-            event = self._load_event_from_file(file_path)
-            if event is not None:
-                page_events.append(event)
+        action are returned. Only the events on the requested page are loaded."""
+        name_gte = self._timestamp_to_str(timestamp__gte) if timestamp__gte else None
+        name_lt = self._timestamp_to_str(timestamp__lt) if timestamp__lt else None
+
+        def search() -> BashEventPage:
+            with self._index_lock:
+                names, next_page_id = self._get_index().search(
+                    kind=kind__eq,
+                    command_id=command_id__eq,
+                    name_gte=name_gte,
+                    name_lt=name_lt,
+                    descending=sort_order == BashEventSortOrder.TIMESTAMP_DESC,
+                    page_id=page_id,
+                    limit=limit,
+                )
+            page_events = self._load_events(names)
+            return BashEventPage(items=page_events, next_page_id=next_page_id)
 
-        return BashEventPage(items=page_events, next_page_id=next_page_id)
+        return await run_io(search)
 
     async def start_bash_command(
         self, request: ExecuteBashRequest
     ) -> tuple[BashCommand, asyncio.Task]:
         """Execute a bash command. The output will be published separately."""
         command = BashCommand(**request.model_dump())
-        self._save_event_to_file(command)
+        task = await self._launch_bash_command(command)
+        return command, task
+
+    async def stream_bash_command(
+        self, request: ExecuteBashRequest
+    ) -> AsyncGenerator[BashEventBase, None]:
+        """Execute a bash command, yielding the command followed by each of its
+        outputs as they are published, and finishing with the one holding the
+        exit code."""
+        command = BashCommand(**request.model_dump())
+        subscriber = _CommandOutputSubscriber(command.id)
+        # Subscribe before the command starts, so no output can be missed
+        subscriber_id = self._pub_sub.subscribe(subscriber)
+        try:
+            await self._launch_bash_command(command)
+            yield command
+            while True:
+                output = await subscriber.outputs.get()
+                yield output
+                if output.exit_code is not None:
+                    break
+        finally:
+            self._pub_sub.unsubscribe(subscriber_id)
+
+    async def _launch_bash_command(self, command: BashCommand) -> asyncio.Task:
+        await run_io(self._save_event_to_file, command)
         await self._pub_sub(command)
 
         # Execute the bash command in a background task
-        task = asyncio.create_task(self._execute_bash_command(command))
-
-        return command, task
+        return asyncio.create_task(self._execute_bash_command(command))
 
     async def _execute_bash_command(self, command: BashCommand) -> None:
         """Execute the bash event and create an observation event."""
@@ -228,7 +279,7 @@ class BashEventService:
                                 stderr=chunk if is_stderr else None,
                             )
 
-                            self._save_event_to_file(output_event)
+                            await run_io(self._save_event_to_file, output_event)
                             await self._pub_sub(output_event)
                             output_order += 1
 
@@ -291,7 +342,7 @@ class BashEventService:
                     stderr=final_stderr,
                 )
 
-                self._save_event_to_file(final_output)
+                await run_io(self._save_event_to_file, final_output)
                 await self._pub_sub(final_output)
 
         except Exception as e:
@@ -304,15 +355,19 @@ class BashEventService:
                 stderr=f"Error executing command: {str(e)}",
             )
 
-            self._save_event_to_file(error_output)
+            await run_io(self._save_event_to_file, error_output)
             await self._pub_sub(error_output)
 
-    async def subscribe_to_events(self, subscriber: Subscriber[BashEventBase]) -> UUID:
+    async def subscribe_to_events(
+        self,
+        subscriber: Subscriber[BashEventBase],
+        overflow_policy: OverflowPolicy | None = None,
+    ) -> UUID:
         """Subscribe to bash events.
 
         The subscriber will receive BashEventBase instances.
         """
-        return self._pub_sub.subscribe(subscriber)
+        return self._pub_sub.subscribe(subscriber, overflow_policy)
 
     async def unsubscribe_from_events(self, subscriber_id: UUID) -> bool:
         return self._pub_sub.unsubscribe(subscriber_id)
@@ -323,21 +378,17 @@ class BashEventService:
         Returns:
             int: The number of events that were cleared.
         """
-        self._ensure_bash_events_dir()
 
-        # Get all event files
-        files = self._get_event_files_by_pattern("*")
-
-        # Count files before deletion
-        count = len(files)
-
-        # Remove all event files
-        for file_path in files:
-            try:
-                file_path.unlink()
-            except Exception as e:
-                logger.error(f"Error deleting event file {file_path}: {e}")
+        def clear() -> int:
+            with self._index_lock:
+                # Rescan, so files the index does not know about are removed too
+                self._index = None
+                names = self._get_index().names()
+                for name in names:
+                    self._remove_event_file(name)
+            return len(names)
 
+        count = await run_io(clear)
         logger.info(f"Cleared {count} bash events from storage")
         return count
 
@@ -347,7 +398,8 @@ class BashEventService:
 
     async def __aenter__(self):
         """Start using this task service"""
-        # No special initialization needed for bash event service
+        await run_io(self._get_index)
+        await run_io(self._apply_retention)
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
@@ -355,6 +407,18 @@ class BashEventService:
         await self.close()
 
 
+class _CommandOutputSubscriber(Subscriber[BashEventBase]):
+    """Collects the outputs of one command for `stream_bash_command`."""
+
+    def __init__(self, command_id: UUID):
+        self.command_id = command_id
+        self.outputs: asyncio.Queue[BashOutput] = asyncio.Queue()
+
+    async def __call__(self, event: BashEventBase):
+        if isinstance(event, BashOutput) and event.command_id == self.command_id:
+            self.outputs.put_nowait(event)
+
+
 _bash_event_service: BashEventService | None = None
 
 
@@ -367,5 +431,9 @@ def get_default_bash_event_service() -> BashEventService:
     from openhands.agent_server.config import get_default_config
 
     config = get_default_config()
-    _bash_event_service = BashEventService(bash_events_dir=config.bash_events_dir)
+    _bash_event_service = BashEventService(
+        bash_events_dir=config.bash_events_dir,
+        max_events=config.bash_events_max_count,
+        max_event_age=config.bash_events_max_age,
+    )
     return _bash_event_service
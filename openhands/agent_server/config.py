@@ -1,15 +1,27 @@
 import os
 from pathlib import Path
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
 from openhands.agent_server.env_parser import from_env
+from openhands.sdk.conversation.state import EventBackend
 
 
 # Environment variable constants
 SESSION_API_KEY_ENV = "SESSION_API_KEY"
 ENVIRONMENT_VARIABLE_PREFIX = "OH"
 
+OverflowPolicy = Literal["drop_oldest", "disconnect", "block"]
+"""What happens when a subscriber's queue is full and another event arrives:
+
+- ``drop_oldest``: discard the oldest queued event to make room.
+- ``disconnect``: unsubscribe and close the subscriber (e.g. a websocket, whose
+  client can reconnect and resend history).
+- ``block``: the publisher waits for room in the queue (holding up delivery to
+  every other subscriber).
+"""
+
 
 def _default_session_api_keys():
     # Legacy fallback for compability with old runtime API
@@ -52,7 +64,35 @@ class WebhookSpec(BaseModel):
         ge=0,
         description="The number of times to retry if the post operation fails",
     )
-    retry_delay: int = Field(default=5, ge=0, description="The delay between retries")
+    retry_delay: int = Field(
+        default=5,
+        ge=0,
+        description=(
+            "The base delay between retries in seconds; it doubles with each "
+            "retry (up to max_retry_delay) and is jittered"
+        ),
+    )
+    max_retry_delay: float = Field(
+        default=60.0, ge=0, description="Upper bound of the delay between retries"
+    )
+
+    # Connection parameters
+    http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 if the server supports it (requires the h2 package)",
+    )
+    max_connections: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum number of concurrent connections to the webhook",
+    )
+    max_keepalive_connections: int = Field(
+        default=5, ge=0, description="Maximum number of idle connections kept open"
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, ge=0, description="Seconds an idle connection is kept open"
+    )
+    gzip: bool = Field(default=False, description="Send event batches gzip-compressed")
 
 
 class Config(BaseModel):
@@ -82,6 +122,39 @@ class Config(BaseModel):
             "The location of the directory where conversations and events are stored."
         ),
     )
+    event_backend: EventBackend = Field(
+        default="files",
+        description=(
+            "How events of new conversations are persisted: 'files' writes one JSON "
+            "file per event, 'journal' appends them to rotating segment files with "
+            "an offset index (fewer inodes and faster resume on busy servers)."
+        ),
+    )
+    io_max_workers: int = Field(
+        default=8,
+        ge=1,
+        description=(
+            "Number of threads used for blocking file I/O (event and metadata "
+            "reads and writes), so it never runs on the server's event loop."
+        ),
+    )
+    subscriber_max_queue_size: int = Field(
+        default=1024,
+        ge=1,
+        description=(
+            "Number of events queued for a subscriber (websocket, webhook, ...) "
+            "that has not caught up yet, unless it is subscribed with another size."
+        ),
+    )
+    subscriber_overflow_policy: OverflowPolicy = Field(
+        default="drop_oldest",
+        description=(
+            "What happens to a subscriber whose queue is full, unless it is "
+            "subscribed with another policy: 'drop_oldest' discards its oldest "
+            "event, 'disconnect' drops the subscriber, 'block' makes the publisher "
+            "wait (which holds up every other subscriber)."
+        ),
+    )
     bash_events_dir: Path = Field(
         default=Path("workspace/bash_events"),
         description=(
@@ -89,6 +162,31 @@ class Config(BaseModel):
             "Defaults to 'workspace/bash_events'."
         ),
     )
+    bash_events_max_count: int | None = Field(
+        default=10_000,
+        ge=1,
+        description=(
+            "The maximum number of bash events kept on disk; the oldest are "
+            "deleted beyond it. Unset to keep all events."
+        ),
+    )
+    bash_events_max_age: float | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Bash events older than this many seconds are deleted. Unset to keep "
+            "events regardless of age."
+        ),
+    )
+    terminal_pool_size: int = Field(
+        default=2,
+        ge=0,
+        description=(
+            "Number of started shells kept ready for the bash tool of new "
+            "conversations, per terminal type and user, so they do not wait for "
+            "a shell to start. 0 starts a new shell for each conversation."
+        ),
+    )
     static_files_path: Path | None = Field(
         default=None,
         description=(
@@ -101,6 +199,14 @@ class Config(BaseModel):
         default_factory=list,
         description="Webhooks to invoke in response to events",
     )
+    webhook_spill_dir: Path | None = Field(
+        default=Path("workspace/webhook_spill"),
+        description=(
+            "Where batches of events that could not be posted to a webhook are "
+            "kept until they can be delivered, including across restarts. If "
+            "unset, they are only kept in memory."
+        ),
+    )
     enable_vscode: bool = Field(
         default=True,
         description="Whether to enable VSCode server functionality",
@@ -1,14 +1,14 @@
 import asyncio
 import logging
 import shutil
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 from uuid import UUID, uuid4
 
-import httpx
-
 from openhands.agent_server.config import Config, WebhookSpec
 from openhands.agent_server.event_service import EventService
+from openhands.agent_server.io_offload import run_io
 from openhands.agent_server.models import (
     ConversationInfo,
     ConversationPage,
@@ -16,11 +16,22 @@ from openhands.agent_server.models import (
     StartConversationRequest,
     StoredConversation,
 )
-from openhands.agent_server.pub_sub import Subscriber
+from openhands.agent_server.pub_sub import Envelope, Subscriber
 from openhands.agent_server.server_details_router import update_last_execution_time
 from openhands.agent_server.utils import utc_now
+from openhands.agent_server.webhook_client import (
+    SpillQueue,
+    encode_body,
+    get_webhook_client,
+    retry_delay,
+)
 from openhands.sdk import Event, Message
-from openhands.sdk.conversation.state import AgentExecutionStatus, ConversationState
+from openhands.sdk.conversation.state import (
+    AgentExecutionStatus,
+    ConversationState,
+    EventBackend,
+)
+from openhands.sdk.event import EphemeralEvent
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +48,13 @@ def _compose_conversation_info(
     )
 
 
+def _load_stored(event_service_dir: Path) -> tuple[UUID, StoredConversation]:
+    """Read the metadata of a persisted conversation (blocking)."""
+    id = UUID(event_service_dir.name)
+    json_str = (event_service_dir / "meta.json").read_text()
+    return id, StoredConversation.model_validate_json(json_str)
+
+
 @dataclass
 class ConversationService:
     """
@@ -47,6 +65,8 @@ class ConversationService:
     event_services_path: Path = field()
     webhook_specs: list[WebhookSpec] = field(default_factory=list)
     session_api_key: str | None = field(default=None)
+    event_backend: EventBackend = field(default="files")
+    webhook_spill_dir: Path | None = field(default=None)
     _event_services: dict[UUID, EventService] | None = field(default=None, init=False)
     _conversation_webhook_subscribers: list["ConversationWebhookSubscriber"] = field(
         default_factory=list, init=False
@@ -149,6 +169,25 @@ class ConversationService:
             results.append(result)
         return results
 
+    async def _subscribe_webhooks(
+        self, conversation_id: UUID, event_service: EventService
+    ) -> None:
+        for webhook_spec in self.webhook_specs:
+            subscriber = WebhookSubscriber(
+                conversation_id=conversation_id,
+                service=event_service,
+                spec=webhook_spec,
+                session_api_key=self.session_api_key,
+                spill_dir=self.webhook_spill_dir / conversation_id.hex
+                if self.webhook_spill_dir
+                else None,
+            )
+            # Webhook events are never dropped. Delivery only queues them (the
+            # posts run in the background), so this does not hold up others
+            await event_service.subscribe_to_events(subscriber, overflow_policy="block")
+            # Deliver anything left over from before a restart
+            subscriber.replay_spilled()
+
     async def _notify_conversation_webhooks(self, conversation_info: ConversationInfo):
         """Notify all conversation webhook subscribers about conversation changes."""
         if not self._conversation_webhook_subscribers:
@@ -179,23 +218,12 @@ class ConversationService:
             stored=stored,
             file_store_path=file_store_path,
             working_dir=Path(request.workspace.working_dir),
+            event_backend=self.event_backend,
         )
 
         # Create subscribers...
         await event_service.subscribe_to_events(_EventSubscriber(service=event_service))
-        asyncio.gather(
-            *[
-                event_service.subscribe_to_events(
-                    WebhookSubscriber(
-                        conversation_id=conversation_id,
-                        service=event_service,
-                        spec=webhook_spec,
-                        session_api_key=self.session_api_key,
-                    )
-                )
-                for webhook_spec in self.webhook_specs
-            ]
-        )
+        await self._subscribe_webhooks(conversation_id, event_service)
 
         self._event_services[conversation_id] = event_service
         await event_service.start()
@@ -257,24 +285,31 @@ class ConversationService:
 
     async def __aenter__(self):
         self.event_services_path.mkdir(parents=True, exist_ok=True)
+        event_service_dirs = await run_io(list, self.event_services_path.iterdir())
+        # Metadata files are read and parsed concurrently on the I/O executor
+        results = await asyncio.gather(
+            *[run_io(_load_stored, d) for d in event_service_dirs],
+            return_exceptions=True,
+        )
         event_services = {}
-        for event_service_dir in self.event_services_path.iterdir():
-            try:
-                meta_file = event_service_dir / "meta.json"
-                json_str = meta_file.read_text()
-                id = UUID(event_service_dir.name)
-                stored = StoredConversation.model_validate_json(json_str)
-                event_services[id] = EventService(
-                    stored=stored,
-                    file_store_path=self.event_services_path / id.hex,
-                    working_dir=Path(stored.workspace.working_dir),
+        for event_service_dir, result in zip(event_service_dirs, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"error_loading_event_service:{event_service_dir}",
+                    exc_info=result,
                 )
-            except Exception:
-                logger.exception(
-                    f"error_loading_event_service:{event_service_dir}", stack_info=True
-                )
-                shutil.rmtree(event_service_dir)
+                await run_io(shutil.rmtree, event_service_dir)
+                continue
+            id, stored = result
+            event_services[id] = EventService(
+                stored=stored,
+                file_store_path=self.event_services_path / id.hex,
+                working_dir=Path(stored.workspace.working_dir),
+                event_backend=self.event_backend,
+            )
         self._event_services = event_services
+        for id, event_service in event_services.items():
+            await self._subscribe_webhooks(id, event_service)
 
         # Initialize conversation webhook subscribers
         self._conversation_webhook_subscribers = [
@@ -308,6 +343,8 @@ class ConversationService:
             session_api_key=config.session_api_keys[0]
             if config.session_api_keys
             else None,
+            event_backend=config.event_backend,
+            webhook_spill_dir=config.webhook_spill_dir,
         )
 
 
@@ -320,87 +357,228 @@ class _EventSubscriber(Subscriber):
         update_last_execution_time()
 
 
+# Batches kept in memory while a webhook is down. Beyond this many, retries stop
+# and the batches are spilled to disk (given a spill directory)
+_MAX_PENDING_BATCHES = 8
+
+
 @dataclass
 class WebhookSubscriber(Subscriber):
+    """Posts conversation events to a webhook in batches.
+
+    `deliver` only queues events. Batches are posted in order by a single
+    background sender task, so a batch being retried goes out before any later
+    one. Events are never dropped: batches that pile up behind an unreachable
+    webhook, or that still fail after their retries, are spilled to disk and
+    replayed first once the webhook is back; without a spill directory, they
+    go back to the queue.
+    """
+
     conversation_id: UUID
     service: EventService
     spec: WebhookSpec
     session_api_key: str | None = None
-    queue: list[Event] = field(default_factory=list)
+    queue: list[Envelope[Event]] = field(default_factory=list)
+    spill_dir: Path | None = None
     _flush_timer: asyncio.Task | None = field(default=None, init=False)
+    # Batches (events and JSON body) waiting to be posted, oldest first
+    _batches: deque[tuple[list[Envelope[Event]], str]] = field(
+        default_factory=deque, init=False
+    )
+    _sender: asyncio.Task | None = field(default=None, init=False)
+    # Whether the sender can be cancelled without losing a batch (it is
+    # waiting to retry or replaying spilled batches, which stay on disk)
+    _sender_cancellable: bool = field(default=False, init=False)
+    _closing: bool = field(default=False, init=False)
+    _spill: SpillQueue | None = field(default=None, init=False)
+    # Whether the spill directory may hold batches (unknown until replayed)
+    _spilled: bool = field(default=True, init=False)
+
+    def __post_init__(self):
+        if self.spill_dir is not None:
+            self._spill = SpillQueue.for_webhook(self.spill_dir, self.spec)
 
     async def __call__(self, event: Event):
-        """Add event to queue and post to webhook when buffer size is reached."""
-        self.queue.append(event)
+        await self.deliver(Envelope(event))
+
+    async def deliver(self, envelope: Envelope[Event]):
+        """Add event to queue and hand it to the sender when buffer size is
+        reached. Never waits for the webhook."""
+        if isinstance(envelope.event, EphemeralEvent):
+            # Deltas are for live (websocket) clients only
+            return
+        self.queue.append(envelope)
 
         if len(self.queue) >= self.spec.event_buffer_size:
             # Cancel timer since we're flushing due to buffer size
             self._cancel_flush_timer()
-            await self._post_events()
+            self._flush()
         else:
             # Reset the flush timer
             self._reset_flush_timer()
 
     async def close(self):
-        """Post any remaining items in the queue to the webhook."""
+        """Post any remaining items in the queue to the webhook.
+
+        With a spill directory, a sender waiting to retry (or replaying spilled
+        batches) is stopped and the batches not posted yet are spilled right
+        away, rather than holding up shutdown through the backoff; they are
+        replayed by the next subscriber for this webhook. Without one, the
+        retries are awaited since there is nowhere else to keep the events.
+        """
         # Cancel any pending flush timer
         self._cancel_flush_timer()
 
+        self._closing = True
+        sender = self._flush()
+        if sender is not None:
+            if self._spill is not None and self._sender_cancellable:
+                sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
+        if self._spill is not None:
+            await self._spill_batches(keep=0)
+
+    @property
+    def _events_url(self) -> str:
+        return f"{self.spec.base_url.rstrip('/')}/events/{self.conversation_id.hex}"
+
+    def _flush(self) -> asyncio.Task | None:
+        """Turn the queued events into a batch and make sure the sender is
+        running. Returns the sender, if there is anything to send."""
         if self.queue:
-            await self._post_events()
+            events = self.queue.copy()
+            self.queue.clear()
+            # Events keep the JSON encoding shared with the other subscribers
+            body = "[" + ",".join(envelope.json for envelope in events) + "]"
+            self._batches.append((events, body))
+        if self._sender is None or self._sender.done():
+            replay = self._spill is not None and self._spilled and not self._closing
+            if not self._batches and not replay:
+                return None
+            self._sender = asyncio.create_task(self._send())
+        return self._sender
 
     async def _post_events(self):
-        """Post queued events to the webhook with retry logic."""
-        if not self.queue:
-            return
-
-        events_to_post = self.queue.copy()
-        self.queue.clear()
+        """Hand the queued events to the sender and wait until it has posted
+        (or given up on) every batch."""
+        sender = self._flush()
+        if sender is not None:
+            await asyncio.shield(sender)
+
+    async def _send(self):
+        """Post the spilled batches, then the queued ones, oldest first.
+
+        Stops at a batch that cannot be posted, after spilling (or
+        re-queueing) it and everything behind it; the next flush starts over.
+        """
+        while True:
+            if self._spill is not None and self._spilled:
+                replayed = False
+                if not self._closing:
+                    self._sender_cancellable = True
+                    try:
+                        replayed = await self._post_spilled(self._spill)
+                    finally:
+                        self._sender_cancellable = False
+                if not replayed:
+                    # Later batches must not overtake the spilled ones
+                    await self._spill_batches(keep=0)
+                    return
+                self._spilled = False
+            if not self._batches:
+                return
+            _, body = self._batches[0]
+            if not await self._post_with_retries(body):
+                await self._give_up()
+                return
+            self._batches.popleft()
+
+    async def _post_with_retries(self, body: str) -> bool:
+        """Post a batch, retrying with backoff; return whether it succeeded.
+
+        With a spill directory, stops retrying early when closing, or when too
+        many batches are waiting behind this one (they are all spilled then).
+        """
+        attempts = 1
+        if await self._post_body(body, attempt=attempts):
+            return True
+        for attempt in range(self.spec.num_retries):
+            if self._spill is not None and (
+                self._closing or len(self._batches) > _MAX_PENDING_BATCHES
+            ):
+                break
+            self._sender_cancellable = True
+            try:
+                await asyncio.sleep(retry_delay(self.spec, attempt))
+            finally:
+                self._sender_cancellable = False
+            attempts += 1
+            if await self._post_body(body, attempt=attempts):
+                return True
+        logger.error(
+            f"Failed to post events to webhook {self._events_url} "
+            f"after {attempts} attempts"
+        )
+        return False
 
-        # Prepare headers
+    async def _give_up(self):
+        """Keep the batches that could not be posted for a later attempt."""
+        if self._spill is not None:
+            await self._spill_batches(keep=0)
+        else:
+            # Re-queue events (in order) for the next flush
+            events = [envelope for batch, _ in self._batches for envelope in batch]
+            self._batches.clear()
+            self.queue[:0] = events
+
+    async def _spill_batches(self, keep: int):
+        """Move the batches after the first `keep` to the spill directory,
+        oldest first. Only the sender (or `close`, once it has stopped) spills,
+        and new batches are only appended, so the indices stay valid."""
+        assert self._spill is not None
+        while len(self._batches) > keep:
+            _, body = self._batches[keep]
+            self._spilled = True
+            await run_io(self._spill.put, body)
+            del self._batches[keep]
+
+    async def _post_body(self, body: str, attempt: int) -> bool:
+        """Make one POST of a JSON batch; return whether it succeeded."""
         headers = self.spec.headers.copy()
         if self.session_api_key:
             headers["X-Session-API-Key"] = self.session_api_key
-
-        # Convert events to serializable format
-        event_data = [
-            event.model_dump() if hasattr(event, "model_dump") else event.__dict__
-            for event in events_to_post
-        ]
-
-        # Construct events URL
-        events_url = (
-            f"{self.spec.base_url.rstrip('/')}/events/{self.conversation_id.hex}"
-        )
-
-        # Retry logic
-        for attempt in range(self.spec.num_retries + 1):
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.request(
-                        method="POST",
-                        url=events_url,
-                        json=event_data,
-                        headers=headers,
-                        timeout=30.0,
-                    )
-                    response.raise_for_status()
-                    logger.debug(
-                        f"Successfully posted {len(event_data)} events "
-                        f"to webhook {events_url}"
-                    )
-                    return
-            except Exception as e:
-                logger.warning(f"Webhook post attempt {attempt + 1} failed: {e}")
-                if attempt < self.spec.num_retries:
-                    await asyncio.sleep(self.spec.retry_delay)
-                else:
-                    logger.error(
-                        f"Failed to post events to webhook {events_url} "
-                        f"after {self.spec.num_retries + 1} attempts"
-                    )
-                    # Re-queue events for potential retry later
-                    self.queue.extend(events_to_post)
+        headers["Content-Type"] = "application/json"
+        content, encoding_headers = encode_body(self.spec, body)
+        headers.update(encoding_headers)
+        try:
+            response = await get_webhook_client(self.spec).request(
+                method="POST",
+                url=self._events_url,
+                content=content,
+                headers=headers,
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            logger.debug(f"Successfully posted events to webhook {self._events_url}")
+            return True
+        except Exception as e:
+            logger.warning(f"Webhook post attempt {attempt} failed: {e}")
+            return False
+
+    def replay_spilled(self):
+        """Post batches spilled by earlier failures (e.g. before a restart) in
+        the background, ahead of any new ones."""
+        self._flush()
+
+    async def _post_spilled(self, spill: SpillQueue) -> bool:
+        """Post spilled batches, oldest first; False at the first one that
+        still cannot be posted."""
+        for path in await run_io(spill.paths):
+            body = await run_io(path.read_text)
+            if not await self._post_body(body, attempt=1):
+                return False
+            await run_io(path.unlink, missing_ok=True)
+        return True
 
     def _cancel_flush_timer(self):
         """Cancel the current flush timer if it exists."""
@@ -422,7 +600,7 @@ class WebhookSubscriber(Subscriber):
             await asyncio.sleep(self.spec.flush_delay)
             # Only flush if there are events in the queue
             if self.queue:
-                await self._post_events()
+                self._flush()
         except asyncio.CancelledError:
             # Timer was cancelled, which is expected behavior
             pass
@@ -453,26 +631,25 @@ class ConversationWebhookSubscriber:
         # Retry logic
         for attempt in range(self.spec.num_retries + 1):
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.request(
-                        method="POST",
-                        url=conversations_url,
-                        json=conversation_data,
-                        headers=headers,
-                        timeout=30.0,
-                    )
-                    response.raise_for_status()
-                    logger.debug(
-                        f"Successfully posted conversation info "
-                        f"to webhook {conversations_url}"
-                    )
-                    return
+                response = await get_webhook_client(self.spec).request(
+                    method="POST",
+                    url=conversations_url,
+                    json=conversation_data,
+                    headers=headers,
+                    timeout=30.0,
+                )
+                response.raise_for_status()
+                logger.debug(
+                    f"Successfully posted conversation info "
+                    f"to webhook {conversations_url}"
+                )
+                return
             except Exception as e:
                 logger.warning(
                     f"Conversation webhook post attempt {attempt + 1} failed: {e}"
                 )
                 if attempt < self.spec.num_retries:
-                    await asyncio.sleep(self.spec.retry_delay)
+                    await asyncio.sleep(retry_delay(self.spec, attempt))
                 else:
                     logger.error(
                         f"Failed to post conversation info to webhook "
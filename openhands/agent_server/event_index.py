@@ -0,0 +1,149 @@
+import bisect
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from openhands.sdk import Event
+from openhands.sdk.event.types import EventID
+
+
+def event_kind(event: Event) -> str:
+    """Fully qualified class name, as accepted by the `kind` search filter."""
+    return f"{event.__class__.__module__}.{event.__class__.__name__}"
+
+
+@dataclass
+class EventIndex:
+    """Secondary index over a conversation's events for search and count.
+
+    For every event it records the position in the log, the kind and the
+    timestamp, and keeps per-kind lists of (timestamp, position) in sorted
+    order. Searches are answered by bisecting those lists, and only the events
+    on the requested page are read back from the log, so neither needs the
+    conversation's state lock: positions below the indexed length always refer
+    to fully appended events.
+
+    The index is fed from the log's append path: register `append` with
+    `set_on_append`, then `load` the events the log already held. Queries
+    never read the log. Appends, loads and queries may come from several
+    threads at once and are serialized by an internal lock, which is only
+    held for in-memory work; `load` reads events without holding it.
+    """
+
+    _ids: list[EventID] = field(default_factory=list, init=False)
+    _timestamps: list[str] = field(default_factory=list, init=False)
+    _positions: dict[EventID, int] = field(default_factory=dict, init=False)
+    # kind -> sorted (timestamp, position); the None key holds every event
+    _by_kind: dict[str | None, list[tuple[str, int]]] = field(
+        default_factory=lambda: {None: []}, init=False
+    )
+    # Events appended while `load` was still reading the ones before them
+    _pending: dict[int, Event] = field(default_factory=dict, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def append(self, position: int, event: Event) -> None:
+        """Index an event that was just appended to the log at `position`."""
+        with self._lock:
+            self._add_in_order(position, event)
+
+    def load(self, events: Sequence[Event]) -> None:
+        """Index the events already in the log.
+
+        Events appended concurrently through `append` are merged in order.
+        """
+        while True:
+            with self._lock:
+                start = len(self._ids)
+            stop = len(events)
+            if start >= stop:
+                return
+            # Reading may hit the disk, so it happens outside the lock
+            batch = [events[position] for position in range(start, stop)]
+            with self._lock:
+                for position, event in enumerate(batch, start):
+                    self._add_in_order(position, event)
+
+    def _add_in_order(self, position: int, event: Event) -> None:
+        if position < len(self._ids):
+            return  # Already indexed
+        if position > len(self._ids):
+            self._pending[position] = event
+            return
+        self._add(position, event)
+        while (pending := self._pending.pop(len(self._ids), None)) is not None:
+            self._add(len(self._ids), pending)
+
+    def _add(self, position: int, event: Event) -> None:
+        self._ids.append(event.id)
+        self._timestamps.append(event.timestamp)
+        self._positions.setdefault(event.id, position)
+        entry = (event.timestamp, position)
+        bisect.insort(self._by_kind[None], entry)
+        bisect.insort(self._by_kind.setdefault(event_kind(event), []), entry)
+
+    def count(self, kind: str | None = None) -> int:
+        """Number of indexed events of the given kind (or of any kind)."""
+        with self._lock:
+            return len(self._by_kind.get(kind, ()))
+
+    def search(
+        self,
+        page_id: EventID | None = None,
+        limit: int = 100,
+        kind: str | None = None,
+        descending: bool = False,
+    ) -> tuple[list[int], EventID | None]:
+        """Positions of one page of events, plus the id starting the next page.
+
+        `page_id` is a cursor returned by a previous search with the same
+        filter and order; an unknown cursor starts from the first event.
+        """
+        with self._lock:
+            entries = self._by_kind.get(kind, [])
+            if not entries:
+                return [], None
+            step = _descending_step if descending else _ascending_step
+            # `i` walks indexes into the ascending list in the requested order
+            i: int | None = _descending_first(entries) if descending else 0
+            position = self._positions.get(page_id) if page_id is not None else None
+            if position is not None:
+                key = (self._timestamps[position], position)
+                j = bisect.bisect_left(entries, key)
+                if j < len(entries) and entries[j] == key:
+                    i = j
+
+            page: list[int] = []
+            while i is not None and len(page) < limit:
+                page.append(entries[i][1])
+                i = step(entries, i)
+            next_page_id = self._ids[entries[i][1]] if i is not None else None
+            return page, next_page_id
+
+
+def _ascending_step(entries: list[tuple[str, int]], i: int) -> int | None:
+    return i + 1 if i + 1 < len(entries) else None
+
+
+def _descending_first(entries: list[tuple[str, int]]) -> int:
+    return _block_start(entries, len(entries) - 1)
+
+
+def _descending_step(entries: list[tuple[str, int]], i: int) -> int | None:
+    """Next index in descending timestamp order.
+
+    Events sharing a timestamp keep their log order, as the stable
+    `sort(reverse=True)` this index replaced did, so timestamps are walked
+    backwards block by block and each block forwards.
+    """
+    if i + 1 < len(entries) and entries[i + 1][0] == entries[i][0]:
+        return i + 1
+    start = _block_start(entries, i)
+    return _block_start(entries, start - 1) if start > 0 else None
+
+
+def _block_start(entries: list[tuple[str, int]], i: int) -> int:
+    """Index of the first entry with the same timestamp as `entries[i]`."""
+    return bisect.bisect_left(entries, (entries[i][0], -1))
@@ -57,6 +57,17 @@ async def search_conversation_events(
         EventSortOrder,
         Query(title="Sort order for events"),
     ] = EventSortOrder.TIMESTAMP,
+    since_index: Annotated[
+        int | None,
+        Query(
+            title=(
+                "Optional position in the conversation's event log: return the "
+                "events from there on in the order they were appended, ignoring "
+                "page_id, kind and sort_order"
+            ),
+            ge=0,
+        ),
+    ] = None,
 ) -> EventPage:
     """Search / List local events"""
     assert limit > 0
@@ -64,7 +75,9 @@ async def search_conversation_events(
     event_service = await conversation_service.get_event_service(conversation_id)
     if event_service is None:
         raise HTTPException(status.HTTP_404_NOT_FOUND)
-    return await event_service.search_events(page_id, limit, kind, sort_order)
+    return await event_service.search_events(
+        page_id, limit, kind, sort_order, since_index
+    )
 
 
 @event_router.get("/count", responses={404: {"description": "Conversation not found"}})
@@ -3,6 +3,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from uuid import UUID
 
+from openhands.agent_server.config import OverflowPolicy
+from openhands.agent_server.event_index import EventIndex
+from openhands.agent_server.io_offload import AsyncFileStore, run_io
 from openhands.agent_server.models import (
     ConfirmationResponseRequest,
     EventPage,
@@ -12,10 +15,13 @@ from openhands.agent_server.models import (
 from openhands.agent_server.pub_sub import PubSub, Subscriber
 from openhands.agent_server.utils import utc_now
 from openhands.sdk import Agent, Event, Message, get_logger
+from openhands.sdk.conversation.event_journal import JournalEventLog
+from openhands.sdk.conversation.event_store import EventLog
 from openhands.sdk.conversation.impl.local_conversation import LocalConversation
 from openhands.sdk.conversation.secrets_manager import SecretValue
-from openhands.sdk.conversation.state import ConversationState
+from openhands.sdk.conversation.state import ConversationState, EventBackend
 from openhands.sdk.event.conversation_state import ConversationStateUpdateEvent
+from openhands.sdk.io import LocalFileStore
 from openhands.sdk.security.confirmation_policy import ConfirmationPolicyBase
 from openhands.sdk.utils.async_utils import AsyncCallbackWrapper
 from openhands.sdk.workspace import LocalWorkspace
@@ -36,9 +42,12 @@ class EventService:
     # conversation will be persisted to "file_store_path / conversation_id"
     # and can be accessible via .persistence_dir property
     working_dir: Path
+    event_backend: EventBackend = "files"
     _conversation: LocalConversation | None = field(default=None, init=False)
     _pub_sub: PubSub[Event] = field(default_factory=lambda: PubSub[Event](), init=False)
     _run_task: asyncio.Task | None = field(default=None, init=False)
+    _event_index: EventIndex = field(default_factory=EventIndex, init=False)
+    _event_index_attached: bool = field(default=False, init=False)
 
     @property
     def persistence_dir(self) -> Path:
@@ -55,22 +64,60 @@ class EventService:
         )
         return Path(persistence_dir)
 
+    @property
+    def _meta_store(self) -> AsyncFileStore:
+        return AsyncFileStore(LocalFileStore(str(self.persistence_dir)))
+
     async def load_meta(self):
-        meta_file = self.persistence_dir / "meta.json"
-        self.stored = StoredConversation.model_validate_json(meta_file.read_text())
+        json_str = await self._meta_store.read("meta.json")
+        self.stored = await run_io(StoredConversation.model_validate_json, json_str)
 
     async def save_meta(self):
         self.stored.updated_at = utc_now()
-        meta_file = self.persistence_dir / "meta.json"
-        meta_file.write_text(self.stored.model_dump_json())
+        await self._meta_store.write("meta.json", self.stored.model_dump_json())
 
     async def get_event(self, event_id: str) -> Event | None:
         if not self._conversation:
             raise ValueError("inactive_service")
-        with self._conversation._state as state:
-            index = state.events.get_index(event_id)
-            event = state.events[index]
-            return event
+        return await run_io(_find_event, self._conversation._state.events, event_id)
+
+    def _indexed_events(self) -> EventIndex:
+        """Return the event index, hooking it into the log on first use.
+
+        From then on the log's append path keeps the index up to date, so
+        queries do no indexing work. The first call reads the events already
+        in the log, so call it via `run_io`. Neither takes the state lock:
+        appends never modify events at lower positions.
+        """
+        if not self._conversation:
+            raise ValueError("inactive_service")
+        if not self._event_index_attached:
+            events = self._conversation._state.events
+            events.set_on_append(self._event_index.append)
+            self._event_index.load(events)
+            self._event_index_attached = True
+        return self._event_index
+
+    def _search_events(
+        self, page_id: str | None, limit: int, kind: str | None, descending: bool
+    ) -> EventPage:
+        index = self._indexed_events()
+        assert self._conversation is not None
+        positions, next_page_id = index.search(
+            page_id=page_id, limit=limit, kind=kind, descending=descending
+        )
+        events = self._conversation._state.events
+        items = [events[position] for position in positions]
+        return EventPage(items=items, next_page_id=next_page_id)
+
+    def _events_since(self, since_index: int, limit: int) -> EventPage:
+        if not self._conversation:
+            raise ValueError("inactive_service")
+        events = self._conversation._state.events
+        stop = min(since_index + limit, len(events))
+        items = [events[position] for position in range(since_index, stop)]
+        next_page_id = events[stop].id if stop < len(events) else None
+        return EventPage(items=items, next_page_id=next_page_id)
 
     async def search_events(
         self,
@@ -78,81 +125,38 @@ class EventService:
         limit: int = 100,
         kind: str | None = None,
         sort_order: EventSortOrder = EventSortOrder.TIMESTAMP,
+        since_index: int | None = None,
     ) -> EventPage:
-        if not self._conversation:
-            raise ValueError("inactive_service")
-
-        # Collect all events
-        all_events = []
-        with self._conversation._state as state:
-            for event in state.events:
-                # Apply kind filter if provided
-                if (
-                    kind is not None
-                    and f"{event.__class__.__module__}.{event.__class__.__name__}"
-                    != kind
-                ):
-                    continue
-                all_events.append(event)
-
-        # Sort events based on sort_order
-        if sort_order == EventSortOrder.TIMESTAMP:
-            all_events.sort(key=lambda x: x.timestamp)
-        elif sort_order == EventSortOrder.TIMESTAMP_DESC:
-            all_events.sort(key=lambda x: x.timestamp, reverse=True)
-
-        # Handle pagination
-        items = []
-        start_index = 0
-
-        # Find the starting point if page_id is provided
-        if page_id:
-            for i, event in enumerate(all_events):
-                if event.id == page_id:
-                    start_index = i
-                    break
-
-        # Collect items for this page
-        next_page_id = None
-        for i in range(start_index, len(all_events)):
-            if len(items) >= limit:
-                # We have more items, set next_page_id
-                if i < len(all_events):
-                    next_page_id = all_events[i].id
-                break
-            items.append(all_events[i])
-
-        return EventPage(items=items, next_page_id=next_page_id)
+        """Search events. With `since_index`, the page instead holds the events
+        at that position of the log and after, in the order they were appended
+        (the other filters are ignored), so a client holding the first N events
+        can fetch just the ones it is missing."""
+        if since_index is not None:
+            return await run_io(self._events_since, since_index, limit)
+        return await run_io(
+            self._search_events,
+            page_id,
+            limit,
+            kind,
+            sort_order == EventSortOrder.TIMESTAMP_DESC,
+        )
 
     async def count_events(
         self,
         kind: str | None = None,
     ) -> int:
         """Count events matching the given filters."""
-        if not self._conversation:
-            raise ValueError("inactive_service")
-
-        count = 0
-        with self._conversation._state as state:
-            for event in state.events:
-                # Apply kind filter if provided
-                if (
-                    kind is not None
-                    and f"{event.__class__.__module__}.{event.__class__.__name__}"
-                    != kind
-                ):
-                    continue
-                count += 1
-
-        return count
+        index = await run_io(self._indexed_events)
+        return index.count(kind)
 
     async def batch_get_events(self, event_ids: list[str]) -> list[Event | None]:
         """Given a list of ids, get events (Or none for any which were not found)"""
-        results = []
-        for event_id in event_ids:
-            result = await self.get_event(event_id)
-            results.append(result)
-        return results
+        if not self._conversation:
+            raise ValueError("inactive_service")
+        events = self._conversation._state.events
+        return await run_io(
+            lambda: [_find_event(events, event_id) for event_id in event_ids]
+        )
 
     async def send_message(self, message: Message):
         if not self._conversation:
@@ -160,26 +164,18 @@ class EventService:
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._conversation.send_message, message)
 
-    async def subscribe_to_events(self, subscriber: Subscriber[Event]) -> UUID:
-        subscriber_id = self._pub_sub.subscribe(subscriber)
+    async def subscribe_to_events(
+        self,
+        subscriber: Subscriber[Event],
+        overflow_policy: OverflowPolicy | None = None,
+    ) -> UUID:
+        subscriber_id = self._pub_sub.subscribe(subscriber, overflow_policy)
 
-        # Send current state to the new subscriber immediately
+        # Send current state to the new subscriber immediately. It goes through
+        # the subscriber's queue, so it is ordered with the live events
         if self._conversation:
-            state = self._conversation._state
-            with state:
-                # Create state update event with current state information
-                state_update_event = (
-                    ConversationStateUpdateEvent.from_conversation_state(state)
-                )
-
-                # Send state update directly to the new subscriber
-                try:
-                    await subscriber(state_update_event)
-                except Exception as e:
-                    logger.error(
-                        f"Error sending initial state to subscriber "
-                        f"{subscriber_id}: {e}"
-                    )
+            state_update_event = await run_io(self._state_update_event)
+            await self._pub_sub.publish_to(subscriber_id, state_update_event)
 
         return subscriber_id
 
@@ -210,6 +206,7 @@ class EventService:
             stuck_detection=self.stored.stuck_detection,
             visualize=False,
             secrets=self.stored.secrets,
+            event_backend=self.event_backend,
         )
 
         # Set confirmation mode if enabled
@@ -218,16 +215,21 @@ class EventService:
 
         # Register state change callback to automatically publish updates
         self._conversation._state.set_on_state_change(self._conversation._on_event)
+        await run_io(self._indexed_events)
 
         # Publish initial state update
         await self._publish_state_update()
 
     async def run(self):
-        """Run the conversation asynchronously."""
+        """Run the conversation asynchronously.
+
+        The agent loop runs on this event loop (LLM calls are awaited, tools
+        run in worker threads), so a running conversation does not pin a
+        thread-pool thread while waiting on the model.
+        """
         if not self._conversation:
             raise ValueError("inactive_service")
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self._conversation.run)
+        await self._conversation.arun()
 
     async def respond_to_confirmation(self, request: ConfirmationResponseRequest):
         if request.accept:
@@ -272,15 +274,19 @@ class EventService:
         if not self._conversation:
             return
 
+        state_update_event = await run_io(self._state_update_event)
+        await self._pub_sub(state_update_event)
+
+    def _state_update_event(self) -> ConversationStateUpdateEvent:
+        """Snapshot the current state under the state lock.
+
+        The lock may be held by a thread running a conversation operation, so
+        call this via `run_io` rather than on the event loop.
+        """
+        assert self._conversation is not None
         state = self._conversation._state
         with state:
-            # Create state update event with current state information
-            state_update_event = ConversationStateUpdateEvent.from_conversation_state(
-                state
-            )
-
-            # Publish the state update event
-            await self._pub_sub(state_update_event)
+            return ConversationStateUpdateEvent.from_conversation_state(state)
 
     async def __aenter__(self):
         await self.start()
@@ -289,3 +295,16 @@ class EventService:
     async def __aexit__(self, exc_type, exc_value, traceback):
         await self.save_meta()
         await self.close()
+
+
+def _find_event(events: EventLog | JournalEventLog, event_id: str) -> Event | None:
+    """Look up an event by id without the state lock.
+
+    An id becomes visible just before the log's length is bumped, so a
+    concurrent append may briefly yield an index that is not readable yet;
+    such an event is treated as not found.
+    """
+    try:
+        return events[events.get_index(event_id)]
+    except (KeyError, IndexError):
+        return None
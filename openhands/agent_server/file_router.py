@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from pathlib import Path
 from typing import Annotated
 
@@ -6,14 +8,23 @@ from fastapi import (
     File,
     HTTPException,
     Path as FastApiPath,
+    Query,
+    Request,
     UploadFile,
     status,
 )
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from openhands.agent_server.config import get_default_config
-from openhands.agent_server.models import Success
+from openhands.agent_server.io_offload import run_io
+from openhands.agent_server.models import DirectoryTransferResult, FileInfo
 from openhands.sdk.logger import get_logger
+from openhands.sdk.utils.tar_stream import (
+    CHUNK_SIZE,
+    extract_tar,
+    iter_tar,
+    sha256_file,
+)
 
 
 logger = get_logger(__name__)
@@ -21,31 +32,64 @@ file_router = APIRouter(prefix="/file", tags=["Files"])
 config = get_default_config()
 
 
-@file_router.post("/upload/{path}")
+def _absolute_path(path: str) -> Path:
+    target_path = Path(path)
+    if not target_path.is_absolute():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Path must be absolute",
+        )
+    return target_path
+
+
+def _open_for_upload(target_path: Path, offset: int):
+    """Open the target for writing from `offset`, dropping anything after it."""
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    if offset == 0:
+        return open(target_path, "wb")
+    if not target_path.is_file() or target_path.stat().st_size < offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Offset is past the end of the file",
+        )
+    f = open(target_path, "r+b")
+    f.truncate(offset)
+    f.seek(offset)
+    return f
+
+
+@file_router.post("/upload/{path:path}")
 async def upload_file(
     path: Annotated[str, FastApiPath(alias="path", description="Absolute file path.")],
     file: UploadFile = File(...),
-) -> Success:
+    offset: Annotated[
+        int,
+        Query(
+            ge=0,
+            description=(
+                "Write the upload starting at this byte offset, keeping the part of "
+                "an existing file before it (to resume an interrupted upload)."
+            ),
+        ),
+    ] = 0,
+) -> FileInfo:
     """Upload a file to the workspace."""
     try:
-        target_path = Path(path)
-        if not target_path.is_absolute():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Path must be absolute",
-            )
-
-        # Ensure target directory exists
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+        target_path = _absolute_path(path)
+        f = await run_io(_open_for_upload, target_path, offset)
 
         # Stream the file to disk to avoid memory issues with large files
-        with open(target_path, "wb") as f:
-            while chunk := await file.read(8192):  # Read in 8KB chunks
-                f.write(chunk)
+        try:
+            while chunk := await file.read(CHUNK_SIZE):
+                await run_io(f.write, chunk)
+        finally:
+            await run_io(f.close)
 
         logger.info(f"Uploaded file to {target_path}")
-        return Success()
+        return FileInfo(path=str(target_path), file_size=target_path.stat().st_size)
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to upload file: {e}")
         raise HTTPException(
@@ -54,18 +98,14 @@ async def upload_file(
         )
 
 
-@file_router.get("/download/{path}")
+@file_router.get("/download/{path:path}")
 async def download_file(
     path: Annotated[str, FastApiPath(description="Absolute file path.")],
 ) -> FileResponse:
-    """Download a file from the workspace."""
+    """Download a file from the workspace. Range requests are supported, so an
+    interrupted download can be resumed."""
     try:
-        target_path = Path(path)
-        if not target_path.is_absolute():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Path must be absolute",
-            )
+        target_path = _absolute_path(path)
 
         if not target_path.exists():
             raise HTTPException(
@@ -91,3 +131,126 @@ async def download_file(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to download file: {str(e)}",
         )
+
+
+@file_router.get(
+    "/info/{path:path}", responses={404: {"description": "File not found"}}
+)
+async def get_file_info(
+    path: Annotated[str, FastApiPath(description="Absolute file path.")],
+    checksum: Annotated[
+        bool, Query(description="Also compute the SHA-256 digest of the file")
+    ] = False,
+    prefix: Annotated[
+        int | None,
+        Query(
+            ge=0,
+            description=(
+                "Compute the checksum over only the first bytes of the file (to "
+                "check that a partial transfer can be resumed)"
+            ),
+        ),
+    ] = None,
+) -> FileInfo:
+    """Get the size of a file, and optionally its checksum (used to resume and
+    verify transfers)."""
+    target_path = _absolute_path(path)
+    if not target_path.is_file():
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="File not found")
+    return FileInfo(
+        path=str(target_path),
+        file_size=target_path.stat().st_size,
+        sha256=await run_io(sha256_file, target_path, prefix) if checksum else None,
+    )
+
+
+@file_router.get("/download_dir/{path:path}")
+async def download_directory(
+    path: Annotated[str, FastApiPath(description="Absolute directory path.")],
+    compress: Annotated[bool, Query(description="Gzip the tar stream")] = False,
+) -> StreamingResponse:
+    """Download a directory from the workspace as a streamed tar archive."""
+    target_path = _absolute_path(path)
+    if not target_path.is_dir():
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Directory not found")
+    return StreamingResponse(
+        iter_tar(target_path, compress=compress),
+        media_type="application/gzip" if compress else "application/x-tar",
+    )
+
+
+@file_router.post("/upload_dir/{path:path}")
+async def upload_directory(
+    path: Annotated[str, FastApiPath(description="Absolute directory path.")],
+    request: Request,
+) -> DirectoryTransferResult:
+    """Upload a directory to the workspace: the request body is a tar archive
+    (optionally gzipped), which is extracted into the directory as it streams
+    in."""
+    target_path = _absolute_path(path)
+    loop = asyncio.get_running_loop()
+    chunks: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=8)
+    extraction: asyncio.Future[int] = loop.create_future()
+
+    def read_chunks():
+        while True:
+            chunk = asyncio.run_coroutine_threadsafe(chunks.get(), loop).result()
+            if chunk is None:
+                return
+            yield chunk
+
+    def extract() -> None:
+        try:
+            size = extract_tar(read_chunks(), target_path)
+        except BaseException as e:
+            loop.call_soon_threadsafe(_settle, extraction, None, e)
+        else:
+            loop.call_soon_threadsafe(_settle, extraction, size, None)
+
+    # Extraction runs as long as the upload, so it gets its own thread rather
+    # than holding an I/O pool worker; the body is queued from the loop
+    threading.Thread(target=extract, name="upload-dir-extract", daemon=True).start()
+    try:
+        async for chunk in request.stream():
+            if not await _offer(chunks, chunk, extraction):
+                break
+    finally:
+        await _offer(chunks, None, extraction)
+    try:
+        size = await extraction
+    except Exception as e:
+        logger.error(f"Failed to upload directory: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to upload directory: {str(e)}",
+        )
+    logger.info(f"Uploaded directory to {target_path}")
+    return DirectoryTransferResult(file_size=size)
+
+
+async def _offer(
+    chunks: asyncio.Queue[bytes | None],
+    chunk: bytes | None,
+    extraction: asyncio.Future[int],
+) -> bool:
+    """Queue a chunk for the extractor; False if extraction already stopped."""
+    if extraction.done():
+        return False
+    put = asyncio.ensure_future(chunks.put(chunk))
+    await asyncio.wait({put, extraction}, return_when=asyncio.FIRST_COMPLETED)
+    if put.done():
+        return True
+    put.cancel()
+    return False
+
+
+def _settle(
+    future: asyncio.Future[int], result: int | None, error: BaseException | None
+) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        assert result is not None
+        future.set_result(result)
@@ -0,0 +1,150 @@
+"""Keep blocking I/O off the agent server's event loop.
+
+Reading events and conversation metadata means synchronous file I/O and
+pydantic parsing; done inline in a request handler it stalls every other
+request and websocket served by the loop. `run_io` runs such work on a
+dedicated, bounded thread pool, separate from the loop's default executor
+(which conversations use for tool calls and may keep busy), and
+`AsyncFileStore` exposes a `FileStore` through it.
+
+`LoopLagMonitor` measures how late the loop wakes up from a short sleep, which
+is how long callbacks had to wait behind blocking work.
+"""
+
+import asyncio
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ParamSpec, TypeVar
+
+from pydantic import BaseModel, Field
+
+from openhands.agent_server.config import get_default_config
+from openhands.sdk import get_logger
+from openhands.sdk.io import FileStore
+
+
+logger = get_logger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """The shared executor for blocking I/O, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_default_config().io_max_workers,
+                thread_name_prefix="agent-server-io",
+            )
+        return _executor
+
+
+def shutdown_io_executor() -> None:
+    """Wait for pending I/O and release the executor's threads."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def run_io(fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run a blocking callable on the I/O executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_io_executor(), functools.partial(fn, *args, **kwargs)
+    )
+
+
+class AsyncFileStore:
+    """Awaitable view of a `FileStore` whose operations run via `run_io`."""
+
+    def __init__(self, file_store: FileStore):
+        self.file_store = file_store
+
+    async def write(self, path: str, contents: str | bytes) -> None:
+        await run_io(self.file_store.write, path, contents)
+
+    async def read(self, path: str) -> str:
+        return await run_io(self.file_store.read, path)
+
+    async def list(self, path: str) -> list[str]:
+        return await run_io(self.file_store.list, path)
+
+    async def delete(self, path: str) -> None:
+        await run_io(self.file_store.delete, path)
+
+
+class LoopLagStats(BaseModel):
+    """Event loop delay observed by a `LoopLagMonitor`, in seconds."""
+
+    samples: int = Field(default=0, description="Number of measurements taken")
+    max_lag: float = Field(default=0.0, description="Largest delay observed")
+    avg_lag: float = Field(default=0.0, description="Mean delay over all samples")
+    last_lag: float = Field(default=0.0, description="Most recent delay")
+
+
+class LoopLagMonitor:
+    """Sample event loop delay from a background task.
+
+    Every `interval` seconds the task sleeps and records how much later than
+    scheduled it woke up.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+        self._samples = 0
+        self._total = 0.0
+        self._max = 0.0
+        self._last = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def record(self, lag: float) -> None:
+        self._samples += 1
+        self._total += lag
+        self._max = max(self._max, lag)
+        self._last = lag
+
+    @property
+    def stats(self) -> LoopLagStats:
+        return LoopLagStats(
+            samples=self._samples,
+            max_lag=self._max,
+            avg_lag=self._total / self._samples if self._samples else 0.0,
+            last_lag=self._last,
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.record(lag)
+            if lag > 1.0:
+                logger.warning(f"event_loop_blocked:{lag:.3f}s")
@@ -126,6 +126,20 @@ class Success(BaseModel):
     success: bool = True
 
 
+class FileInfo(BaseModel):
+    """Size (and optionally checksum) of a file in the workspace."""
+
+    path: str
+    file_size: int
+    sha256: str | None = Field(
+        default=None, description="Hex SHA-256 digest, if it was requested"
+    )
+
+
+class DirectoryTransferResult(Success):
+    file_size: int = Field(description="Total bytes of file content transferred")
+
+
 class EventPage(OpenHandsModel):
     items: list[Event]
     next_page_id: str | None = None
@@ -1,9 +1,14 @@
 import asyncio
+import json
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import TypeVar
 from uuid import UUID, uuid4
 
+from pydantic import BaseModel, Field
+
+from openhands.agent_server.config import OverflowPolicy, get_default_config
 from openhands.sdk.logger import get_logger
 
 
@@ -12,46 +17,199 @@ logger = get_logger(__name__)
 T = TypeVar("T")
 
 
+class Envelope[T]:
+    """An event being published, together with its JSON encoding.
+
+    The encoding is computed on first access and shared by every subscriber
+    the event is delivered to, so an event fanned out to many websockets and
+    webhooks is serialized once rather than once per subscriber.
+    """
+
+    __slots__ = ("event", "_json")
+
+    def __init__(self, event: T):
+        self.event = event
+        self._json: str | None = None
+
+    @property
+    def json(self) -> str:
+        if self._json is None:
+            self._json = encode_json(self.event)
+        return self._json
+
+
+def encode_json(event) -> str:
+    """JSON text for an event (pydantic models use `model_dump_json`)."""
+    if hasattr(event, "model_dump_json"):
+        return event.model_dump_json()
+    return json.dumps(event.__dict__)
+
+
 class Subscriber[T](ABC):
     @abstractmethod
     async def __call__(self, event: T):
         """Invoke this subscriber"""
 
+    async def deliver(self, envelope: Envelope[T]):
+        """Invoke this subscriber with a published envelope.
+
+        Subscribers that send events over the wire override this to reuse
+        `envelope.json` instead of serializing the event themselves.
+        """
+        await self(envelope.event)
+
     async def close(self):
         """Clean up this subscriber"""
 
+    async def disconnect(self):
+        """Clean up a subscriber dropped for falling behind (the `disconnect`
+        overflow policy). Defaults to `close`."""
+        await self.close()
+
+
+class SubscriberStats(BaseModel):
+    """Delivery metrics for one subscriber; lags are in seconds."""
+
+    queued: int = Field(default=0, description="Events waiting to be delivered")
+    delivered: int = Field(default=0, description="Events delivered so far")
+    dropped: int = Field(default=0, description="Events dropped on overflow")
+    max_lag: float = Field(
+        default=0.0, description="Largest delay between publish and delivery"
+    )
+    last_lag: float = Field(default=0.0, description="Delay of the latest delivery")
+
+
+class _Subscription[T]:
+    """A subscriber with its own bounded queue and delivery task."""
+
+    def __init__(
+        self,
+        subscriber_id: UUID,
+        subscriber: Subscriber[T],
+        overflow_policy: OverflowPolicy,
+        max_queue_size: int,
+    ):
+        self.subscriber_id = subscriber_id
+        self.subscriber = subscriber
+        self.overflow_policy: OverflowPolicy = overflow_policy
+        self.queue: asyncio.Queue[tuple[float, Envelope[T]]] = asyncio.Queue(
+            maxsize=max_queue_size
+        )
+        self.stats = SubscriberStats()
+        self._task: asyncio.Task | None = None
+
+    async def offer(self, envelope: Envelope[T]) -> bool:
+        """Queue an event; False if the subscriber should be disconnected."""
+        item = (time.monotonic(), envelope)
+        policy = self.overflow_policy
+        if policy == "block":
+            await self.queue.put(item)
+        else:
+            try:
+                self.queue.put_nowait(item)
+            except asyncio.QueueFull:
+                if policy == "disconnect":
+                    return False
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self.stats.dropped += 1
+                self.queue.put_nowait(item)
+        if self._task is None:
+            self._task = asyncio.create_task(self._deliver_queued())
+        return True
+
+    async def _deliver_queued(self) -> None:
+        while True:
+            published, envelope = await self.queue.get()
+            try:
+                await self.subscriber.deliver(envelope)
+            except Exception as e:
+                logger.error(
+                    f"Error in subscriber {self.subscriber_id}: {e}", exc_info=True
+                )
+            finally:
+                lag = time.monotonic() - published
+                self.stats.delivered += 1
+                self.stats.last_lag = lag
+                self.stats.max_lag = max(self.stats.max_lag, lag)
+                self.queue.task_done()
+
+    async def drain(self, timeout: float) -> None:
+        """Wait (up to `timeout` seconds) until every queued event is delivered."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self.queue.join(), timeout)
+        except TimeoutError:
+            logger.warning(
+                f"Subscriber {self.subscriber_id} did not drain "
+                f"{self.queue.qsize()} events within {timeout}s"
+            )
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def snapshot(self) -> SubscriberStats:
+        return self.stats.model_copy(update={"queued": self.queue.qsize()})
+
 
 @dataclass
 class PubSub[T]:
     """A subscription service that extends ConversationCallbackType functionality.
     This class maintains a dictionary of UUIDs to ConversationCallbackType instances
-    and provides methods to subscribe/unsubscribe callbacks. When invoked, it calls
-    all registered callbacks with proper error handling.
+    and provides methods to subscribe/unsubscribe callbacks. When invoked, it hands
+    the event to every registered callback.
+
+    Each subscriber has its own bounded queue and delivery task, so a slow
+    subscriber only falls behind itself; what happens once its queue is full is
+    set by the `overflow_policy` it was subscribed with.
     """
 
-    _subscribers: dict[UUID, Subscriber[T]] = field(default_factory=dict)
+    close_timeout: float = 5.0
+    _subscriptions: dict[UUID, _Subscription[T]] = field(default_factory=dict)
+    _closing: set[asyncio.Task] = field(default_factory=set)
 
-    def subscribe(self, subscriber: Subscriber[T]) -> UUID:
+    def subscribe(
+        self,
+        subscriber: Subscriber[T],
+        overflow_policy: OverflowPolicy | None = None,
+        max_queue_size: int | None = None,
+    ) -> UUID:
         """Subscribe a subscriber and return its UUID for later unsubscription.
         Args:
             subscriber: The callback function to register
+            overflow_policy: What to do once its queue is full (defaults to
+                the server config's `subscriber_overflow_policy`)
+            max_queue_size: How many events can be queued for it (defaults to
+                the server config's `subscriber_max_queue_size`)
         Returns:
             UUID: UUID that can be used to unsubscribe this callback
         """
+        config = get_default_config()
+        if overflow_policy is None:
+            overflow_policy = config.subscriber_overflow_policy
+        if max_queue_size is None:
+            max_queue_size = config.subscriber_max_queue_size
         subscriber_id = uuid4()
-        self._subscribers[subscriber_id] = subscriber
+        self._subscriptions[subscriber_id] = _Subscription(
+            subscriber_id, subscriber, overflow_policy, max_queue_size
+        )
         logger.debug(f"Subscribed subscriber with ID: {subscriber_id}")
         return subscriber_id
 
     def unsubscribe(self, subscriber_id: UUID) -> bool:
         """Unsubscribe a subscriber by its UUID.
+        Events still queued for it are discarded.
         Args:
             subscriber_id: The UUID returned by subscribe()
         Returns:
             bool: True if subscriber was found and removed, False otherwise
         """
-        if subscriber_id in self._subscribers:
-            del self._subscribers[subscriber_id]
+        subscription = self._subscriptions.pop(subscriber_id, None)
+        if subscription is not None:
+            subscription.cancel()
             logger.debug(f"Unsubscribed subscriber with ID: {subscriber_id}")
             return True
         else:
@@ -61,20 +219,70 @@ class PubSub[T]:
             return False
 
     async def __call__(self, event: T) -> None:
-        """Invoke all registered callbacks with the given event.
-        Each callback is invoked in its own try/catch block to prevent
-        one failing callback from affecting others.
+        """Queue the given event for all registered callbacks.
+        Callbacks run on their own delivery tasks, each inside a try/catch
+        block, so one failing or slow callback does not affect the others.
+        All callbacks share one `Envelope`, so the event is serialized at
+        most once.
         Args:
             event: The event to pass to all callbacks
         """
-        for subscriber_id, subscriber in list(self._subscribers.items()):
-            try:
-                await subscriber(event)
-            except Exception as e:
-                logger.error(f"Error in subscriber {subscriber_id}: {e}", exc_info=True)
+        envelope = Envelope(event)
+        for subscriber_id, subscription in list(self._subscriptions.items()):
+            if not await subscription.offer(envelope):
+                self._disconnect(subscriber_id)
+
+    async def publish_to(self, subscriber_id: UUID, event: T) -> None:
+        """Queue an event for a single subscriber, behind the events already
+        queued for it and subject to its overflow policy."""
+        subscription = self._subscriptions.get(subscriber_id)
+        if subscription is None:
+            return
+        if not await subscription.offer(Envelope(event)):
+            self._disconnect(subscriber_id)
+
+    def _disconnect(self, subscriber_id: UUID) -> None:
+        subscription = self._subscriptions.pop(subscriber_id, None)
+        if subscription is None:
+            return
+        logger.warning(
+            f"Disconnecting subscriber {subscriber_id}: "
+            f"{subscription.queue.qsize()} events behind"
+        )
+        subscription.cancel()
+        task = asyncio.create_task(subscription.subscriber.disconnect())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def stats(self) -> dict[UUID, SubscriberStats]:
+        """Delivery metrics for every current subscriber."""
+        return {
+            subscriber_id: subscription.snapshot()
+            for subscriber_id, subscription in self._subscriptions.items()
+        }
+
+    async def join(self) -> None:
+        """Wait until every event published so far has been delivered."""
+        await asyncio.gather(
+            *[
+                subscription.queue.join()
+                for subscription in list(self._subscriptions.values())
+            ]
+        )
 
     async def close(self):
+        subscriptions = list(self._subscriptions.values())
+        self._subscriptions.clear()
         await asyncio.gather(
-            *[subscriber.close() for subscriber in self._subscribers.values()]
+            *[subscription.drain(self.close_timeout) for subscription in subscriptions]
+        )
+        for subscription in subscriptions:
+            subscription.cancel()
+        results = await asyncio.gather(
+            *[subscription.subscriber.close() for subscription in subscriptions],
+            *self._closing,
+            return_exceptions=True,
         )
-        self._subscribers.clear()
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error closing subscriber: {result}")
@@ -4,10 +4,13 @@ from importlib.metadata import version
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from openhands.agent_server.io_offload import LoopLagMonitor, LoopLagStats
+
 
 server_details_router = APIRouter(prefix="", tags=["Server Details"])
 _start_time = time.time()
 _last_event_time = time.time()
+_loop_lag_monitor = LoopLagMonitor()
 
 
 class ServerInfo(BaseModel):
@@ -17,6 +20,11 @@ class ServerInfo(BaseModel):
     version: str = version("openhands-agent-server")
     docs: str = "/docs"
     redoc: str = "/redoc"
+    event_loop_lag: LoopLagStats | None = None
+
+
+def get_loop_lag_monitor() -> LoopLagMonitor:
+    return _loop_lag_monitor
 
 
 def update_last_execution_time():
@@ -40,4 +48,5 @@ async def get_server_info() -> ServerInfo:
     return ServerInfo(
         uptime=int(now - _start_time),
         idle_time=int(now - _last_event_time),
+        event_loop_lag=_loop_lag_monitor.stats,
     )
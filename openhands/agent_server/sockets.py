@@ -7,7 +7,7 @@ send custom HTTP headers directly with WebSocket connections.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Annotated
 from uuid import UUID
 
@@ -24,8 +24,9 @@ from openhands.agent_server.conversation_service import (
     get_default_conversation_service,
 )
 from openhands.agent_server.models import BashEventBase
-from openhands.agent_server.pub_sub import Subscriber
+from openhands.agent_server.pub_sub import Envelope, Subscriber, encode_json
 from openhands.sdk import Event, Message
+from openhands.sdk.event.types import EventID
 
 
 sockets_router = APIRouter(prefix="/sockets", tags=["WebSockets"])
@@ -40,8 +41,14 @@ async def events_socket(
     websocket: WebSocket,
     session_api_key: Annotated[str | None, Query(alias="session_api_key")] = None,
     resend_all: Annotated[bool, Query()] = False,
+    resume_from: Annotated[int | None, Query(ge=0)] = None,
 ):
-    """WebSocket endpoint for conversation events."""
+    """WebSocket endpoint for conversation events.
+
+    A client that already holds the first N events of the conversation (for
+    example after a dropped connection) can pass `resume_from=N`: the events
+    it is missing are sent first, in log order, followed by live events.
+    """
     # Perform authentication check before accepting the WebSocket connection
     config = get_default_config()
     if config.session_api_keys and session_api_key not in config.session_api_keys:
@@ -55,11 +62,28 @@ async def events_socket(
         await websocket.close(code=4004, reason="Conversation not found")
         return
 
+    subscriber = _WebSocketSubscriber(websocket)
+    if resume_from is not None:
+        # Live events wait until the missed ones are sent, to keep log order
+        subscriber.hold()
     subscriber_id = await event_service.subscribe_to_events(
-        _WebSocketSubscriber(websocket)
+        subscriber, overflow_policy="disconnect"
     )
 
     try:
+        if resume_from is not None:
+            sent_ids = set()
+            index = resume_from
+            while True:
+                page = await event_service.search_events(since_index=index)
+                for event in page.items:
+                    await _send_event(event, websocket)
+                    sent_ids.add(event.id)
+                index += len(page.items)
+                if not page.next_page_id:
+                    break
+            await subscriber.release(skip_ids=sent_ids)
+
         # Resend all existing events if requested
         if resend_all:
             page_id = None
@@ -106,7 +130,7 @@ async def bash_events_socket(
 
     await websocket.accept()
     subscriber_id = await bash_event_service.subscribe_to_events(
-        _BashWebSocketSubscriber(websocket)
+        _BashWebSocketSubscriber(websocket), overflow_policy="disconnect"
     )
     try:
         # Resend all existing events if requested
@@ -138,36 +162,83 @@ async def bash_events_socket(
 
 
 async def _send_event(event: Event, websocket: WebSocket):
+    await _send_json_text(encode_json(event), websocket)
+
+
+async def _send_json_text(text: str, websocket: WebSocket):
+    """Send an already encoded event as a websocket text frame."""
     try:
-        dumped = event.model_dump()
-        await websocket.send_json(dumped)
+        await websocket.send_text(text)
     except Exception:
-        logger.exception("error_sending_event:{event}", stack_info=True)
+        logger.exception("error_sending_event", stack_info=True)
 
 
 @dataclass
 class _WebSocketSubscriber(Subscriber):
-    """WebSocket subscriber for conversation events."""
+    """WebSocket subscriber for conversation events.
+
+    It is subscribed with the `disconnect` overflow policy: a client that
+    falls too far behind is disconnected rather than buffered for; it can
+    reconnect with `resend_all` to catch up.
+    """
 
     websocket: WebSocket
+    _held: list[Envelope[Event]] | None = field(default=None, init=False)
 
     async def __call__(self, event: Event):
         await _send_event(event, self.websocket)
 
+    async def deliver(self, envelope: Envelope[Event]):
+        if self._held is not None:
+            self._held.append(envelope)
+            return
+        await _send_json_text(envelope.json, self.websocket)
+
+    def hold(self) -> None:
+        """Buffer published events instead of sending them, until `release`."""
+        self._held = []
+
+    async def release(self, skip_ids: set[EventID]) -> None:
+        """Send the buffered events (except those already sent) and go live."""
+        while self._held:
+            envelope = self._held.pop(0)
+            if envelope.event.id not in skip_ids:
+                await _send_json_text(envelope.json, self.websocket)
+        self._held = None
+
+    async def close(self):
+        await _close_websocket(self.websocket, 1000, "Conversation closed")
+
+    async def disconnect(self):
+        await _close_websocket(self.websocket, 1013, "Subscriber lagging")
+
 
 async def _send_bash_event(event: BashEventBase, websocket: WebSocket):
-    try:
-        dumped = event.model_dump()
-        await websocket.send_json(dumped)
-    except Exception:
-        logger.exception("error_sending_event:{event}", stack_info=True)
+    await _send_json_text(encode_json(event), websocket)
 
 
 @dataclass
 class _BashWebSocketSubscriber(Subscriber[BashEventBase]):
-    """WebSocket subscriber for bash events."""
+    """WebSocket subscriber for bash events (disconnected when lagging)."""
 
     websocket: WebSocket
 
     async def __call__(self, event: BashEventBase):
         await _send_bash_event(event, self.websocket)
+
+    async def deliver(self, envelope: Envelope[BashEventBase]):
+        await _send_json_text(envelope.json, self.websocket)
+
+    async def close(self):
+        await _close_websocket(self.websocket, 1001, "Server shutting down")
+
+    async def disconnect(self):
+        await _close_websocket(self.websocket, 1013, "Subscriber lagging")
+
+
+async def _close_websocket(websocket: WebSocket, code: int, reason: str):
+    try:
+        await websocket.close(code=code, reason=reason)
+    except Exception:
+        # Already closed by the client
+        pass
@@ -0,0 +1,110 @@
+"""Pooled HTTP clients and retry helpers for webhook delivery.
+
+Webhook posts share one `httpx.AsyncClient` per base URL (and event loop), so
+consecutive batches reuse kept-alive connections (HTTP/2 when the `h2`
+package is installed) instead of opening a new TCP/TLS connection per post.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import importlib.util
+import random
+import time
+import uuid
+import weakref
+from pathlib import Path
+
+import httpx
+
+from openhands.agent_server.config import WebhookSpec
+from openhands.sdk import get_logger
+
+
+logger = get_logger(__name__)
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# event loop -> base url -> client; clients cannot be shared across loops
+_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
+
+def get_webhook_client(spec: WebhookSpec) -> httpx.AsyncClient:
+    """The shared client for the spec's base URL on the running event loop."""
+    clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    key = spec.base_url.rstrip("/")
+    client = clients.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=spec.http2 and _HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=spec.max_connections,
+                max_keepalive_connections=spec.max_keepalive_connections,
+                keepalive_expiry=spec.keepalive_expiry,
+            ),
+            timeout=30.0,
+        )
+        clients[key] = client
+    return client
+
+
+async def close_webhook_clients() -> None:
+    """Close the clients created on the running event loop."""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    await asyncio.gather(
+        *[client.aclose() for client in clients.values()], return_exceptions=True
+    )
+
+
+def retry_delay(spec: WebhookSpec, attempt: int) -> float:
+    """Delay before retry number `attempt` (0-based): jittered exponential.
+
+    The delay doubles from `spec.retry_delay` up to `spec.max_retry_delay`, and
+    a random value between half of it and all of it is used, so webhooks that
+    failed together do not all retry at the same instant.
+    """
+    delay = min(spec.retry_delay * 2**attempt, spec.max_retry_delay)
+    return random.uniform(delay / 2, delay)
+
+
+def encode_body(spec: WebhookSpec, body: str) -> tuple[bytes, dict[str, str]]:
+    """Request body and extra headers, gzipped if the spec asks for it."""
+    data = body.encode()
+    if spec.gzip:
+        return gzip.compress(data), {"Content-Encoding": "gzip"}
+    return data, {}
+
+
+class SpillQueue:
+    """Webhook batches that could not be delivered, persisted on disk.
+
+    Each batch is one JSON file, named so that sorting the names gives the
+    order they were spilled in. Files are removed once the batch is posted.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    @staticmethod
+    def for_webhook(root: Path, spec: WebhookSpec) -> "SpillQueue":
+        """Spill queue for one webhook under `root`, keyed by its base URL."""
+        key = hashlib.sha256(spec.base_url.rstrip("/").encode()).hexdigest()
+        return SpillQueue(root / key[:16])
+
+    def put(self, body: str) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{time.time_ns():020d}-{uuid.uuid4().hex}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(body)
+        tmp.replace(path)
+        return path
+
+    def paths(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob("*.json"))
+
+    def __len__(self) -> int:
+        return len(self.paths())
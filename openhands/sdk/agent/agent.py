@@ -1,4 +1,10 @@
+import asyncio
 import json
+import logging
+import threading
+from collections.abc import Callable, Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from pydantic import ValidationError
 
@@ -10,13 +16,17 @@ from openhands.sdk.conversation.state import AgentExecutionStatus
 from openhands.sdk.event import (
     ActionEvent,
     AgentErrorEvent,
+    Event,
     LLMConvertibleEvent,
     MessageEvent,
     ObservationEvent,
     SystemPromptEvent,
 )
 from openhands.sdk.event.condenser import Condensation, CondensationRequest
+from openhands.sdk.event.streaming import StreamingDeltaEvent, ToolOutputDeltaEvent
 from openhands.sdk.llm import (
+    LLMResponse,
+    LLMStreamChunk,
     Message,
     MessageToolCall,
     RedactedThinkingBlock,
@@ -30,12 +40,15 @@ from openhands.sdk.tool import (
     Action,
     FinishTool,
     Observation,
+    tool_output_callback,
 )
 from openhands.sdk.tool.builtins import FinishAction
 
 
 logger = get_logger(__name__)
 
+_StepFlow = Generator[dict[str, Any], LLMResponse, None]
+
 
 class Agent(AgentBase):
     @property
@@ -70,6 +83,11 @@ class Agent(AgentBase):
                     # Wire the env provider and env masker for the bash executor
                     setattr(executable_tool.executor, "env_provider", env_for_cmd)
                     setattr(executable_tool.executor, "env_masker", env_masker)
+                    setattr(
+                        executable_tool.executor,
+                        "secret_max_length",
+                        secrets_manager.max_secret_length,
+                    )
                     execute_bash_exists = True
                 except NotImplementedError:
                     # Tool has no executor, skip it
@@ -125,17 +143,129 @@ class Agent(AgentBase):
         action_events: list[ActionEvent],
         on_event: ConversationCallbackType,
     ):
+        for batch in self._execution_batches(action_events):
+            if len(batch) == 1:
+                self._execute_action_event(state, batch[0], on_event=on_event)
+            else:
+                self._execute_concurrently(state, batch, on_event)
+
+    def _execution_batches(
+        self, action_events: list[ActionEvent]
+    ) -> list[list[ActionEvent]]:
+        """Group consecutive concurrency-safe actions; others run on their own.
+
+        Unsafe actions act as barriers, so every action still observes the
+        effects of all unsafe actions that precede it in the LLM response.
+        """
+        if self.max_parallel_tool_calls == 1:
+            return [[action_event] for action_event in action_events]
+
+        batches: list[list[ActionEvent]] = []
+        previous_safe = False
         for action_event in action_events:
-            self._execute_action_event(state, action_event, on_event=on_event)
+            tool = self.tools_map.get(action_event.tool_name)
+            safe = tool is not None and tool.concurrency_safe
+            if safe and previous_safe:
+                batches[-1].append(action_event)
+            else:
+                batches.append([action_event])
+            previous_safe = safe
+        return batches
+
+    def _execute_concurrently(
+        self,
+        state: ConversationState,
+        action_events: list[ActionEvent],
+        on_event: ConversationCallbackType,
+    ) -> None:
+        """Run a batch of concurrency-safe actions in a bounded thread pool.
+
+        Observations are emitted in the original call order, so the resulting
+        event history is the same as with sequential execution. The whole
+        batch is awaited first: a call that raised gets an AgentErrorEvent,
+        and the observations of its siblings are still emitted, so no action
+        that already ran is left pending.
+        """
+        # Live tool output is emitted from the worker threads, one at a time
+        lock = threading.Lock()
+
+        def on_output_event(event: Event) -> None:
+            with lock:
+                on_event(event)
+
+        workers = min(self.max_parallel_tool_calls, len(action_events))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="tool-call"
+        ) as pool:
+            futures = [
+                pool.submit(self._run_tool, a, on_output_event) for a in action_events
+            ]
+        # Leaving the pool waits for every call, failed or not
+        for action_event, future in zip(action_events, futures):
+            error = future.exception()
+            if error is None:
+                self._emit_observation(state, action_event, future.result(), on_event)
+            elif isinstance(error, Exception):
+                self._emit_tool_error(action_event, error, on_event)
+            else:
+                raise error
 
     def step(
         self,
         state: ConversationState,
         on_event: ConversationCallbackType,
     ) -> None:
+        flow = self._step_flow(state, on_event)
+        completion_kwargs = _start_flow(flow)
+        if completion_kwargs is None:
+            return
+        try:
+            llm_response = self.llm.completion(**completion_kwargs)
+        except Exception as e:
+            _finish_flow(flow.throw, e)
+            return
+        _finish_flow(flow.send, llm_response)
+
+    async def astep(
+        self,
+        state: ConversationState,
+        on_event: ConversationCallbackType,
+    ) -> None:
+        """Async `step`: awaits the LLM on the event loop.
+
+        Runs the same `_step_flow` as `step`. Its synchronous parts (which may
+        read events, run tools, or condense with a synchronous LLM call) run in
+        worker threads holding the state lock, so the event loop never waits
+        for the lock; the lock is released while the LLM call is awaited.
+        """
+        flow = self._step_flow(state, on_event)
+        completion_kwargs = await asyncio.to_thread(
+            self._locked, state, _start_flow, flow
+        )
+        if completion_kwargs is None:
+            return
+        try:
+            llm_response = await self.llm.acompletion(**completion_kwargs)
+        except Exception as e:
+            await asyncio.to_thread(self._locked, state, _finish_flow, flow.throw, e)
+            return
+        await asyncio.to_thread(
+            self._locked, state, _finish_flow, flow.send, llm_response
+        )
+
+    def _step_flow(
+        self,
+        state: ConversationState,
+        on_event: ConversationCallbackType,
+    ) -> _StepFlow:
+        """The steps of `step` around its LLM call, shared with `astep`.
+
+        Yields the completion kwargs if the step needs an LLM call, and is then
+        sent the response (or thrown the error the call raised).
+        """
         # Check for pending actions (implicit confirmation)
         # and execute them before sampling new actions.
-        pending_actions = ConversationState.get_unmatched_actions(state.events)
+        pending_actions = state.get_pending_actions()
         if pending_actions:
             logger.info(
                 "Confirmation mode: Executing %d pending action(s)",
@@ -149,54 +279,93 @@ class Agent(AgentBase):
         # of events, exactly as expected, or a new condensation that needs to be
         # processed before the agent can sample another action.
         if self.condenser is not None:
-            view = View.from_events(state.events)
-            condensation_result = self.condenser.condense(view)
+            condensation_result = self.condenser.condense(state.view)
+        else:
+            condensation_result = None
+        messages = self._prepare_messages(state, condensation_result, on_event)
+        if messages is None:
+            return
 
-            match condensation_result:
-                case View():
-                    llm_convertible_events = condensation_result.events
+        try:
+            llm_response = yield self._completion_kwargs(messages, on_event)
+        except Exception as e:
+            self._handle_completion_error(e, on_event)
+            return
 
-                case Condensation():
-                    on_event(condensation_result)
-                    return None
+        action_events = self._process_llm_response(state, llm_response, on_event)
+        if action_events:
+            self._execute_actions(state, action_events, on_event)
 
-        else:
-            llm_convertible_events = [
-                e for e in state.events if isinstance(e, LLMConvertibleEvent)
-            ]
+    def _prepare_messages(
+        self,
+        state: ConversationState,
+        condensation_result: View | Condensation | None,
+        on_event: ConversationCallbackType,
+    ) -> list[Message] | None:
+        """Messages to send to the LLM, or None if a condensation was emitted."""
+        match condensation_result:
+            case View():
+                llm_convertible_events = condensation_result.events
+
+            case Condensation():
+                on_event(condensation_result)
+                return None
+
+            case None:
+                llm_convertible_events = [
+                    e for e in state.events if isinstance(e, LLMConvertibleEvent)
+                ]
 
         # Get LLM Response (Action)
         _messages = LLMConvertibleEvent.events_to_messages(llm_convertible_events)
-        logger.debug(
-            "Sending messages to LLM: "
-            f"{json.dumps([m.model_dump() for m in _messages], indent=2)}"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sending messages to LLM: "
+                f"{json.dumps([m.model_dump() for m in _messages], indent=2)}"
+            )
+        return _messages
+
+    def _completion_kwargs(
+        self, messages: list[Message], on_event: ConversationCallbackType
+    ) -> dict[str, Any]:
+        # Forward streamed deltas so UIs can render the response as it arrives
+        def on_token(delta: LLMStreamChunk) -> None:
+            on_event(StreamingDeltaEvent(delta=delta))
+
+        return dict(
+            messages=messages,
+            tools=list(self.tools_map.values()),
+            extra_body={"metadata": self.llm.metadata},
+            add_security_risk_prediction=self._add_security_risk_prediction,
+            on_token=on_token if self.llm.stream else None,
         )
 
-        try:
-            llm_response = self.llm.completion(
-                messages=_messages,
-                tools=list(self.tools_map.values()),
-                extra_body={"metadata": self.llm.metadata},
-                add_security_risk_prediction=self._add_security_risk_prediction,
+    def _handle_completion_error(
+        self, e: Exception, on_event: ConversationCallbackType
+    ) -> None:
+        # If there is a condenser registered and the exception is a context window
+        # exceeded, we can recover by triggering a condensation request.
+        if (
+            self.condenser is not None
+            and self.condenser.handles_condensation_requests()
+            and self.llm.is_context_window_exceeded_exception(e)
+        ):
+            logger.warning(
+                "LLM raised context window exceeded error, triggering condensation"
             )
-        except Exception as e:
-            # If there is a condenser registered and the exception is a context window
-            # exceeded, we can recover by triggering a condensation request.
-            if (
-                self.condenser is not None
-                and self.condenser.handles_condensation_requests()
-                and self.llm.is_context_window_exceeded_exception(e)
-            ):
-                logger.warning(
-                    "LLM raised context window exceeded error, triggering condensation"
-                )
-                on_event(CondensationRequest())
-                return
+            on_event(CondensationRequest())
+            return
 
-            # If the error isn't recoverable, keep propagating it up the stack.
-            else:
-                raise e
+        # If the error isn't recoverable, keep propagating it up the stack.
+        raise e
 
+    def _process_llm_response(
+        self,
+        state: ConversationState,
+        llm_response: LLMResponse,
+        on_event: ConversationCallbackType,
+    ) -> list[ActionEvent]:
+        """Emit the events for an LLM response; return the actions to execute."""
         # LLMResponse already contains the converted message and metrics snapshot
         message: Message = llm_response.message
 
@@ -230,19 +399,18 @@ class Agent(AgentBase):
 
             # Handle confirmation mode - exit early if actions need confirmation
             if self._requires_user_confirmation(state, action_events):
-                return
+                return []
 
-            if action_events:
-                self._execute_actions(state, action_events, on_event)
+            return action_events
 
-        else:
-            logger.info("LLM produced a message response - awaits user input")
-            state.agent_status = AgentExecutionStatus.FINISHED
-            msg_event = MessageEvent(
-                source="agent",
-                llm_message=message,
-            )
-            on_event(msg_event)
+        logger.info("LLM produced a message response - awaits user input")
+        state.agent_status = AgentExecutionStatus.FINISHED
+        msg_event = MessageEvent(
+            source="agent",
+            llm_message=message,
+        )
+        on_event(msg_event)
+        return []
 
     def _requires_user_confirmation(
         self, state: ConversationState, action_events: list[ActionEvent]
@@ -371,7 +539,24 @@ class Agent(AgentBase):
         """Execute an action event and update the conversation state.
 
         It will call the tool's executor and update the state & call callback fn
-        with the observation.
+        with the observation. A tool that raises gets an AgentErrorEvent instead,
+        the same as a failed call in a concurrent batch.
+        """
+        try:
+            observation = self._run_tool(action_event, on_event)
+        except Exception as e:
+            return self._emit_tool_error(action_event, e, on_event)
+        return self._emit_observation(state, action_event, observation, on_event)
+
+    def _run_tool(
+        self,
+        action_event: ActionEvent,
+        on_event: ConversationCallbackType | None = None,
+    ) -> Observation:
+        """Call the tool's executor for an action.
+
+        Live output the tool publishes while it runs is emitted to `on_event` as
+        ToolOutputDeltaEvents; the observation itself is not emitted here.
         """
         tool = self.tools_map.get(action_event.tool_name, None)
         if tool is None:
@@ -380,21 +565,74 @@ class Agent(AgentBase):
                 "as it was checked earlier."
             )
 
-        # Execute actions!
-        observation: Observation = tool(action_event.action)
+        if on_event is None:
+            observation: Observation = tool(action_event.action)
+        else:
+
+            def on_output(output: str, skipped: int) -> None:
+                on_event(
+                    ToolOutputDeltaEvent(
+                        action_id=action_event.id,
+                        tool_name=action_event.tool_name,
+                        tool_call_id=action_event.tool_call.id,
+                        output=output,
+                        skipped=skipped,
+                    )
+                )
+
+            # Execute actions!
+            with tool_output_callback(on_output):
+                observation = tool(action_event.action)
         assert isinstance(observation, Observation), (
             f"Tool '{tool.name}' executor must return an Observation"
         )
+        return observation
+
+    def _emit_tool_error(
+        self,
+        action_event: ActionEvent,
+        error: Exception,
+        on_event: ConversationCallbackType,
+    ) -> AgentErrorEvent:
+        logger.error(f"Tool '{action_event.tool_name}' failed: {error}", exc_info=error)
+        error_event = AgentErrorEvent(
+            error=f"Error executing tool '{action_event.tool_name}': {error}",
+            tool_name=action_event.tool_name,
+            tool_call_id=action_event.tool_call.id,
+        )
+        on_event(error_event)
+        return error_event
 
+    def _emit_observation(
+        self,
+        state: ConversationState,
+        action_event: ActionEvent,
+        observation: Observation,
+        on_event: ConversationCallbackType,
+    ) -> ObservationEvent:
         obs_event = ObservationEvent(
             observation=observation,
             action_id=action_event.id,
-            tool_name=tool.name,
+            tool_name=action_event.tool_name,
             tool_call_id=action_event.tool_call.id,
         )
         on_event(obs_event)
 
         # Set conversation state
-        if tool.name == FinishTool.name:
+        if action_event.tool_name == FinishTool.name:
             state.agent_status = AgentExecutionStatus.FINISHED
         return obs_event
+
+
+def _start_flow(flow: _StepFlow) -> dict[str, Any] | None:
+    """Run a `_step_flow` up to its LLM call; its kwargs, or None if none."""
+    return next(flow, None)
+
+
+def _finish_flow(resume: Callable[[Any], Any], value: Any) -> None:
+    """Resume a `_step_flow` after its LLM call and run it to the end."""
+    try:
+        resume(value)
+    except StopIteration:
+        return
+    raise RuntimeError("Agent step flow yielded more than one LLM call")
@@ -1,8 +1,9 @@
+import asyncio
 import os
 import re
 import sys
 from abc import ABC, abstractmethod
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Iterable
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
@@ -133,6 +134,15 @@ class AgentBase(DiscriminatedUnionMixin, ABC):
         ],
     )
 
+    max_parallel_tool_calls: int = Field(
+        default=1,
+        ge=1,
+        description="Maximum number of tool calls from one LLM response to run "
+        "concurrently. Only tools that opt in with `concurrency_safe` are run in "
+        "parallel; observations are still emitted in the original call order. "
+        "1 disables parallelism.",
+    )
+
     # Runtime materialized tools; private and non-serializable
     _tools: dict[str, ToolDefinition] = PrivateAttr(default_factory=dict)
 
@@ -250,6 +260,26 @@ class AgentBase(DiscriminatedUnionMixin, ABC):
         NOTE: state will be mutated in-place.
         """
 
+    async def astep(
+        self,
+        state: "ConversationState",
+        on_event: "ConversationCallbackType",
+    ) -> None:
+        """Async variant of `step`, used by `LocalConversation.arun`.
+
+        Unlike `step`, it is called without the state lock held, and takes the
+        lock itself around the synchronous parts of the step. The default runs
+        all of `step` in a worker thread holding the lock; agents with async
+        LLM support override it to await the LLM on the event loop instead.
+        """
+        await asyncio.to_thread(self._locked, state, self.step, state, on_event)
+
+    @staticmethod
+    def _locked[T](state: "ConversationState", func: Callable[..., T], *args: Any) -> T:
+        """Call `func(*args)` holding the state lock, e.g. in a worker thread."""
+        with state:
+            return func(*args)
+
     def resolve_diff_from_deserialized(self, persisted: "AgentBase") -> "AgentBase":
         """
         Return a new AgentBase instance equivalent to `persisted` but with
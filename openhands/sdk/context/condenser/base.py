@@ -67,8 +67,9 @@ class RollingCondenser(PipelinableCondenserBase, ABC):
     """Base class for a specialized condenser strategy that applies condensation to a
     rolling history.
 
-    The rolling history is generated by `View.from_events`, which analyzes all events in
-    the history and produces a `View` object representing what will be sent to the LLM.
+    The rolling history is the `View` maintained by `ConversationState.view` (equivalent
+    to `View.from_events` over all events in the history), representing what will be
+    sent to the LLM.
 
     If `should_condense` says so, the condenser is then responsible for generating a
     `Condensation` object from the `View` object. This will be added to the event
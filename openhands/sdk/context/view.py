@@ -199,3 +199,107 @@ class View(BaseModel):
             unhandled_condensation_request=unhandled_condensation_request,
             condensations=condensations,
         )
+
+
+class IncrementalView:
+    """A `View` over an append-only event log, maintained as events arrive.
+
+    Produces the same result as `View.from_events` on the full history, but each
+    appended event is folded in once: forgotten ids, kept events (in an ordered
+    dict so forgetting is O(1)) and per-tool-call-id action/observation counts are
+    updated in place, so keeping up with the log costs O(1) amortized per event
+    (O(len(forgotten_event_ids)) for a `Condensation`, which forgets each event at
+    most once). Materializing the `View` costs O(len(view)), which a condenser
+    keeps bounded regardless of how long the history grows.
+
+    Call `update` with the full event sequence; only events past the last seen
+    position are processed. If the sequence shrinks, the view is rebuilt.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._position = 0
+        self._forgotten: set[EventID] = set()
+        self._kept: dict[EventID, LLMConvertibleEvent] = {}
+        self._action_calls: dict[ToolCallID, int] = {}
+        self._observation_calls: dict[ToolCallID, int] = {}
+        self._condensations: list[Condensation] = []
+        self._summary_event: CondensationSummaryEvent | None = None
+        self._summary_offset: int | None = None
+        self._unhandled_condensation_request = False
+        self._view: View | None = None
+
+    def __len__(self) -> int:
+        """Number of events processed so far."""
+        return self._position
+
+    def update(self, events: Sequence[Event]) -> View:
+        """Fold any new events into the view and return the current `View`."""
+        if len(events) < self._position:
+            self._reset()
+        for i in range(self._position, len(events)):
+            self.append(events[i])
+        return self.view
+
+    def append(self, event: Event) -> None:
+        """Fold a single newly appended event into the view."""
+        self._position += 1
+        self._view = None
+        if isinstance(event, Condensation):
+            self._condensations.append(event)
+            self._unhandled_condensation_request = False
+            self._forgotten.add(event.id)
+            for forgotten_id in event.forgotten_event_ids:
+                self._forgotten.add(forgotten_id)
+                forgotten = self._kept.pop(forgotten_id, None)
+                if forgotten is not None:
+                    self._count_tool_call(forgotten, -1)
+            if event.summary is not None and event.summary_offset is not None:
+                self._summary_event = CondensationSummaryEvent(summary=event.summary)
+                self._summary_offset = event.summary_offset
+        elif isinstance(event, CondensationRequest):
+            self._unhandled_condensation_request = True
+            self._forgotten.add(event.id)
+        elif isinstance(event, LLMConvertibleEvent):
+            if event.id in self._forgotten:
+                return
+            self._kept[event.id] = event
+            self._count_tool_call(event, 1)
+
+    @property
+    def view(self) -> View:
+        """The `View` for all events processed so far (cached until changed)."""
+        if self._view is None:
+            kept_events = list(self._kept.values())
+            if self._summary_event is not None and self._summary_offset is not None:
+                kept_events.insert(self._summary_offset, self._summary_event)
+            self._view = View(
+                events=[e for e in kept_events if self._is_matched(e)],
+                unhandled_condensation_request=self._unhandled_condensation_request,
+                condensations=list(self._condensations),
+            )
+        return self._view
+
+    def _count_tool_call(self, event: LLMConvertibleEvent, delta: int) -> None:
+        if isinstance(event, ActionEvent):
+            counts, key = self._action_calls, event.tool_call_id
+        elif isinstance(event, ObservationBaseEvent):
+            counts, key = self._observation_calls, event.tool_call_id
+        else:
+            return
+        remaining = counts.get(key, 0) + delta
+        if remaining > 0:
+            counts[key] = remaining
+        else:
+            counts.pop(key, None)
+
+    def _is_matched(self, event: LLMConvertibleEvent) -> bool:
+        """Incremental equivalent of `View._should_keep_event`."""
+        if isinstance(event, ObservationBaseEvent):
+            return event.tool_call_id in self._action_calls
+        elif isinstance(event, ActionEvent):
+            return event.tool_call_id in self._observation_calls
+        else:
+            return True
@@ -1,5 +1,6 @@
 from openhands.sdk.conversation.base import BaseConversation
 from openhands.sdk.conversation.conversation import Conversation
+from openhands.sdk.conversation.event_journal import JournalEventLog
 from openhands.sdk.conversation.event_store import EventLog
 from openhands.sdk.conversation.events_list_base import EventsListBase
 from openhands.sdk.conversation.impl.local_conversation import LocalConversation
@@ -20,6 +21,7 @@ __all__ = [
     "SecretsManager",
     "StuckDetector",
     "EventLog",
+    "JournalEventLog",
     "LocalConversation",
     "RemoteConversation",
     "EventsListBase",
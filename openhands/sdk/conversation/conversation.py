@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Self, overload
 from openhands.sdk.agent.base import AgentBase
 from openhands.sdk.conversation.base import BaseConversation
 from openhands.sdk.conversation.secrets_manager import SecretValue
+from openhands.sdk.conversation.state import EventBackend
 from openhands.sdk.conversation.types import ConversationCallbackType, ConversationID
 from openhands.sdk.logger import get_logger
 from openhands.sdk.workspace import LocalWorkspace, RemoteWorkspace
@@ -36,6 +37,7 @@ class Conversation:
         stuck_detection: bool = True,
         visualize: bool = True,
         secrets: dict[str, SecretValue] | dict[str, str] | None = None,
+        event_backend: EventBackend = "files",
     ) -> "LocalConversation": ...
 
     @overload
@@ -64,6 +66,7 @@ class Conversation:
         stuck_detection: bool = True,
         visualize: bool = True,
         secrets: dict[str, SecretValue] | dict[str, str] | None = None,
+        event_backend: EventBackend = "files",
     ) -> BaseConversation:
         from openhands.sdk.conversation.impl.local_conversation import LocalConversation
         from openhands.sdk.conversation.impl.remote_conversation import (
@@ -98,4 +101,5 @@ class Conversation:
             workspace=workspace,
             persistence_dir=persistence_dir,
             secrets=secrets,
+            event_backend=event_backend,
         )
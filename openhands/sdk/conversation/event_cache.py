@@ -0,0 +1,100 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from openhands.sdk.event import Event
+
+
+DEFAULT_CACHE_MAX_EVENTS = 10_000
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256 MiB of serialized JSON
+
+
+@dataclass(frozen=True)
+class EventCacheStats:
+    """Point-in-time counters for an EventCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    bytes: int
+
+
+class EventCache:
+    """Bounded LRU cache of decoded events keyed by their log index.
+
+    Each entry is charged the length of the event's serialized JSON, which is
+    already known on both the write path (append) and the read path (file
+    contents), so accounting adds no extra serialization. Events are frozen
+    pydantic models, so cached instances can be shared with callers safely.
+
+    A budget of 0 for either limit disables caching entirely.
+    """
+
+    def __init__(
+        self,
+        max_events: int = DEFAULT_CACHE_MAX_EVENTS,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        if max_events < 0 or max_bytes < 0:
+            raise ValueError("Cache budgets must be non-negative")
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[int, tuple[Event, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_events > 0 and self.max_bytes > 0
+
+    def get(self, idx: int) -> Event | None:
+        """Return the cached event at ``idx`` and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(idx)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(idx)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, idx: int, event: Event, size: int) -> None:
+        """Insert ``event`` at ``idx``, evicting least recently used entries."""
+        if not self.enabled or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(idx, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[idx] = (event, size)
+            self._bytes += size
+            while len(self._entries) > self.max_events or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, idx: object) -> bool:
+        return idx in self._entries
+
+    @property
+    def stats(self) -> EventCacheStats:
+        with self._lock:
+            return EventCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                bytes=self._bytes,
+            )
@@ -0,0 +1,558 @@
+"""Append-only, segmented event journal.
+
+An alternative to the one-JSON-file-per-event layout used by ``EventLog``.
+Events are stored as length-prefixed records in rotating segment files::
+
+    <root>/segment-00000000.log   [u32 length][u32 crc32][json bytes] ...
+    <root>/segment-00000001.log
+    <root>/index.log              [u32 segment][u64 offset][u32 length]
+                                  [u16 id length][id bytes] ...
+
+The sidecar index maps every event index to its record location, so resuming
+a conversation is a single sequential read of ``index.log`` instead of a
+directory listing, and random access by index or id is one ``pread``. Records
+that reached a segment but not the index (e.g. after a crash between the two
+writes) are recovered on open; torn trailing records are truncated.
+
+Every open journal holds a shared ``flock`` on ``<root>.lock`` (next to the
+journal directory, since compaction renames the directory). Compaction needs
+the lock exclusively, so it refuses to run while the journal is open anywhere
+else, and a journal cannot be opened while it is being compacted.
+
+Usage as a maintenance tool::
+
+    python -m openhands.sdk.conversation.event_journal migrate <persistence_dir>
+    python -m openhands.sdk.conversation.event_journal compact <persistence_dir>
+    python -m openhands.sdk.conversation.event_journal stats <persistence_dir>
+"""
+
+import argparse
+import json
+import operator
+import os
+import struct
+import zlib
+from collections.abc import Iterator
+from typing import IO, SupportsIndex, overload
+
+from openhands.sdk.conversation.event_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_CACHE_MAX_EVENTS,
+    EventCache,
+    EventCacheStats,
+)
+from openhands.sdk.conversation.events_list_base import EventsListBase
+from openhands.sdk.conversation.persistence_const import (
+    BASE_STATE,
+    EVENTS_DIR,
+    EVENTS_JOURNAL_DIR,
+)
+from openhands.sdk.event import Event, EventID
+from openhands.sdk.logger import get_logger
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+logger = get_logger(__name__)
+
+DEFAULT_SEGMENT_MAX_BYTES = 16 * 1024 * 1024
+
+SEGMENT_FILE_PATTERN = "segment-{segment:08d}.log"
+INDEX_FILE = "index.log"
+LOCK_SUFFIX = ".lock"
+COMPACT_SUFFIX = ".compact"
+OLD_SUFFIX = ".old"
+MIGRATE_SUFFIX = ".migrate"
+
+_RECORD_HEADER = struct.Struct(">II")  # payload length, crc32
+_INDEX_HEADER = struct.Struct(">IQIH")  # segment, offset, payload length, id length
+
+
+class JournalLockedError(RuntimeError):
+    """The journal is in use by another instance or process."""
+
+
+class JournalEventLog(EventsListBase):
+    """Event sequence persisted as an append-only segmented journal.
+
+    Exposes the same interface as ``EventLog`` (including the decoded-event
+    cache) but needs a local directory, since segments are appended in place
+    rather than rewritten through a ``FileStore``. Call ``close`` to release
+    the journal lock; it is otherwise released when the object is collected.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        *,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        fsync: bool = False,
+        cache_max_events: int = DEFAULT_CACHE_MAX_EVENTS,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        if segment_max_bytes <= 0:
+            raise ValueError("segment_max_bytes must be positive")
+        self._root = os.path.abspath(os.path.expanduser(root))
+        self._segment_max_bytes = segment_max_bytes
+        self._fsync = fsync
+        self._cache = EventCache(max_events=cache_max_events, max_bytes=cache_max_bytes)
+        # Parallel arrays indexed by event index
+        self._locations: list[tuple[int, int, int]] = []
+        self._ids: list[EventID] = []
+        self._id_to_idx: dict[EventID, int] = {}
+        self._segment = 0
+        self._segment_size = 0
+        self._lock_file: IO[bytes] | None = None
+        self._acquire_lock()
+        self._recover_compaction()
+        os.makedirs(self._root, exist_ok=True)
+        self._load()
+
+    @property
+    def root(self) -> str:
+        return self._root
+
+    @property
+    def cache_stats(self) -> EventCacheStats:
+        """Hit/miss/eviction counters and current footprint of the event cache."""
+        return self._cache.stats
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._segment_numbers())
+
+    def get_index(self, event_id: EventID) -> int:
+        """Return the integer index for a given event_id."""
+        try:
+            return self._id_to_idx[event_id]
+        except KeyError:
+            raise KeyError(f"Unknown event_id: {event_id}")
+
+    def get_id(self, idx: int) -> EventID:
+        """Return the event_id for a given index."""
+        if idx < 0:
+            idx += len(self._ids)
+        if idx < 0 or idx >= len(self._ids):
+            raise IndexError("Event index out of range")
+        return self._ids[idx]
+
+    @overload
+    def __getitem__(self, idx: int) -> Event: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[Event]: ...
+
+    def __getitem__(self, idx: SupportsIndex | slice) -> Event | list[Event]:
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self._ids))
+            return [self._get_single_item(i) for i in range(start, stop, step)]
+        return self._get_single_item(idx)
+
+    def _get_single_item(self, idx: SupportsIndex) -> Event:
+        i = operator.index(idx)
+        if i < 0:
+            i += len(self._ids)
+        if i < 0 or i >= len(self._ids):
+            raise IndexError("Event index out of range")
+        evt = self._cache.get(i)
+        if evt is not None:
+            return evt
+        payload = self._read_payload(i)
+        evt = Event.model_validate_json(payload)
+        self._cache.put(i, evt, len(payload))
+        return evt
+
+    def __iter__(self) -> Iterator[Event]:
+        for i in range(len(self._ids)):
+            yield self._get_single_item(i)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def append(self, event: Event) -> None:
+        evt_id = event.id
+        if evt_id in self._id_to_idx:
+            existing_idx = self._id_to_idx[evt_id]
+            raise ValueError(
+                f"Event with ID '{evt_id}' already exists at index {existing_idx}"
+            )
+
+        payload = event.model_dump_json(exclude_none=True).encode("utf-8")
+        self._append_raw(evt_id, payload)
+        self._cache.put(len(self._ids) - 1, event, len(payload))
+        if self._on_append is not None:
+            self._on_append(len(self._ids) - 1, event)
+
+    def close(self) -> None:
+        """Release the journal lock. The instance must not be used afterwards."""
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def compact(self) -> None:
+        """Rewrite the journal into densely packed segments and a fresh index.
+
+        Merges undersized segments (e.g. after lowering ``segment_max_bytes`` or
+        after a migration), and drops bytes no longer referenced by the index.
+        The new journal is written next to the old one and swapped in with
+        renames; opening the journal finishes or rolls back a swap that was
+        interrupted. Raises ``JournalLockedError`` if the journal is open in
+        another instance or process, whose appends would otherwise be lost.
+        """
+        self._lock(exclusive=True)
+        try:
+            self._compact()
+        finally:
+            self._lock(exclusive=False)
+
+    def _compact(self) -> None:
+        # Other instances may have appended before they released the lock
+        self._load()
+        tmp_root = self._root + COMPACT_SUFFIX
+        if os.path.exists(tmp_root):
+            _remove_tree(tmp_root)
+        compacted = JournalEventLog(
+            tmp_root,
+            segment_max_bytes=self._segment_max_bytes,
+            fsync=self._fsync,
+            cache_max_events=0,
+        )
+        for i in range(len(self._ids)):
+            compacted._append_raw(self._ids[i], self._read_payload(i))
+        compacted.close()
+        _remove_file(tmp_root + LOCK_SUFFIX)
+
+        old_root = self._root + OLD_SUFFIX
+        if os.path.exists(old_root):
+            _remove_tree(old_root)
+        # A crash after this rename leaves only `old_root`, which the next
+        # open moves back into place
+        os.replace(self._root, old_root)
+        os.replace(tmp_root, self._root)
+        _remove_tree(old_root)
+
+        self._cache.clear()
+        self._load()
+
+    # ===== internals =====
+
+    def _acquire_lock(self) -> None:
+        if fcntl is None:
+            return
+        os.makedirs(os.path.dirname(self._root), exist_ok=True)
+        self._lock_file = open(self._root + LOCK_SUFFIX, "ab")
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self.close()
+            raise JournalLockedError(
+                f"Event journal {self._root} is being compacted"
+            ) from None
+
+    def _lock(self, *, exclusive: bool) -> None:
+        """Switch the journal lock between shared and exclusive."""
+        if self._lock_file is None or fcntl is None:
+            return
+        if not exclusive:
+            fcntl.flock(self._lock_file, fcntl.LOCK_SH)
+            return
+        try:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # flock may drop the shared lock while trying to convert it
+            fcntl.flock(self._lock_file, fcntl.LOCK_SH)
+            raise JournalLockedError(
+                f"Event journal {self._root} is open elsewhere; close it before "
+                "compacting"
+            ) from None
+
+    def _recover_compaction(self) -> None:
+        """Finish or roll back a compaction that was interrupted by a crash.
+
+        The compacted copy only replaces the journal once it is complete, so a
+        leftover ``.compact`` directory is always discarded. A leftover ``.old``
+        directory is the original journal: it is moved back if the swap did not
+        complete, and deleted if it did.
+        """
+        old_root = self._root + OLD_SUFFIX
+        if os.path.exists(old_root):
+            if os.path.exists(self._root):
+                _remove_tree(old_root)
+            else:
+                logger.warning("Restoring event journal from interrupted compaction")
+                os.replace(old_root, self._root)
+        tmp_root = self._root + COMPACT_SUFFIX
+        if os.path.exists(tmp_root):
+            _remove_tree(tmp_root)
+        _remove_file(tmp_root + LOCK_SUFFIX)
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self._root, SEGMENT_FILE_PATTERN.format(segment=segment))
+
+    def _index_path(self) -> str:
+        return os.path.join(self._root, INDEX_FILE)
+
+    def _segment_numbers(self) -> list[int]:
+        numbers = []
+        for name in os.listdir(self._root):
+            if name.startswith("segment-") and name.endswith(".log"):
+                try:
+                    numbers.append(int(name[len("segment-") : -len(".log")]))
+                except ValueError:
+                    logger.warning(f"Unrecognized journal file name: {name}")
+        return sorted(numbers)
+
+    def _append_bytes(self, path: str, data: bytes) -> None:
+        with open(path, "ab") as f:
+            f.write(data)
+            if self._fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _append_raw(self, evt_id: EventID, payload: bytes) -> None:
+        """Write a serialized event to the current segment and the index."""
+        record_size = _RECORD_HEADER.size + len(payload)
+        if (
+            self._segment_size > 0
+            and self._segment_size + record_size > self._segment_max_bytes
+        ):
+            self._segment += 1
+            self._segment_size = 0
+        offset = self._segment_size
+        record = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        self._append_bytes(self._segment_path(self._segment), record)
+        self._append_bytes(
+            self._index_path(),
+            _encode_index_entry(self._segment, offset, len(payload), evt_id),
+        )
+        self._segment_size += record_size
+        self._locations.append((self._segment, offset, len(payload)))
+        self._id_to_idx.setdefault(evt_id, len(self._ids))
+        self._ids.append(evt_id)
+
+    def _read_payload(self, idx: int) -> bytes:
+        segment, offset, length = self._locations[idx]
+        path = self._segment_path(segment)
+        with open(path, "rb") as f:
+            f.seek(offset + _RECORD_HEADER.size)
+            payload = f.read(length)
+        if len(payload) != length:
+            raise FileNotFoundError(f"Truncated event record {idx} in {path}")
+        return payload
+
+    def _load(self) -> None:
+        """Rebuild in-memory index from index.log, recovering unindexed records."""
+        self._locations.clear()
+        self._ids.clear()
+        self._id_to_idx.clear()
+
+        index_path = self._index_path()
+        data = b""
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as f:
+                data = f.read()
+
+        pos = 0
+        valid_end = 0
+        while pos + _INDEX_HEADER.size <= len(data):
+            segment, offset, length, id_len = _INDEX_HEADER.unpack_from(data, pos)
+            end = pos + _INDEX_HEADER.size + id_len
+            if end > len(data):
+                break
+            evt_id = data[pos + _INDEX_HEADER.size : end].decode("utf-8")
+            self._register(evt_id, (segment, offset, length))
+            pos = valid_end = end
+
+        if valid_end != len(data):
+            logger.warning(
+                f"Truncating torn index entry in {index_path} "
+                f"({len(data) - valid_end} bytes)"
+            )
+            with open(index_path, "r+b") as f:
+                f.truncate(valid_end)
+
+        segments = self._segment_numbers()
+        if self._locations:
+            last_segment, last_offset, last_length = self._locations[-1]
+            self._segment = last_segment
+            self._segment_size = last_offset + _RECORD_HEADER.size + last_length
+        elif segments:
+            self._segment = segments[0]
+            self._segment_size = 0
+        else:
+            self._segment = 0
+            self._segment_size = 0
+            return
+
+        self._recover_unindexed(segments)
+
+    def _recover_unindexed(self, segments: list[int]) -> None:
+        """Index records written to segments after the last index entry."""
+        for segment in [s for s in segments if s >= self._segment]:
+            if segment != self._segment:
+                self._segment = segment
+                self._segment_size = 0
+            path = self._segment_path(segment)
+            with open(path, "rb") as f:
+                f.seek(self._segment_size)
+                tail = f.read()
+            pos = 0
+            while pos + _RECORD_HEADER.size <= len(tail):
+                length, crc = _RECORD_HEADER.unpack_from(tail, pos)
+                start = pos + _RECORD_HEADER.size
+                payload = tail[start : start + length]
+                if len(payload) != length or zlib.crc32(payload) != crc:
+                    break
+                evt_id = json.loads(payload)["id"]
+                offset = self._segment_size + pos
+                self._append_bytes(
+                    self._index_path(),
+                    _encode_index_entry(segment, offset, length, evt_id),
+                )
+                self._register(evt_id, (segment, offset, length))
+                logger.info(f"Recovered unindexed event {evt_id} from {path}")
+                pos = start + length
+            if pos != len(tail):
+                logger.warning(
+                    f"Truncating torn record in {path} ({len(tail) - pos} bytes)"
+                )
+                with open(path, "r+b") as f:
+                    f.truncate(self._segment_size + pos)
+            self._segment_size += pos
+
+    def _register(self, evt_id: EventID, location: tuple[int, int, int]) -> None:
+        idx = len(self._ids)
+        if evt_id in self._id_to_idx:
+            logger.warning(
+                f"Duplicate event ID '{evt_id}' found in journal. "
+                f"Keeping first occurrence at index {self._id_to_idx[evt_id]}, "
+                f"ignoring duplicate at index {idx}"
+            )
+        else:
+            self._id_to_idx[evt_id] = idx
+        self._ids.append(evt_id)
+        self._locations.append(location)
+
+
+def _encode_index_entry(segment: int, offset: int, length: int, evt_id: str) -> bytes:
+    raw_id = evt_id.encode("utf-8")
+    return _INDEX_HEADER.pack(segment, offset, length, len(raw_id)) + raw_id
+
+
+def _remove_tree(path: str) -> None:
+    for name in os.listdir(path):
+        os.remove(os.path.join(path, name))
+    os.rmdir(path)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def migrate_to_journal(
+    persistence_dir: str,
+    *,
+    remove_legacy: bool = False,
+    segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+) -> int:
+    """Copy a conversation's per-file events into an event journal.
+
+    The conversation's ``base_state.json`` is switched to the journal backend
+    so that it is picked up on the next resume. Returns the number of events
+    migrated. Legacy event files are kept unless ``remove_legacy`` is set.
+
+    The journal is written next to its final location and renamed into place
+    once complete, so an interrupted migration leaves nothing behind that
+    would make it fail when run again.
+    """
+    from openhands.sdk.conversation.event_store import EventLog
+    from openhands.sdk.io import LocalFileStore
+
+    fs = LocalFileStore(persistence_dir)
+    journal_root = os.path.join(fs.root, EVENTS_JOURNAL_DIR)
+    if os.path.exists(os.path.join(journal_root, INDEX_FILE)):
+        raise FileExistsError(f"Event journal already exists at {journal_root}")
+
+    tmp_root = journal_root + MIGRATE_SUFFIX
+    if os.path.exists(tmp_root):
+        _remove_tree(tmp_root)
+    legacy = EventLog(fs, dir_path=EVENTS_DIR, cache_max_events=0)
+    journal = JournalEventLog(
+        tmp_root, segment_max_bytes=segment_max_bytes, cache_max_events=0
+    )
+    for i in range(len(legacy)):
+        txt = fs.read(legacy._path(i))
+        journal._append_raw(legacy.get_id(i), txt.encode("utf-8"))
+    count = len(journal)
+    journal.close()
+    _remove_file(tmp_root + LOCK_SUFFIX)
+    os.replace(tmp_root, journal_root)
+
+    base_path = os.path.join(fs.root, BASE_STATE)
+    if os.path.exists(base_path):
+        with open(base_path, encoding="utf-8") as f:
+            base_state = json.load(f)
+        base_state["event_backend"] = "journal"
+        fs.write(BASE_STATE, json.dumps(base_state))
+
+    if remove_legacy:
+        fs.delete(EVENTS_DIR)
+    return count
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="OpenHands event journal tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    migrate = sub.add_parser(
+        "migrate", help="Convert per-file events of a conversation to a journal"
+    )
+    migrate.add_argument("persistence_dir")
+    migrate.add_argument(
+        "--remove-legacy",
+        action="store_true",
+        help="Delete the per-file events after a successful migration",
+    )
+
+    compact = sub.add_parser("compact", help="Rewrite a journal into full segments")
+    compact.add_argument("persistence_dir")
+    compact.add_argument(
+        "--segment-max-bytes", type=int, default=DEFAULT_SEGMENT_MAX_BYTES
+    )
+
+    stats = sub.add_parser("stats", help="Show journal size information")
+    stats.add_argument("persistence_dir")
+
+    args = parser.parse_args(argv)
+    if args.command == "migrate":
+        n = migrate_to_journal(args.persistence_dir, remove_legacy=args.remove_legacy)
+        print(f"Migrated {n} events")
+        return
+
+    root = os.path.join(args.persistence_dir, EVENTS_JOURNAL_DIR)
+    if not os.path.exists(os.path.join(root, INDEX_FILE)):
+        parser.error(f"No event journal found at {root}")
+    if args.command == "compact":
+        journal = JournalEventLog(
+            root, segment_max_bytes=args.segment_max_bytes, cache_max_events=0
+        )
+        before = journal.segment_count
+        journal.compact()
+        print(
+            f"Compacted {len(journal)} events: {before} -> "
+            f"{journal.segment_count} segments"
+        )
+    else:
+        journal = JournalEventLog(root, cache_max_events=0)
+        print(f"events: {len(journal)}, segments: {journal.segment_count}")
+
+
+if __name__ == "__main__":
+    main()
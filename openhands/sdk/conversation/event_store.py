@@ -3,6 +3,12 @@ import operator
 from collections.abc import Iterator
 from typing import SupportsIndex, overload
 
+from openhands.sdk.conversation.event_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_CACHE_MAX_EVENTS,
+    EventCache,
+    EventCacheStats,
+)
 from openhands.sdk.conversation.events_list_base import EventsListBase
 from openhands.sdk.conversation.persistence_const import (
     EVENT_FILE_PATTERN,
@@ -18,9 +24,25 @@ logger = get_logger(__name__)
 
 
 class EventLog(EventsListBase):
-    def __init__(self, fs: FileStore, dir_path: str = EVENTS_DIR) -> None:
+    """File-backed event sequence with a write-through decoded-event cache.
+
+    Every appended event is persisted to the FileStore and kept decoded in an
+    LRU cache, so repeated scans of the log (once per agent step) are served
+    from memory. Reads only hit the FileStore for events that were evicted or
+    that predate this instance (e.g. right after resuming a conversation).
+    """
+
+    def __init__(
+        self,
+        fs: FileStore,
+        dir_path: str = EVENTS_DIR,
+        *,
+        cache_max_events: int = DEFAULT_CACHE_MAX_EVENTS,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
         self._fs = fs
         self._dir = dir_path
+        self._cache = EventCache(max_events=cache_max_events, max_bytes=cache_max_bytes)
         self._id_to_idx: dict[EventID, int] = {}
         self._idx_to_id: dict[int, EventID] = {}
         self._length = self._scan_and_build_index()
@@ -32,6 +54,11 @@ class EventLog(EventsListBase):
         except KeyError:
             raise KeyError(f"Unknown event_id: {event_id}")
 
+    @property
+    def cache_stats(self) -> EventCacheStats:
+        """Hit/miss/eviction counters and current footprint of the event cache."""
+        return self._cache.stats
+
     def get_id(self, idx: int) -> EventID:
         """Return the event_id for a given index."""
         if idx < 0:
@@ -59,17 +86,32 @@ class EventLog(EventsListBase):
             i += self._length
         if i < 0 or i >= self._length:
             raise IndexError("Event index out of range")
-        txt = self._fs.read(self._path(i))
-        if not txt:
+        evt = self._cache.get(i)
+        if evt is not None:
+            return evt
+        evt = self._load(i)
+        if evt is None:
             raise FileNotFoundError(f"Missing event file: {self._path(i)}")
-        return Event.model_validate_json(txt)
+        return evt
+
+    def _load(self, idx: int) -> Event | None:
+        """Read and decode the event at ``idx`` from the FileStore, caching it."""
+        txt = self._fs.read(self._path(idx))
+        if not txt:
+            return None
+        evt = Event.model_validate_json(txt)
+        self._cache.put(idx, evt, len(txt))
+        return evt
 
     def __iter__(self) -> Iterator[Event]:
         for i in range(self._length):
-            txt = self._fs.read(self._path(i))
-            if not txt:
+            evt = self._cache.get(i)
+            if evt is not None:
+                yield evt
+                continue
+            evt = self._load(i)
+            if evt is None:
                 continue
-            evt = Event.model_validate_json(txt)
             evt_id = evt.id
             # only backfill mapping if missing
             if i not in self._idx_to_id:
@@ -87,10 +129,14 @@ class EventLog(EventsListBase):
             )
 
         path = self._path(self._length, event_id=evt_id)
-        self._fs.write(path, event.model_dump_json(exclude_none=True))
+        payload = event.model_dump_json(exclude_none=True)
+        self._fs.write(path, payload)
+        self._cache.put(self._length, event, len(payload))
         self._idx_to_id[self._length] = evt_id
         self._id_to_idx[evt_id] = self._length
         self._length += 1
+        if self._on_append is not None:
+            self._on_append(self._length - 1, event)
 
     def __len__(self) -> int:
         return self._length
@@ -103,6 +149,7 @@ class EventLog(EventsListBase):
         }"
 
     def _scan_and_build_index(self) -> int:
+        self._cache.clear()
         try:
             paths = self._fs.list(self._dir)
         except Exception:
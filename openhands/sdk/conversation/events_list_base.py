@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 
 from openhands.sdk.event import Event
 
@@ -11,7 +11,18 @@ class EventsListBase(Sequence[Event], ABC):
     RemoteEventsList implementations, avoiding circular imports in protocols.
     """
 
+    _on_append: Callable[[int, Event], None] | None = None
+
     @abstractmethod
     def append(self, event: Event) -> None:
         """Add a new event to the list."""
         ...
+
+    def set_on_append(self, callback: Callable[[int, Event], None] | None) -> None:
+        """Set a callback to be called after each append.
+
+        Args:
+            callback: A function that takes the position and the event just
+                     appended, or None to remove the callback
+        """
+        self._on_append = callback
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 from collections.abc import Mapping
 from pathlib import Path
@@ -5,11 +6,16 @@ from pathlib import Path
 from openhands.sdk.agent.base import AgentBase
 from openhands.sdk.conversation.base import BaseConversation
 from openhands.sdk.conversation.secrets_manager import SecretValue
-from openhands.sdk.conversation.state import AgentExecutionStatus, ConversationState
+from openhands.sdk.conversation.state import (
+    AgentExecutionStatus,
+    ConversationState,
+    EventBackend,
+)
 from openhands.sdk.conversation.stuck_detector import StuckDetector
 from openhands.sdk.conversation.types import ConversationCallbackType, ConversationID
 from openhands.sdk.conversation.visualizer import create_default_visualizer
 from openhands.sdk.event import (
+    EphemeralEvent,
     MessageEvent,
     PauseEvent,
     UserRejectObservation,
@@ -38,6 +44,7 @@ class LocalConversation(BaseConversation):
         stuck_detection: bool = True,
         visualize: bool = True,
         secrets: Mapping[str, SecretValue] | None = None,
+        event_backend: EventBackend = "files",
         **_: object,
     ):
         """Initialize the conversation.
@@ -55,6 +62,9 @@ class LocalConversation(BaseConversation):
                       a default visualizer callback. If False, relies on
                       application to provide visualization through callbacks.
             stuck_detection: Whether to enable stuck detection
+            event_backend: How events are persisted for new conversations
+                      ("files" or "journal"); resumed conversations keep the
+                      backend they were created with.
         """
         self.agent = agent
         if isinstance(workspace, str):
@@ -77,10 +87,14 @@ class LocalConversation(BaseConversation):
             else None,
             max_iterations=max_iteration_per_run,
             stuck_detection=stuck_detection,
+            event_backend=event_backend,
         )
 
-        # Default callback: persist every event to state
+        # Default callback: persist every event to state (except ephemeral
+        # ones like streaming deltas, which only matter while something runs)
         def _default_callback(e):
+            if isinstance(e, EphemeralEvent):
+                return
             self._state.events.append(e)
 
         composed_list = (callbacks if callbacks else []) + [_default_callback]
@@ -99,6 +113,7 @@ class LocalConversation(BaseConversation):
 
         # Initialize stuck detector
         self._stuck_detector = StuckDetector(self._state) if stuck_detection else None
+        self._arun_active = False
 
         with self._state:
             self.agent.init_state(self._state, on_event=self._on_event)
@@ -205,10 +220,7 @@ class LocalConversation(BaseConversation):
 
         Can be paused between steps
         """
-
-        with self._state:
-            if self._state.agent_status == AgentExecutionStatus.PAUSED:
-                self._state.agent_status = AgentExecutionStatus.RUNNING
+        self._resume_if_paused()
 
         iteration = 0
         while True:
@@ -217,48 +229,89 @@ class LocalConversation(BaseConversation):
                 # Pause attempts to acquire the state lock
                 # Before value can be modified step can be taken
                 # Ensure step conditions are checked when lock is already acquired
-                if self._state.agent_status in [
-                    AgentExecutionStatus.FINISHED,
-                    AgentExecutionStatus.PAUSED,
-                    AgentExecutionStatus.STUCK,
-                ]:
+                if not self._ready_for_step():
                     break
 
-                # Check for stuck patterns if enabled
-                if self._stuck_detector:
-                    is_stuck = self._stuck_detector.is_stuck()
-
-                    if is_stuck:
-                        logger.warning("Stuck pattern detected.")
-                        self._state.agent_status = AgentExecutionStatus.STUCK
-                        continue
-
-                # clear the flag before calling agent.step() (user approved)
-                if (
-                    self._state.agent_status
-                    == AgentExecutionStatus.WAITING_FOR_CONFIRMATION
-                ):
-                    self._state.agent_status = AgentExecutionStatus.RUNNING
-
                 # step must mutate the SAME state object
                 self.agent.step(self._state, on_event=self._on_event)
                 iteration += 1
 
-                # Check for non-finished terminal conditions
-                # Note: We intentionally do NOT check for FINISHED status here.
-                # This allows concurrent user messages to be processed:
-                # 1. Agent finishes and sets status to FINISHED
-                # 2. User sends message concurrently via send_message()
-                # 3. send_message() waits for FIFO lock, then sets status to IDLE
-                # 4. Run loop continues to next iteration and processes the message
-                # 5. Without this design, concurrent messages would be lost
-                if (
-                    self.state.agent_status
-                    == AgentExecutionStatus.WAITING_FOR_CONFIRMATION
-                    or iteration >= self.max_iteration_per_run
-                ):
+                if self._should_stop_run(iteration):
                     break
 
+    async def arun(self) -> None:
+        """Async `run`: same loop, awaiting `agent.astep` on the event loop.
+
+        The LLM call is awaited rather than blocking a thread, so many
+        conversations can run concurrently on one event loop. The state lock
+        is a blocking thread lock, so it is only taken in worker threads,
+        around the synchronous parts of a step (see `AgentBase.astep`), and
+        never held across an await; instead, a second `arun` while one is in
+        progress raises ``ValueError("conversation_already_running")``.
+        """
+        if self._arun_active:
+            raise ValueError("conversation_already_running")
+        self._arun_active = True
+        try:
+            await asyncio.to_thread(self._resume_if_paused)
+
+            iteration = 0
+            while await asyncio.to_thread(self._ready_for_next_step, iteration):
+                logger.debug(f"Conversation arun iteration {iteration}")
+                await self.agent.astep(self._state, on_event=self._on_event)
+                iteration += 1
+        finally:
+            self._arun_active = False
+
+    def _ready_for_next_step(self, iteration: int) -> bool:
+        """`run`'s checks between steps, under the state lock (for `arun`)."""
+        with self._state:
+            if iteration and self._should_stop_run(iteration):
+                return False
+            return self._ready_for_step()
+
+    def _resume_if_paused(self) -> None:
+        with self._state:
+            if self._state.agent_status == AgentExecutionStatus.PAUSED:
+                self._state.agent_status = AgentExecutionStatus.RUNNING
+
+    def _ready_for_step(self) -> bool:
+        """Check (with the state lock held) whether the run loop may step."""
+        if self._state.agent_status in [
+            AgentExecutionStatus.FINISHED,
+            AgentExecutionStatus.PAUSED,
+            AgentExecutionStatus.STUCK,
+        ]:
+            return False
+
+        # Check for stuck patterns if enabled
+        if self._stuck_detector:
+            is_stuck = self._stuck_detector.is_stuck()
+
+            if is_stuck:
+                logger.warning("Stuck pattern detected.")
+                self._state.agent_status = AgentExecutionStatus.STUCK
+                return False
+
+        # clear the flag before calling agent.step() (user approved)
+        if self._state.agent_status == AgentExecutionStatus.WAITING_FOR_CONFIRMATION:
+            self._state.agent_status = AgentExecutionStatus.RUNNING
+        return True
+
+    def _should_stop_run(self, iteration: int) -> bool:
+        # Check for non-finished terminal conditions
+        # Note: We intentionally do NOT check for FINISHED status here.
+        # This allows concurrent user messages to be processed:
+        # 1. Agent finishes and sets status to FINISHED
+        # 2. User sends message concurrently via send_message()
+        # 3. send_message() waits for FIFO lock, then sets status to IDLE
+        # 4. Run loop continues to next iteration and processes the message
+        # 5. Without this design, concurrent messages would be lost
+        return (
+            self.state.agent_status == AgentExecutionStatus.WAITING_FOR_CONFIRMATION
+            or iteration >= self.max_iteration_per_run
+        )
+
     def set_confirmation_policy(self, policy: ConfirmationPolicyBase) -> None:
         """Set the confirmation policy and store it in conversation state."""
         with self._state:
@@ -271,9 +324,9 @@ class LocalConversation(BaseConversation):
         This is a non-invasive method to reject actions between run() calls.
         Also clears the agent_waiting_for_confirmation flag.
         """
-        pending_actions = ConversationState.get_unmatched_actions(self._state.events)
-
         with self._state:
+            pending_actions = self._state.get_pending_actions()
+
             # Always clear the agent_waiting_for_confirmation flag
             if (
                 self._state.agent_status
@@ -335,7 +388,8 @@ class LocalConversation(BaseConversation):
         logger.info(f"Added {len(secrets)} secrets to conversation")
 
     def close(self) -> None:
-        """Close the conversation and clean up all tool executors."""
+        """Close the conversation: clean up all tool executors and release the
+        event storage."""
         logger.debug("Closing conversation and cleaning up tool executors")
         for tool in self.agent.tools_map.values():
             try:
@@ -346,6 +400,7 @@ class LocalConversation(BaseConversation):
                 continue
             except Exception as e:
                 logger.warning(f"Error closing executor for tool '{tool.name}': {e}")
+        self._state.close()
 
     def __del__(self) -> None:
         """Ensure cleanup happens when conversation is destroyed."""
@@ -1,13 +1,15 @@
 import asyncio
 import json
 import threading
+import time
 import uuid
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from typing import SupportsIndex, overload
-from urllib.parse import urlparse
+from urllib.parse import urlencode, urlparse
 
 import httpx
 import websockets
+from pydantic import BaseModel
 
 from openhands.sdk.agent.base import AgentBase
 from openhands.sdk.conversation.base import BaseConversation, ConversationStateProtocol
@@ -22,6 +24,7 @@ from openhands.sdk.event.conversation_state import (
     FULL_STATE_KEY,
     ConversationStateUpdateEvent,
 )
+from openhands.sdk.event.streaming import EphemeralEvent
 from openhands.sdk.llm import Message, TextContent
 from openhands.sdk.logger import get_logger
 from openhands.sdk.security.confirmation_policy import (
@@ -42,11 +45,17 @@ class WebSocketCallbackClient:
         conversation_id: str,
         callback: ConversationCallbackType,
         api_key: str | None = None,
+        on_connection_change: Callable[[bool], None] | None = None,
+        resume_from: Callable[[], int] | None = None,
     ):
         self.host = host
         self.conversation_id = conversation_id
         self.callback = callback
         self.api_key = api_key
+        self.on_connection_change = on_connection_change
+        # Called on every (re)connect for the number of events already held,
+        # so the server sends the ones missed while disconnected
+        self.resume_from = resume_from
         self._thread: threading.Thread | None = None
         self._stop = threading.Event()
 
@@ -81,24 +90,32 @@ class WebSocketCallbackClient:
         ws_url = f"{base}/sockets/events/{self.conversation_id}"
 
         # Add API key as query parameter if provided
+        params = {}
         if self.api_key:
-            ws_url += f"?session_api_key={self.api_key}"
+            params["session_api_key"] = self.api_key
 
         delay = 1.0
         while not self._stop.is_set():
+            if self.resume_from is not None:
+                params["resume_from"] = str(self.resume_from())
+            url = f"{ws_url}?{urlencode(params)}" if params else ws_url
             try:
-                async with websockets.connect(ws_url) as ws:
+                async with websockets.connect(url) as ws:
                     delay = 1.0
-                    async for message in ws:
-                        if self._stop.is_set():
-                            break
-                        try:
-                            event = Event.model_validate(json.loads(message))
-                            self.callback(event)
-                        except Exception:
-                            logger.exception(
-                                "ws_event_processing_error", stack_info=True
-                            )
+                    self._notify_connection(True)
+                    try:
+                        async for message in ws:
+                            if self._stop.is_set():
+                                break
+                            try:
+                                event = Event.model_validate(json.loads(message))
+                                self.callback(event)
+                            except Exception:
+                                logger.exception(
+                                    "ws_event_processing_error", stack_info=True
+                                )
+                    finally:
+                        self._notify_connection(False)
             except websockets.exceptions.ConnectionClosed:
                 break
             except Exception:
@@ -106,12 +123,25 @@ class WebSocketCallbackClient:
                 await asyncio.sleep(delay)
                 delay = min(delay * 2, 30.0)
 
+    def _notify_connection(self, connected: bool) -> None:
+        if self.on_connection_change is None:
+            return
+        try:
+            self.on_connection_change(connected)
+        except Exception:
+            logger.exception("ws_connection_callback_error", stack_info=True)
+
 
 class RemoteEventsList(EventsListBase):
     """A list-like, read-only view of remote conversation events.
 
     On first access it fetches existing events from the server. Afterwards,
     it relies on the WebSocket stream to incrementally append new events.
+
+    It holds the events persisted on the server, in log order, so its length
+    is the log position of the next event it expects. After a reconnect the
+    server is asked to resume from that position (see `WebSocketCallbackClient`)
+    and `sync` fetches only the events from there on.
     """
 
     def __init__(self, client: httpx.Client, conversation_id: str):
@@ -126,34 +156,61 @@ class RemoteEventsList(EventsListBase):
     def _do_full_sync(self) -> None:
         """Perform a full sync with the remote API."""
         logger.debug(f"Performing full sync for conversation {self._conversation_id}")
+        with self._lock:
+            self._cached_events = []
+            self._cached_event_ids = set()
+            self.sync()
+        logger.debug(f"Full sync completed, {len(self)} events cached")
 
-        events = []
-        page_id = None
-
-        while True:
-            params = {"limit": 100}
-            if page_id:
-                params["page_id"] = page_id
-
+    def sync(self) -> int:
+        """Fetch the events past the ones held, returning how many were added."""
+        with self._lock:
+            added = 0
+            while True:
+                resp = self._client.get(
+                    f"/api/conversations/{self._conversation_id}/events/search",
+                    params={"since_index": len(self._cached_events), "limit": 100},
+                )
+                resp.raise_for_status()
+                data = resp.json()
+
+                before = len(self._cached_events)
+                for item in data["items"]:
+                    self.add_event(Event.model_validate(item))
+                added += len(self._cached_events) - before
+
+                if not data.get("next_page_id"):
+                    return added
+                if len(self._cached_events) == before:
+                    # The server ignored since_index (an older server); fall
+                    # back to following its page cursor from the start
+                    return added + self._sync_by_page(data["next_page_id"])
+
+    def _sync_by_page(self, page_id: str) -> int:
+        before = len(self._cached_events)
+        while page_id:
             resp = self._client.get(
                 f"/api/conversations/{self._conversation_id}/events/search",
-                params=params,
+                params={"page_id": page_id, "limit": 100},
             )
             resp.raise_for_status()
             data = resp.json()
-
-            events.extend([Event.model_validate(item) for item in data["items"]])
-
-            if not data.get("next_page_id"):
-                break
-            page_id = data["next_page_id"]
-
-        self._cached_events = events
-        self._cached_event_ids.update(e.id for e in events)
-        logger.debug(f"Full sync completed, {len(events)} events cached")
+            for item in data["items"]:
+                self.add_event(Event.model_validate(item))
+            page_id = data.get("next_page_id")
+        return len(self._cached_events) - before
 
     def add_event(self, event: Event) -> None:
         """Add a new event to the local cache (called by WebSocket callback)."""
+        if isinstance(event, EphemeralEvent):
+            # Ephemeral; the server does not persist these either
+            return
+        if (
+            isinstance(event, ConversationStateUpdateEvent)
+            and event.key == FULL_STATE_KEY
+        ):
+            # Snapshots sent to each new subscriber are not persisted either
+            return
         with self._lock:
             # Check if event already exists to avoid duplicates
             if event.id not in self._cached_event_ids:
@@ -191,41 +248,91 @@ class RemoteEventsList(EventsListBase):
             return iter(self._cached_events)
 
 
+class RemoteStateStats(BaseModel):
+    """How `RemoteState` reads were served, to check how many hit the server."""
+
+    http_fetches: int = 0
+    cache_hits: int = 0
+    event_updates: int = 0
+
+
 class RemoteState(ConversationStateProtocol):
-    """A state-like interface for accessing remote conversation state."""
+    """A state-like interface for accessing remote conversation state.
 
-    def __init__(self, client: httpx.Client, conversation_id: str):
+    Reads are served from a local snapshot. While the websocket is connected
+    and has delivered a full state snapshot, the snapshot is kept current by
+    the `ConversationStateUpdateEvent`s it receives and no requests are made.
+    Otherwise (before the first snapshot, or after a disconnect) the snapshot
+    is fetched over HTTP once it is older than `max_staleness` seconds.
+    """
+
+    def __init__(
+        self, client: httpx.Client, conversation_id: str, max_staleness: float = 5.0
+    ):
         self._client = client
         self._conversation_id = conversation_id
         self._events = RemoteEventsList(client, conversation_id)
+        self.max_staleness = max_staleness
 
         # Cache for state information to avoid REST calls
         self._cached_state: dict | None = None
+        self._fetched_at = 0.0
+        self._connected = False
+        self._synced = False
+        self._stats = RemoteStateStats()
         self._lock = threading.RLock()
 
+    @property
+    def stats(self) -> RemoteStateStats:
+        """Counts of HTTP fetches, cache hits and websocket updates so far."""
+        with self._lock:
+            return self._stats.model_copy()
+
+    def _is_fresh(self) -> bool:
+        if self._cached_state is None:
+            return False
+        if self._synced:
+            return True
+        return time.monotonic() - self._fetched_at < self.max_staleness
+
     def _get_conversation_info(self) -> dict:
-        """Fetch the latest conversation info from the remote API."""
+        """The conversation info, from the local snapshot if it is current."""
         with self._lock:
-            # Return cached state if available
-            if self._cached_state is not None:
+            if self._cached_state is not None and self._is_fresh():
+                self._stats.cache_hits += 1
                 return self._cached_state
 
-            # Fallback to REST API if no cached state
+            # Fallback to REST API if the snapshot is missing or stale
             resp = self._client.get(f"/api/conversations/{self._conversation_id}")
+            self._stats.http_fetches += 1
             resp.raise_for_status()
             state = resp.json()
             self._cached_state = state
+            self._fetched_at = time.monotonic()
             return state
 
+    def set_connected(self, connected: bool) -> None:
+        """Record whether the websocket delivering state updates is connected.
+
+        Updates may be missed while disconnected, so the snapshot is only
+        trusted again once a full snapshot arrives on the new connection.
+        """
+        with self._lock:
+            self._connected = connected
+            self._synced = False
+
     def update_state_from_event(self, event: ConversationStateUpdateEvent) -> None:
         """Update cached state from a ConversationStateUpdateEvent."""
         with self._lock:
+            self._stats.event_updates += 1
             # Handle full state snapshot
             if event.key == FULL_STATE_KEY:
                 # Update cached state with the full snapshot
                 if self._cached_state is None:
                     self._cached_state = {}
                 self._cached_state.update(event.value)
+                self._fetched_at = time.monotonic()
+                self._synced = self._connected
             else:
                 # Handle individual field updates
                 if self._cached_state is None:
@@ -427,6 +534,8 @@ class RemoteConversation(BaseConversation):
             conversation_id=str(self._id),
             callback=composed_callback,
             api_key=self.workspace.api_key,
+            on_connection_change=self._state.set_connected,
+            resume_from=self._state.events.__len__,
         )
         self._ws_client.start()
 
@@ -449,7 +558,7 @@ class RemoteConversation(BaseConversation):
     def conversation_stats(self) -> ConversationStats:
         """Get conversation stats from remote server."""
         info = self._state._get_conversation_info()
-        stats_data = info.get("conversation_stats", {})
+        stats_data = info.get("stats") or info.get("conversation_stats", {})
         return ConversationStats.model_validate(stats_data)
 
     @property
@@ -0,0 +1,62 @@
+from collections.abc import Sequence
+
+from openhands.sdk.event import (
+    ActionEvent,
+    AgentErrorEvent,
+    ObservationEvent,
+    UserRejectObservation,
+)
+from openhands.sdk.event.base import Event
+from openhands.sdk.event.types import EventID, ToolCallID
+
+
+class PendingActionIndex:
+    """Live index of ActionEvents that have not been answered yet.
+
+    Gives the same result as `ConversationState.get_unmatched_actions` without
+    rescanning the history: an action is opened when its `ActionEvent` is seen
+    and closed by an `ObservationEvent` / `UserRejectObservation` carrying its
+    id, or by an `AgentErrorEvent` carrying its tool_call_id.
+
+    Call `update` with the full event sequence; only events past the last seen
+    position are processed (so a resumed conversation is indexed once, on first
+    use). If the sequence shrinks, the index is rebuilt.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._position = 0
+        # Insertion-ordered, so values are in chronological order
+        self._open: dict[EventID, ActionEvent] = {}
+        self._open_by_tool_call: dict[ToolCallID, list[EventID]] = {}
+
+    def __len__(self) -> int:
+        """Number of currently pending actions."""
+        return len(self._open)
+
+    def update(self, events: Sequence[Event]) -> list[ActionEvent]:
+        """Fold any new events into the index and return the pending actions."""
+        if len(events) < self._position:
+            self._reset()
+        for i in range(self._position, len(events)):
+            self.append(events[i])
+        return list(self._open.values())
+
+    def append(self, event: Event) -> None:
+        """Fold a single newly appended event into the index."""
+        self._position += 1
+        if isinstance(event, ActionEvent):
+            self._open[event.id] = event
+            self._open_by_tool_call.setdefault(event.tool_call_id, []).append(event.id)
+        elif isinstance(event, (ObservationEvent, UserRejectObservation)):
+            action = self._open.pop(event.action_id, None)
+            if action is not None:
+                action_ids = self._open_by_tool_call[action.tool_call_id]
+                action_ids.remove(action.id)
+                if not action_ids:
+                    del self._open_by_tool_call[action.tool_call_id]
+        elif isinstance(event, AgentErrorEvent):
+            for action_id in self._open_by_tool_call.pop(event.tool_call_id, []):
+                del self._open[action_id]
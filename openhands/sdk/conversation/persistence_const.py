@@ -3,6 +3,7 @@ import re
 
 BASE_STATE = "base_state.json"
 EVENTS_DIR = "events"
+EVENTS_JOURNAL_DIR = "events_journal"
 EVENT_NAME_RE = re.compile(
     r"^event-(?P<idx>\d{5})-(?P<event_id>[0-9a-fA-F\-]{8,})\.json$"
 )
@@ -94,6 +94,10 @@ class SecretsManager:
         logger.debug(f"Prepared {len(env_vars)} secrets as environment variables")
         return env_vars
 
+    def max_secret_length(self) -> int:
+        """Length of the longest secret value `mask_secrets_in_output` masks."""
+        return max(map(len, self._exported_values.values()), default=0)
+
     def mask_secrets_in_output(self, text: str) -> str:
         """Mask secret values in the given text.
 
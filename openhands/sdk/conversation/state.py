@@ -1,19 +1,32 @@
 # state.py
 import json
+import os
 from collections.abc import Sequence
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Self
+from typing import TYPE_CHECKING, Any, Literal, Self
 
 from pydantic import Field, PrivateAttr
 
 from openhands.sdk.agent.base import AgentBase
+from openhands.sdk.context.view import IncrementalView, View
 from openhands.sdk.conversation.conversation_stats import ConversationStats
+from openhands.sdk.conversation.event_journal import JournalEventLog
 from openhands.sdk.conversation.event_store import EventLog
 from openhands.sdk.conversation.fifo_lock import FIFOLock
-from openhands.sdk.conversation.persistence_const import BASE_STATE, EVENTS_DIR
+from openhands.sdk.conversation.pending_actions import PendingActionIndex
+from openhands.sdk.conversation.persistence_const import (
+    BASE_STATE,
+    EVENTS_DIR,
+    EVENTS_JOURNAL_DIR,
+)
 from openhands.sdk.conversation.secrets_manager import SecretsManager
 from openhands.sdk.conversation.types import ConversationCallbackType, ConversationID
-from openhands.sdk.event import ActionEvent, ObservationEvent, UserRejectObservation
+from openhands.sdk.event import (
+    ActionEvent,
+    AgentErrorEvent,
+    ObservationEvent,
+    UserRejectObservation,
+)
 from openhands.sdk.event.base import Event
 from openhands.sdk.io import FileStore, InMemoryFileStore, LocalFileStore
 from openhands.sdk.logger import get_logger
@@ -46,6 +59,9 @@ if TYPE_CHECKING:
     from openhands.sdk.conversation.secrets_manager import SecretsManager
 
 
+EventBackend = Literal["files", "journal"]
+
+
 class ConversationState(OpenHandsModel):
     # ===== Public, validated fields =====
     id: ConversationID = Field(description="Unique conversation ID")
@@ -68,6 +84,12 @@ class ConversationState(OpenHandsModel):
         description="Directory for persisting conversation state and events. "
         "If None, conversation will not be persisted.",
     )
+    event_backend: EventBackend = Field(
+        default="files",
+        description="How events are persisted: 'files' writes one JSON file per "
+        "event, 'journal' appends them to rotating segment files with an offset "
+        "index. Only applies when persistence_dir is set.",
+    )
 
     max_iterations: int = Field(
         default=500,
@@ -98,7 +120,7 @@ class ConversationState(OpenHandsModel):
     # ===== Private attrs (NOT Fields) =====
     _secrets_manager: "SecretsManager" = PrivateAttr(default_factory=SecretsManager)
     _fs: FileStore = PrivateAttr()  # filestore for persistence
-    _events: EventLog = PrivateAttr()  # now the storage for events
+    _events: EventLog | JournalEventLog = PrivateAttr()  # storage for events
     _autosave_enabled: bool = PrivateAttr(
         default=False
     )  # to avoid recursion during init
@@ -108,12 +130,28 @@ class ConversationState(OpenHandsModel):
     _lock: FIFOLock = PrivateAttr(
         default_factory=FIFOLock
     )  # FIFO lock for thread safety
+    _view: IncrementalView = PrivateAttr(
+        default_factory=IncrementalView
+    )  # condensation-aware view, kept up to date with events
+    _pending_actions: PendingActionIndex = PrivateAttr(
+        default_factory=PendingActionIndex
+    )  # actions awaiting an observation, kept up to date with events
 
     # ===== Public "events" facade (Sequence[Event]) =====
     @property
-    def events(self) -> EventLog:
+    def events(self) -> EventLog | JournalEventLog:
         return self._events
 
+    @property
+    def view(self) -> View:
+        """The condensation-aware `View` of the events, as `View.from_events`
+        would compute it.
+
+        Maintained incrementally: only events appended since the last access are
+        processed, so reading it every agent step does not rescan the history.
+        """
+        return self._view.update(self._events)
+
     @property
     def secrets_manager(self) -> SecretsManager:
         """Public accessor for the SecretsManager (stored as a private attr)."""
@@ -128,6 +166,12 @@ class ConversationState(OpenHandsModel):
         """
         self._on_state_change = callback
 
+    def close(self) -> None:
+        """Release the event storage, i.e. the journal lock when the events are
+        kept in a journal. The state must not be used afterwards."""
+        if isinstance(self._events, JournalEventLog):
+            self._events.close()
+
     # ===== Base snapshot helpers (same FileStore usage you had) =====
     def _save_base_state(self, fs: FileStore) -> None:
         """
@@ -136,6 +180,11 @@ class ConversationState(OpenHandsModel):
         payload = self.model_dump_json(exclude_none=True)
         fs.write(BASE_STATE, payload)
 
+    def _open_events(self, fs: FileStore) -> EventLog | JournalEventLog:
+        if self.event_backend == "journal" and isinstance(fs, LocalFileStore):
+            return JournalEventLog(os.path.join(fs.root, EVENTS_JOURNAL_DIR))
+        return EventLog(fs, dir_path=EVENTS_DIR)
+
     # ===== Factory: open-or-create (no load/save methods needed) =====
     @classmethod
     def create(
@@ -146,11 +195,15 @@ class ConversationState(OpenHandsModel):
         persistence_dir: str | None = None,
         max_iterations: int = 500,
         stuck_detection: bool = True,
+        event_backend: EventBackend = "files",
     ) -> "ConversationState":
         """
         If base_state.json exists: resume (attach EventLog,
             reconcile agent, enforce id).
         Else: create fresh (agent required), persist base, and return.
+
+        ``event_backend`` only applies to fresh conversations; a resumed one
+        keeps the backend its events were written with.
         """
         file_store = (
             LocalFileStore(persistence_dir) if persistence_dir else InMemoryFileStore()
@@ -176,8 +229,13 @@ class ConversationState(OpenHandsModel):
             resolved = agent.resolve_diff_from_deserialized(state.agent)
 
             # Attach runtime handles and commit reconciled agent (may autosave)
+            if state.event_backend != event_backend:
+                logger.info(
+                    f"Conversation {state.id} was persisted with the "
+                    f"'{state.event_backend}' event backend; keeping it."
+                )
             state._fs = file_store
-            state._events = EventLog(file_store, dir_path=EVENTS_DIR)
+            state._events = state._open_events(file_store)
             state._autosave_enabled = True
             state.agent = resolved
 
@@ -203,9 +261,10 @@ class ConversationState(OpenHandsModel):
             persistence_dir=persistence_dir,
             max_iterations=max_iterations,
             stuck_detection=stuck_detection,
+            event_backend=event_backend,
         )
         state._fs = file_store
-        state._events = EventLog(file_store, dir_path=EVENTS_DIR)
+        state._events = state._open_events(file_store)
         state.stats = ConversationStats()
 
         state._save_base_state(file_store)  # initial snapshot
@@ -265,8 +324,11 @@ class ConversationState(OpenHandsModel):
         """Find actions in the event history that don't have matching observations.
 
         This method identifies ActionEvents that don't have corresponding
-        ObservationEvents or UserRejectObservations, which typically indicates
-        actions that are pending confirmation or execution.
+        ObservationEvents, UserRejectObservations or AgentErrorEvents, which
+        typically indicates actions that are pending confirmation or execution.
+
+        This scans the whole sequence; for a conversation's own events prefer
+        `get_pending_actions`, which is maintained incrementally.
 
         Args:
             events: List of events to search through
@@ -276,18 +338,34 @@ class ConversationState(OpenHandsModel):
             in chronological order
         """
         observed_action_ids = set()
+        errored_tool_call_ids = set()
         unmatched_actions = []
         # Search in reverse - recent events are more likely to be unmatched
         for event in reversed(events):
             if isinstance(event, (ObservationEvent, UserRejectObservation)):
                 observed_action_ids.add(event.action_id)
+            elif isinstance(event, AgentErrorEvent):
+                errored_tool_call_ids.add(event.tool_call_id)
             elif isinstance(event, ActionEvent):
-                if event.id not in observed_action_ids:
-                    # Insert at beginning to maintain chronological order in result
-                    unmatched_actions.insert(0, event)
-
+                if (
+                    event.id not in observed_action_ids
+                    and event.tool_call_id not in errored_tool_call_ids
+                ):
+                    unmatched_actions.append(event)
+
+        # Restore chronological order
+        unmatched_actions.reverse()
         return unmatched_actions
 
+    def get_pending_actions(self) -> list[ActionEvent]:
+        """Return this conversation's unmatched actions in chronological order.
+
+        Same result as `get_unmatched_actions(self.events)`, but served from an
+        index that only processes events appended since the last call, so the
+        cost is O(new events + pending actions) rather than O(history).
+        """
+        return self._pending_actions.update(self._events)
+
     # ===== FIFOLock delegation methods =====
     def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
         """
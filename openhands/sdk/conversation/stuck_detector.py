@@ -1,3 +1,5 @@
+from collections import deque
+
 from openhands.sdk.conversation.state import ConversationState
 from openhands.sdk.event import (
     ActionEvent,
@@ -27,49 +29,67 @@ class StuckDetector:
 
     def __init__(self, state: ConversationState):
         self.state = state
+        # What the checks need from the history after the last user message,
+        # updated from the events appended since the previous check, so a check
+        # does not re-read the whole history
+        self._scanned = 0
+        self._seen_user_message = False
+        self._events_since_user = 0
+        self._last_actions: deque[Event] = deque(maxlen=6)
+        self._last_observations: deque[Event] = deque(maxlen=4)
+        self._last_observations_or_errors: deque[Event] = deque(maxlen=6)
+        self._trailing_agent_messages = 0
+
+    def _scan_new_events(self) -> None:
+        events = self.state.events
+        for index in range(self._scanned, len(events)):
+            self._add(events[index])
+        self._scanned = len(events)
+
+    def _add(self, event: Event) -> None:
+        if isinstance(event, MessageEvent) and event.source == "user":
+            self._seen_user_message = True
+            self._events_since_user = 0
+            self._last_actions.clear()
+            self._last_observations.clear()
+            self._last_observations_or_errors.clear()
+            self._trailing_agent_messages = 0
+            return
+
+        self._events_since_user += 1
+        if isinstance(event, ActionEvent):
+            self._last_actions.append(event)
+        elif isinstance(event, ObservationBaseEvent):
+            self._last_observations.append(event)
+        if isinstance(event, ObservationEvent | AgentErrorEvent):
+            self._last_observations_or_errors.append(event)
+
+        if isinstance(event, MessageEvent):
+            if event.source == "agent":
+                self._trailing_agent_messages += 1
+        elif not isinstance(event, CondensationSummaryEvent):
+            # Condensation events don't break the monologue pattern
+            self._trailing_agent_messages = 0
 
     def is_stuck(self) -> bool:
         """Check if the agent is currently stuck."""
-        events = list(self.state.events)
+        self._scan_new_events()
 
         # Only look at history after the last user message
-        last_user_msg_index = next(
-            (
-                i
-                for i in reversed(range(len(events)))
-                if isinstance(events[i], MessageEvent) and events[i].source == "user"
-            ),
-            -1,  # Default to -1 if no user message found
-        )
-        if last_user_msg_index == -1:
+        if not self._seen_user_message:
             logger.warning("No user message found in history, skipping stuck detection")
             return False
 
-        events = events[last_user_msg_index + 1 :]
-
         # it takes 3 actions minimum to detect a loop, otherwise nothing to do here
-        if len(events) < 3:
+        if self._events_since_user < 3:
             return False
 
-        logger.debug(f"Checking for stuck patterns in {len(events)} events")
-        logger.debug(
-            f"Events after last user message: {[type(e).__name__ for e in events]}"
-        )
-
-        # the first few scenarios detect 3 or 4 repeated steps
-        # prepare the last 4 actions and observations, to check them out
-        last_actions: list[Event] = []
-        last_observations: list[Event] = []
-
-        # retrieve the last four actions and observations starting from
-        # the end of history, wherever they are
-        for event in reversed(events):
-            if isinstance(event, ActionEvent) and len(last_actions) < 4:
-                last_actions.append(event)
-            elif isinstance(event, ObservationBaseEvent) and len(last_observations) < 4:
-                last_observations.append(event)
-            if len(last_actions) >= 4 and len(last_observations) >= 4:
-                break
+        logger.debug(f"Checking for stuck patterns in {self._events_since_user} events")
+
+        # the first few scenarios detect 3 or 4 repeated steps, on the last 4
+        # actions and observations (most recent first)
+        last_actions = list(reversed(self._last_actions))[:4]
+        last_observations = list(reversed(self._last_observations))
 
         # Check all stuck patterns
         # scenario 1: same action, same observation
@@ -81,17 +101,20 @@ class StuckDetector:
             return True
 
         # scenario 3: monologue
-        if self._is_stuck_monologue(events):
+        if self._is_stuck_monologue():
             return True
 
         # scenario 4: action, observation alternating pattern on the last six steps
-        if len(events) >= 6:
-            if self._is_stuck_alternating_action_observation(events):
+        if self._events_since_user >= 6:
+            if self._is_stuck_alternating_action_observation(
+                list(reversed(self._last_actions)),
+                list(reversed(self._last_observations_or_errors)),
+            ):
                 return True
 
         # scenario 5: context window error loop
-        if len(events) >= 10:
-            if self._is_stuck_context_window_error(events):
+        if self._events_since_user >= 10:
+            if self._is_stuck_context_window_error():
                 return True
 
         return False
@@ -148,52 +171,20 @@ class StuckDetector:
         # Check if observations are errors
         return False
 
-    def _is_stuck_monologue(self, events: list[Event]) -> bool:
+    def _is_stuck_monologue(self) -> bool:
         # scenario 3: monologue
         # check for repeated MessageActions with source=AGENT
         # see if the agent is engaged in a good old monologue, telling
-        # itself the same thing over and over
-        if len(events) < 3:
-            return False
+        # itself the same thing over and over: 3 consecutive agent messages
+        # without user interruption (actions/observations break the pattern)
+        return self._trailing_agent_messages >= 3
 
-        # Look for 3 consecutive agent messages without user interruption
-        agent_message_count = 0
-
-        for event in reversed(events):
-            if isinstance(event, MessageEvent):
-                if event.source == "agent":
-                    agent_message_count += 1
-                elif event.source == "user":
-                    break  # User interrupted, not a monologue
-            elif isinstance(event, CondensationSummaryEvent):
-                # Condensation events don't break the monologue pattern
-                continue
-            else:
-                # Other events (actions/observations) don't count as monologue
-                break
-
-        return agent_message_count >= 3
-
-    def _is_stuck_alternating_action_observation(self, events: list[Event]) -> bool:
+    def _is_stuck_alternating_action_observation(
+        self, last_actions: list[Event], last_observations: list[Event]
+    ) -> bool:
         # scenario 4: alternating action-observation loop
-        # needs 6 actions and 6 observations to detect the ping-pong pattern
-
-        last_actions: list[Event] = []
-        last_observations: list[Event] = []
-
-        # collect most recent 6 actions and 6 observations
-        for event in reversed(events):
-            if isinstance(event, ActionEvent) and len(last_actions) < 6:
-                last_actions.append(event)
-            elif (
-                isinstance(event, (ObservationEvent, AgentErrorEvent))
-                and len(last_observations) < 6
-            ):
-                last_observations.append(event)
-
-            if len(last_actions) == 6 and len(last_observations) == 6:
-                break
-
+        # needs the most recent 6 actions and 6 observations (or errors) to
+        # detect the ping-pong pattern
         if len(last_actions) == 6 and len(last_observations) == 6:
             actions_equal = (
                 self._event_eq(last_actions[0], last_actions[2])
@@ -214,7 +205,7 @@ class StuckDetector:
 
         return False
 
-    def _is_stuck_context_window_error(self, events: list[Event]) -> bool:
+    def _is_stuck_context_window_error(self) -> bool:
         """Detects if we're stuck in a loop of context window errors.
 
         This happens when we repeatedly get context window errors and try to trim,
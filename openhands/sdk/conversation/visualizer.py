@@ -12,6 +12,7 @@ from openhands.sdk.event import (
     ObservationEvent,
     PauseEvent,
     SystemPromptEvent,
+    ToolOutputDeltaEvent,
 )
 from openhands.sdk.event.base import Event
 from openhands.sdk.event.condenser import Condensation
@@ -144,6 +145,15 @@ class ConversationVisualizer:
                 padding=_PANEL_PADDING,
                 expand=True,
             )
+        elif isinstance(event, ToolOutputDeltaEvent):
+            return Panel(
+                content,
+                title=f"[bold {_OBSERVATION_COLOR}]Output so far ({event.tool_name})"
+                f"[/bold {_OBSERVATION_COLOR}]",
+                border_style=_OBSERVATION_COLOR,
+                padding=_PANEL_PADDING,
+                expand=True,
+            )
         elif isinstance(event, MessageEvent):
             if (
                 self._skip_user_messages
@@ -14,6 +14,11 @@ from openhands.sdk.event.llm_convertible import (
     SystemPromptEvent,
     UserRejectObservation,
 )
+from openhands.sdk.event.streaming import (
+    EphemeralEvent,
+    StreamingDeltaEvent,
+    ToolOutputDeltaEvent,
+)
 from openhands.sdk.event.types import EventID, ToolCallID
 from openhands.sdk.event.user_action import PauseEvent
 
@@ -33,6 +38,9 @@ __all__ = [
     "CondensationRequest",
     "CondensationSummaryEvent",
     "ConversationStateUpdateEvent",
+    "EphemeralEvent",
+    "StreamingDeltaEvent",
+    "ToolOutputDeltaEvent",
     "EventID",
     "ToolCallID",
 ]
@@ -115,12 +115,15 @@ class LLMConvertibleEvent(Event, ABC):
                     j += 1
 
                 # Create combined message for the response
-                messages.append(_combine_action_events(batch_events))
+                message = _combine_action_events(batch_events)
+                message._event_key = ",".join(e.id for e in batch_events)
                 i = j
             else:
                 # Regular event - direct conversion
-                messages.append(event.to_llm_message())
+                message = event.to_llm_message()
+                message._event_key = event.id
                 i += 1
+            messages.append(message)
 
         return messages
 
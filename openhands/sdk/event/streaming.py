@@ -0,0 +1,66 @@
+from abc import ABC
+
+from rich.text import Text
+
+from openhands.sdk.event.base import Event
+from openhands.sdk.event.types import EventID, SourceType, ToolCallID
+from openhands.sdk.llm.streaming import LLMStreamChunk
+
+
+class EphemeralEvent(Event, ABC):
+    """Base class for events that are only relevant while something is running.
+
+    Ephemeral events reach conversation callbacks (and thus agent-server
+    websocket clients) but are never persisted or sent to webhooks; the
+    completed result is recorded as usual by the events that follow.
+    """
+
+
+class StreamingDeltaEvent(EphemeralEvent):
+    """A token-level delta of an LLM completion that is still streaming.
+
+    The completed response is recorded by the Action/Message events that follow.
+    """
+
+    source: SourceType = "agent"
+    delta: LLMStreamChunk
+
+    @property
+    def visualize(self) -> Text:
+        # Deltas are folded into the final event; nothing to render per token
+        return Text()
+
+    def __str__(self) -> str:
+        """Plain text string representation for StreamingDeltaEvent."""
+        return f"{self.__class__.__name__} ({self.source}): {self.delta.content!r}"
+
+
+class ToolOutputDeltaEvent(EphemeralEvent):
+    """Output produced so far by a tool call that is still running.
+
+    Published with bounded rate and size, so a client can tail a long command;
+    the complete result is recorded by the ObservationEvent that follows.
+    """
+
+    source: SourceType = "environment"
+    action_id: EventID
+    tool_name: str
+    tool_call_id: ToolCallID
+    output: str
+    skipped: int = 0
+    """Characters of output produced before `output` that were not published."""
+
+    @property
+    def visualize(self) -> Text:
+        content = Text()
+        if self.skipped:
+            content.append(f"[... {self.skipped} characters skipped ...]\n", "dim")
+        content.append(self.output)
+        return content
+
+    def __str__(self) -> str:
+        """Plain text string representation for ToolOutputDeltaEvent."""
+        return (
+            f"{self.__class__.__name__} ({self.source}): "
+            f"[{self.tool_name}] {self.output!r}"
+        )
@@ -11,6 +11,11 @@ from openhands.sdk.llm.message import (
     content_to_str,
 )
 from openhands.sdk.llm.router import RouterLLM
+from openhands.sdk.llm.streaming import (
+    LLMStreamChunk,
+    TokenCallbackType,
+    ToolCallDelta,
+)
 from openhands.sdk.llm.utils.metrics import Metrics, MetricsSnapshot
 from openhands.sdk.llm.utils.unverified_models import (
     UNVERIFIED_MODELS_EXCLUDING_BEDROCK,
@@ -32,6 +37,9 @@ __all__ = [
     "ThinkingBlock",
     "RedactedThinkingBlock",
     "content_to_str",
+    "LLMStreamChunk",
+    "ToolCallDelta",
+    "TokenCallbackType",
     "Metrics",
     "MetricsSnapshot",
     "VERIFIED_MODELS",
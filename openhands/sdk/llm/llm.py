@@ -4,8 +4,10 @@ import copy
 import json
 import os
 import warnings
-from collections.abc import Callable, Sequence
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Literal, get_args, get_origin
 
 import httpx
@@ -30,9 +32,13 @@ from openhands.sdk.utils.pydantic_diff import pretty_pydantic_diff
 
 with warnings.catch_warnings():
     warnings.simplefilter("ignore")
-    import litellm
+    import litellm  # noqa: F401  (import once with its warnings silenced)
 
-from litellm import ChatCompletionToolParam, completion as litellm_completion
+from litellm import (
+    ChatCompletionToolParam,
+    acompletion as litellm_acompletion,
+    completion as litellm_completion,
+)
 from litellm.exceptions import (
     APIConnectionError,
     BadRequestError,
@@ -43,6 +49,10 @@ from litellm.exceptions import (
     ServiceUnavailableError,
     Timeout as LiteLLMTimeout,
 )
+from litellm.litellm_core_utils.prompt_templates.factory import (
+    DEFAULT_ASSISTANT_CONTINUE_MESSAGE,
+    DEFAULT_USER_CONTINUE_MESSAGE,
+)
 from litellm.types.utils import ModelResponse
 from litellm.utils import (
     create_pretrained_tokenizer,
@@ -57,6 +67,11 @@ from openhands.sdk.llm.exceptions import LLMNoResponseError
 from openhands.sdk.llm.llm_response import LLMResponse
 from openhands.sdk.llm.message import Message
 from openhands.sdk.llm.mixins.non_native_fc import NonNativeToolCallingMixin
+from openhands.sdk.llm.streaming import (
+    RetryingTokenCallback,
+    StreamAccumulator,
+    TokenCallbackType,
+)
 from openhands.sdk.llm.utils.metrics import Metrics, MetricsSnapshot
 from openhands.sdk.llm.utils.model_features import get_features
 from openhands.sdk.llm.utils.retry_mixin import RetryMixin
@@ -68,6 +83,47 @@ logger = get_logger(__name__)
 
 __all__ = ["LLM"]
 
+# Most formatted messages kept by format_messages_for_llm. Large enough for
+# several callers (e.g. the agent and a condenser) sharing one LLM to keep
+# their whole views memoized
+FORMATTED_MESSAGES_MEMO_SIZE = 4096
+
+
+@contextmanager
+def _litellm_warnings() -> Iterator[None]:
+    """Silence noise from httpx/litellm internals during a litellm call."""
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=DeprecationWarning, module="httpx.*")
+        warnings.filterwarnings(
+            "ignore", message=r".*content=.*upload.*", category=DeprecationWarning
+        )
+        warnings.filterwarnings(
+            "ignore",
+            message=r"There is no current event loop",
+            category=DeprecationWarning,
+        )
+        yield
+
+
+@dataclass(frozen=True)
+class _PreparedCall:
+    """A completion request after formatting, tool mocking and normalization."""
+
+    messages: list[dict[str, Any]]
+    cc_tools: list[ChatCompletionToolParam]
+    use_mock_tools: bool
+    call_kwargs: dict[str, Any]
+    streaming: bool
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy the dicts and lists of a formatted message, sharing the strings."""
+    if isinstance(value, dict):
+        return {k: _copy_containers(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(v) for v in value]
+    return value
+
 
 # Exceptions we retry on
 LLM_RETRY_EXCEPTIONS: tuple[type[Exception], ...] = (
@@ -157,6 +213,12 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
         default=False, description="Disable using of stop word."
     )
     caching_prompt: bool = Field(default=True, description="Enable caching of prompts.")
+    stream: bool = Field(
+        default=False,
+        description="Stream completions token by token. The final response is "
+        "the same as without streaming; deltas go to the `on_token` callback "
+        "and time-to-first-token is recorded in metrics.",
+    )
     log_completions: bool = Field(
         default=False, description="Enable logging of completions."
     )
@@ -230,6 +292,12 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
     _tokenizer: Any = PrivateAttr(default=None)
     _function_calling_active: bool = PrivateAttr(default=False)
     _telemetry: Telemetry | None = PrivateAttr(default=None)
+    # LRU of formatted messages, keyed by (event key, whether the message
+    # carries a prompt-caching breakpoint); see format_messages_for_llm
+    _formatted_messages: OrderedDict[tuple[str, bool], dict] = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _formatted_messages_flags: dict[str, bool] = PrivateAttr(default_factory=dict)
 
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
@@ -367,22 +435,112 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
         tools: Sequence[ToolBase] | None = None,
         return_metrics: bool = False,
         add_security_risk_prediction: bool = False,
+        on_token: TokenCallbackType | None = None,
         **kwargs,
     ) -> LLMResponse:
         """Single entry point for LLM completion.
 
         Normalize → (maybe) mock tools → transport → postprocess.
+
+        The call is streamed when `self.stream` is set, `stream=True` is passed
+        or an `on_token` callback is given; `on_token` then receives every
+        delta (text, reasoning and partially assembled tool calls) as it
+        arrives. The returned LLMResponse is the same in both modes.
+        """
+        call = self._prepare_call(
+            messages, tools, add_security_risk_prediction, on_token, kwargs
+        )
+        attempt_on_token = RetryingTokenCallback(on_token) if on_token else None
+
+        # 5) do the call with retries
+        @self._retry_decorator()
+        def _one_attempt(**retry_kwargs) -> ModelResponse:
+            # Merge retry-modified kwargs (like temperature) with call_kwargs
+            final_kwargs = {**call.call_kwargs, **retry_kwargs}
+            if call.streaming:
+                if attempt_on_token is not None:
+                    attempt_on_token.start_attempt()
+                resp = self._stream_transport_call(
+                    messages=call.messages,
+                    on_token=attempt_on_token,
+                    mock_tools=call.use_mock_tools,
+                    **final_kwargs,
+                )
+            else:
+                resp = self._transport_call(messages=call.messages, **final_kwargs)
+            return self._postprocess_response(resp, call)
+
+        assert self._telemetry is not None
+        try:
+            return self._to_llm_response(_one_attempt())
+        except Exception as e:
+            self._telemetry.on_error(e)
+            raise
+
+    async def acompletion(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolBase] | None = None,
+        return_metrics: bool = False,
+        add_security_risk_prediction: bool = False,
+        on_token: TokenCallbackType | None = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Async counterpart of `completion`, built on litellm's async API.
+
+        Retries, telemetry, prompt-mocked tool calling and streaming behave
+        exactly as in `completion`; waiting on the provider does not block the
+        event loop (retry back-off sleeps are awaited too).
         """
-        # Check if streaming is requested
-        if kwargs.get("stream", False):
-            raise ValueError("Streaming is not supported")
+        call = self._prepare_call(
+            messages, tools, add_security_risk_prediction, on_token, kwargs
+        )
+        attempt_on_token = RetryingTokenCallback(on_token) if on_token else None
+
+        @self._retry_decorator()
+        async def _one_attempt(**retry_kwargs) -> ModelResponse:
+            final_kwargs = {**call.call_kwargs, **retry_kwargs}
+            if call.streaming:
+                if attempt_on_token is not None:
+                    attempt_on_token.start_attempt()
+                resp = await self._astream_transport_call(
+                    messages=call.messages,
+                    on_token=attempt_on_token,
+                    mock_tools=call.use_mock_tools,
+                    **final_kwargs,
+                )
+            else:
+                resp = await self._atransport_call(
+                    messages=call.messages, **final_kwargs
+                )
+            return self._postprocess_response(resp, call)
+
+        assert self._telemetry is not None
+        try:
+            return self._to_llm_response(await _one_attempt())
+        except Exception as e:
+            self._telemetry.on_error(e)
+            raise
+
+    def _prepare_call(
+        self,
+        messages: list[Message],
+        tools: Sequence[ToolBase] | None,
+        add_security_risk_prediction: bool,
+        on_token: TokenCallbackType | None,
+        kwargs: dict[str, Any],
+    ) -> _PreparedCall:
+        """Steps 1-4 of a completion: everything up to the transport call."""
+        streaming = bool(kwargs.pop("stream", False)) or self.stream
+        streaming = streaming or on_token is not None
 
         # 1) serialize messages
         formatted_messages = self.format_messages_for_llm(messages)
 
         # 2) choose function-calling strategy
         use_native_fc = self.is_function_calling_active()
-        original_fncall_msgs = copy.deepcopy(formatted_messages)
+        # The prompt mock converts a copy, so this list stays as formatted
+        original_fncall_msgs = formatted_messages
 
         # Convert Tool objects to ChatCompletionToolParam once here
         cc_tools: list[ChatCompletionToolParam] = []
@@ -424,8 +582,17 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
                 log_ctx["raw_messages"] = original_fncall_msgs
         self._telemetry.on_request(log_ctx=log_ctx)
 
-        # 5) do the call with retries
-        @self.retry_decorator(
+        return _PreparedCall(
+            messages=formatted_messages,
+            cc_tools=cc_tools,
+            use_mock_tools=use_mock_tools,
+            call_kwargs=call_kwargs,
+            streaming=streaming,
+        )
+
+    def _retry_decorator(self) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        # tenacity wraps coroutine functions with async sleeps between attempts
+        return self.retry_decorator(
             num_retries=self.num_retries,
             retry_exceptions=LLM_RETRY_EXCEPTIONS,
             retry_min_wait=self.retry_min_wait,
@@ -433,50 +600,44 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
             retry_multiplier=self.retry_multiplier,
             retry_listener=self.retry_listener,
         )
-        def _one_attempt(**retry_kwargs) -> ModelResponse:
-            assert self._telemetry is not None
-            # Merge retry-modified kwargs (like temperature) with call_kwargs
-            final_kwargs = {**call_kwargs, **retry_kwargs}
-            resp = self._transport_call(messages=formatted_messages, **final_kwargs)
-            raw_resp: ModelResponse | None = None
-            if use_mock_tools:
-                raw_resp = copy.deepcopy(resp)
-                resp = self.post_response_prompt_mock(
-                    resp, nonfncall_msgs=formatted_messages, tools=cc_tools
-                )
-            # 6) telemetry
-            self._telemetry.on_response(resp, raw_resp=raw_resp)
 
-            # Ensure at least one choice
-            if not resp.get("choices") or len(resp["choices"]) < 1:
-                raise LLMNoResponseError(
-                    "Response choices is less than 1. Response: " + str(resp)
-                )
-
-            return resp
-
-        try:
-            resp = _one_attempt()
-
-            # Convert the first choice to an OpenHands Message
-            first_choice = resp["choices"][0]
-            message = Message.from_litellm_message(first_choice["message"])
-
-            # Get current metrics snapshot
-            metrics_snapshot = MetricsSnapshot(
-                model_name=self.metrics.model_name,
-                accumulated_cost=self.metrics.accumulated_cost,
-                max_budget_per_task=self.metrics.max_budget_per_task,
-                accumulated_token_usage=self.metrics.accumulated_token_usage,
+    def _postprocess_response(
+        self, resp: ModelResponse, call: _PreparedCall
+    ) -> ModelResponse:
+        """Per-attempt post-processing: un-mock tool calls, then telemetry."""
+        assert self._telemetry is not None
+        raw_resp: ModelResponse | None = None
+        if call.use_mock_tools:
+            raw_resp = copy.deepcopy(resp)
+            resp = self.post_response_prompt_mock(
+                resp, nonfncall_msgs=call.messages, tools=call.cc_tools
             )
+        # 6) telemetry
+        self._telemetry.on_response(resp, raw_resp=raw_resp)
 
-            # Create and return LLMResponse
-            return LLMResponse(
-                message=message, metrics=metrics_snapshot, raw_response=resp
+        # Ensure at least one choice
+        if not resp.get("choices") or len(resp["choices"]) < 1:
+            raise LLMNoResponseError(
+                "Response choices is less than 1. Response: " + str(resp)
             )
-        except Exception as e:
-            self._telemetry.on_error(e)
-            raise
+
+        return resp
+
+    def _to_llm_response(self, resp: ModelResponse) -> LLMResponse:
+        # Convert the first choice to an OpenHands Message
+        first_choice = resp["choices"][0]
+        message = Message.from_litellm_message(first_choice["message"])
+
+        # Get current metrics snapshot
+        metrics_snapshot = MetricsSnapshot(
+            model_name=self.metrics.model_name,
+            accumulated_cost=self.metrics.accumulated_cost,
+            max_budget_per_task=self.metrics.max_budget_per_task,
+            accumulated_token_usage=self.metrics.accumulated_token_usage,
+        )
+
+        # Create and return LLMResponse
+        return LLMResponse(message=message, metrics=metrics_snapshot, raw_response=resp)
 
     # =========================================================================
     # Transport + helpers
@@ -484,47 +645,125 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
     def _transport_call(
         self, *, messages: list[dict[str, Any]], **kwargs
     ) -> ModelResponse:
-        # litellm.modify_params is GLOBAL; guard it for thread-safety
-        with self._litellm_modify_params_ctx(self.modify_params):
-            with warnings.catch_warnings():
-                warnings.filterwarnings(
-                    "ignore", category=DeprecationWarning, module="httpx.*"
-                )
-                warnings.filterwarnings(
-                    "ignore",
-                    message=r".*content=.*upload.*",
-                    category=DeprecationWarning,
-                )
-                warnings.filterwarnings(
-                    "ignore",
-                    message=r"There is no current event loop",
-                    category=DeprecationWarning,
-                )
-                # Some providers need renames handled in _normalize_call_kwargs.
-                ret = litellm_completion(
-                    model=self.model,
-                    api_key=self.api_key.get_secret_value() if self.api_key else None,
-                    base_url=self.base_url,
-                    api_version=self.api_version,
-                    timeout=self.timeout,
-                    drop_params=self.drop_params,
-                    seed=self.seed,
-                    messages=messages,
-                    **kwargs,
-                )
-                assert isinstance(ret, ModelResponse), (
-                    f"Expected ModelResponse, got {type(ret)}"
-                )
-                return ret
+        with _litellm_warnings():
+            ret = self._litellm_call(messages, **kwargs)
+            assert isinstance(ret, ModelResponse), (
+                f"Expected ModelResponse, got {type(ret)}"
+            )
+            return ret
 
-    @contextmanager
-    def _litellm_modify_params_ctx(self, flag: bool):
-        old = getattr(litellm, "modify_params", None)
-        try:
-            litellm.modify_params = flag
-            yield
-        finally:
-            litellm.modify_params = old
+    def _stream_transport_call(
+        self,
+        *,
+        messages: list[dict[str, Any]],
+        on_token: TokenCallbackType | None,
+        mock_tools: bool,
+        **kwargs,
+    ) -> ModelResponse:
+        """Stream a completion, forwarding deltas; return the assembled response."""
+        assert self._telemetry is not None
+        accumulator = StreamAccumulator(
+            prompt_mock=self.prompt_mock_stream_parser() if mock_tools else None
+        )
+        # Ask for a final usage chunk so token accounting matches non-streaming
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        self._telemetry.on_stream_start()
+        with _litellm_warnings():
+            for chunk in self._litellm_call(messages, stream=True, **kwargs):
+                self._on_stream_chunk(accumulator, chunk, on_token)
+        return self._finish_stream(accumulator, messages, on_token)
+
+    async def _atransport_call(
+        self, *, messages: list[dict[str, Any]], **kwargs
+    ) -> ModelResponse:
+        with _litellm_warnings():
+            ret = await litellm_acompletion(**self._litellm_kwargs(messages, kwargs))
+            assert isinstance(ret, ModelResponse), (
+                f"Expected ModelResponse, got {type(ret)}"
+            )
+            return ret
+
+    async def _astream_transport_call(
+        self,
+        *,
+        messages: list[dict[str, Any]],
+        on_token: TokenCallbackType | None,
+        mock_tools: bool,
+        **kwargs,
+    ) -> ModelResponse:
+        """Async counterpart of `_stream_transport_call`."""
+        assert self._telemetry is not None
+        accumulator = StreamAccumulator(
+            prompt_mock=self.prompt_mock_stream_parser() if mock_tools else None
+        )
+        kwargs.setdefault("stream_options", {"include_usage": True})
+        self._telemetry.on_stream_start()
+        with _litellm_warnings():
+            stream = await litellm_acompletion(
+                **self._litellm_kwargs(messages, {**kwargs, "stream": True})
+            )
+            async for chunk in stream:  # type: ignore[union-attr]
+                self._on_stream_chunk(accumulator, chunk, on_token)
+        return self._finish_stream(accumulator, messages, on_token)
+
+    def _on_stream_chunk(
+        self,
+        accumulator: StreamAccumulator,
+        chunk: Any,
+        on_token: TokenCallbackType | None,
+    ) -> None:
+        assert self._telemetry is not None
+        delta = accumulator.add(chunk)
+        if delta is None:
+            return
+        self._telemetry.on_stream_delta()
+        if on_token is not None:
+            on_token(delta)
+
+    def _finish_stream(
+        self,
+        accumulator: StreamAccumulator,
+        messages: list[dict[str, Any]],
+        on_token: TokenCallbackType | None,
+    ) -> ModelResponse:
+        delta = accumulator.finish()
+        if delta is not None and on_token is not None:
+            on_token(delta)
+        return accumulator.build(messages)
+
+    def _litellm_call(self, messages: list[dict[str, Any]], **kwargs) -> Any:
+        return litellm_completion(**self._litellm_kwargs(messages, kwargs))
+
+    def _litellm_kwargs(
+        self, messages: list[dict[str, Any]], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        # Some providers need renames handled in _normalize_call_kwargs.
+        return dict(
+            model=self.model,
+            api_key=self.api_key.get_secret_value() if self.api_key else None,
+            base_url=self.base_url,
+            api_version=self.api_version,
+            timeout=self.timeout,
+            drop_params=self.drop_params,
+            seed=self.seed,
+            messages=messages,
+            **{**self._modify_params_kwargs(), **kwargs},
+        )
+
+    def _modify_params_kwargs(self) -> dict[str, Any]:
+        """`modify_params` as litellm's per-call arguments: the placeholder
+        messages it inserts when a provider needs the turns fixed up (e.g. a
+        conversation starting or ending with the wrong role).
+
+        litellm's module-wide `litellm.modify_params` is left alone, so calls
+        from LLMs with different settings cannot interfere.
+        """
+        if not self.modify_params:
+            return {}
+        return dict(
+            user_continue_message=DEFAULT_USER_CONTINUE_MESSAGE,
+            assistant_continue_message=DEFAULT_ASSISTANT_CONTINUE_MESSAGE,
+        )
 
     def _normalize_call_kwargs(self, opts: dict, *, has_tools: bool) -> dict:
         """Central place for provider quirks + param harmonization."""
@@ -590,6 +829,12 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
         if not has_tools:
             out.pop("tools", None)
             out.pop("tool_choice", None)
+        # Tool parameters are shared, read-only schemas; litellm rewrites them
+        # in place for Gemini / Vertex / Bedrock, so those get their own copy
+        elif out.get("tools") and any(
+            p in self.model.lower() for p in ("gemini", "vertex", "bedrock")
+        ):
+            out["tools"] = copy.deepcopy(out["tools"])
 
         # non litellm proxy special-case: keep `extra_body` off unless model requires it
         if "litellm_proxy" not in self.model:
@@ -741,40 +986,68 @@ class LLM(BaseModel, RetryMixin, NonNativeToolCallingMixin):
     # =========================================================================
     # Utilities preserved from previous class
     # =========================================================================
-    def _apply_prompt_caching(self, messages: list[Message]) -> None:
-        """Applies caching breakpoints to the messages.
+    def _prompt_caching_breakpoints(self, messages: list[Message]) -> set[int]:
+        """Indices of the messages that get a prompt-caching breakpoint.
 
-        For new Anthropic API, we only need to mark the last user or
-          tool message as cacheable.
+        For new Anthropic API, we only need to mark the system message and the
+        last user or tool message as cacheable.
         """
+        breakpoints: set[int] = set()
         if len(messages) > 0 and messages[0].role == "system":
-            messages[0].content[-1].cache_prompt = True
-        # NOTE: this is only needed for anthropic
-        for message in reversed(messages):
-            if message.role in ("user", "tool"):
-                message.content[
-                    -1
-                ].cache_prompt = True  # Last item inside the message content
+            breakpoints.add(0)
+        for i in range(len(messages) - 1, -1, -1):
+            if messages[i].role in ("user", "tool"):
+                breakpoints.add(i)
                 break
+        return {i for i in breakpoints if messages[i].content}
 
     def format_messages_for_llm(self, messages: list[Message]) -> list[dict]:
-        """Formats Message objects for LLM consumption."""
-
-        messages = copy.deepcopy(messages)
-        if self.is_caching_prompt_active():
-            self._apply_prompt_caching(messages)
-
-        for message in messages:
-            message.cache_enabled = self.is_caching_prompt_active()
-            message.vision_enabled = self.vision_is_active()
-            message.function_calling_enabled = self.is_function_calling_active()
-            if "deepseek" in self.model or (
-                "kimi-k2-instruct" in self.model and "groq" in self.model
-            ):
-                message.force_string_serializer = True
-
-        formatted_messages = [message.to_llm_dict() for message in messages]
-
+        """Formats Message objects for LLM consumption.
+
+        The given messages are left untouched: capability flags are computed
+        once per call and applied to shallow copies, and only the messages that
+        get a prompt-caching breakpoint have their last content item copied.
+        Messages converted from events are memoized by event id in a bounded
+        LRU, so a step only formats the messages that are new since the
+        previous call, even when several callers share this LLM.
+        """
+        caching = self.is_caching_prompt_active()
+        flags = {
+            "cache_enabled": caching,
+            "vision_enabled": self.vision_is_active(),
+            "function_calling_enabled": self.is_function_calling_active(),
+        }
+        if "deepseek" in self.model or (
+            "kimi-k2-instruct" in self.model and "groq" in self.model
+        ):
+            flags["force_string_serializer"] = True
+        if flags != self._formatted_messages_flags:
+            self._formatted_messages = OrderedDict()
+            self._formatted_messages_flags = flags
+        breakpoints = self._prompt_caching_breakpoints(messages) if caching else set()
+
+        memo = self._formatted_messages
+        formatted_messages: list[dict] = []
+        for i, message in enumerate(messages):
+            key = (
+                (message._event_key, i in breakpoints)
+                if message._event_key is not None
+                else None
+            )
+            formatted = memo.get(key) if key is not None else None
+            if formatted is None:
+                update: dict[str, Any] = dict(flags)
+                if i in breakpoints:
+                    last = message.content[-1].model_copy(update={"cache_prompt": True})
+                    update["content"] = [*message.content[:-1], last]
+                formatted = message.model_copy(update=update).to_llm_dict()
+            if key is not None:
+                memo[key] = formatted
+                memo.move_to_end(key)
+            formatted_messages.append(_copy_containers(formatted))
+
+        while len(memo) > FORMATTED_MESSAGES_MEMO_SIZE:
+            memo.popitem(last=False)
         return formatted_messages
 
     def get_token_count(self, messages: list[Message]) -> int:
@@ -4,7 +4,7 @@ from typing import Any, Literal
 
 from litellm import ChatCompletionMessageToolCall
 from litellm.types.utils import Message as LiteLLMMessage
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from openhands.sdk.logger import get_logger
 from openhands.sdk.utils import DEFAULT_TEXT_CONTENT_LIMIT, maybe_truncate
@@ -165,6 +165,9 @@ class Message(BaseModel):
         default_factory=list,
         description="Raw Anthropic thinking blocks for extended thinking feature",
     )
+    # Id(s) of the event(s) this message was converted from, if any. Lets the
+    # LLM memoize the formatted message across steps.
+    _event_key: str | None = PrivateAttr(default=None)
 
     @property
     def contains_image(self) -> bool:
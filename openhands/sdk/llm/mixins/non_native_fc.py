@@ -11,6 +11,7 @@ from openhands.sdk.llm.mixins.fn_call_converter import (
     convert_fncall_messages_to_non_fncall_messages,
     convert_non_fncall_messages_to_fncall_messages,
 )
+from openhands.sdk.llm.streaming import PromptMockStreamParser
 from openhands.sdk.llm.utils.model_features import get_features
 
 
@@ -54,6 +55,10 @@ class NonNativeToolCallingMixin:
         kwargs.pop("tool_choice", None)
         return messages, kwargs
 
+    def prompt_mock_stream_parser(self: _HostSupports) -> PromptMockStreamParser:
+        """Parser separating mocked tool-call markup from streamed text."""
+        return PromptMockStreamParser()
+
     def post_response_prompt_mock(
         self: _HostSupports,
         resp: ModelResponse,
@@ -0,0 +1,248 @@
+"""Token-level streaming support for `LLM.completion`.
+
+A streamed completion is consumed chunk by chunk by `StreamAccumulator`, which
+turns each provider chunk into an `LLMStreamChunk` delta for the caller's
+callback and keeps everything needed to rebuild the final, non-streaming
+`ModelResponse` once the stream ends.
+"""
+
+from collections.abc import Callable
+
+import litellm
+from litellm.types.utils import ModelResponse, ModelResponseStream
+from pydantic import BaseModel, Field
+
+
+__all__ = [
+    "LLMStreamChunk",
+    "RetryingTokenCallback",
+    "StreamAccumulator",
+    "TokenCallbackType",
+    "ToolCallDelta",
+]
+
+
+class ToolCallDelta(BaseModel):
+    """Incremental piece of a tool call in a streamed completion.
+
+    `id` and `name` are set on the first delta of a call (when known); later
+    deltas for the same `index` only carry more `arguments` text. With native
+    function calling the arguments are JSON fragments; with prompt-mocked
+    function calling they are fragments of the `<parameter=...>` markup.
+    """
+
+    index: int = Field(description="Position of the tool call in the response")
+    id: str | None = Field(default=None, description="Tool call id, if known")
+    name: str | None = Field(default=None, description="Tool name, if known")
+    arguments: str = Field(default="", description="Arguments text fragment")
+
+
+class LLMStreamChunk(BaseModel):
+    """One delta of a streamed completion, as delivered to token callbacks."""
+
+    response_id: str = Field(description="Id of the response being streamed")
+    content: str = Field(default="", description="Assistant text fragment")
+    reasoning_content: str = Field(
+        default="", description="Reasoning/thinking text fragment"
+    )
+    tool_calls: list[ToolCallDelta] = Field(
+        default_factory=list, description="Tool call fragments"
+    )
+    reset: bool = Field(
+        default=False,
+        description=(
+            "Set on the first delta of a retried attempt: deltas received "
+            "before it belong to a failed attempt and should be discarded"
+        ),
+    )
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.content or self.reasoning_content or self.tool_calls)
+
+
+TokenCallbackType = Callable[[LLMStreamChunk], None]
+
+
+class RetryingTokenCallback:
+    """Token callback shared by the retried attempts of one completion.
+
+    Call `start_attempt` before each attempt. If an earlier attempt already
+    streamed deltas, the first delta of the next one is marked `reset=True`,
+    so consumers know to drop the partial response instead of appending to it.
+    """
+
+    def __init__(self, on_token: TokenCallbackType):
+        self._on_token = on_token
+        self._streamed = False
+        self._reset_pending = False
+
+    def start_attempt(self) -> None:
+        if self._streamed:
+            self._reset_pending = True
+            self._streamed = False
+
+    def __call__(self, chunk: LLMStreamChunk) -> None:
+        if self._reset_pending:
+            chunk = chunk.model_copy(update={"reset": True})
+            self._reset_pending = False
+        self._streamed = True
+        self._on_token(chunk)
+
+
+class PromptMockStreamParser:
+    """Split streamed text of a prompt-mocked completion into content and calls.
+
+    With native function calling off, tool calls arrive as
+    `<function=NAME>...</function>` markup inside the assistant text. This
+    parser withholds that markup from the content deltas and reports it as
+    `ToolCallDelta`s instead, buffering just enough text to recognize tags that
+    straddle chunk boundaries.
+    """
+
+    OPEN_TAG = "<function="
+    CLOSE_TAG = "</function>"
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._state: str = "text"  # "text" | "name" | "arguments"
+        self._index = -1
+
+    def feed(self, text: str) -> tuple[str, list[ToolCallDelta]]:
+        """Consume a text fragment; return (plain content, tool call deltas)."""
+        self._buffer += text
+        content: list[str] = []
+        calls: list[ToolCallDelta] = []
+        while self._buffer:
+            if self._state == "text":
+                pos = self._buffer.find(self.OPEN_TAG)
+                if pos < 0:
+                    keep = _partial_tag_suffix(self._buffer, self.OPEN_TAG)
+                    content.append(self._buffer[: len(self._buffer) - keep])
+                    self._buffer = self._buffer[len(self._buffer) - keep :]
+                    break
+                content.append(self._buffer[:pos])
+                self._buffer = self._buffer[pos + len(self.OPEN_TAG) :]
+                self._state = "name"
+            elif self._state == "name":
+                pos = self._buffer.find(">")
+                if pos < 0:
+                    break
+                self._index += 1
+                calls.append(ToolCallDelta(index=self._index, name=self._buffer[:pos]))
+                self._buffer = self._buffer[pos + 1 :]
+                self._state = "arguments"
+            else:
+                pos = self._buffer.find(self.CLOSE_TAG)
+                if pos < 0:
+                    keep = _partial_tag_suffix(self._buffer, self.CLOSE_TAG)
+                    fragment = self._buffer[: len(self._buffer) - keep]
+                    self._buffer = self._buffer[len(self._buffer) - keep :]
+                    if fragment:
+                        calls.append(
+                            ToolCallDelta(index=self._index, arguments=fragment)
+                        )
+                    break
+                if pos:
+                    calls.append(
+                        ToolCallDelta(index=self._index, arguments=self._buffer[:pos])
+                    )
+                self._buffer = self._buffer[pos + len(self.CLOSE_TAG) :]
+                self._state = "text"
+        return "".join(content), calls
+
+    def flush(self) -> tuple[str, list[ToolCallDelta]]:
+        """Release whatever is still buffered once the stream has ended."""
+        rest, self._buffer = self._buffer, ""
+        if not rest:
+            return "", []
+        if self._state == "text":
+            return rest, []
+        if self._state == "arguments":
+            return "", [ToolCallDelta(index=self._index, arguments=rest)]
+        return "", []
+
+
+def _partial_tag_suffix(text: str, tag: str) -> int:
+    """Length of the longest suffix of `text` that is a proper prefix of `tag`."""
+    for size in range(min(len(tag) - 1, len(text)), 0, -1):
+        if text.endswith(tag[:size]):
+            return size
+    return 0
+
+
+class StreamAccumulator:
+    """Collect a streamed completion and emit per-chunk deltas.
+
+    Tool calls are assembled incrementally by index (`tool_calls`), so callers
+    can inspect the calls made so far at any point during the stream.
+    """
+
+    def __init__(self, prompt_mock: PromptMockStreamParser | None = None) -> None:
+        self._chunks: list[ModelResponseStream] = []
+        self._prompt_mock = prompt_mock
+        self._tool_calls: dict[int, ToolCallDelta] = {}
+        self.response_id = ""
+
+    @property
+    def tool_calls(self) -> list[ToolCallDelta]:
+        """Tool calls assembled so far, with arguments concatenated."""
+        return [self._tool_calls[i] for i in sorted(self._tool_calls)]
+
+    def add(self, chunk: ModelResponseStream) -> LLMStreamChunk | None:
+        """Record a provider chunk; return its delta, or None if it has none."""
+        self._chunks.append(chunk)
+        self.response_id = self.response_id or chunk.id
+        if not chunk.choices:
+            return None
+        delta = chunk.choices[0].delta
+        content = getattr(delta, "content", None) or ""
+        reasoning = getattr(delta, "reasoning_content", None) or ""
+        calls: list[ToolCallDelta] = []
+        for tc in getattr(delta, "tool_calls", None) or []:
+            fn = tc.function
+            calls.append(
+                ToolCallDelta(
+                    index=tc.index,
+                    id=tc.id,
+                    name=fn.name if fn else None,
+                    arguments=(fn.arguments if fn else None) or "",
+                )
+            )
+        if self._prompt_mock is not None and content:
+            content, mocked = self._prompt_mock.feed(content)
+            calls.extend(mocked)
+        return self._emit(content, reasoning, calls)
+
+    def finish(self) -> LLMStreamChunk | None:
+        """Flush buffered text at end of stream; return the last delta, if any."""
+        if self._prompt_mock is None:
+            return None
+        content, calls = self._prompt_mock.flush()
+        return self._emit(content, "", calls)
+
+    def build(self, messages: list[dict]) -> ModelResponse:
+        """Assemble the complete, non-streaming response from all chunks."""
+        resp = litellm.stream_chunk_builder(self._chunks, messages=messages)
+        if not isinstance(resp, ModelResponse):
+            raise ValueError("Streamed completion produced no chunks")
+        return resp
+
+    def _emit(
+        self, content: str, reasoning: str, calls: list[ToolCallDelta]
+    ) -> LLMStreamChunk | None:
+        for call in calls:
+            seen = self._tool_calls.get(call.index)
+            if seen is None:
+                self._tool_calls[call.index] = call.model_copy()
+            else:
+                seen.id = seen.id or call.id
+                seen.name = seen.name or call.name
+                seen.arguments += call.arguments
+        out = LLMStreamChunk(
+            response_id=self.response_id,
+            content=content,
+            reasoning_content=reasoning,
+            tool_calls=calls,
+        )
+        return None if out.is_empty else out
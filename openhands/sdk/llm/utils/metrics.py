@@ -30,6 +30,19 @@ class ResponseLatency(BaseModel):
         return max(0.0, v)
 
 
+class StreamingLatency(BaseModel):
+    """Metric tracking token timing per streamed completion call."""
+
+    model: str
+    time_to_first_token: float = Field(
+        ge=0.0, description="Seconds from request to the first streamed delta"
+    )
+    inter_token_latency: float = Field(
+        default=0.0, ge=0.0, description="Mean seconds between streamed deltas"
+    )
+    response_id: str
+
+
 class TokenUsage(BaseModel):
     """Metric tracking detailed token usage per completion call."""
 
@@ -96,6 +109,7 @@ class Metrics(MetricsSnapshot):
       - accumulated_cost and costs
       - max_budget_per_task (budget limit)
       - A list of ResponseLatency
+      - A list of StreamingLatency (streamed calls only)
       - A list of TokenUsage (one per call).
     """
 
@@ -108,6 +122,10 @@ class Metrics(MetricsSnapshot):
     token_usages: list[TokenUsage] = Field(
         default_factory=list, description="List of token usage records"
     )
+    streaming_latencies: list[StreamingLatency] = Field(
+        default_factory=list,
+        description="Time to first token and inter-token latency of streamed calls",
+    )
 
     @field_validator("accumulated_cost")
     @classmethod
@@ -155,6 +173,21 @@ class Metrics(MetricsSnapshot):
             )
         )
 
+    def add_streaming_latency(
+        self,
+        time_to_first_token: float,
+        inter_token_latency: float,
+        response_id: str,
+    ) -> None:
+        self.streaming_latencies.append(
+            StreamingLatency(
+                model=self.model_name,
+                time_to_first_token=max(0.0, time_to_first_token),
+                inter_token_latency=max(0.0, inter_token_latency),
+                response_id=response_id,
+            )
+        )
+
     def add_token_usage(
         self,
         prompt_tokens: int,
@@ -210,6 +243,7 @@ class Metrics(MetricsSnapshot):
         self.costs += other.costs
         self.token_usages += other.token_usages
         self.response_latencies += other.response_latencies
+        self.streaming_latencies += other.streaming_latencies
 
         # Merge accumulated token usage using the __add__ operator
         if self.accumulated_token_usage is None:
@@ -232,6 +266,9 @@ class Metrics(MetricsSnapshot):
                 latency.model_dump() for latency in self.response_latencies
             ],
             "token_usages": [usage.model_dump() for usage in self.token_usages],
+            "streaming_latencies": [
+                latency.model_dump() for latency in self.streaming_latencies
+            ],
         }
 
     def log(self) -> str:
@@ -276,6 +313,10 @@ class Metrics(MetricsSnapshot):
             len(baseline.response_latencies) :
         ]
 
+        result.streaming_latencies = self.streaming_latencies[
+            len(baseline.streaming_latencies) :
+        ]
+
         # Include only token usages that were added after the baseline
         result.token_usages = self.token_usages[len(baseline.token_usages) :]
 
@@ -40,6 +40,10 @@ class Telemetry(BaseModel):
     _req_start: float = PrivateAttr(default=0.0)
     _req_ctx: dict[str, Any] = PrivateAttr(default_factory=dict)
     _last_latency: float = PrivateAttr(default=0.0)
+    _stream_start: float = PrivateAttr(default=0.0)
+    _first_delta_at: float | None = PrivateAttr(default=None)
+    _last_delta_at: float = PrivateAttr(default=0.0)
+    _stream_deltas: int = PrivateAttr(default=0)
 
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
@@ -47,6 +51,22 @@ class Telemetry(BaseModel):
     def on_request(self, log_ctx: dict | None) -> None:
         self._req_start = time.time()
         self._req_ctx = log_ctx or {}
+        self._first_delta_at = None
+        self._stream_deltas = 0
+
+    def on_stream_start(self) -> None:
+        """Mark the start of a streamed attempt (resets token timing)."""
+        self._stream_start = time.time()
+        self._first_delta_at = None
+        self._stream_deltas = 0
+
+    def on_stream_delta(self) -> None:
+        """Record the arrival of a streamed delta."""
+        now = time.time()
+        if self._first_delta_at is None:
+            self._first_delta_at = now
+        self._last_delta_at = now
+        self._stream_deltas += 1
 
     def on_response(
         self, resp: ModelResponse, raw_resp: ModelResponse | None = None
@@ -54,12 +74,17 @@ class Telemetry(BaseModel):
         """
         Side-effects:
           - records latency, tokens, cost into Metrics
+          - for streamed calls, records time to first token and inter-token
+            latency
           - optionally writes a JSON log file
         """
         # 1) latency
         self._last_latency = time.time() - (self._req_start or time.time())
         response_id = resp.id
         self.metrics.add_response_latency(self._last_latency, response_id)
+        if self._first_delta_at is not None:
+            ttft, itl = self._stream_timing()
+            self.metrics.add_streaming_latency(ttft, itl, response_id)
 
         # 2) cost
         cost = self._compute_cost(resp)
@@ -88,6 +113,14 @@ class Telemetry(BaseModel):
         return
 
     # ---------- Helpers ----------
+    def _stream_timing(self) -> tuple[float, float]:
+        """(time to first token, mean inter-token latency) of the last stream."""
+        assert self._first_delta_at is not None
+        ttft = self._first_delta_at - (self._stream_start or self._req_start)
+        gaps = self._stream_deltas - 1
+        itl = (self._last_delta_at - self._first_delta_at) / gaps if gaps else 0.0
+        return ttft, itl
+
     def _has_meaningful_usage(self, usage) -> bool:
         """Check if usage has meaningful (non-zero) token counts."""
         if not usage:
@@ -207,6 +240,10 @@ class Telemetry(BaseModel):
             data["cost"] = float(cost or 0.0)
             data["timestamp"] = time.time()
             data["latency_sec"] = self._last_latency
+            if self._first_delta_at is not None:
+                ttft, itl = self._stream_timing()
+                data["time_to_first_token_sec"] = ttft
+                data["inter_token_latency_sec"] = itl
 
             # Usage summary (prompt, completion, reasoning tokens) for quick inspection
             try:
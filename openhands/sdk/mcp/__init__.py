@@ -1,11 +1,12 @@
 """MCP (Model Context Protocol) integration for agent-sdk."""
 
 from openhands.sdk.mcp.client import MCPClient
-from openhands.sdk.mcp.definition import MCPToolAction, MCPToolObservation
-from openhands.sdk.mcp.tool import (
-    MCPToolDefinition,
-    MCPToolExecutor,
+from openhands.sdk.mcp.definition import (
+    MCPToolAction,
+    MCPToolLatency,
+    MCPToolObservation,
 )
+from openhands.sdk.mcp.tool import MCPToolDefinition, MCPToolExecutor
 from openhands.sdk.mcp.utils import (
     create_mcp_tools,
 )
@@ -17,5 +18,6 @@ __all__ = [
     "MCPToolAction",
     "MCPToolObservation",
     "MCPToolExecutor",
+    "MCPToolLatency",
     "create_mcp_tools",
 ]
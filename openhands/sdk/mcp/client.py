@@ -2,25 +2,60 @@
 
 import asyncio
 import inspect
+import time
 from collections.abc import Callable
 from typing import Any
 
+import mcp.types
 from fastmcp import Client as AsyncMCPClient
 
+from openhands.sdk.logger import get_logger
 from openhands.sdk.utils.async_executor import AsyncExecutor
 
 
+logger = get_logger(__name__)
+
+
 class MCPClient(AsyncMCPClient):
     """
     Behaves exactly like fastmcp.Client (same constructor & async API),
     but owns a background event loop and offers:
       - call_async_from_sync(awaitable_or_fn, *args, timeout=None, **kwargs)
       - call_sync_from_async(fn, *args, **kwargs)  # await this from async code
+      - ensure_session()  # long-lived session reused across tool calls
+
+    The persistent session lives on the background loop: it is opened on first
+    use, health-checked with a ping when it has been idle for longer than
+    `health_check_interval`, and reopened with exponential backoff when it is
+    found dead. The session is held through the public `async with client`
+    lifecycle (`__aenter__`/`__aexit__`), so it composes with other contexts
+    entered on the same client. MCP multiplexes requests over one session, so up to
+    `max_concurrent_requests` tool calls may be in flight at once for servers
+    that handle requests concurrently.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        health_check_interval: float = 30.0,
+        health_check_timeout: float = 5.0,
+        max_reconnect_attempts: int = 3,
+        reconnect_backoff: float = 0.5,
+        max_concurrent_requests: int = 1,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self._executor = AsyncExecutor()
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self.reconnect_backoff = reconnect_backoff
+        self.max_concurrent_requests = max_concurrent_requests
+        self.reconnects = 0
+        self._session_held = False
+        self._last_used = 0.0
+        self._session_lock = asyncio.Lock()
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
 
     def call_async_from_sync(
         self,
@@ -49,6 +84,77 @@ class MCPClient(AsyncMCPClient):
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: fn(*args, **kwargs))
 
+    async def ensure_session(self) -> float:
+        """
+        Make sure the persistent session is open and healthy.
+
+        Returns the seconds spent (re)connecting, which is 0.0 when the existing
+        session was reused without a health check.
+        """
+        start = time.perf_counter()
+        async with self._session_lock:
+            if not (self._session_held and self.is_connected()):
+                await self._reconnect()
+            elif time.monotonic() - self._last_used > self.health_check_interval:
+                if not await self._is_healthy():
+                    logger.warning("MCP session failed health check; reconnecting")
+                    await self._reconnect()
+            self._last_used = time.monotonic()
+        return time.perf_counter() - start
+
+    async def _is_healthy(self) -> bool:
+        try:
+            return await asyncio.wait_for(
+                self.ping(), timeout=self.health_check_timeout
+            )
+        except Exception as e:
+            # An error reply (e.g. the server does not implement ping) still
+            # shows the session is alive
+            return isinstance(getattr(e, "error", None), mcp.types.ErrorData)
+
+    async def _reconnect(self) -> None:
+        """(Re)open the persistent session, backing off between attempts."""
+        if self._session_held:
+            self._session_held = False
+            self.reconnects += 1
+            try:
+                await self._close_session()
+            except Exception:
+                pass  # The old session is already broken
+        attempts = max(1, self.max_reconnect_attempts)
+        for attempt in range(attempts):
+            try:
+                await self._open_session()
+                self._session_held = True
+                return
+            except Exception as e:
+                if attempt == attempts - 1:
+                    raise
+                delay = self.reconnect_backoff * 2**attempt
+                logger.warning(
+                    f"Connecting to MCP server failed ({e}); retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    async def _open_session(self) -> None:
+        """Enter the client context on behalf of the persistent session."""
+        await self.__aenter__()
+
+    async def _close_session(self) -> None:
+        """Leave the context entered by `_open_session`."""
+        await self.__aexit__(None, None, None)
+
+    async def call_tool_mcp(  # type: ignore[override]
+        self, *args, **kwargs
+    ) -> mcp.types.CallToolResult:
+        """Call a tool, holding one of the `max_concurrent_requests` slots."""
+        async with self._request_slots:
+            return await super().call_tool_mcp(*args, **kwargs)
+
+    async def close(self) -> None:
+        self._session_held = False
+        await super().close()
+
     def sync_close(self) -> None:
         """
         Synchronously close the MCP client and cleanup resources.
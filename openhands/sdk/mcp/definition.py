@@ -5,7 +5,7 @@ from collections.abc import Sequence
 from typing import Any
 
 import mcp.types
-from pydantic import Field
+from pydantic import BaseModel, Field
 from rich.text import Text
 
 from openhands.sdk.llm import ImageContent, TextContent
@@ -48,6 +48,34 @@ class MCPToolAction(Action):
         return self.data
 
 
+class MCPToolLatency(BaseModel):
+    """Latency of MCP tool calls (one call, or accumulated over many), split
+    into connection and call time."""
+
+    calls: int = Field(default=0, description="Number of calls made")
+    errors: int = Field(default=0, description="Calls that raised an exception")
+    connect_seconds: float = Field(
+        default=0.0,
+        description="Time spent opening, health-checking or reopening the session",
+    )
+    call_seconds: float = Field(
+        default=0.0, description="Time spent in the tool call itself"
+    )
+
+    @property
+    def connect_overhead(self) -> float:
+        """Fraction of the total latency spent on the connection."""
+        total = self.connect_seconds + self.call_seconds
+        return self.connect_seconds / total if total else 0.0
+
+    def add(self, other: "MCPToolLatency") -> None:
+        """Accumulate another latency record into this one."""
+        self.calls += other.calls
+        self.errors += other.errors
+        self.connect_seconds += other.connect_seconds
+        self.call_seconds += other.call_seconds
+
+
 class MCPToolObservation(Observation):
     """Observation from MCP tool execution."""
 
@@ -60,6 +88,11 @@ class MCPToolObservation(Observation):
         default=False, description="Whether the call resulted in an error"
     )
     tool_name: str = Field(description="Name of the tool that was called")
+    latency: MCPToolLatency | None = Field(
+        default=None,
+        description="Connection and call time spent on this call (not shown to "
+        "the LLM)",
+    )
 
     @classmethod
     def from_call_tool_result(
@@ -1,6 +1,7 @@
 """Utility functions for MCP integration."""
 
 import re
+import time
 from collections.abc import Sequence
 from typing import Any
 
@@ -11,7 +12,11 @@ from pydantic import Field, ValidationError
 from openhands.sdk.llm import TextContent
 from openhands.sdk.logger import get_logger
 from openhands.sdk.mcp.client import MCPClient
-from openhands.sdk.mcp.definition import MCPToolAction, MCPToolObservation
+from openhands.sdk.mcp.definition import (
+    MCPToolAction,
+    MCPToolLatency,
+    MCPToolObservation,
+)
 from openhands.sdk.tool import (
     Action,
     Observation,
@@ -36,34 +41,72 @@ def to_camel_case(s: str) -> str:
 
 
 class MCPToolExecutor(ToolExecutor):
-    """Executor for MCP tools."""
+    """Executor for MCP tools.
+
+    Calls go over the client's persistent session (see
+    `MCPClient.ensure_session`). If the session turns out to be dead mid-call,
+    it is reopened, but the call is only retried for tools whose annotations
+    say that repeating it is harmless (read-only or idempotent): the server
+    may already have run it before the connection dropped.
 
-    def __init__(self, tool_name: str, client: MCPClient):
+    Each observation carries the latency of its call; `latency` accumulates
+    it over all calls.
+    """
+
+    def __init__(
+        self, tool_name: str, client: MCPClient, retry_on_disconnect: bool = False
+    ):
         self.tool_name = tool_name
         self.client = client
+        self.retry_on_disconnect = retry_on_disconnect
+        self.latency = MCPToolLatency()
+
+    async def _call_once(
+        self, arguments: dict[str, Any], latency: MCPToolLatency
+    ) -> mcp.types.CallToolResult:
+        latency.connect_seconds += await self.client.ensure_session()
+        start = time.perf_counter()
+        try:
+            return await self.client.call_tool_mcp(
+                name=self.tool_name, arguments=arguments
+            )
+        finally:
+            latency.call_seconds += time.perf_counter() - start
+
+    async def _call_over_session(
+        self, arguments: dict[str, Any], latency: MCPToolLatency
+    ) -> mcp.types.CallToolResult:
+        try:
+            return await self._call_once(arguments, latency)
+        except Exception:
+            if self.client.is_connected() or not self.retry_on_disconnect:
+                raise
+            logger.warning(
+                f"MCP session dropped while calling {self.tool_name}; retrying"
+            )
+        return await self._call_once(arguments, latency)
 
     async def call_tool(self, action: MCPToolAction) -> MCPToolObservation:
-        async with self.client:
-            assert self.client.is_connected(), "MCP client is not connected."
-            try:
-                logger.debug(
-                    f"Calling MCP tool {self.tool_name} "
-                    f"with args: {action.model_dump()}"
-                )
-                result: mcp.types.CallToolResult = await self.client.call_tool_mcp(
-                    name=self.tool_name, arguments=action.to_mcp_arguments()
-                )
-                return MCPToolObservation.from_call_tool_result(
-                    tool_name=self.tool_name, result=result
-                )
-            except Exception as e:
-                error_msg = f"Error calling MCP tool {self.tool_name}: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                return MCPToolObservation(
-                    content=[TextContent(text=error_msg)],
-                    is_error=True,
-                    tool_name=self.tool_name,
-                )
+        latency = MCPToolLatency(calls=1)
+        try:
+            logger.debug(
+                f"Calling MCP tool {self.tool_name} with args: {action.model_dump()}"
+            )
+            result = await self._call_over_session(action.to_mcp_arguments(), latency)
+            observation = MCPToolObservation.from_call_tool_result(
+                tool_name=self.tool_name, result=result
+            )
+        except Exception as e:
+            latency.errors = 1
+            error_msg = f"Error calling MCP tool {self.tool_name}: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            observation = MCPToolObservation(
+                content=[TextContent(text=error_msg)],
+                is_error=True,
+                tool_name=self.tool_name,
+            )
+        self.latency.add(latency)
+        return observation.model_copy(update={"latency": latency})
 
     def __call__(self, action: MCPToolAction) -> MCPToolObservation:
         """Execute an MCP tool call."""
@@ -175,7 +218,7 @@ class MCPToolDefinition(ToolDefinition[MCPToolAction, MCPToolObservation]):
         try:
             annotations = (
                 ToolAnnotations.model_validate(
-                    mcp_tool.annotations.model_dump(exclude_none=True)
+                    mcp_tool.annotations.model_dump(by_alias=True, exclude_none=True)
                 )
                 if mcp_tool.annotations
                 else None
@@ -190,7 +233,10 @@ class MCPToolDefinition(ToolDefinition[MCPToolAction, MCPToolObservation]):
                     annotations=annotations,
                     meta=mcp_tool.meta,
                     executor=MCPToolExecutor(
-                        tool_name=mcp_tool.name, client=mcp_client
+                        tool_name=mcp_tool.name,
+                        client=mcp_client,
+                        retry_on_disconnect=annotations is not None
+                        and (annotations.readOnlyHint or annotations.idempotentHint),
                     ),
                     # pass-through fields (enabled by **extra in Tool.create)
                     mcp_tool=mcp_tool,
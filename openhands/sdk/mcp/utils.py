@@ -31,23 +31,36 @@ async def log_handler(message: LogMessage):
 
 
 async def _list_tools(client: MCPClient) -> list[ToolBase]:
-    """List tools from an MCP client."""
+    """List tools from an MCP client.
+
+    This opens the client's persistent session, which the returned tools then
+    reuse for their calls.
+    """
     tools: list[ToolBase] = []
 
-    async with client:
-        assert client.is_connected(), "MCP client is not connected."
-        mcp_type_tools: list[mcp.types.Tool] = await client.list_tools()
-        for mcp_tool in mcp_type_tools:
-            tool_sequence = MCPToolDefinition.create(
-                mcp_tool=mcp_tool, mcp_client=client
-            )
-            tools.extend(tool_sequence)  # Flatten sequence into list
-    assert not client.is_connected(), (
-        "MCP client should be disconnected after listing tools."
-    )
+    await client.ensure_session()
+    assert client.is_connected(), "MCP client is not connected."
+    mcp_type_tools: list[mcp.types.Tool] = await client.list_tools()
+    for mcp_tool in mcp_type_tools:
+        tool_sequence = MCPToolDefinition.create(mcp_tool=mcp_tool, mcp_client=client)
+        tools.extend(tool_sequence)  # Flatten sequence into list
     return tools
 
 
+def _max_concurrent_requests(config: MCPConfig) -> int:
+    """Concurrency the servers allow, from their `max_concurrent_requests` key.
+
+    Servers are assumed to handle one request at a time unless their config
+    says otherwise; with several servers behind one client the most
+    restrictive setting wins.
+    """
+    limits = [
+        int(getattr(server, "max_concurrent_requests", None) or 1)
+        for server in config.mcpServers.values()
+    ]
+    return min(limits, default=1)
+
+
 def create_mcp_tools(
     config: dict | MCPConfig,
     timeout: float = 30.0,
@@ -56,7 +69,11 @@ def create_mcp_tools(
     tools: list[MCPToolDefinition] = []
     if isinstance(config, dict):
         config = MCPConfig.model_validate(config)
-    client = MCPClient(config, log_handler=log_handler)
+    client = MCPClient(
+        config,
+        log_handler=log_handler,
+        max_concurrent_requests=_max_concurrent_requests(config),
+    )
     tools = client.call_async_from_sync(_list_tools, timeout=timeout, client=client)
 
     logger.info(f"Created {len(tools)} MCP tools: {[t.name for t in tools]}")
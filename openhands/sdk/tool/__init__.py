@@ -1,6 +1,11 @@
 """OpenHands runtime package."""
 
 from openhands.sdk.tool.builtins import BUILT_IN_TOOLS, FinishTool, ThinkTool
+from openhands.sdk.tool.output import (
+    ToolOutputCallback,
+    get_tool_output_callback,
+    tool_output_callback,
+)
 from openhands.sdk.tool.registry import (
     list_registered_tools,
     register_tool,
@@ -27,6 +32,9 @@ __all__ = [
     "ToolAnnotations",
     "ToolExecutor",
     "ExecutableTool",
+    "ToolOutputCallback",
+    "tool_output_callback",
+    "get_tool_output_callback",
     "Action",
     "Observation",
     "FinishTool",
@@ -86,4 +86,5 @@ ThinkTool = ToolDefinition(
         idempotentHint=True,
         openWorldHint=False,
     ),
+    concurrency_safe=True,
 )
@@ -0,0 +1,34 @@
+"""Live output of tool calls that are still running.
+
+Executors are called with just the action, so the agent makes a callback
+available for the duration of the call through a context variable. Tools that
+produce output over time (like a shell command) hand it to that callback and it
+reaches conversation callbacks as `ToolOutputDeltaEvent`s.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+ToolOutputCallback = Callable[[str, int], None]
+"""Called with new output and the number of characters skipped before it."""
+
+_output_callback: ContextVar[ToolOutputCallback | None] = ContextVar(
+    "tool_output_callback", default=None
+)
+
+
+@contextmanager
+def tool_output_callback(callback: ToolOutputCallback) -> Iterator[None]:
+    """Send live output of tool calls made in this block to `callback`."""
+    token = _output_callback.set(callback)
+    try:
+        yield
+    finally:
+        _output_callback.reset(token)
+
+
+def get_tool_output_callback() -> ToolOutputCallback | None:
+    """The callback for live output of the current tool call, if anyone listens."""
+    return _output_callback.get()
@@ -1,6 +1,8 @@
+import copy
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import Any, TypeVar
+from typing import Any, NoReturn, TypeVar
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, ConfigDict, Field, create_model
 from rich.text import Text
@@ -16,6 +18,53 @@ from openhands.sdk.utils.visualize import display_dict
 S = TypeVar("S", bound="Schema")
 
 
+def _read_only(self, *args, **kwargs) -> NoReturn:
+    raise TypeError(
+        "Compiled tool schemas are shared and read-only; "
+        "use copy.deepcopy() to get an editable copy"
+    )
+
+
+class _FrozenDict(dict):
+    """A dict that refuses edits. Still a dict, so JSON encoders accept it."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class _FrozenList(list):
+    """A list that refuses edits. Still a list, so JSON encoders accept it."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def _freeze(node: Any) -> Any:
+    if isinstance(node, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in node.items())
+    if isinstance(node, list):
+        return _FrozenList(_freeze(v) for v in node)
+    return node
+
+
+# Compiled (ref-flattened) MCP schemas per Schema class, frozen so that they
+# can be handed out without copying. Weakly keyed, so dynamically created
+# classes (e.g. per MCP tool) are not kept alive by the cache.
+_compiled_mcp_schemas: "WeakKeyDictionary[type, _FrozenDict]" = WeakKeyDictionary()
+
+
 def py_type(spec: dict[str, Any]) -> Any:
     """Map JSON schema types to Python types."""
     t = spec.get("type")
@@ -100,13 +149,31 @@ class Schema(BaseModel):
 
     model_config = ConfigDict(extra="forbid", frozen=True)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A new subclass can change the schema of the classes it derives from
+        # (discriminated-union owners list their subclasses), so drop those
+        for base in cls.__mro__[1:]:
+            _compiled_mcp_schemas.pop(base, None)
+
     @classmethod
-    def to_mcp_schema(cls) -> dict[str, Any]:
-        """Convert to JSON schema format compatible with MCP."""
-        full_schema = cls.model_json_schema()
-        # This will get rid of all "anyOf" in the schema,
-        # so it is fully compatible with MCP tool schema
-        return _process_schema_node(full_schema, full_schema.get("$defs", {}))
+    def to_mcp_schema(cls, frozen: bool = False) -> dict[str, Any]:
+        """Convert to JSON schema format compatible with MCP.
+
+        The schema is compiled once per class. By default the caller gets its
+        own editable copy; with `frozen=True` it gets the shared compiled
+        schema itself, which raises TypeError on any edit.
+        """
+        compiled = _compiled_mcp_schemas.get(cls)
+        if compiled is None:
+            full_schema = cls.model_json_schema()
+            # This will get rid of all "anyOf" in the schema,
+            # so it is fully compatible with MCP tool schema
+            compiled = _freeze(
+                _process_schema_node(full_schema, full_schema.get("$defs", {}))
+            )
+            _compiled_mcp_schemas[cls] = compiled
+        return compiled if frozen else copy.deepcopy(compiled)
 
     @classmethod
     def from_mcp_schema(
@@ -120,6 +120,13 @@ class ToolBase[ActionT, ObservationT](DiscriminatedUnionMixin, ABC):
 
     annotations: ToolAnnotations | None = None
     meta: dict[str, Any] | None = None
+    concurrency_safe: bool = Field(
+        default=False,
+        description="If true, calls to this tool may run concurrently with other "
+        "concurrency-safe calls from the same LLM response. This is an explicit "
+        "opt-in: readOnlyHint alone does not imply it (read-only tools can still "
+        "share state such as a browser session).",
+    )
 
     # runtime-only; always hidden on dumps
     executor: SkipJsonSchema[ToolExecutor | None] = Field(
@@ -289,6 +296,9 @@ class ToolBase[ActionT, ObservationT](DiscriminatedUnionMixin, ABC):
             action_type: Optionally override the action_type to use for the schema.
                 This is useful for MCPTool to use a dynamically created action type
                 based on the tool's input schema.
+
+        The returned parameters are the action type's shared, read-only
+        compiled schema (see `Schema.to_mcp_schema`), so no copy is made.
         """
         action_type = action_type or self.action_type
 
@@ -303,9 +313,9 @@ class ToolBase[ActionT, ObservationT](DiscriminatedUnionMixin, ABC):
             function=ChatCompletionToolParamFunctionChunk(
                 name=self.name,
                 description=self.description,
-                parameters=action_type_with_risk.to_mcp_schema()
+                parameters=action_type_with_risk.to_mcp_schema(frozen=True)
                 if add_security_risk_prediction
-                else action_type.to_mcp_schema(),
+                else action_type.to_mcp_schema(frozen=True),
             ),
         )
 
@@ -0,0 +1,139 @@
+"""Stream directories as tar archives without holding them in memory.
+
+Used by both ends of directory transfers between a workspace client and the
+agent server: `iter_tar` produces the archive in bounded chunks while it is
+being written, and `extract_tar` unpacks one from any iterable of chunks.
+"""
+
+import hashlib
+import io
+import queue
+import tarfile
+import threading
+from collections.abc import Generator, Iterable
+from pathlib import Path
+
+
+CHUNK_SIZE = 1024 * 1024
+_MAX_QUEUED_CHUNKS = 8
+
+
+class _Aborted(Exception):
+    """Raised in the archiving thread once the consumer stopped reading."""
+
+
+class _QueueWriter(io.RawIOBase):
+    def __init__(self, chunks: "queue.Queue[bytes | None]", stop: threading.Event):
+        self._chunks = chunks
+        self._stop = stop
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        chunk = bytes(data)
+        while True:
+            if self._stop.is_set():
+                raise _Aborted()
+            try:
+                self._chunks.put(chunk, timeout=0.5)
+                return len(chunk)
+            except queue.Full:
+                continue
+
+
+class _IterReader(io.RawIOBase):
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def iter_tar(directory: Path, compress: bool = False) -> Generator[bytes, None, None]:
+    """Yield a tar archive of `directory` (gzipped if `compress`) in chunks.
+
+    The archive is written by a background thread into a small bounded queue,
+    so memory use does not depend on the size of the files. Closing the
+    iterator early stops the thread.
+    """
+    chunks: queue.Queue[bytes | None] = queue.Queue(maxsize=_MAX_QUEUED_CHUNKS)
+    stop = threading.Event()
+    errors: list[BaseException] = []
+
+    def write_archive() -> None:
+        try:
+            with tarfile.open(
+                fileobj=_QueueWriter(chunks, stop),
+                mode="w|gz" if compress else "w|",
+                bufsize=CHUNK_SIZE,
+            ) as tar:
+                for path in sorted(directory.rglob("*")):
+                    tar.add(path, arcname=path.relative_to(directory), recursive=False)
+        except _Aborted:
+            return
+        except BaseException as e:
+            errors.append(e)
+        while not stop.is_set():
+            try:
+                chunks.put(None, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    thread = threading.Thread(target=write_archive, name="tar-stream", daemon=True)
+    thread.start()
+    try:
+        while (chunk := chunks.get()) is not None:
+            yield chunk
+        if errors:
+            raise errors[0]
+    finally:
+        stop.set()
+        thread.join()
+
+
+def extract_tar(chunks: Iterable[bytes], directory: Path) -> int:
+    """Extract a (possibly gzipped) tar archive read from `chunks` into
+    `directory`, returning the number of bytes of file content written.
+
+    Members that would end up outside `directory`, links to absolute paths
+    and special files are rejected (the "data" extraction filter).
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    size = 0
+    with tarfile.open(fileobj=_IterReader(chunks), mode="r|*") as tar:
+        for member in tar:
+            tar.extract(member, directory, filter="data")
+            if member.isfile():
+                size += member.size
+    return size
+
+
+def sha256_file(path: Path, limit: int | None = None) -> str:
+    """Hex SHA-256 digest of a file (or of its first `limit` bytes), read in
+    chunks."""
+    digest = hashlib.sha256()
+    remaining = limit
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            size = CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining)
+            chunk = f.read(size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return digest.hexdigest()
@@ -1,17 +1,78 @@
+import io
+import json
+import queue
+import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, cast
+from urllib.parse import quote
 
 import httpx
 from pydantic import Field, PrivateAttr
 
 from openhands.sdk.logger import get_logger
+from openhands.sdk.utils.tar_stream import (
+    CHUNK_SIZE,
+    extract_tar,
+    iter_tar,
+    sha256_file,
+)
 from openhands.sdk.workspace.base import BaseWorkspace
 from openhands.sdk.workspace.models import CommandResult, FileOperationResult
 
 
 logger = get_logger(__name__)
 
+OutputCallback = Callable[[str, str], None]
+"""Called with the stream name ("stdout" or "stderr") and a chunk of output."""
+
+ProgressCallback = Callable[[int, int | None], None]
+"""Called with the bytes transferred so far and the total size (if known)."""
+
+# Large transfers may take long, but no single read or write should stall
+_TRANSFER_TIMEOUT = httpx.Timeout(60.0)
+
+
+class _ChunkReader(io.RawIOBase):
+    """File-like view of the rest of an open file for a multipart upload.
+
+    httpx rewinds file objects and sends them whole; this reads from the
+    current position instead (so an upload can resume at an offset) and
+    reports progress as the body is sent.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        offset: int,
+        total: int,
+        on_progress: ProgressCallback | None,
+    ):
+        super().__init__()
+        self._file = file
+        self._done = offset
+        self._total = total
+        self._on_progress = on_progress
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(max(size, CHUNK_SIZE) if size > 0 else -1)
+        self._done += len(chunk)
+        if chunk and self._on_progress is not None:
+            self._on_progress(self._done, self._total)
+        return chunk
+
+
+def _notify_output(event: dict[str, Any], on_output: OutputCallback | None) -> None:
+    if on_output is None:
+        return
+    for stream in ("stdout", "stderr"):
+        if event.get(stream):
+            on_output(stream, event[stream])
+
 
 class RemoteWorkspace(BaseWorkspace):
     """Mixin providing remote workspace operations."""
@@ -45,23 +106,26 @@ class RemoteWorkspace(BaseWorkspace):
         command: str,
         cwd: str | Path | None = None,
         timeout: float = 30.0,
+        on_output: OutputCallback | None = None,
     ) -> CommandResult:
         """Execute a bash command on the remote system.
 
-        This method starts a bash command via the remote agent server API,
-        then polls for the output until the command completes.
+        The agent server streams the command's output back on the request that
+        starts it, so the result is available as soon as the command exits.
+        Servers without the streaming endpoint are polled instead.
 
         Args:
             command: The bash command to execute
             cwd: Working directory (optional)
             timeout: Timeout in seconds
+            on_output: Optional callback, called with the stream name ("stdout"
+                or "stderr") and text of each chunk of output as it arrives
 
         Returns:
             CommandResult: Result with stdout, stderr, exit_code, and other metadata
         """
         logger.debug(f"Executing remote command: {command}")
 
-        # Step 1: Start the bash command
         payload = {
             "command": command,
             "timeout": int(timeout),
@@ -70,57 +134,22 @@ class RemoteWorkspace(BaseWorkspace):
             payload["cwd"] = str(cwd)
 
         try:
-            # Start the command
-            response = self._client.post(
-                "/api/bash/execute_bash_command",
-                json=payload,
-                timeout=timeout + 5.0,  # Add buffer to HTTP timeout
+            outputs = self._stream_command_output(payload, timeout, on_output)
+            if outputs is None:
+                outputs = self._poll_command_output(payload, timeout, on_output)
+
+            # Polled events within the same second are not in output order
+            outputs.sort(key=lambda event: event.get("order", 0))
+            stdout_parts = [e["stdout"] for e in outputs if e.get("stdout")]
+            stderr_parts = [e["stderr"] for e in outputs if e.get("stderr")]
+            exit_code = next(
+                (
+                    e["exit_code"]
+                    for e in reversed(outputs)
+                    if e.get("exit_code") is not None
+                ),
+                None,
             )
-            response.raise_for_status()
-            bash_command = response.json()
-            command_id = bash_command["id"]
-
-            logger.debug(f"Started command with ID: {command_id}")
-
-            # Step 2: Poll for output until command completes
-            start_time = time.time()
-            stdout_parts = []
-            stderr_parts = []
-            exit_code = None
-
-            while time.time() - start_time < timeout:
-                # Search for all events and filter client-side
-                # (workaround for bash service filtering bug)
-                search_response = self._client.get(
-                    "/api/bash/bash_events/search",
-                    params={
-                        "sort_order": "TIMESTAMP",
-                        "limit": 100,
-                    },
-                    timeout=10.0,
-                )
-                search_response.raise_for_status()
-                search_result = search_response.json()
-
-                # Filter for BashOutput events for this command
-                for event in search_result.get("items", []):
-                    if (
-                        event.get("kind") == "BashOutput"
-                        and event.get("command_id") == command_id
-                    ):
-                        if event.get("stdout"):
-                            stdout_parts.append(event["stdout"])
-                        if event.get("stderr"):
-                            stderr_parts.append(event["stderr"])
-                        if event.get("exit_code") is not None:
-                            exit_code = event["exit_code"]
-
-                # If we have an exit code, the command is complete
-                if exit_code is not None:
-                    break
-
-                # Wait a bit before polling again
-                time.sleep(0.1)
 
             # If we timed out waiting for completion
             if exit_code is None:
@@ -150,18 +179,157 @@ class RemoteWorkspace(BaseWorkspace):
                 timeout_occurred=False,
             )
 
+    def _stream_command_output(
+        self,
+        payload: dict[str, Any],
+        timeout: float,
+        on_output: OutputCallback | None,
+    ) -> list[dict[str, Any]] | None:
+        """Run a command through the streaming endpoint, returning its BashOutput
+        events, or None if the server does not have the endpoint.
+
+        Lines are read on a separate thread, so waiting for the next one is
+        bounded by the time left before the deadline even when the command is
+        silent; the response is closed at the deadline, which ends the read.
+        """
+        deadline = time.monotonic() + timeout
+        outputs = []
+        with self._client.stream(
+            "POST",
+            "/api/bash/execute_bash_command/stream",
+            json=payload,
+            timeout=timeout + 5.0,  # Add buffer to HTTP timeout
+        ) as response:
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            lines: queue.Queue[str | Exception | None] = queue.Queue()
+
+            def read_lines() -> None:
+                try:
+                    for line in response.iter_lines():
+                        lines.put(line)
+                except Exception as e:
+                    lines.put(e)
+                finally:
+                    lines.put(None)
+
+            threading.Thread(
+                target=read_lines, name="bash-stream-reader", daemon=True
+            ).start()
+            try:
+                while (remaining := deadline - time.monotonic()) > 0:
+                    try:
+                        line = lines.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    if line is None:
+                        break
+                    if isinstance(line, Exception):
+                        raise line
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if event.get("kind") != "BashOutput":
+                        logger.debug(f"Started command with ID: {event.get('id')}")
+                        continue
+                    outputs.append(event)
+                    _notify_output(event, on_output)
+                    if event.get("exit_code") is not None:
+                        break
+            finally:
+                response.close()
+        return outputs
+
+    def _poll_command_output(
+        self,
+        payload: dict[str, Any],
+        timeout: float,
+        on_output: OutputCallback | None,
+    ) -> list[dict[str, Any]]:
+        """Start a command and poll the event search until it exits, returning
+        its BashOutput events."""
+        response = self._client.post(
+            "/api/bash/execute_bash_command",
+            json=payload,
+            timeout=timeout + 5.0,  # Add buffer to HTTP timeout
+        )
+        response.raise_for_status()
+        command_id = response.json()["id"]
+        logger.debug(f"Started command with ID: {command_id}")
+
+        # Each poll only asks for this command's output since the last event
+        # seen (timestamps are matched to the second, so events seen before
+        # are skipped by id)
+        start_time = time.time()
+        outputs = []
+        since = None
+        page_id = None
+        seen_ids: set[str] = set()
+
+        while time.time() - start_time < timeout:
+            params = {
+                "kind__eq": "BashOutput",
+                "command_id__eq": command_id,
+                "sort_order": "TIMESTAMP",
+                "limit": 100,
+            }
+            if since:
+                params["timestamp__gte"] = since
+            if page_id:
+                params["page_id"] = page_id
+            search_response = self._client.get(
+                "/api/bash/bash_events/search",
+                params=params,
+                timeout=10.0,
+            )
+            search_response.raise_for_status()
+            search_result = search_response.json()
+
+            items = search_result.get("items", [])
+            for event in items:
+                if event["id"] in seen_ids:
+                    continue
+                seen_ids.add(event["id"])
+                outputs.append(event)
+                _notify_output(event, on_output)
+
+            page_id = search_result.get("next_page_id")
+            if page_id:
+                continue
+            if items:
+                since = items[-1]["timestamp"]
+
+            # If we have an exit code, the command is complete
+            if any(event.get("exit_code") is not None for event in items):
+                break
+
+            # Wait a bit before polling again
+            time.sleep(0.1)
+
+        return outputs
+
     def file_upload(
         self,
         source_path: str | Path,
         destination_path: str | Path,
+        resume: bool = False,
+        verify_checksum: bool = False,
+        on_progress: ProgressCallback | None = None,
     ) -> FileOperationResult:
         """Upload a file to the remote system.
 
-        Reads the local file and sends it to the remote system via HTTP API.
+        The file is streamed from disk in chunks, so it is never held in memory.
 
         Args:
             source_path: Path to the local source file
             destination_path: Path where the file should be uploaded on remote system
+            resume: Continue a previously interrupted upload, keeping the part
+                of the remote file already uploaded
+            verify_checksum: Compare the SHA-256 of the remote file with the
+                local one after uploading
+            on_progress: Optional callback, called with the bytes sent so far
+                and the total size
 
         Returns:
             FileOperationResult: Result with success status and metadata
@@ -172,31 +340,39 @@ class RemoteWorkspace(BaseWorkspace):
         logger.debug(f"Remote file upload: {source} -> {destination}")
 
         try:
-            # Read the file content
-            with open(source, "rb") as f:
-                file_content = f.read()
-
-            # Prepare the upload
-            files = {"file": (source.name, file_content)}
-            data = {"destination_path": str(destination)}
+            total = source.stat().st_size
+            offset = 0
+            if resume:
+                remote_size = self._remote_file_size(destination)
+                if (
+                    remote_size is not None
+                    and remote_size <= total
+                    and self._prefix_matches(destination, source, remote_size)
+                ):
+                    offset = remote_size
 
-            # Make synchronous HTTP call
-            response = self._client.post(
-                "/api/files/upload",
-                files=files,
-                data=data,
-                timeout=60.0,
-            )
+            with open(source, "rb") as f:
+                f.seek(offset)
+                reader = _ChunkReader(f, offset, total, on_progress)
+                response = self._client.post(
+                    f"/api/file/upload/{quote(str(destination))}",
+                    files={"file": (source.name, cast(BinaryIO, reader))},
+                    params={"offset": offset},
+                    timeout=_TRANSFER_TIMEOUT,
+                )
             response.raise_for_status()
             result_data = response.json()
+            error = None
+            if verify_checksum:
+                error = self._checksum_error(destination, source)
 
             # Convert the API response to our model
             return FileOperationResult(
-                success=result_data.get("success", True),
+                success=error is None,
                 source_path=str(source),
                 destination_path=str(destination),
                 file_size=result_data.get("file_size"),
-                error=result_data.get("error"),
+                error=error,
             )
 
         except Exception as e:
@@ -212,54 +388,225 @@ class RemoteWorkspace(BaseWorkspace):
         self,
         source_path: str | Path,
         destination_path: str | Path,
+        resume: bool = False,
+        verify_checksum: bool = False,
+        on_progress: ProgressCallback | None = None,
     ) -> FileOperationResult:
         """Download a file from the remote system.
 
-        Requests the file from the remote system via HTTP API and saves it locally.
+        The file is streamed to `<destination>.part` in chunks and renamed once
+        complete, so it is never held in memory.
 
         Args:
             source_path: Path to the source file on remote system
             destination_path: Path where the file should be saved locally
+            resume: Continue from a `.part` file left by an interrupted
+                download, requesting only the missing range
+            verify_checksum: Compare the SHA-256 of the downloaded file with
+                the remote one
+            on_progress: Optional callback, called with the bytes received so
+                far and the total size (if known)
 
         Returns:
             FileOperationResult: Result with success status and metadata
         """
         source = Path(source_path)
         destination = Path(destination_path)
+        partial = destination.with_name(destination.name + ".part")
 
         logger.debug(f"Remote file download: {source} -> {destination}")
 
         try:
-            # Request the file from remote system
-            params = {"file_path": str(source)}
+            # Ensure destination directory exists
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            offset = partial.stat().st_size if resume and partial.exists() else 0
+            if offset and not self._prefix_matches(source, partial, offset):
+                # The remote file shrank or was replaced since the partial
+                # download, so its bytes cannot be reused
+                logger.debug(f"Restarting download of changed file {source}")
+                offset = 0
+            # A 416 answer means the partial file already holds the whole
+            # remote file
+            self._download_range(source, partial, offset, on_progress)
+            partial.replace(destination)
+
+            error = None
+            if verify_checksum:
+                error = self._checksum_error(source, destination)
 
-            # Make synchronous HTTP call
-            response = self._client.get(
-                "/api/files/download",
-                params=params,
-                timeout=60.0,
+            return FileOperationResult(
+                success=error is None,
+                source_path=str(source),
+                destination_path=str(destination),
+                file_size=destination.stat().st_size,
+                error=error,
             )
-            response.raise_for_status()
 
-            # Ensure destination directory exists
-            destination.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error(f"Remote file download failed: {e}")
+            return FileOperationResult(
+                success=False,
+                source_path=str(source),
+                destination_path=str(destination),
+                error=str(e),
+            )
 
-            # Write the file content
-            with open(destination, "wb") as f:
-                f.write(response.content)
+    def upload_directory(
+        self,
+        source_path: str | Path,
+        destination_path: str | Path,
+        compress: bool = False,
+    ) -> FileOperationResult:
+        """Upload a local directory to the remote system as one tar stream.
+
+        Args:
+            source_path: Path to the local directory
+            destination_path: Directory on the remote system to extract into
+            compress: Gzip the stream (worth it for compressible content over
+                slow links)
 
+        Returns:
+            FileOperationResult: Result with the total bytes of file content
+        """
+        source = Path(source_path)
+        destination = Path(destination_path)
+        logger.debug(f"Remote directory upload: {source} -> {destination}")
+
+        try:
+            if not source.is_dir():
+                raise NotADirectoryError(str(source))
+            response = self._client.post(
+                f"/api/file/upload_dir/{quote(str(destination))}",
+                content=iter_tar(source, compress=compress),
+                headers={"Content-Type": "application/x-tar"},
+                timeout=_TRANSFER_TIMEOUT,
+            )
+            response.raise_for_status()
             return FileOperationResult(
                 success=True,
                 source_path=str(source),
                 destination_path=str(destination),
-                file_size=len(response.content),
+                file_size=response.json().get("file_size"),
+            )
+        except Exception as e:
+            logger.error(f"Remote directory upload failed: {e}")
+            return FileOperationResult(
+                success=False,
+                source_path=str(source),
+                destination_path=str(destination),
+                error=str(e),
             )
 
+    def download_directory(
+        self,
+        source_path: str | Path,
+        destination_path: str | Path,
+        compress: bool = False,
+    ) -> FileOperationResult:
+        """Download a directory from the remote system as one tar stream.
+
+        Args:
+            source_path: Directory on the remote system
+            destination_path: Local directory to extract into
+            compress: Ask the server to gzip the stream
+
+        Returns:
+            FileOperationResult: Result with the total bytes of file content
+        """
+        source = Path(source_path)
+        destination = Path(destination_path)
+        logger.debug(f"Remote directory download: {source} -> {destination}")
+
+        try:
+            with self._client.stream(
+                "GET",
+                f"/api/file/download_dir/{quote(str(source))}",
+                params={"compress": compress},
+                timeout=_TRANSFER_TIMEOUT,
+            ) as response:
+                response.raise_for_status()
+                size = extract_tar(response.iter_raw(CHUNK_SIZE), destination)
+            return FileOperationResult(
+                success=True,
+                source_path=str(source),
+                destination_path=str(destination),
+                file_size=size,
+            )
         except Exception as e:
-            logger.error(f"Remote file download failed: {e}")
+            logger.error(f"Remote directory download failed: {e}")
             return FileOperationResult(
                 success=False,
                 source_path=str(source),
                 destination_path=str(destination),
                 error=str(e),
             )
+
+    def _download_range(
+        self,
+        source: Path,
+        partial: Path,
+        offset: int,
+        on_progress: ProgressCallback | None,
+    ) -> bool:
+        """Stream `source` from `offset` into `partial`.
+
+        Returns False if the server answered 416 (range not satisfiable).
+        """
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        with self._client.stream(
+            "GET",
+            f"/api/file/download/{quote(str(source))}",
+            headers=headers,
+            timeout=_TRANSFER_TIMEOUT,
+        ) as response:
+            if response.status_code == 416:
+                return False
+            response.raise_for_status()
+            if response.status_code != 206:
+                offset = 0
+            length = response.headers.get("Content-Length")
+            total = offset + int(length) if length is not None else None
+            done = offset
+            with open(partial, "ab" if offset else "wb") as f:
+                for chunk in response.iter_bytes(CHUNK_SIZE):
+                    f.write(chunk)
+                    done += len(chunk)
+                    if on_progress is not None:
+                        on_progress(done, total)
+        return True
+
+    def _remote_file_size(self, path: Path) -> int | None:
+        response = self._client.get(f"/api/file/info/{quote(str(path))}")
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()["file_size"]
+
+    def _prefix_matches(self, remote: Path, local: Path, length: int) -> bool:
+        """Whether the first `length` bytes of `remote` and `local` are the same,
+        so that a transfer interrupted after them can be resumed."""
+        response = self._client.get(
+            f"/api/file/info/{quote(str(remote))}",
+            params={"checksum": True, "prefix": length},
+            timeout=_TRANSFER_TIMEOUT,
+        )
+        if response.status_code == 404:
+            return False
+        response.raise_for_status()
+        info = response.json()
+        return info["file_size"] >= length and info["sha256"] == sha256_file(
+            local, length
+        )
+
+    def _checksum_error(self, remote: Path, local: Path) -> str | None:
+        response = self._client.get(
+            f"/api/file/info/{quote(str(remote))}",
+            params={"checksum": True},
+            timeout=_TRANSFER_TIMEOUT,
+        )
+        response.raise_for_status()
+        remote_sha256 = response.json()["sha256"]
+        local_sha256 = sha256_file(local)
+        if remote_sha256 != local_sha256:
+            return f"Checksum mismatch: local {local_sha256}, remote {remote_sha256}"
+        return None
@@ -28,4 +28,9 @@ NO_CHANGE_TIMEOUT_SECONDS = 30
 
 # How often to poll for new output in seconds
 POLL_INTERVAL = 0.5
+
+# Output of a running command is published at most this often (in seconds),
+# and at most this many characters at a time (the latest output wins)
+OUTPUT_CHUNK_INTERVAL = 1.0
+OUTPUT_CHUNK_MAX_SIZE = 16 * 1024
 HISTORY_LIMIT = 10_000
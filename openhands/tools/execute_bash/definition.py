@@ -244,6 +244,7 @@ class BashTool(ToolDefinition[ExecuteBashAction, ExecuteBashObservation]):
         terminal_type: Literal["tmux", "subprocess"] | None = None,
         env_provider: Callable[[str], dict[str, str]] | None = None,
         env_masker: Callable[[str], str] | None = None,
+        secret_max_length: Callable[[], int] | None = None,
     ) -> Sequence["BashTool"]:
         """Initialize BashTool with executor parameters.
 
@@ -264,6 +265,9 @@ class BashTool(ToolDefinition[ExecuteBashAction, ExecuteBashObservation]):
             env_masker: Optional callable that returns current secret values
                         for masking purposes. This ensures consistent masking
                         even when env_provider calls fail.
+            secret_max_length: Optional callable returning the length of the
+                        longest secret env_masker masks, used to mask secrets
+                        split across chunks of live output.
         """
         # Import here to avoid circular imports
         from openhands.tools.execute_bash.impl import BashExecutor
@@ -280,6 +284,7 @@ class BashTool(ToolDefinition[ExecuteBashAction, ExecuteBashObservation]):
             terminal_type=terminal_type,
             env_provider=env_provider,
             env_masker=env_masker,
+            secret_max_length=secret_max_length,
         )
 
         # Initialize the parent ToolDefinition with the executor
@@ -1,18 +1,69 @@
 import json
+import time
 from collections.abc import Callable
 from typing import Literal
 
 from openhands.sdk.logger import get_logger
-from openhands.sdk.tool import ToolExecutor
+from openhands.sdk.tool import (
+    ToolExecutor,
+    ToolOutputCallback,
+    get_tool_output_callback,
+)
 from openhands.tools.execute_bash.definition import (
     ExecuteBashAction,
     ExecuteBashObservation,
 )
-from openhands.tools.execute_bash.terminal.factory import create_terminal_session
+from openhands.tools.execute_bash.terminal.factory import acquire_terminal_session
 
 
 logger = get_logger(__name__)
 
+# Length assumed for the longest secret when it is unknown
+DEFAULT_SECRET_MAX_LENGTH = 256
+
+
+class _MaskedOutput:
+    """Masks secrets in live output, whose chunks may split a secret.
+
+    Chunks are cut at arbitrary points, so the last `secret_max_length() - 1`
+    characters (all of a secret but its final one) are held back until the
+    next chunk, and the cut is moved back further if a secret straddles it.
+    After skipped output, the held-back text and as many characters from the
+    start of the new chunk may each be part of a secret whose rest was
+    skipped, so they are dropped and counted as skipped. Text
+    still held back when the command ends is not published; the observation
+    carries the full, masked output.
+    """
+
+    def __init__(
+        self,
+        callback: ToolOutputCallback,
+        mask: Callable[[str], str],
+        secret_max_length: Callable[[], int],
+    ):
+        self._callback = callback
+        self._mask = mask
+        self._secret_max_length = secret_max_length
+        self._pending = ""
+        self._skipped = 0
+
+    def __call__(self, output: str, skipped: int) -> None:
+        holdback = max(self._secret_max_length() - 1, 0)
+        if skipped:
+            self._skipped += skipped + len(self._pending) + min(holdback, len(output))
+            self._pending = ""
+            output = output[holdback:]
+        text = self._pending + output
+        cut = max(len(text) - holdback, 0)
+        masked = self._mask(text)
+        while cut > 0 and self._mask(text[:cut]) + self._mask(text[cut:]) != masked:
+            cut -= 1
+        self._pending = text[cut:]
+        if cut == 0:
+            return
+        self._callback(self._mask(text[:cut]), self._skipped)
+        self._skipped = 0
+
 
 class BashExecutor(ToolExecutor):
     def __init__(
@@ -23,6 +74,7 @@ class BashExecutor(ToolExecutor):
         terminal_type: Literal["tmux", "subprocess"] | None = None,
         env_provider: Callable[[str], dict[str, str]] | None = None,
         env_masker: Callable[[str], str] | None = None,
+        secret_max_length: Callable[[], int] | None = None,
     ):
         """Initialize BashExecutor with auto-detected or specified session type.
 
@@ -38,20 +90,29 @@ class BashExecutor(ToolExecutor):
             env_masker: Optional function that returns current secret values
                         for masking purposes. This ensures consistent masking
                         even when env_provider calls fail.
+            secret_max_length: Optional function returning the length of the
+                        longest secret env_masker masks. Output published
+                        while a command runs holds back that many characters
+                        minus one, so a secret split across chunks is still
+                        masked; without it, DEFAULT_SECRET_MAX_LENGTH is
+                        assumed.
         """
-        self.session = create_terminal_session(
+        start = time.perf_counter()
+        # From the terminal pool if one is configured (see configure_terminal_pool)
+        self.session = acquire_terminal_session(
             work_dir=working_dir,
             username=username,
             no_change_timeout_seconds=no_change_timeout_seconds,
             terminal_type=terminal_type,
         )
-        self.session.initialize()
         self.env_provider = env_provider
         self.env_masker = env_masker
+        self.secret_max_length = secret_max_length
         logger.info(
             f"BashExecutor initialized with working_dir: {working_dir}, "
             f"username: {username}, "
-            f"terminal_type: {terminal_type or self.session.__class__.__name__}"
+            f"terminal_type: {terminal_type or self.session.__class__.__name__} "
+            f"in {time.perf_counter() - start:.2f}s"
         )
 
     def _export_envs(self, action: ExecuteBashAction) -> None:
@@ -83,6 +144,21 @@ class BashExecutor(ToolExecutor):
             )
         )
 
+    def _output_callback(self) -> ToolOutputCallback | None:
+        """Where to publish output while a command runs (secrets masked)."""
+        callback = get_tool_output_callback()
+        env_masker = self.env_masker
+        if callback is None or env_masker is None:
+            return callback
+
+        return _MaskedOutput(
+            callback,
+            env_masker,
+            secret_max_length=(
+                self.secret_max_length or (lambda: DEFAULT_SECRET_MAX_LENGTH)
+            ),
+        )
+
     def reset(self) -> ExecuteBashObservation:
         """Reset the terminal session by creating a new instance.
 
@@ -94,13 +170,12 @@ class BashExecutor(ToolExecutor):
         original_no_change_timeout = self.session.no_change_timeout_seconds
 
         self.session.close()
-        self.session = create_terminal_session(
+        self.session = acquire_terminal_session(
             work_dir=original_work_dir,
             username=original_username,
             no_change_timeout_seconds=original_no_change_timeout,
             terminal_type=None,  # Let it auto-detect like before
         )
-        self.session.initialize()
 
         logger.info(
             f"Terminal session reset successfully with working_dir: {original_work_dir}"
@@ -120,6 +195,7 @@ class BashExecutor(ToolExecutor):
         if action.reset and action.is_input:
             raise ValueError("Cannot use reset=True with is_input=True")
 
+        on_output = self._output_callback()
         if action.reset:
             reset_result = self.reset()
 
@@ -131,7 +207,7 @@ class BashExecutor(ToolExecutor):
                     is_input=False,  # is_input validated to be False when reset=True
                 )
                 self._export_envs(command_action)
-                command_result = self.session.execute(command_action)
+                command_result = self.session.execute(command_action, on_output)
                 observation = command_result.model_copy(
                     update={
                         "output": (
@@ -146,7 +222,7 @@ class BashExecutor(ToolExecutor):
         else:
             # If env keys detected, export env values to bash as a separate action first
             self._export_envs(action)
-            observation = self.session.execute(action)
+            observation = self.session.execute(action, on_output)
 
         # Apply automatic secrets masking using env_masker
         if self.env_masker and observation.output:
@@ -1,4 +1,10 @@
-from openhands.tools.execute_bash.terminal.factory import create_terminal_session
+from openhands.tools.execute_bash.terminal.factory import (
+    TerminalPool,
+    acquire_terminal_session,
+    configure_terminal_pool,
+    create_terminal_session,
+    get_terminal_pool,
+)
 from openhands.tools.execute_bash.terminal.interface import (
     TerminalInterface,
     TerminalSessionBase,
@@ -19,4 +25,8 @@ __all__ = [
     "TerminalSession",
     "TerminalCommandStatus",
     "create_terminal_session",
+    "TerminalPool",
+    "acquire_terminal_session",
+    "configure_terminal_pool",
+    "get_terminal_pool",
 ]
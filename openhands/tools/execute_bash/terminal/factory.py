@@ -1,15 +1,24 @@
 """Factory for creating appropriate terminal sessions based on system capabilities."""
 
+import os
 import platform
+import shlex
 import subprocess
+import tempfile
+import threading
+from dataclasses import dataclass, field
 from typing import Literal
 
 from openhands.sdk.logger import get_logger
+from openhands.tools.execute_bash.constants import NO_CHANGE_TIMEOUT_SECONDS
+from openhands.tools.execute_bash.definition import ExecuteBashAction
 from openhands.tools.execute_bash.terminal.terminal_session import TerminalSession
 
 
 logger = get_logger(__name__)
 
+TerminalType = Literal["tmux", "subprocess"]
+
 
 def _is_tmux_available() -> bool:
     """Check if tmux is available on the system."""
@@ -50,7 +59,7 @@ def create_terminal_session(
     work_dir: str,
     username: str | None = None,
     no_change_timeout_seconds: int | None = None,
-    terminal_type: Literal["tmux", "subprocess"] | None = None,
+    terminal_type: TerminalType | None = None,
 ) -> TerminalSession:
     """Create an appropriate terminal session based on system capabilities.
 
@@ -111,3 +120,252 @@ def create_terminal_session(
             logger.info("Auto-detected: Using SubprocessTerminal (tmux not available)")
             terminal = SubprocessTerminal(work_dir, username)
             return TerminalSession(terminal, no_change_timeout_seconds)
+
+
+# Seconds a pooled shell may take to switch to the requested directory
+_RESET_TIMEOUT = 10.0
+# Seconds to wait for a pooled shell that is already starting
+_ACQUIRE_TIMEOUT = 30.0
+
+
+@dataclass
+class _WarmSession:
+    session: TerminalSession
+    # os.environ when the shell was started (and inherited it)
+    environment: dict[str, str] = field(default_factory=lambda: dict(os.environ))
+
+
+def _environment_changes(before: dict[str, str], after: dict[str, str]) -> list[str]:
+    """Shell commands bringing a shell started with `before` up to `after`."""
+    commands = [
+        f"unset {key}" for key in before if key not in after and key.isidentifier()
+    ]
+    for key, value in after.items():
+        if before.get(key) == value:
+            continue
+        if "\n" in value or not key.isidentifier():
+            logger.debug(f"Not passing {key} to a pooled shell")
+            continue
+        commands.append(f"export {key}={shlex.quote(value)}")
+    return commands
+
+
+class TerminalPool:
+    """Initialized terminal sessions kept ready to be handed out.
+
+    Starting a shell and waiting for its first prompt takes from a fraction of
+    a second to several seconds, which every new conversation would otherwise
+    pay before its first command. The pool keeps up to `size` idle sessions per
+    profile (terminal type and username), started in `spawn_dir` and
+    replenished in the background. When one is handed out it is reset to the
+    requested working directory, and environment variables that changed in
+    this process since it was started are exported (or unset) in it.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        spawn_dir: str | None = None,
+        acquire_timeout: float = _ACQUIRE_TIMEOUT,
+    ):
+        self.size = size
+        self.spawn_dir = spawn_dir or tempfile.gettempdir()
+        self.acquire_timeout = acquire_timeout
+        self.hits = 0
+        self.misses = 0
+        self._idle: dict[tuple[TerminalType, str | None], list[_WarmSession]] = {}
+        self._filling: set[tuple[TerminalType, str | None]] = set()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def acquire(
+        self,
+        work_dir: str,
+        username: str | None = None,
+        no_change_timeout_seconds: int | None = None,
+        terminal_type: TerminalType | None = None,
+    ) -> TerminalSession:
+        """Hand out an initialized session in `work_dir`, starting a new one
+        if none is ready.
+
+        Raises:
+            TimeoutError: If a pooled shell that is already starting does not
+                become ready within `acquire_timeout` seconds
+        """
+        profile = (terminal_type or _default_terminal_type(), username)
+        with self._condition:
+            # A shell that is already starting is ready sooner than a new one
+            if not self._condition.wait_for(
+                lambda: self._idle.get(profile) or profile not in self._filling,
+                timeout=self.acquire_timeout,
+            ):
+                raise TimeoutError(
+                    f"Timed out after {self.acquire_timeout}s waiting for a pooled "
+                    f"{profile[0]} terminal to start"
+                )
+            idle = self._idle.get(profile)
+            warm = idle.pop() if idle else None
+        self._replenish(profile)
+
+        if warm is not None:
+            session = self._reset(warm, work_dir, no_change_timeout_seconds)
+            if session is not None:
+                with self._condition:
+                    self.hits += 1
+                return session
+        with self._condition:
+            self.misses += 1
+        session = create_terminal_session(
+            work_dir=work_dir,
+            username=username,
+            no_change_timeout_seconds=no_change_timeout_seconds,
+            terminal_type=profile[0],
+        )
+        session.initialize()
+        return session
+
+    def prewarm(
+        self, username: str | None = None, terminal_type: TerminalType | None = None
+    ) -> None:
+        """Start filling the pool for a profile in the background."""
+        self._replenish((terminal_type or _default_terminal_type(), username))
+
+    def idle_count(
+        self, username: str | None = None, terminal_type: TerminalType | None = None
+    ) -> int:
+        """Number of sessions ready to be handed out for a profile."""
+        profile = (terminal_type or _default_terminal_type(), username)
+        with self._condition:
+            return len(self._idle.get(profile, []))
+
+    def close(self) -> None:
+        """Close the idle sessions and stop replenishing."""
+        with self._condition:
+            self._closed = True
+            idle = [warm for sessions in self._idle.values() for warm in sessions]
+            self._idle.clear()
+        for warm in idle:
+            warm.session.close()
+
+    def _replenish(self, profile: tuple[TerminalType, str | None]) -> None:
+        with self._condition:
+            if self._closed or self.size <= 0 or profile in self._filling:
+                return
+            self._filling.add(profile)
+        threading.Thread(
+            target=self._fill, args=(profile,), name="terminal-pool", daemon=True
+        ).start()
+
+    def _fill(self, profile: tuple[TerminalType, str | None]) -> None:
+        terminal_type, username = profile
+        try:
+            while True:
+                with self._condition:
+                    if self._closed or len(self._idle.get(profile, [])) >= self.size:
+                        return
+                warm = _WarmSession(
+                    create_terminal_session(
+                        work_dir=self.spawn_dir,
+                        username=username,
+                        terminal_type=terminal_type,
+                    )
+                )
+                warm.session.initialize()
+                with self._condition:
+                    if not self._closed:
+                        self._idle.setdefault(profile, []).append(warm)
+                        self._condition.notify_all()
+                        continue
+                warm.session.close()
+                return
+        except Exception as e:
+            logger.warning(f"Failed to start a pooled {terminal_type} terminal: {e}")
+        finally:
+            with self._condition:
+                self._filling.discard(profile)
+                self._condition.notify_all()
+
+    def _reset(
+        self,
+        warm: _WarmSession,
+        work_dir: str,
+        no_change_timeout_seconds: int | None,
+    ) -> TerminalSession | None:
+        """Move a pooled session to `work_dir` and this process's current
+        environment, or close it and return None if that fails."""
+        session = warm.session
+        stream = session.terminal.output_stream
+        if stream is not None and stream.closed:
+            session.close()
+            return None
+
+        work_dir = os.path.abspath(work_dir)
+        commands = [f"cd -- {shlex.quote(work_dir)}"]
+        commands += _environment_changes(warm.environment, dict(os.environ))
+        try:
+            observation = session.execute(
+                ExecuteBashAction(command=" && ".join(commands), timeout=_RESET_TIMEOUT)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to reset a pooled terminal: {e}")
+            observation = None
+        if observation is None or observation.metadata.exit_code != 0:
+            session.close()
+            return None
+
+        session.work_dir = session.terminal.work_dir = work_dir
+        session.no_change_timeout_seconds = (
+            no_change_timeout_seconds or NO_CHANGE_TIMEOUT_SECONDS
+        )
+        return session
+
+
+def _default_terminal_type() -> TerminalType:
+    """The terminal type `create_terminal_session` picks when none is forced."""
+    if platform.system() == "Windows":
+        raise NotImplementedError("Windows is not supported yet for OpenHands V1.")
+    return "tmux" if _is_tmux_available() else "subprocess"
+
+
+_terminal_pool: TerminalPool | None = None
+
+
+def configure_terminal_pool(size: int, spawn_dir: str | None = None) -> None:
+    """Keep `size` ready sessions per profile for `acquire_terminal_session`
+    (0 disables pooling). Replaces, and closes, any previously configured pool.
+    """
+    global _terminal_pool
+    previous, _terminal_pool = (
+        _terminal_pool,
+        TerminalPool(size, spawn_dir) if size > 0 else None,
+    )
+    if previous is not None:
+        previous.close()
+
+
+def get_terminal_pool() -> TerminalPool | None:
+    """The pool configured with `configure_terminal_pool`, if any."""
+    return _terminal_pool
+
+
+def acquire_terminal_session(
+    work_dir: str,
+    username: str | None = None,
+    no_change_timeout_seconds: int | None = None,
+    terminal_type: TerminalType | None = None,
+) -> TerminalSession:
+    """An initialized terminal session: from the terminal pool if one is
+    configured, otherwise a newly created one."""
+    pool = _terminal_pool
+    if pool is not None:
+        return pool.acquire(
+            work_dir, username, no_change_timeout_seconds, terminal_type
+        )
+    session = create_terminal_session(
+        work_dir=work_dir,
+        username=username,
+        no_change_timeout_seconds=no_change_timeout_seconds,
+        terminal_type=terminal_type,
+    )
+    session.initialize()
+    return session
@@ -3,10 +3,12 @@
 import os
 from abc import ABC, abstractmethod
 
+from openhands.sdk.tool import ToolOutputCallback
 from openhands.tools.execute_bash.definition import (
     ExecuteBashAction,
     ExecuteBashObservation,
 )
+from openhands.tools.execute_bash.terminal.output_stream import TerminalOutputStream
 
 
 class TerminalInterface(ABC):
@@ -32,6 +34,9 @@ class TerminalInterface(ABC):
         self.username = username
         self._initialized = False
         self._closed = False
+        # Backends that can observe output as it arrives set this, so that
+        # sessions wait on it instead of polling read_screen()
+        self.output_stream: TerminalOutputStream | None = None
 
     @abstractmethod
     def initialize(self) -> None:
@@ -154,7 +159,11 @@ class TerminalSessionBase(ABC):
         """
 
     @abstractmethod
-    def execute(self, action: ExecuteBashAction) -> ExecuteBashObservation:
+    def execute(
+        self,
+        action: ExecuteBashAction,
+        on_output: ToolOutputCallback | None = None,
+    ) -> ExecuteBashObservation:
         """Execute a command in the terminal session.
 
         This method should execute the bash command specified in the action
@@ -162,6 +171,8 @@ class TerminalSessionBase(ABC):
 
         Args:
             action: The bash action to execute containing the command and parameters.
+            on_output: Optional callback receiving the command's output while it
+                is still running, with bounded rate and size.
 
         Returns:
             ExecuteBashObservation with the command result including output,
@@ -0,0 +1,161 @@
+"""Incremental view of a terminal's output for waiting on commands."""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+from openhands.tools.execute_bash.constants import (
+    CMD_OUTPUT_METADATA_PS1_REGEX,
+    CMD_OUTPUT_PS1_BEGIN,
+    CMD_OUTPUT_PS1_END,
+)
+from openhands.tools.execute_bash.metadata import CmdOutputMetadata
+
+
+_PS1_MARKER = CMD_OUTPUT_PS1_BEGIN.strip()
+# A prompt block longer than this is not ours; drop it rather than buffer it
+_MAX_PROMPT_SIZE = 64 * 1024
+_TAIL_SIZE = 4096
+# Recent output kept for `read`
+_RETAIN_SIZE = 64 * 1024
+# Stands in for the rest of an unfinished line that cannot start a prompt, so
+# that "^" does not match at the start of the next scan
+_MID_LINE = "\x00"
+
+
+class TerminalOutputStream:
+    """A terminal's output as an append-only stream with a cursor.
+
+    The terminal's reader thread `feed`s text as it arrives and waiters are
+    woken through a condition variable, so a session can block until there is
+    new output instead of polling the screen. PS1 prompts are found by scanning
+    only the newly appended text (plus an unfinished prompt carried over from
+    the previous chunk), so the cost of each update does not depend on how much
+    output the command has produced so far. The most recent output is retained
+    so that it can be published while a command is still running.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._cursor = 0
+        self._prompt_count = 0
+        self._carry = ""
+        self._tail = ""
+        self._retained: deque[str] = deque()
+        self._retained_size = 0
+        self._ends_with_prompt = False
+        self._last_output_time = time.time()
+        self._closed = False
+
+    @property
+    def cursor(self) -> int:
+        """Number of characters fed so far."""
+        return self._cursor
+
+    @property
+    def prompt_count(self) -> int:
+        """Number of complete PS1 prompts fed so far."""
+        return self._prompt_count
+
+    @property
+    def ends_with_prompt(self) -> bool:
+        """Whether the output so far ends with a PS1 prompt."""
+        return self._ends_with_prompt
+
+    @property
+    def last_output_time(self) -> float:
+        """When output was last fed (or the stream created), as `time.time()`."""
+        return self._last_output_time
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def feed(self, text: str) -> None:
+        """Append output (without carriage returns) and wake up waiters."""
+        if not text:
+            return
+        with self._condition:
+            self._cursor += len(text)
+            self._last_output_time = time.time()
+            self._tail = (self._tail + text)[-_TAIL_SIZE:]
+            self._ends_with_prompt = self._tail.rstrip().endswith(
+                CMD_OUTPUT_PS1_END.rstrip()
+            )
+            self._retain(text)
+            self._scan(text)
+            self._condition.notify_all()
+
+    def read(self, cursor: int, limit: int = _RETAIN_SIZE) -> tuple[str, int]:
+        """Output fed after `cursor`, at most the last `limit` characters of it.
+
+        Returns the text and how many characters before it were left out (past
+        the limit or no longer retained); the cursor after the text is `cursor`
+        plus both.
+        """
+        with self._condition:
+            available = self._cursor - cursor
+            if available <= 0:
+                return "", 0
+            size = min(available, limit, self._retained_size)
+            retained = "".join(self._retained)
+            return retained[len(retained) - size :], available - size
+
+    def close(self) -> None:
+        """Mark the stream as finished (the terminal went away)."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def wait(self, cursor: int, timeout: float | None) -> bool:
+        """Block until output past `cursor` arrives, the stream is closed or
+        `timeout` seconds pass. Returns whether the cursor moved."""
+        self.wait_until(lambda: self._cursor != cursor, timeout)
+        return self._cursor != cursor
+
+    def wait_until(self, predicate: Callable[[], bool], timeout: float | None) -> bool:
+        """Block until `predicate` holds, the stream is closed or `timeout`
+        seconds pass. The predicate is re-checked (with the stream locked)
+        whenever output is fed, so it should only compare the properties."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: predicate() or self._closed, timeout
+            )
+
+    def _retain(self, text: str) -> None:
+        self._retained.append(text)
+        self._retained_size += len(text)
+        while self._retained_size - len(self._retained[0]) >= _RETAIN_SIZE:
+            self._retained_size -= len(self._retained.popleft())
+
+    def _scan(self, text: str) -> None:
+        # The carry starts either at the start of a line or with _MID_LINE
+        data = self._carry + text
+        self._prompt_count += len(CmdOutputMetadata.matches_ps1_metadata(data))
+        rest = 0
+        for match in CMD_OUTPUT_METADATA_PS1_REGEX.finditer(data):
+            rest = match.end()
+        at_line_start = rest == 0 and not data.startswith(_MID_LINE)
+
+        # Keep whatever may still turn out to be a prompt once more output
+        # arrives: a started prompt block, or a line that may start one
+        start = data.rfind("\n" + _PS1_MARKER, rest) + 1
+        if start == 0 and at_line_start and data.startswith(_PS1_MARKER):
+            start = 0
+        elif start == 0:
+            newline = data.rfind("\n", rest)
+            if newline != -1:
+                start = newline + 1
+            elif at_line_start:
+                start = 0
+            else:
+                self._carry = _MID_LINE
+                return
+        carry = data[start:]
+        if len(carry) <= _MAX_PROMPT_SIZE and (
+            carry.startswith(_PS1_MARKER) or _PS1_MARKER.startswith(carry)
+        ):
+            self._carry = carry
+        else:
+            self._carry = _MID_LINE
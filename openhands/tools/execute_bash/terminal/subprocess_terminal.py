@@ -1,5 +1,6 @@
 """PTY-based terminal backend implementation (replaces pipe-based subprocess)."""
 
+import codecs
 import fcntl
 import os
 import pty
@@ -20,6 +21,7 @@ from openhands.tools.execute_bash.constants import (
 )
 from openhands.tools.execute_bash.metadata import CmdOutputMetadata
 from openhands.tools.execute_bash.terminal import TerminalInterface
+from openhands.tools.execute_bash.terminal.output_stream import TerminalOutputStream
 
 
 logger = get_logger(__name__)
@@ -58,6 +60,8 @@ class SubprocessTerminal(TerminalInterface):
         self.output_lock = threading.Lock()
         self.reader_thread: threading.Thread | None = None
         self._current_command_running = False
+        self._stream = TerminalOutputStream()
+        self.output_stream = self._stream
 
     # ------------------------- Lifecycle -------------------------
 
@@ -190,6 +194,8 @@ class SubprocessTerminal(TerminalInterface):
         fd = self._pty_master_fd
         if fd is None:
             return
+        # Characters split across reads are decoded once complete
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
         try:
             while True:
@@ -207,10 +213,11 @@ class SubprocessTerminal(TerminalInterface):
                     if not chunk:
                         break  # EOF
                     # Normalize newlines; PTY typically uses \n already
-                    text = chunk.decode("utf-8", errors="replace")
+                    text = decoder.decode(chunk)
                     with self.output_lock:
                         # Store one line per buffer item to make deque truncation work
                         self._add_text_to_buffer(text)
+                    self._stream.feed(text.replace("\r", ""))
                 except OSError:
                     # Would-block or FD closed
                     continue
@@ -219,6 +226,8 @@ class SubprocessTerminal(TerminalInterface):
                     break
         except Exception as e:
             logger.error(f"PTY reader thread error: {e}", exc_info=True)
+        finally:
+            self._stream.close()
 
     def _add_text_to_buffer(self, text: str) -> None:
         """Add text to buffer, ensuring one line per buffer item."""
@@ -263,16 +272,20 @@ class SubprocessTerminal(TerminalInterface):
         return False
 
     def _wait_for_prompt(self, timeout: float = 5.0) -> bool:
-        """Wait until the screen ends with our PS1 end marker (prompt visible)."""
+        """Wait until the output ends with our PS1 end marker (prompt visible)."""
         pat = re.compile(re.escape(CMD_OUTPUT_PS1_END.rstrip()) + r"\s*$")
         deadline = time.time() + timeout
-        while time.time() < deadline:
+        while True:
+            cursor = self._stream.cursor
             with self.output_lock:
-                tail = "".join(self.output_buffer)[-4096:]
+                # The prompt spans a few lines; one buffer item holds one line
+                tail = "".join(list(self.output_buffer)[-64:])
             if pat.search(tail):
                 return True
-            time.sleep(0.05)
-        return False
+            remaining = deadline - time.time()
+            if remaining <= 0 or self._stream.closed:
+                return False
+            self._stream.wait(cursor, remaining)
 
     # ------------------------- Public API -------------------------
 
@@ -5,9 +5,14 @@ import time
 from enum import Enum
 
 from openhands.sdk.logger import get_logger
+from openhands.sdk.tool import ToolOutputCallback
 from openhands.tools.execute_bash.constants import (
+    CMD_OUTPUT_METADATA_PS1_REGEX,
+    CMD_OUTPUT_PS1_BEGIN,
     CMD_OUTPUT_PS1_END,
     NO_CHANGE_TIMEOUT_SECONDS,
+    OUTPUT_CHUNK_INTERVAL,
+    OUTPUT_CHUNK_MAX_SIZE,
     POLL_INTERVAL,
     TIMEOUT_MESSAGE_TEMPLATE,
 )
@@ -20,6 +25,7 @@ from openhands.tools.execute_bash.terminal.interface import (
     TerminalInterface,
     TerminalSessionBase,
 )
+from openhands.tools.execute_bash.terminal.output_stream import TerminalOutputStream
 from openhands.tools.execute_bash.utils.command import (
     escape_bash_special_chars,
     split_bash_commands,
@@ -28,6 +34,13 @@ from openhands.tools.execute_bash.utils.command import (
 
 logger = get_logger(__name__)
 
+# CSI, OSC and two-character escape sequences, which clients tailing the
+# output cannot render
+_ANSI_ESCAPE = re.compile(
+    r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)?|[@-Z\\-_])"
+)
+_PS1_MARKER = CMD_OUTPUT_PS1_BEGIN.strip()
+
 
 class TerminalCommandStatus(Enum):
     """Status of a terminal command execution."""
@@ -43,6 +56,62 @@ def _remove_command_prefix(command_output: str, command: str) -> str:
     return command_output.lstrip().removeprefix(command.lstrip()).lstrip()
 
 
+def _clean_output_chunk(text: str) -> str:
+    """Drop escape sequences and PS1 metadata from raw terminal output."""
+    text = CMD_OUTPUT_METADATA_PS1_REGEX.sub("", _ANSI_ESCAPE.sub("", text))
+    # A prompt that has only partly arrived so far
+    start = text.find(_PS1_MARKER)
+    return text if start == -1 else text[:start]
+
+
+class _OutputPublisher:
+    """Publishes the output of a running command from the terminal's stream.
+
+    At most one chunk is handed to the callback per `interval` seconds, holding
+    at most the last `max_size` characters that arrived since the previous one.
+    """
+
+    def __init__(
+        self,
+        callback: ToolOutputCallback,
+        stream: TerminalOutputStream,
+        cursor: int,
+        interval: float = OUTPUT_CHUNK_INTERVAL,
+        max_size: int = OUTPUT_CHUNK_MAX_SIZE,
+    ):
+        self._callback = callback
+        self._stream = stream
+        self._cursor = cursor
+        self._interval = interval
+        self._max_size = max_size
+        self._skipped = 0
+        self._next_time = time.time() + interval
+
+    def wake_time(self) -> float:
+        """When the session should check for output to publish next."""
+        now = time.time()
+        return self._next_time if self._next_time > now else now + self._interval
+
+    def publish(self) -> None:
+        """Publish the output that arrived since the last chunk, if it is time."""
+        now = time.time()
+        if now < self._next_time or self._stream.cursor == self._cursor:
+            return
+        text, skipped = self._stream.read(self._cursor, self._max_size)
+        self._cursor += skipped + len(text)
+        self._next_time = now + self._interval
+        skipped += self._skipped
+        text = _clean_output_chunk(text)
+        if not text:
+            self._skipped = skipped
+            return
+        self._skipped = 0
+        try:
+            self._callback(text, skipped)
+        except Exception as e:
+            logger.warning(f"Error publishing command output: {e}")
+
+
 class TerminalSession(TerminalSessionBase):
     """Unified bash session that works with any TerminalInterface backend.
 
@@ -291,8 +360,17 @@ class TerminalSession(TerminalSessionBase):
         logger.debug(f"COMBINED OUTPUT: {combined_output}")
         return combined_output
 
-    def execute(self, action: ExecuteBashAction) -> ExecuteBashObservation:
-        """Execute a command using the terminal backend."""
+    def execute(
+        self,
+        action: ExecuteBashAction,
+        on_output: ToolOutputCallback | None = None,
+    ) -> ExecuteBashObservation:
+        """Execute a command using the terminal backend.
+
+        If `on_output` is given, the command's output is published to it while
+        the command runs (see `_OutputPublisher`); the terminal must provide an
+        output stream for that.
+        """
         if not self._initialized:
             raise RuntimeError("Unified session is not initialized")
 
@@ -388,6 +466,16 @@ class TerminalSession(TerminalSessionBase):
             logger.debug(f"RETURNING OBSERVATION (previous-command): {obs}")
             return obs
 
+        # Output from here on belongs to this command
+        stream = self.terminal.output_stream
+        sent_cursor = stream.cursor if stream is not None else 0
+        initial_stream_prompts = stream.prompt_count if stream is not None else 0
+        publisher = (
+            _OutputPublisher(on_output, stream, sent_cursor)
+            if on_output is not None and stream is not None
+            else None
+        )
+
         # Send actual command/inputs to the terminal
         if command != "":
             is_special_key = self._is_special_key(command)
@@ -408,24 +496,36 @@ class TerminalSession(TerminalSessionBase):
                     enter=not is_special_key,
                 )
 
+        def stream_shows_prompt() -> bool:
+            # The prompt the command was typed after does not count until the
+            # command's own output has started arriving
+            assert stream is not None
+            return stream.prompt_count > initial_stream_prompts or (
+                stream.ends_with_prompt
+                and (command == "" or stream.cursor != sent_cursor)
+            )
+
         # Loop until the command completes or times out
+        stream_cursor = sent_cursor
+        cur_terminal_output = last_terminal_output
+        ps1_matches = initial_ps1_matches
         while True:
-            _start_time = time.time()
-            logger.debug(f"GETTING TERMINAL CONTENT at {_start_time}")
-            cur_terminal_output = self.terminal.read_screen()
-            logger.debug(
-                f"TERMINAL CONTENT GOT after {time.time() - _start_time:.2f} seconds"
-            )
-            logger.debug(
-                f"BEGIN OF TERMINAL CONTENT: {cur_terminal_output.split('\n')[:10]}"
-            )
-            logger.debug(
-                f"END OF TERMINAL CONTENT: {cur_terminal_output.split('\n')[-10:]}"
-            )
-            ps1_matches = CmdOutputMetadata.matches_ps1_metadata(cur_terminal_output)
+            # With an output stream the screen is only read when the stream
+            # shows a new prompt (or a timeout needs the output), instead of
+            # on every iteration
+            may_have_completed = stream is None or stream_shows_prompt()
+            screen_is_current = False
+            if may_have_completed:
+                cur_terminal_output, ps1_matches = self._read_screen()
+                screen_is_current = True
             current_ps1_count = len(ps1_matches)
 
-            if cur_terminal_output != last_terminal_output:
+            if stream is not None:
+                if stream.cursor != stream_cursor:
+                    stream_cursor = stream.cursor
+                    last_change_time = stream.last_output_time
+                    logger.debug(f"CONTENT UPDATED DETECTED at {last_change_time}")
+            elif cur_terminal_output != last_terminal_output:
                 last_terminal_output = cur_terminal_output
                 last_change_time = time.time()
                 logger.debug(f"CONTENT UPDATED DETECTED at {last_change_time}")
@@ -435,7 +535,7 @@ class TerminalSession(TerminalSessionBase):
             # Condition 2: The prompt count hasn't increased (potentially because the
             # initial one scrolled off), BUT the *current* visible terminal ends with a
             # prompt, indicating completion.
-            if (
+            if screen_is_current and (
                 current_ps1_count > initial_ps1_count
                 or cur_terminal_output.rstrip().endswith(CMD_OUTPUT_PS1_END.rstrip())
             ):
@@ -447,6 +547,9 @@ class TerminalSession(TerminalSessionBase):
                 logger.debug(f"RETURNING OBSERVATION (completed): {obs}")
                 return obs
 
+            if publisher is not None:
+                publisher.publish()
+
             # Timeout checks should only trigger if a new prompt hasn't appeared yet.
 
             # 2) Execution timed out since there's no change in output
@@ -462,6 +565,8 @@ class TerminalSession(TerminalSessionBase):
                 not is_blocking
                 and time_since_last_change >= self.no_change_timeout_seconds
             ):
+                if not screen_is_current:
+                    cur_terminal_output, ps1_matches = self._read_screen()
                 obs = self._handle_nochange_timeout_command(
                     command,
                     terminal_content=cur_terminal_output,
@@ -479,6 +584,8 @@ class TerminalSession(TerminalSessionBase):
             if action.timeout is not None:
                 time_since_start = time.time() - start_time
                 if time_since_start >= action.timeout:
+                    if not screen_is_current:
+                        cur_terminal_output, ps1_matches = self._read_screen()
                     obs = self._handle_hard_timeout_command(
                         command,
                         terminal_content=cur_terminal_output,
@@ -488,5 +595,29 @@ class TerminalSession(TerminalSessionBase):
                     logger.debug(f"RETURNING OBSERVATION (hard-timeout): {obs}")
                     return obs
 
-            # Sleep before next check
-            time.sleep(POLL_INTERVAL)
+            if stream is None or stream.closed or may_have_completed:
+                # Sleep before next check
+                time.sleep(POLL_INTERVAL)
+                continue
+
+            # Wait for a prompt, but no longer than until the next timeout
+            if is_blocking:
+                assert action.timeout is not None
+                deadline = start_time + action.timeout
+            else:
+                deadline = last_change_time + self.no_change_timeout_seconds
+            if publisher is not None:
+                deadline = min(deadline, publisher.wake_time())
+            stream.wait_until(stream_shows_prompt, max(deadline - time.time(), 0))
+
+    def _read_screen(self) -> tuple[str, list[re.Match]]:
+        """Read the terminal screen and find the PS1 prompts on it."""
+        _start_time = time.time()
+        logger.debug(f"GETTING TERMINAL CONTENT at {_start_time}")
+        terminal_output = self.terminal.read_screen()
+        logger.debug(
+            f"TERMINAL CONTENT GOT after {time.time() - _start_time:.2f} seconds"
+        )
+        logger.debug(f"BEGIN OF TERMINAL CONTENT: {terminal_output.split('\n')[:10]}")
+        logger.debug(f"END OF TERMINAL CONTENT: {terminal_output.split('\n')[-10:]}")
+        return terminal_output, CmdOutputMetadata.matches_ps1_metadata(terminal_output)
@@ -1,6 +1,11 @@
 """Tmux-based terminal backend implementation."""
 
+import codecs
 import os
+import shlex
+import shutil
+import tempfile
+import threading
 import time
 import uuid
 
@@ -10,6 +15,7 @@ from openhands.sdk.logger import get_logger
 from openhands.tools.execute_bash.constants import HISTORY_LIMIT
 from openhands.tools.execute_bash.metadata import CmdOutputMetadata
 from openhands.tools.execute_bash.terminal import TerminalInterface
+from openhands.tools.execute_bash.terminal.output_stream import TerminalOutputStream
 
 
 logger = get_logger(__name__)
@@ -29,6 +35,10 @@ class TmuxTerminal(TerminalInterface):
     ):
         super().__init__(work_dir, username)
         self.PS1 = CmdOutputMetadata.to_ps1_prompt()
+        self._stream = TerminalOutputStream()
+        self.output_stream = self._stream
+        self._pipe_dir: str | None = None
+        self._pipe_thread: threading.Thread | None = None
 
     def initialize(self) -> None:
         """Initialize the tmux terminal session."""
@@ -74,17 +84,75 @@ class TmuxTerminal(TerminalInterface):
         assert isinstance(self.pane, libtmux.Pane)
         logger.debug(f"pane: {self.pane}; history_limit: {self.session.history_limit}")
         _initial_window.kill()
+        self._start_output_pipe(self.pane)
 
         # Configure bash to use simple PS1 and disable PS2
         self.pane.send_keys(
             f'export PROMPT_COMMAND=\'export PS1="{self.PS1}"\'; export PS2=""'
         )
-        time.sleep(0.1)  # Wait for command to take effect
+        # Wait for command to take effect: the shell may still be starting, and
+        # its first prompt must not be mistaken for the end of a later command
+        if not self._wait_for_prompt(timeout=10.0):
+            logger.warning("Tmux terminal prompt not seen after initialization")
 
         logger.debug(f"Tmux terminal initialized with work dir: {self.work_dir}")
         self._initialized = True
         self.clear_screen()
 
+    def _start_output_pipe(self, pane: libtmux.Pane) -> None:
+        """Copy everything the pane prints into the output stream.
+
+        tmux writes the pane's output to a command (`pipe-pane`), here `cat`
+        into a FIFO read by a thread, so output is seen as it arrives rather
+        than by capturing the pane over and over.
+        """
+        self._pipe_dir = tempfile.mkdtemp(prefix="openhands-tmux-")
+        fifo = os.path.join(self._pipe_dir, "output")
+        os.mkfifo(fifo)
+        self._pipe_thread = threading.Thread(
+            target=self._read_output_pipe, args=(fifo,), daemon=True
+        )
+        self._pipe_thread.start()
+        pane.cmd("pipe-pane", "-o", f"cat > {shlex.quote(fifo)}")
+
+    def _read_output_pipe(self, fifo: str) -> None:
+        # Characters split across reads are decoded once complete
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        try:
+            # Blocks until tmux starts the pipe command
+            with open(fifo, "rb", buffering=0) as f:
+                while chunk := f.read(65536):
+                    self._stream.feed(decoder.decode(chunk).replace("\r", ""))
+        except Exception as e:
+            logger.debug(f"Error reading tmux output pipe: {e}")
+        finally:
+            self._stream.close()
+
+    def _wait_for_prompt(self, timeout: float) -> bool:
+        deadline = time.time() + timeout
+        while True:
+            cursor = self._stream.cursor
+            if self._stream.prompt_count > 0:
+                return True
+            remaining = deadline - time.time()
+            if remaining <= 0 or self._stream.closed:
+                return False
+            self._stream.wait(cursor, remaining)
+
+    def _stop_output_pipe(self) -> None:
+        if self._pipe_dir is None:
+            return
+        fifo = os.path.join(self._pipe_dir, "output")
+        try:
+            # Unblock the reader if the pipe command never started
+            os.close(os.open(fifo, os.O_WRONLY | os.O_NONBLOCK))
+        except OSError:
+            pass
+        if self._pipe_thread is not None:
+            self._pipe_thread.join(timeout=1)
+        shutil.rmtree(self._pipe_dir, ignore_errors=True)
+        self._pipe_dir = None
+
     def close(self) -> None:
         """Clean up the tmux session."""
         if self._closed:
@@ -92,6 +160,7 @@ class TmuxTerminal(TerminalInterface):
         try:
             if hasattr(self, "session"):
                 self.session.kill()
+            self._stop_output_pipe()
         except ImportError:
             # Python is shutting down, let the OS handle cleanup
             pass
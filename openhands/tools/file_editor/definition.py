@@ -17,7 +17,10 @@ from openhands.sdk.tool import (
     ToolAnnotations,
     ToolDefinition,
 )
-from openhands.tools.file_editor.utils.diff import visualize_diff
+from openhands.tools.file_editor.utils.diff import (
+    visualize_diff,
+    visualize_unified_diff,
+)
 
 
 CommandLiteral = Literal["view", "create", "str_replace", "insert", "undo_edit"]
@@ -84,6 +87,11 @@ class FileEditorObservation(Observation):
     new_content: str | None = Field(
         default=None, description="The content of the file after the edit."
     )
+    diff: str | None = Field(
+        default=None,
+        description="Unified diff of the edited region. Set instead of "
+        "old_content and new_content for edits to large files.",
+    )
     error: str | None = Field(default=None, description="Error message if any.")
 
     _diff_cache: Text | None = PrivateAttr(default=None)
@@ -102,6 +110,11 @@ class FileEditorObservation(Observation):
         edits), otherwise falls back to agent observation.
         """
 
+        if self.diff is not None and self.path and not self.error:
+            if not self._diff_cache:
+                self._diff_cache = visualize_unified_diff(self.path, self.diff)
+            return self._diff_cache
+
         if not self._has_meaningful_diff:
             return super().visualize
 
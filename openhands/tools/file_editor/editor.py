@@ -1,3 +1,5 @@
+import codecs
+import mmap
 import os
 import re
 import shutil
@@ -26,6 +28,7 @@ from openhands.tools.file_editor.utils.constants import (
     MAX_RESPONSE_LEN_CHAR,
     TEXT_FILE_CONTENT_TRUNCATED_NOTICE,
 )
+from openhands.tools.file_editor.utils.diff import get_unified_diff
 from openhands.tools.file_editor.utils.encoding import (
     EncodingManager,
     with_encoding,
@@ -36,6 +39,24 @@ from openhands.tools.file_editor.utils.shell import run_shell_cmd
 
 logger = get_logger(__name__)
 
+# Encodings in which a string can be found by searching for its encoded bytes
+_BYTE_SEARCHABLE_ENCODINGS = {"utf-8", "ascii"}
+
+
+def _find_occurrences(data: mmap.mmap, pattern: bytes) -> list[tuple[int, int]]:
+    """Line number and offset of each (non-overlapping) occurrence of
+    `pattern`, counting lines in the same pass."""
+    occurrences = []
+    line = 1
+    counted = 0
+    start = data.find(pattern)
+    while start != -1:
+        line += data[counted:start].count(b"\n")
+        counted = start
+        occurrences.append((line, start))
+        start = data.find(pattern, start + len(pattern))
+    return occurrences
+
 
 class FileEditor:
     """
@@ -50,6 +71,8 @@ class FileEditor:
     """
 
     MAX_FILE_SIZE_MB = 10  # Maximum file size in MB
+    # Files from this size on are edited without reading them into strings
+    LARGE_FILE_SIZE_MB = 1
 
     def __init__(
         self,
@@ -69,6 +92,7 @@ class FileEditor:
         self._max_file_size = (
             (max_file_size_mb or self.MAX_FILE_SIZE_MB) * 1024 * 1024
         )  # Convert to bytes
+        self._large_file_size = self.LARGE_FILE_SIZE_MB * 1024 * 1024
 
         # Initialize encoding manager
         self._encoding_manager = EncodingManager()
@@ -103,7 +127,7 @@ class FileEditor:
             if file_text is None:
                 raise EditorToolParameterMissingError(command, "file_text")
             self.write_file(_path, file_text)
-            self._history_manager.add_history(_path, file_text)
+            self._history_manager.add_history(_path, file_text, file_text)
             return FileEditorObservation(
                 command=command,
                 path=str(_path),
@@ -158,6 +182,7 @@ class FileEditor:
         path: Path,
         old_str: str,
         new_str: str | None,
+        encoding: str = "utf-8",
     ) -> FileEditorObservation:
         """
         Implement the str_replace command, which replaces old_str with new_str in
@@ -173,6 +198,14 @@ class FileEditor:
         self.validate_file(path)
         new_str = new_str or ""
 
+        if (
+            os.path.getsize(path) >= self._large_file_size
+            and codecs.lookup(encoding).name in _BYTE_SEARCHABLE_ENCODINGS
+        ):
+            observation = self._str_replace_large_file(path, old_str, new_str, encoding)
+            if observation is not None:
+                return observation
+
         # Read the entire file first to handle both single-line and multi-line
         # replacements
         file_content = self.read_file(path)
@@ -228,7 +261,7 @@ class FileEditor:
         self.write_file(path, new_file_content)
 
         # Save the content to history
-        self._history_manager.add_history(path, file_content)
+        self._history_manager.add_history(path, file_content, new_file_content)
 
         # Create a snippet of the edited section
         start_line = max(0, replacement_line - SNIPPET_CONTEXT_WINDOW)
@@ -256,6 +289,132 @@ class FileEditor:
             new_content=new_file_content,
         )
 
+    def _str_replace_large_file(
+        self,
+        path: Path,
+        old_str: str,
+        new_str: str,
+        encoding: str,
+    ) -> FileEditorObservation | None:
+        """
+        Implement str_replace for a large file without searching it as a string.
+
+        The file is memory-mapped and searched for the encoded `old_str`, counting
+        lines in the same pass. The new content is written to a temporary file
+        that then replaces the original, the snippet is cut from the mapped
+        content, and the observation carries a diff of the edited region instead
+        of the full old and new content.
+
+        Returns None if the file has carriage returns, which reading it as text
+        translates; those files take the regular path.
+        """
+        old_bytes = old_str.encode(encoding)
+        if not old_str.strip():
+            return None
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            if data.find(b"\r") != -1:
+                return None
+            occurrences = _find_occurrences(data, old_bytes)
+            if not occurrences:
+                # We found no occurrences, possibly because of extra white spaces
+                # at either the front or back of the string.
+                # Remove the white spaces and try again.
+                old_str = old_str.strip()
+                new_str = new_str.strip()
+                old_bytes = old_str.encode(encoding)
+                occurrences = _find_occurrences(data, old_bytes)
+                if not occurrences:
+                    raise ToolError(
+                        f"No replacement was performed, old_str `{old_str}` did not "
+                        f"appear verbatim in {path}."
+                    )
+            if len(occurrences) > 1:
+                line_numbers = sorted(set(line for line, _ in occurrences))
+                raise ToolError(
+                    f"No replacement was performed. Multiple occurrences of old_str "
+                    f"`{old_str}` in lines {line_numbers}. Please ensure it is unique."
+                )
+
+            # We found exactly one occurrence
+            replacement_line, start = occurrences[0]
+            end = start + len(old_bytes)
+            new_bytes = new_str.encode(encoding)
+
+            # The lines around the edit, before and after it
+            start_line = max(0, replacement_line - SNIPPET_CONTEXT_WINDOW)
+            end_line = replacement_line + SNIPPET_CONTEXT_WINDOW + new_str.count("\n")
+            region_start = data.rfind(b"\n", 0, start) + 1
+            for _ in range(replacement_line - start_line - 1):
+                region_start = data.rfind(b"\n", 0, region_start - 1) + 1
+            region_end = end
+            for _ in range(SNIPPET_CONTEXT_WINDOW + 1):
+                region_end = data.find(b"\n", region_end) + 1
+                if region_end == 0:
+                    region_end = len(data)
+                    break
+            old_region = data[region_start:region_end].decode(encoding)
+            new_region = (
+                data[region_start:start] + new_bytes + data[end:region_end]
+            ).decode(encoding)
+            snippet = "".join(
+                new_region.splitlines(keepends=True)[: end_line - start_line]
+            )
+
+            # Write the new content next to the file, then move it into place
+            temp_fd, temp_name = tempfile.mkstemp(
+                dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(temp_fd, "wb") as temp_file, memoryview(data) as view:
+                    temp_file.write(view[:start])
+                    temp_file.write(new_bytes)
+                    temp_file.write(view[end:])
+                shutil.copymode(path, temp_name)
+            except Exception as e:
+                os.unlink(temp_name)
+                raise ToolError(
+                    f"Ran into {e} while trying to write to {path}"
+                ) from None
+
+            # The history stores the edit as a diff, but of the full content
+            before = data[:start].decode(encoding)
+            after = data[end:].decode(encoding)
+
+        try:
+            os.replace(temp_name, path)
+        except Exception as e:
+            os.unlink(temp_name)
+            raise ToolError(f"Ran into {e} while trying to write to {path}") from None
+        self._history_manager.add_history(
+            path, before + old_str + after, before + new_str + after
+        )
+        del before, after
+
+        success_message = f"The file {path} has been edited. "
+        success_message += self._make_output(
+            snippet, f"a snippet of {path}", start_line + 1
+        )
+        success_message += (
+            "Review the changes and make sure they are as expected. Edit the "
+            "file again if necessary."
+        )
+        return FileEditorObservation(
+            command="str_replace",
+            output=success_message,
+            prev_exist=True,
+            path=str(path),
+            diff=get_unified_diff(
+                str(path),
+                old_region,
+                new_region,
+                first_line=start_line + 1,
+                n_context_lines=SNIPPET_CONTEXT_WINDOW,
+            ),
+        )
+
     def view(
         self, path: Path, view_range: list[int] | None = None
     ) -> FileEditorObservation:
@@ -472,13 +631,13 @@ class FileEditor:
         )
         snippet = self.read_file(path, start_line=start_line + 1, end_line=end_line)
 
-        # Save history - we already have the lines in memory
-        file_text = "".join(history_lines)
-        self._history_manager.add_history(path, file_text)
-
         # Read new content for result
         new_file_text = self.read_file(path)
 
+        # Save history - we already have the lines in memory
+        file_text = "".join(history_lines)
+        self._history_manager.add_history(path, file_text, new_file_text)
+
         success_message = f"The file {path} has been edited. "
         success_message += self._make_output(
             snippet,
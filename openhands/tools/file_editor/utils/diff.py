@@ -1,4 +1,5 @@
-from difflib import SequenceMatcher
+import re
+from difflib import SequenceMatcher, unified_diff
 
 from pydantic import BaseModel
 from rich.text import Text
@@ -122,3 +123,59 @@ def visualize_diff(
             content.append(line + "\n", style="green")
         content.append(f"[end of {op_type} {i + 1} / {len(edit_groups)}]", style="bold")
     return content
+
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+
+def get_unified_diff(
+    path: str,
+    old_content: str,
+    new_content: str,
+    first_line: int = 1,
+    n_context_lines: int = 2,
+) -> str:
+    """Unified diff between two versions of a file, or of a region of it.
+
+    Args:
+        first_line: Line number of the first line of both versions, so that
+            hunk headers refer to lines of the whole file.
+        n_context_lines: Number of context lines to show around each change.
+    """
+    offset = first_line - 1
+
+    def shift(match: re.Match) -> str:
+        old_start = int(match.group(1)) + offset
+        new_start = int(match.group(3)) + offset
+        return (
+            f"@@ -{old_start}{match.group(2) or ''} "
+            f"+{new_start}{match.group(4) or ''} @@"
+        )
+
+    lines = unified_diff(
+        old_content.splitlines(),
+        new_content.splitlines(),
+        fromfile=path,
+        tofile=path,
+        n=n_context_lines,
+        lineterm="",
+    )
+    return "\n".join(_HUNK_HEADER.sub(shift, line) for line in lines)
+
+
+def visualize_unified_diff(path: str, diff: str) -> Text:
+    """Visualize an edit given as a unified diff (see `get_unified_diff`)."""
+    content = Text()
+    content.append(f"[File {path} edited.]\n", style="bold")
+    for line in diff.splitlines():
+        if line.startswith(("---", "+++")):
+            continue
+        if line.startswith("@@"):
+            content.append(line + "\n", style="bold")
+        elif line.startswith("-"):
+            content.append(line + "\n", style="red")
+        elif line.startswith("+"):
+            content.append(line + "\n", style="green")
+        else:
+            content.append(line + "\n")
+    return content
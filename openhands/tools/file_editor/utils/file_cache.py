@@ -2,6 +2,7 @@ import hashlib
 import json
 import os
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -12,12 +13,22 @@ logger = get_logger(__name__)
 
 
 class FileCache:
+    """A key-value store keeping one JSON file per key in a directory.
+
+    The size of every entry is tracked in memory in least-recently-used order
+    (loaded from the directory once), so that sets, evictions and `len` do not
+    need to list the directory. The index assumes this instance is the only
+    one writing to the directory.
+    """
+
     def __init__(self, directory: str, size_limit: int | None = None):
         self.directory = Path(directory)
         self.directory.mkdir(parents=True, exist_ok=True)
         self.size_limit = size_limit
         self.current_size = 0
-        self._update_current_size()
+        # Entry file -> size in bytes, least recently used first
+        self._index: OrderedDict[Path, int] = OrderedDict()
+        self._load_index()
         logger.debug(
             f"FileCache initialized with directory: {self.directory}, "
             f"size_limit: {self.size_limit}, current_size: {self.current_size}"
@@ -27,10 +38,16 @@ class FileCache:
         hashed_key = hashlib.sha256(key.encode()).hexdigest()
         return self.directory / f"{hashed_key}.json"
 
-    def _update_current_size(self):
-        self.current_size = sum(
-            f.stat().st_size for f in self.directory.glob("*.json") if f.is_file()
-        )
+    def _load_index(self):
+        entries = []
+        for f in self.directory.glob("*.json"):
+            if f.is_file():
+                stat = f.stat()
+                entries.append((stat.st_mtime, f, stat.st_size))
+        self._index.clear()
+        for _, f, size in sorted(entries, key=lambda entry: entry[0]):
+            self._index[f] = size
+        self.current_size = sum(self._index.values())
         logger.debug(f"Current size updated: {self.current_size}")
 
     def set(self, key: str, value: Any) -> None:
@@ -40,8 +57,8 @@ class FileCache:
         logger.debug(f"Setting key: {key}, content_size: {content_size}")
 
         if self.size_limit is not None:
-            if file_path.exists():
-                old_size = file_path.stat().st_size
+            if file_path in self._index:
+                old_size = self._index[file_path]
                 size_diff = content_size - old_size
                 logger.debug(
                     f"Existing file: old_size: {old_size}, size_diff: {size_diff}"
@@ -68,8 +85,8 @@ class FileCache:
                     )
                     self._evict_oldest(file_path)
 
-        if file_path.exists():
-            self.current_size -= file_path.stat().st_size
+        if file_path in self._index:
+            self.current_size -= self._index.pop(file_path)
             logger.debug(
                 f"Existing file removed from current_size: {self.current_size}"
             )
@@ -77,6 +94,7 @@ class FileCache:
         with open(file_path, "w") as f:
             f.write(content)
 
+        self._index[file_path] = content_size
         self.current_size += content_size
         logger.debug(f"File written, new current_size: {self.current_size}")
         os.utime(
@@ -84,17 +102,10 @@ class FileCache:
         )  # Update access and modification time
 
     def _evict_oldest(self, exclude_path: Path | None = None):
-        oldest_file = min(
-            (
-                f
-                for f in self.directory.glob("*.json")
-                if f.is_file() and f != exclude_path
-            ),
-            key=os.path.getmtime,
-        )
-        evicted_size = oldest_file.stat().st_size
+        oldest_file = next(f for f in self._index if f != exclude_path)
+        evicted_size = self._index.pop(oldest_file)
         self.current_size -= evicted_size
-        os.remove(oldest_file)
+        oldest_file.unlink(missing_ok=True)
         logger.debug(
             f"Evicted file: {oldest_file}, size: {evicted_size}, "
             f"new current_size: {self.current_size}"
@@ -108,13 +119,17 @@ class FileCache:
         with open(file_path) as f:
             data = json.load(f)
             os.utime(file_path, (time.time(), time.time()))  # Update access time
+            if file_path in self._index:
+                self._index.move_to_end(file_path)
             logger.debug(f"Get: Key found: {key}")
             return data["value"]
 
     def delete(self, key: str) -> None:
         file_path = self._get_file_path(key)
         if file_path.exists():
-            deleted_size = file_path.stat().st_size
+            deleted_size = self._index.pop(file_path, None)
+            if deleted_size is None:
+                deleted_size = file_path.stat().st_size
             self.current_size -= deleted_size
             os.remove(file_path)
             logger.debug(
@@ -126,6 +141,7 @@ class FileCache:
         for item in self.directory.glob("*.json"):
             if item.is_file():
                 os.remove(item)
+        self._index.clear()
         self.current_size = 0
         logger.debug("Cache cleared")
 
@@ -135,7 +151,7 @@ class FileCache:
         return exists
 
     def __len__(self) -> int:
-        length = sum(1 for _ in self.directory.glob("*.json") if _.is_file())
+        length = len(self._index)
         logger.debug(f"Cache length: {length}")
         return length
 
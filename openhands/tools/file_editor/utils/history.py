@@ -1,16 +1,139 @@
-"""History management for file edits with disk-based storage and memory constraints."""
+"""History management for file edits with disk-based storage and memory constraints.
 
+Each file's history is a stack of versions. The latest content of the file
+(the "head") is stored once, as is. Every version is stored as a compressed
+reverse diff against the next newer version (or the head). Every
+`snapshot_interval`-th version, and any version changed over most of its
+length, is stored as a full compressed snapshot instead. Edits usually change a small
+part of a file, so a version costs about as much as the edit itself rather than
+the size of the file. Undo applies a single diff to the head.
+"""
+
+import base64
+import hashlib
 import logging
 import tempfile
+import threading
+import zlib
 from pathlib import Path
+from typing import Any
 
 from openhands.tools.file_editor.utils.file_cache import FileCache
 
 
+# Compared block by block when looking for the changed part of two versions
+_COMPARE_BLOCK_SIZE = 64 * 1024
+_COMPRESSION_LEVEL = 6
+
+# A single raw deflate compressor is shared by all entries, so that an edit does
+# not allocate a new compressor state (a few hundred KB). A full flush after
+# each entry resets it, so every entry can be decompressed on its own.
+_compressor = zlib.compressobj(_COMPRESSION_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+_compressor_lock = threading.Lock()
+
+
+def _compress(text: str) -> str:
+    data = text.encode("utf-8", "surrogatepass")
+    with _compressor_lock:
+        data = _compressor.compress(data) + _compressor.flush(zlib.Z_FULL_FLUSH)
+    return base64.b64encode(data).decode("ascii")
+
+
+def _decompress(data: str) -> str:
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    return decompressor.decompress(base64.b64decode(data)).decode(
+        "utf-8", "surrogatepass"
+    )
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _common_prefix_length(a: str, b: str, limit: int) -> int:
+    """Length of the common prefix of `a` and `b`, up to `limit` characters."""
+    start = 0
+    # Skip equal blocks, then narrow down within the first unequal one
+    while start < limit:
+        end = min(start + _COMPARE_BLOCK_SIZE, limit)
+        if a[start:end] != b[start:end]:
+            break
+        start = end
+    else:
+        return limit
+    low, high = start, min(start + _COMPARE_BLOCK_SIZE, limit)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[start:middle] == b[start:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _common_suffix_length(a: str, b: str, limit: int) -> int:
+    """Length of the common suffix of `a` and `b`, up to `limit` characters."""
+    end = 0
+    while end < limit:
+        size = min(end + _COMPARE_BLOCK_SIZE, limit)
+        if a[len(a) - size : len(a) - end] != b[len(b) - size : len(b) - end]:
+            break
+        end = size
+    else:
+        return limit
+    low, high = end, min(end + _COMPARE_BLOCK_SIZE, limit)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[len(a) - middle : len(a) - end] == b[len(b) - middle : len(b) - end]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _make_entry(content: str, base: str | None, snapshot: bool) -> dict[str, Any]:
+    """Encode `content` as a reverse diff against `base` (a full snapshot if
+    `snapshot`, if there is no base or if the changed region is most of
+    `content`).
+
+    The diff is the single changed region: `content` is `base` with everything
+    between a common prefix and a common suffix replaced. Only the stored form
+    is compressed.
+    """
+    if snapshot or base is None:
+        return {"kind": "full", "data": _compress(content)}
+    limit = min(len(content), len(base))
+    prefix = _common_prefix_length(content, base, limit)
+    suffix = _common_suffix_length(content, base, limit - prefix)
+    if (prefix + suffix) * 2 < len(content):
+        return {"kind": "full", "data": _compress(content)}
+    return {
+        "kind": "diff",
+        "prefix": prefix,
+        "suffix": suffix,
+        "data": _compress(content[prefix : len(content) - suffix]),
+    }
+
+
+def _apply_entry(entry: dict[str, Any], base: str | None) -> str:
+    """Decode a history entry made by `_make_entry` against the same `base`."""
+    data = _decompress(entry["data"])
+    if entry["kind"] == "full":
+        return data
+    if base is None:
+        raise ValueError("A base version is required to apply a diff")
+    return base[: entry["prefix"]] + data + base[len(base) - entry["suffix"] :]
+
+
 class FileHistoryManager:
     """Manages file edit history with disk-based storage and memory constraints."""
 
-    def __init__(self, max_history_per_file: int = 5, history_dir: Path | None = None):
+    def __init__(
+        self,
+        max_history_per_file: int = 5,
+        history_dir: Path | None = None,
+        snapshot_interval: int = 10,
+    ):
         """Initialize the history manager.
 
         Args:
@@ -18,6 +141,8 @@ class FileHistoryManager:
                 file (default: 5)
             history_dir: Directory to store history files. If None, uses a temp
                 directory
+            snapshot_interval: Every this many entries per file are stored as a
+                full snapshot rather than as a diff (default: 10)
 
         Notes:
             - Each file's history is limited to the last N entries to conserve
@@ -26,6 +151,7 @@ class FileHistoryManager:
             - Older entries are automatically removed when limits are exceeded
         """
         self.max_history_per_file = max_history_per_file
+        self.snapshot_interval = snapshot_interval
         if history_dir is None:
             history_dir = Path(tempfile.mkdtemp(prefix="oh_editor_history_"))
         self.cache = FileCache(str(history_dir))
@@ -37,20 +163,70 @@ class FileHistoryManager:
     def _get_history_key(self, file_path: Path, counter: int) -> str:
         return f"{file_path}.{counter}"
 
-    def add_history(self, file_path: Path, content: str):
-        """Add a new history entry for a file."""
+    def _get_head_key(self, file_path: Path) -> str:
+        return f"{file_path}.head"
+
+    def _get_head(self, file_path: Path) -> str | None:
+        return self.cache.get(self._get_head_key(file_path))
+
+    def _set_head(self, file_path: Path, metadata: dict, content: str | None):
+        """Store the content the newest entry's diff is against, if any.
+
+        The head is rewritten on every edit, so it is stored as is rather than
+        compressed.
+        """
+        if content is None:
+            self.cache.delete(self._get_head_key(file_path))
+            metadata["head_sha"] = None
+        else:
+            self.cache.set(self._get_head_key(file_path), content)
+            metadata["head_sha"] = _digest(content)
+
+    def _rebase_newest(self, file_path: Path, metadata: dict, base: str):
+        """Store the newest entry against `base` instead of the head.
+
+        Needed when the file was changed outside of the editor since the last
+        edit, so that the entry is reconstructed from the new entry's content.
+        """
+        key = self._get_history_key(file_path, metadata["entries"][-1])
+        entry = self.cache.get(key)
+        if entry is None or entry["kind"] != "diff":
+            return
+        try:
+            content = _apply_entry(entry, self._get_head(file_path))
+        except ValueError:
+            self.logger.warning(f"History entry base not found for {file_path}")
+            return
+        self.cache.set(key, _make_entry(content, base, snapshot=False))
+
+    def add_history(
+        self, file_path: Path, content: str, new_content: str | None = None
+    ):
+        """Add a new history entry for a file.
+
+        Args:
+            file_path: The edited file
+            content: The content to go back to on undo (before the edit)
+            new_content: The content after the edit. If given, `content` is
+                stored as a diff against it; otherwise as a full snapshot.
+        """
         metadata_key = self._get_metadata_key(file_path)
         metadata = self.cache.get(metadata_key, {"entries": [], "counter": 0})
         counter = metadata["counter"]
 
+        if metadata["entries"] and metadata.get("head_sha") != _digest(content):
+            self._rebase_newest(file_path, metadata, content)
+
         # Add new entry
         history_key = self._get_history_key(file_path, counter)
-        self.cache.set(history_key, content)
+        snapshot = counter % self.snapshot_interval == 0
+        self.cache.set(history_key, _make_entry(content, new_content, snapshot))
+        self._set_head(file_path, metadata, new_content)
 
         metadata["entries"].append(counter)
         metadata["counter"] += 1
 
-        # Keep only last N entries
+        # Keep only last N entries (nothing is stored against the oldest)
         while len(metadata["entries"]) > self.max_history_per_file:
             old_counter = metadata["entries"].pop(0)
             old_history_key = self._get_history_key(file_path, old_counter)
@@ -70,14 +246,22 @@ class FileHistoryManager:
         # Pop and remove the last entry
         last_counter = entries.pop()
         history_key = self._get_history_key(file_path, last_counter)
-        content = self.cache.get(history_key)
+        entry = self.cache.get(history_key)
 
-        if content is None:
+        content = None
+        if entry is None:
             self.logger.warning(f"History entry not found for {file_path}")
         else:
+            try:
+                content = _apply_entry(entry, self._get_head(file_path))
+            except ValueError:
+                self.logger.warning(f"History entry base not found for {file_path}")
             # Remove the entry from the cache
             self.cache.delete(history_key)
 
+        # The entry below is stored against the content restored by this undo
+        self._set_head(file_path, metadata, content if entries else None)
+
         # Update metadata
         metadata["entries"] = entries
         self.cache.set(metadata_key, metadata)
@@ -99,6 +283,7 @@ class FileHistoryManager:
         for counter in metadata["entries"]:
             history_key = self._get_history_key(file_path, counter)
             self.cache.delete(history_key)
+        self.cache.delete(self._get_head_key(file_path))
 
         # Clear metadata
         self.cache.set(metadata_key, {"entries": [], "counter": 0})
@@ -109,11 +294,19 @@ class FileHistoryManager:
         metadata = self.cache.get(metadata_key, {"entries": [], "counter": 0})
         entries = metadata["entries"]
 
+        # Each entry is reconstructed from the next newer one
         history = []
-        for counter in entries:
+        base = self._get_head(file_path)
+        for counter in reversed(entries):
             history_key = self._get_history_key(file_path, counter)
-            content = self.cache.get(history_key)
-            if content is not None:
-                history.append(content)
+            entry = self.cache.get(history_key)
+            if entry is None:
+                base = None
+                continue
+            try:
+                base = _apply_entry(entry, base)
+            except ValueError:
+                continue
+            history.append(base)
 
-        return history
+        return history[::-1]
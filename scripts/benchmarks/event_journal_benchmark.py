@@ -0,0 +1,98 @@
+"""Compare per-file event persistence (EventLog) against the event journal.
+
+Measures, for each backend:
+
+* append: writing N events
+* resume: opening the persisted log (directory scan vs. index read)
+* random read: reading K random events from a cold (uncached) log
+
+Usage:
+    uv run python scripts/benchmarks/event_journal_benchmark.py --events 5000
+"""
+
+import argparse
+import gc
+import random
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
+
+from openhands.sdk.conversation.event_journal import JournalEventLog
+from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import LocalFileStore
+from openhands.sdk.llm import Message, TextContent
+
+
+def make_events(n: int, payload_size: int) -> list[MessageEvent]:
+    text = "x" * payload_size
+    return [
+        MessageEvent(
+            id=str(uuid.uuid4()),
+            llm_message=Message(role="user", content=[TextContent(text=text)]),
+            source="user",
+        )
+        for _ in range(n)
+    ]
+
+
+def timed(fn: Callable[[], object]) -> tuple[float, object]:
+    # Keep collector pauses over the (large) event fixture out of the numbers
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = fn()
+        return time.perf_counter() - start, result
+    finally:
+        gc.enable()
+
+
+def bench_files(events: list[MessageEvent], reads: list[int]) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as root:
+        fs = LocalFileStore(root)
+        log = EventLog(fs, cache_max_events=0)
+        append_s, _ = timed(lambda: [log.append(e) for e in events])
+        resume_s, resumed = timed(lambda: EventLog(fs, cache_max_events=0))
+        assert isinstance(resumed, EventLog)
+        read_s, _ = timed(lambda: [resumed[i] for i in reads])
+    return {"append": append_s, "resume": resume_s, "random_read": read_s}
+
+
+def bench_journal(events: list[MessageEvent], reads: list[int]) -> dict[str, float]:
+    with tempfile.TemporaryDirectory() as root:
+        log = JournalEventLog(root, cache_max_events=0)
+        append_s, _ = timed(lambda: [log.append(e) for e in events])
+        resume_s, resumed = timed(lambda: JournalEventLog(root, cache_max_events=0))
+        assert isinstance(resumed, JournalEventLog)
+        read_s, _ = timed(lambda: [resumed[i] for i in reads])
+    return {"append": append_s, "resume": resume_s, "random_read": read_s}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--reads", type=int, default=1000)
+    parser.add_argument("--payload-size", type=int, default=512)
+    args = parser.parse_args()
+
+    events = make_events(args.events, args.payload_size)
+    reads = [random.randrange(args.events) for _ in range(args.reads)]
+
+    results = {
+        "files": bench_files(events, reads),
+        "journal": bench_journal(events, reads),
+    }
+
+    print(f"{args.events} events, {args.reads} random reads")
+    print(f"{'backend':<10}{'append (s)':>14}{'resume (s)':>14}{'read (s)':>14}")
+    for name, r in results.items():
+        print(
+            f"{name:<10}{r['append']:>14.4f}{r['resume']:>14.4f}"
+            f"{r['random_read']:>14.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
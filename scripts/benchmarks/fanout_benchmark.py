@@ -0,0 +1,69 @@
+"""Cost of publishing one event to N websocket subscribers.
+
+Compares serializing the event once per subscriber (``model_dump`` +
+``json.dumps``, as ``send_json`` does) with sharing one lazily encoded
+``Envelope`` across all subscribers, as ``PubSub`` now does.
+
+Usage:
+    uv run python scripts/benchmarks/fanout_benchmark.py
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from openhands.agent_server.pub_sub import Envelope, PubSub, Subscriber
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.llm import Message, TextContent
+
+
+class PerSubscriberEncoding(Subscriber[MessageEvent]):
+    async def __call__(self, event: MessageEvent):
+        json.dumps(event.model_dump())
+
+
+class SharedEncoding(Subscriber[MessageEvent]):
+    async def __call__(self, event: MessageEvent):
+        raise NotImplementedError
+
+    async def deliver(self, envelope: Envelope[MessageEvent]):
+        envelope.json
+
+
+def make_event(size: int) -> MessageEvent:
+    return MessageEvent(
+        llm_message=Message(role="assistant", content=[TextContent(text="x" * size)]),
+        source="agent",
+    )
+
+
+async def per_event(subscriber: Subscriber, count: int, size: int, n: int) -> float:
+    pub_sub = PubSub[MessageEvent]()
+    for _ in range(count):
+        pub_sub.subscribe(subscriber)
+    events = [make_event(size) for _ in range(n)]
+    start = time.perf_counter()
+    for event in events:
+        await pub_sub(event)
+    return (time.perf_counter() - start) / n
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(f"{'subscribers':>12}{'per-subscriber (ms)':>22}{'shared (ms)':>14}")
+    for count in args.subscribers:
+        old = await per_event(PerSubscriberEncoding(), count, args.size, args.events)
+        new = await per_event(SharedEncoding(), count, args.size, args.events)
+        print(f"{count:>12}{old * 1000:>22.3f}{new * 1000:>14.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200)
+    parser.add_argument("--size", type=int, default=4000, help="Text chars/event")
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1, 5, 20, 50])
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Cost of FileEditor undo history for repeated small edits to a large file.
+
+Creates a file (5 MiB by default) and makes ``--edits`` single-line
+``str_replace`` edits to it through ``FileEditor``, then undoes all of them.
+Reports the time per edit and per undo and the size of the history directory,
+once with the history stored as reverse diffs and once with a full snapshot for
+every edit (``snapshot_interval=1``, close to the former behavior, though
+compressed).
+
+Usage:
+    uv run python scripts/benchmarks/file_editor_history_benchmark.py
+    uv run python scripts/benchmarks/file_editor_history_benchmark.py --size-mb 20
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from openhands.tools.file_editor.editor import FileEditor
+from openhands.tools.file_editor.utils.history import FileHistoryManager
+
+
+def write_file(path: Path, size_mb: int) -> int:
+    # Random constants keep the content from compressing unrealistically well
+    rng = random.Random(0)
+    lines = []
+    size = 0
+    while size < size_mb * 1024 * 1024:
+        line = f"{len(lines):08d} value = compute({rng.getrandbits(96):x})\n"
+        lines.append(line)
+        size += len(line)
+    path.write_text("".join(lines))
+    return len(lines)
+
+
+def history_size(manager: FileHistoryManager) -> int:
+    return sum(f.stat().st_size for f in manager.cache.directory.glob("*.json"))
+
+
+def run(path: Path, lines: int, edits: int, snapshot_interval: int) -> None:
+    editor = FileEditor()
+    manager = FileHistoryManager(max_history_per_file=10)
+    manager.snapshot_interval = snapshot_interval
+    editor._history_manager = manager
+    step = max(lines // edits, 1)
+
+    start = time.perf_counter()
+    for i in range(edits):
+        editor(
+            command="str_replace",
+            path=str(path),
+            old_str=f"{i * step:08d} value",
+            new_str=f"{i * step:08d} edited",
+        )
+    edit_time = (time.perf_counter() - start) / edits
+    size = history_size(manager)
+
+    undos = len(manager.get_metadata(path)["entries"])
+    start = time.perf_counter()
+    for _ in range(undos):
+        editor(command="undo_edit", path=str(path))
+    undo_time = (time.perf_counter() - start) / undos
+
+    name = "diffs" if snapshot_interval > 1 else "snapshots"
+    print(
+        f"{name:>10}{edit_time * 1000:>12.1f}{undo_time * 1000:>12.1f}"
+        f"{size / 1024 / 1024:>16.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=5)
+    parser.add_argument("--edits", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'history':>10}{'edit (ms)':>12}{'undo (ms)':>12}{'history (MiB)':>16}")
+    for snapshot_interval in (10, 1):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "generated.py"
+            lines = write_file(path, args.size_mb)
+            run(path, lines, args.edits, snapshot_interval)
+
+
+if __name__ == "__main__":
+    main()
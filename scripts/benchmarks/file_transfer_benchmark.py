@@ -0,0 +1,106 @@
+"""Throughput and client memory of large file transfers to a local agent server.
+
+Starts the agent server on a free local port, then uploads and downloads one
+file (1 GiB by default) through ``RemoteWorkspace`` and reports the throughput
+and the growth of the benchmark process's peak RSS, which stays near the chunk
+size because both directions are streamed. Note that the server runs in the
+same process, so its buffers are included in the peak.
+
+Usage:
+    uv run python scripts/benchmarks/file_transfer_benchmark.py
+    uv run python scripts/benchmarks/file_transfer_benchmark.py --size-mb 256
+"""
+
+import argparse
+import os
+import resource
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import uvicorn
+
+from openhands.agent_server.api import create_app
+from openhands.agent_server.config import Config
+from openhands.sdk.workspace.remote.base import RemoteWorkspace
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port: int) -> uvicorn.Server:
+    config = uvicorn.Config(
+        create_app(Config(session_api_keys=[])),
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+    )
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def write_file(path: Path, size_mb: int) -> None:
+    block = os.urandom(1024 * 1024)
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(block)
+
+
+def report(name: str, size_mb: int, seconds: float, rss_before: float) -> None:
+    print(
+        f"{name:>10}{seconds:>10.2f}{size_mb / seconds:>12.1f}"
+        f"{peak_rss_mb() - rss_before:>18.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument(
+        "--verify", action="store_true", help="Also verify SHA-256 checksums"
+    )
+    args = parser.parse_args()
+
+    port = free_port()
+    server = start_server(port)
+    workspace = RemoteWorkspace(host=f"http://127.0.0.1:{port}", working_dir="/tmp")
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "source.bin"
+        write_file(source, args.size_mb)
+
+        print(f"{'transfer':>10}{'seconds':>10}{'MiB/s':>12}{'peak RSS +MiB':>18}")
+        rss = peak_rss_mb()
+        start = time.perf_counter()
+        result = workspace.file_upload(
+            source, Path(tmp) / "uploaded.bin", verify_checksum=args.verify
+        )
+        assert result.success, result.error
+        report("upload", args.size_mb, time.perf_counter() - start, rss)
+
+        rss = peak_rss_mb()
+        start = time.perf_counter()
+        result = workspace.file_download(
+            Path(tmp) / "uploaded.bin",
+            Path(tmp) / "downloaded.bin",
+            verify_checksum=args.verify,
+        )
+        assert result.success, result.error
+        report("download", args.size_mb, time.perf_counter() - start, rss)
+
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Per-step cost of LLM.format_messages_for_llm on a long history.
+
+Builds a synthetic ``--messages``-message history (user request, then
+alternating tool calls and ``--output-size``-character tool outputs) and
+reports the time to format it the previous way (deep-copy every message, then
+serialize) and with the memoized pipeline, where each step only formats the
+messages that are new since the previous one.
+
+Usage:
+    uv run python scripts/benchmarks/format_messages_benchmark.py
+"""
+
+import argparse
+import copy
+import time
+from collections.abc import Sequence
+
+from pydantic import SecretStr
+
+from openhands.sdk.event import ActionEvent, MessageEvent, ObservationEvent
+from openhands.sdk.event.base import LLMConvertibleEvent
+from openhands.sdk.llm import LLM, ImageContent, Message, MessageToolCall, TextContent
+from openhands.sdk.tool import Action, Observation
+
+
+class BenchAction(Action):
+    command: str
+
+
+class BenchObservation(Observation):
+    output: str
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.output)]
+
+
+def build_history(length: int, output_size: int) -> list[LLMConvertibleEvent]:
+    events: list[LLMConvertibleEvent] = [
+        MessageEvent(
+            source="user",
+            llm_message=Message(role="user", content=[TextContent(text="Fix it")]),
+        )
+    ]
+    while len(events) < length:
+        i = len(events)
+        action = ActionEvent(
+            source="agent",
+            thought=[TextContent(text=f"Step {i}")],
+            action=BenchAction(command=f"cat file_{i}"),
+            tool_name="bash",
+            tool_call_id=f"call_{i}",
+            tool_call=MessageToolCall(
+                id=f"call_{i}",
+                name="bash",
+                arguments=f'{{"command": "cat file_{i}"}}',
+                origin="completion",
+            ),
+            llm_response_id=f"resp_{i}",
+        )
+        events.append(action)
+        events.append(
+            ObservationEvent(
+                observation=BenchObservation(output="x" * output_size),
+                action_id=action.id,
+                tool_name="bash",
+                tool_call_id=f"call_{i}",
+            )
+        )
+    return events
+
+
+def previous_format(llm: LLM, messages: list[Message]) -> list[dict]:
+    messages = copy.deepcopy(messages)
+    if llm.is_caching_prompt_active():
+        llm._apply_prompt_caching(messages)
+    for message in messages:
+        message.cache_enabled = llm.is_caching_prompt_active()
+        message.vision_enabled = llm.vision_is_active()
+        message.function_calling_enabled = llm.is_function_calling_active()
+    formatted = [message.to_llm_dict() for message in messages]
+    # The previous pipeline also deep-copied the formatted messages
+    copy.deepcopy(formatted)
+    return formatted
+
+
+def per_step(events: list[LLMConvertibleEvent], steps: int, memoized: bool) -> float:
+    llm = LLM(
+        model="anthropic/claude-sonnet-4-20250514",
+        api_key=SecretStr("key"),
+        service_id="bench",
+    )
+    history = events[: len(events) - 2 * steps]
+    llm.format_messages_for_llm(LLMConvertibleEvent.events_to_messages(history))
+    elapsed = 0.0
+    for step in range(steps):
+        end = len(history) + 2 * (step + 1)
+        messages = LLMConvertibleEvent.events_to_messages(events[:end])
+        start = time.perf_counter()
+        if memoized:
+            llm.format_messages_for_llm(messages)
+        else:
+            previous_format(llm, messages)
+        elapsed += time.perf_counter() - start
+    return elapsed / steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--output-size", type=int, default=20_000)
+    parser.add_argument("--steps", type=int, default=10)
+    args = parser.parse_args()
+
+    events = build_history(args.messages, args.output_size)
+    previous = per_step(events, args.steps, memoized=False)
+    memoized = per_step(events, args.steps, memoized=True)
+    print(f"{'messages':>10}{'previous (ms)':>20}{'memoized (ms)':>20}")
+    print(f"{len(events):>10}{previous * 1000:>20.3f}{memoized * 1000:>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Time and observation size of FileEditor.str_replace on large files.
+
+Edits a generated file (20 MiB by default) once with the regular path, which
+reads the file into a string and searches it with a regex, and once with the
+large file path, which searches the memory-mapped file and writes it
+atomically. Also times a rejected edit whose ``old_str`` occurs on every
+``--repeat``-th line. The regular path finds the line number of each of those
+occurrences by counting from the start of the file.
+
+Usage:
+    uv run python scripts/benchmarks/str_replace_benchmark.py
+    uv run python scripts/benchmarks/str_replace_benchmark.py --size-mb 50
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from openhands.tools.file_editor.editor import FileEditor
+from openhands.tools.file_editor.exceptions import ToolError
+
+
+def write_file(path: Path, size_mb: int, repeat: int) -> int:
+    lines = []
+    size = 0
+    while size < size_mb * 1024 * 1024:
+        i = len(lines)
+        marker = "  # repeated" if i % repeat == 0 else ""
+        line = f"{i:08d} value = compute(alpha, beta){marker}\n"
+        lines.append(line)
+        size += len(line)
+    path.write_text("".join(lines))
+    return len(lines)
+
+
+def make_editor(size_mb: int, large: bool) -> FileEditor:
+    editor = FileEditor(max_file_size_mb=size_mb + 1)
+    if not large:
+        editor._large_file_size = size_mb * 1024 * 1024 * 2
+    return editor
+
+
+def run(path: Path, lines: int, size_mb: int, large: bool) -> None:
+    editor = make_editor(size_mb, large)
+    start = time.perf_counter()
+    observation = editor(
+        command="str_replace",
+        path=str(path),
+        old_str=f"{lines // 2:08d} value",
+        new_str=f"{lines // 2:08d} edited",
+    )
+    edit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    try:
+        editor(command="str_replace", path=str(path), old_str="# repeated", new_str="")
+    except ToolError:
+        pass
+    rejected_time = time.perf_counter() - start
+
+    name = "mmap" if large else "regular"
+    size = len(observation.model_dump_json())
+    print(
+        f"{name:>10}{edit_time * 1000:>12.0f}{rejected_time * 1000:>16.0f}"
+        f"{size / 1024:>20.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    print(
+        f"{'path':>10}{'edit (ms)':>12}{'rejected (ms)':>16}{'observation (KiB)':>20}"
+    )
+    for large in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "generated.py"
+            lines = write_file(path, args.size_mb, args.repeat)
+            run(path, lines, args.size_mb, large)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Latency and CPU cost of waiting for terminal commands to finish.
+
+Runs a chatty command (``yes | head -n 200000``) and a long quiet one
+(``sleep``) in a ``TerminalSession`` for each available backend, once waiting
+on the terminal's output stream and once polling the screen every
+``POLL_INTERVAL`` (the previous behaviour, forced by detaching the stream).
+Reports the wall time until the observation is returned and the CPU time this
+process spent meanwhile, including the terminal's reader thread.
+
+Usage:
+    uv run python scripts/benchmarks/terminal_output_benchmark.py
+    uv run python scripts/benchmarks/terminal_output_benchmark.py --sleep 10
+"""
+
+import argparse
+import tempfile
+import time
+
+from openhands.tools.execute_bash.definition import ExecuteBashAction
+from openhands.tools.execute_bash.terminal import create_terminal_session
+from openhands.tools.execute_bash.terminal.factory import _is_tmux_available
+
+
+def run(terminal_type: str, streamed: bool, commands: list[str]) -> None:
+    with tempfile.TemporaryDirectory() as work_dir:
+        session = create_terminal_session(work_dir, terminal_type=terminal_type)
+        session.initialize()
+        if not streamed:
+            session.terminal.output_stream = None
+        session.execute(ExecuteBashAction(command="true"))  # warm up
+        try:
+            for command in commands:
+                wall = time.perf_counter()
+                cpu = time.process_time()
+                observation = session.execute(
+                    ExecuteBashAction(command=command, timeout=600)
+                )
+                assert observation.metadata.exit_code == 0, observation.output
+                mode = "stream" if streamed else "poll"
+                print(
+                    f"{terminal_type:>10}{mode:>8}  {command:<28}"
+                    f"{time.perf_counter() - wall:>10.2f}"
+                    f"{time.process_time() - cpu:>10.2f}"
+                )
+        finally:
+            session.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--sleep", type=float, default=5.0)
+    args = parser.parse_args()
+
+    commands = [f"yes | head -n {args.lines}", f"sleep {args.sleep:g}"]
+    terminal_types = ["subprocess"] + (["tmux"] if _is_tmux_available() else [])
+    print(f"{'terminal':>10}{'mode':>8}  {'command':<28}{'wall s':>10}{'cpu s':>10}")
+    for terminal_type in terminal_types:
+        for streamed in (False, True):
+            run(terminal_type, streamed, commands)
+
+
+if __name__ == "__main__":
+    main()
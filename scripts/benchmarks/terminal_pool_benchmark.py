@@ -0,0 +1,79 @@
+"""Conversation cold start and first-command latency of the bash tool.
+
+Creates ``BashExecutor``s (as the bash tool of each new conversation does) one
+after another, in a fresh working directory each, and reports how long each
+took to be ready and to run its first command: once starting a new shell per
+executor and once taking them from a ``TerminalPool`` of ``--pool-size``
+pre-warmed shells. The pool is refilled in the background between
+conversations, after a ``--think`` second pause standing in for the model.
+
+Usage:
+    uv run python scripts/benchmarks/terminal_pool_benchmark.py
+    uv run python scripts/benchmarks/terminal_pool_benchmark.py --terminal-type tmux
+"""
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+
+from openhands.tools.execute_bash.definition import ExecuteBashAction
+from openhands.tools.execute_bash.impl import BashExecutor
+from openhands.tools.execute_bash.terminal import (
+    configure_terminal_pool,
+    get_terminal_pool,
+)
+
+
+def conversations(count: int, terminal_type: str, think: float) -> list[tuple]:
+    timings = []
+    for _ in range(count):
+        with tempfile.TemporaryDirectory() as work_dir:
+            start = time.perf_counter()
+            executor = BashExecutor(work_dir, terminal_type=terminal_type)  # type: ignore[arg-type]
+            ready = time.perf_counter()
+            observation = executor(ExecuteBashAction(command="pwd"))
+            done = time.perf_counter()
+            assert work_dir in observation.output, observation.output
+            executor.close()
+            timings.append((ready - start, done - ready))
+        time.sleep(think)
+    return timings
+
+
+def report(name: str, timings: list[tuple]) -> None:
+    startup = [t[0] * 1000 for t in timings]
+    first = [t[1] * 1000 for t in timings]
+    print(
+        f"{name:>10}{statistics.median(startup):>14.1f}{max(startup):>12.1f}"
+        f"{statistics.median(first):>16.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--terminal-type", choices=["subprocess", "tmux"], default="subprocess"
+    )
+    parser.add_argument("--conversations", type=int, default=10)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--think", type=float, default=1.0)
+    args = parser.parse_args()
+    logging.getLogger("openhands").setLevel(logging.WARNING)
+
+    print(f"{'':>10}{'ready ms':>14}{'max ms':>12}{'1st cmd ms':>16}")
+    report("cold", conversations(args.conversations, args.terminal_type, args.think))
+
+    configure_terminal_pool(args.pool_size)
+    pool = get_terminal_pool()
+    assert pool is not None
+    pool.prewarm(terminal_type=args.terminal_type)  # type: ignore[arg-type]
+    time.sleep(args.think)
+    report("pooled", conversations(args.conversations, args.terminal_type, args.think))
+    print(f"pool hits: {pool.hits}, misses: {pool.misses}")
+    configure_terminal_pool(0)
+
+
+if __name__ == "__main__":
+    main()
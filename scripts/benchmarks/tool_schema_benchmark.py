@@ -0,0 +1,104 @@
+"""Cost of preparing the tools list for a completion, with and without the
+compiled schema cache.
+
+Builds ``--tools`` tools (half regular tools with nested action schemas, half
+MCP tools with dynamically created action types) and reports the average time
+to convert all of them with ``to_openai_tool``.
+
+Usage:
+    uv run python scripts/benchmarks/tool_schema_benchmark.py
+"""
+
+import argparse
+import time
+from collections.abc import Sequence
+
+import mcp.types
+from pydantic import Field
+
+from openhands.sdk.llm import ImageContent, TextContent
+from openhands.sdk.mcp.tool import MCPToolDefinition
+from openhands.sdk.tool import (
+    Action,
+    Observation,
+    ToolBase,
+    ToolDefinition,
+    schema as schema_module,
+)
+
+
+class BenchTarget(Action):
+    path: str = Field(description="Path to operate on")
+    line: int | None = Field(default=None, description="Optional line number")
+
+
+class BenchAction(Action):
+    command: str = Field(description="Command to run")
+    targets: list[BenchTarget] = Field(default_factory=list)
+    timeout: float | None = Field(default=None, description="Timeout in seconds")
+    is_input: bool = Field(default=False, description="Send as stdin")
+
+
+class BenchObservation(Observation):
+    output: str = ""
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.output)]
+
+
+def build_tools(count: int) -> list[ToolBase]:
+    tools: list[ToolBase] = []
+    for i in range(count // 2):
+        tools.append(
+            ToolDefinition(
+                name=f"tool_{i}",
+                description=f"Regular tool {i}",
+                action_type=BenchAction,
+                observation_type=BenchObservation,
+            )
+        )
+    for i in range(count - count // 2):
+        mcp_tool = mcp.types.Tool(
+            name=f"mcp_tool_{i}",
+            description=f"MCP tool {i}",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "url": {"type": "string", "description": "URL"},
+                    "max_length": {"type": "integer"},
+                    "headers": {"type": "object"},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["url"],
+            },
+        )
+        tools.extend(MCPToolDefinition.create(mcp_tool=mcp_tool, mcp_client=None))  # type: ignore[arg-type]
+    return tools
+
+
+def prepare(tools: list[ToolBase], rounds: int, cached: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for tool in tools:
+            if not cached:
+                schema_module._compiled_mcp_schemas.clear()
+            tool.to_openai_tool(add_security_risk_prediction=True)
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tools", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    tools = build_tools(args.tools)
+    uncached = prepare(tools, args.rounds, cached=False)
+    cached = prepare(tools, args.rounds, cached=True)
+    print(f"{'tools':>10}{'uncached (ms)':>20}{'cached (ms)':>20}")
+    print(f"{len(tools):>10}{uncached * 1000:>20.3f}{cached * 1000:>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Per-step cost of View.from_events vs. IncrementalView as history grows.
+
+Simulates an agent whose view is kept to ~``--view-size`` events by a rolling
+condenser, and reports the average time to obtain the view after one appended
+event at several history lengths.
+
+Usage:
+    uv run python scripts/benchmarks/view_benchmark.py
+"""
+
+import argparse
+import time
+
+from openhands.sdk.context.view import IncrementalView, View
+from openhands.sdk.event.base import Event
+from openhands.sdk.event.condenser import Condensation
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.llm import Message, TextContent
+
+
+def message_event(i: int) -> MessageEvent:
+    return MessageEvent(
+        llm_message=Message(role="user", content=[TextContent(text=f"msg {i}")]),
+        source="user",
+    )
+
+
+def build_history(length: int, view_size: int) -> list[Event]:
+    events: list[Event] = []
+    incremental = IncrementalView()
+    for i in range(length):
+        events.append(message_event(i))
+        view = incremental.update(events)
+        if len(view) > view_size:
+            events.append(
+                Condensation(
+                    forgotten_event_ids=[
+                        e.id for e in view.events[1 : -view_size // 2]
+                    ],
+                    summary="summary",
+                    summary_offset=1,
+                )
+            )
+    return events
+
+
+def per_step(events: list[Event], steps: int, incremental: bool) -> float:
+    events = list(events)
+    tracker = IncrementalView()
+    tracker.update(events)
+    start = time.perf_counter()
+    for i in range(steps):
+        events.append(message_event(i))
+        if incremental:
+            tracker.update(events)
+        else:
+            View.from_events(events)
+    return (time.perf_counter() - start) / steps
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--view-size", type=int, default=120)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument(
+        "--lengths", type=int, nargs="+", default=[500, 2000, 8000, 20000]
+    )
+    args = parser.parse_args()
+
+    print(f"{'history':>10}{'from_events (ms)':>20}{'incremental (ms)':>20}")
+    for length in args.lengths:
+        events = build_history(length, args.view_size)
+        full = per_step(events, args.steps, incremental=False)
+        inc = per_step(events, args.steps, incremental=True)
+        print(f"{len(events):>10}{full * 1000:>20.3f}{inc * 1000:>20.3f}")
+
+
+if __name__ == "__main__":
+    main()
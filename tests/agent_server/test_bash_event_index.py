@@ -0,0 +1,196 @@
+"""Tests for the in-memory bash event index, paged search and retention."""
+
+import threading
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from openhands.agent_server.bash_event_index import BashEventEntry, BashEventIndex
+from openhands.agent_server.bash_service import BashEventService
+from openhands.agent_server.models import (
+    BashCommand,
+    BashEventSortOrder,
+    BashOutput,
+    ExecuteBashRequest,
+)
+from openhands.agent_server.utils import utc_now
+
+
+@pytest.fixture
+def bash_service(tmp_path: Path):
+    return BashEventService(bash_events_dir=tmp_path / "bash_events")
+
+
+def save_command_with_outputs(
+    service: BashEventService, num_outputs: int, seconds_ago: int = 0
+) -> tuple[BashCommand, list[BashOutput]]:
+    timestamp = utc_now() - timedelta(seconds=seconds_ago)
+    command = BashCommand(command="echo", timestamp=timestamp)
+    service._save_event_to_file(command)
+    outputs = []
+    for order in range(num_outputs):
+        output = BashOutput(
+            command_id=command.id,
+            order=order,
+            stdout=str(order),
+            timestamp=timestamp + timedelta(seconds=order + 1),
+        )
+        service._save_event_to_file(output)
+        outputs.append(output)
+    return command, outputs
+
+
+def test_entry_parse():
+    command_id, event_id = uuid4().hex, uuid4().hex
+    entry = BashEventEntry.parse(f"20250101000000_BashOutput_{command_id}_{event_id}")
+    assert entry is not None
+    assert (entry.kind, entry.command_id, entry.event_id) == (
+        "BashOutput",
+        command_id,
+        event_id,
+    )
+    entry = BashEventEntry.parse(f"20250101000000_BashCommand_{event_id}")
+    assert entry is not None
+    assert entry.command_id is None
+    assert BashEventEntry.parse("not-an-event") is None
+
+
+def test_index_remove_and_find():
+    event_id = uuid4()
+    name = f"20250101000000_BashCommand_{event_id.hex}"
+    index = BashEventIndex.from_names([name, "garbage"])
+    assert len(index) == 1
+    assert index.find(event_id.hex) == name
+    assert index.find(str(event_id)) == name
+    assert index.find("not-a-uuid") is None
+
+    index.remove(name)
+    assert len(index) == 0
+    assert index.find(event_id.hex) is None
+    assert index.search(kind="BashCommand") == ([], None)
+
+
+async def test_search_pages_through_all_events(bash_service: BashEventService):
+    command, outputs = save_command_with_outputs(bash_service, 25)
+
+    seen = []
+    page_id = None
+    while True:
+        page = await bash_service.search_bash_events(
+            command_id__eq=command.id, page_id=page_id, limit=10
+        )
+        assert len(page.items) <= 10
+        seen.extend(page.items)
+        page_id = page.next_page_id
+        if not page_id:
+            break
+    assert [event.id for event in seen] == [output.id for output in outputs]
+
+
+async def test_search_only_loads_requested_page(bash_service: BashEventService):
+    save_command_with_outputs(bash_service, 50)
+    with patch.object(
+        bash_service,
+        "_load_event_from_file",
+        wraps=bash_service._load_event_from_file,
+    ) as load:
+        page = await bash_service.search_bash_events(limit=5)
+    assert len(page.items) == 5
+    assert page.next_page_id is not None
+    assert load.call_count == 5
+
+
+async def test_search_filters_and_sort(bash_service: BashEventService):
+    first, _ = save_command_with_outputs(bash_service, 2, seconds_ago=100)
+    second, second_outputs = save_command_with_outputs(bash_service, 3)
+
+    page = await bash_service.search_bash_events(kind__eq="BashCommand")
+    assert [event.id for event in page.items] == [first.id, second.id]
+
+    page = await bash_service.search_bash_events(
+        kind__eq="BashOutput",
+        command_id__eq=second.id,
+        sort_order=BashEventSortOrder.TIMESTAMP_DESC,
+    )
+    assert [event.id for event in page.items] == [
+        output.id for output in reversed(second_outputs)
+    ]
+
+    page = await bash_service.search_bash_events(
+        timestamp__gte=second.timestamp, kind__eq="BashCommand"
+    )
+    assert [event.id for event in page.items] == [second.id]
+
+    page = await bash_service.search_bash_events(timestamp__lt=second.timestamp)
+    assert len(page.items) == 3
+
+
+async def test_get_bash_event_accepts_hex_and_uuid(bash_service: BashEventService):
+    command, _ = save_command_with_outputs(bash_service, 0)
+    assert await bash_service.get_bash_event(command.id.hex) == command
+    assert await bash_service.get_bash_event(str(command.id)) == command
+    assert await bash_service.get_bash_event(uuid4().hex) is None
+
+
+async def test_index_is_rebuilt_from_existing_files(tmp_path: Path):
+    service = BashEventService(bash_events_dir=tmp_path)
+    command, outputs = save_command_with_outputs(service, 3)
+
+    restarted = BashEventService(bash_events_dir=tmp_path)
+    assert await restarted.get_bash_event(outputs[1].id.hex) == outputs[1]
+    page = await restarted.search_bash_events(command_id__eq=command.id)
+    assert len(page.items) == 3
+
+
+async def test_retention_by_count(tmp_path: Path):
+    service = BashEventService(bash_events_dir=tmp_path, max_events=3)
+    command, outputs = save_command_with_outputs(service, 4)
+
+    page = await service.search_bash_events()
+    assert [event.id for event in page.items] == [output.id for output in outputs[1:]]
+    assert len(list(tmp_path.iterdir())) == 3
+    assert await service.get_bash_event(command.id.hex) is None
+
+
+async def test_retention_by_age(tmp_path: Path):
+    service = BashEventService(bash_events_dir=tmp_path, max_event_age=60)
+    save_command_with_outputs(service, 2, seconds_ago=600)
+    recent, _ = save_command_with_outputs(service, 0)
+
+    page = await service.search_bash_events()
+    assert [event.id for event in page.items] == [recent.id]
+
+
+async def test_clear_all_events_resets_index(bash_service: BashEventService):
+    save_command_with_outputs(bash_service, 2)
+    assert await bash_service.clear_all_events() == 3
+    page = await bash_service.search_bash_events()
+    assert page.items == []
+    assert list(bash_service.bash_events_dir.iterdir()) == []
+
+
+async def test_event_files_are_written_and_pruned_off_the_loop(tmp_path: Path):
+    service = BashEventService(bash_events_dir=tmp_path, max_events=1)
+    threads: set[str] = set()
+    save, remove = service._save_event_to_file, service._remove_event_file
+
+    def record(method):
+        def wrapper(*args):
+            threads.add(threading.current_thread().name)
+            return method(*args)
+
+        return wrapper
+
+    with (
+        patch.object(service, "_save_event_to_file", record(save)),
+        patch.object(service, "_remove_event_file", record(remove)),
+    ):
+        _, task = await service.start_bash_command(ExecuteBashRequest(command="true"))
+        await task
+
+    assert len(list(tmp_path.iterdir())) == 1
+    assert threads
+    assert all(name.startswith("agent-server-io") for name in threads)
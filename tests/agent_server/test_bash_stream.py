@@ -0,0 +1,138 @@
+"""Tests for streaming bash command execution and its RemoteWorkspace client."""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from openhands.agent_server.api import create_app
+from openhands.agent_server.bash_router import bash_router
+from openhands.agent_server.bash_service import BashEventService
+from openhands.agent_server.config import Config
+from openhands.agent_server.models import BashCommand, BashOutput, ExecuteBashRequest
+from openhands.sdk.workspace.remote.base import RemoteWorkspace
+
+
+@pytest.fixture
+def bash_service(tmp_path: Path):
+    service = BashEventService(bash_events_dir=tmp_path / "bash_events")
+    with patch("openhands.agent_server.bash_router.bash_event_service", service):
+        yield service
+
+
+def remote_workspace(client: TestClient) -> RemoteWorkspace:
+    workspace = RemoteWorkspace(host="http://testserver", working_dir="/tmp")
+    workspace._client = client
+    return workspace
+
+
+async def test_stream_yields_command_then_outputs(bash_service: BashEventService):
+    request = ExecuteBashRequest(command="echo out; echo err >&2; exit 3", cwd="/tmp")
+    events = [event async for event in bash_service.stream_bash_command(request)]
+
+    assert isinstance(events[0], BashCommand)
+    outputs = [event for event in events[1:] if isinstance(event, BashOutput)]
+    assert len(outputs) == len(events) - 1
+    assert all(output.command_id == events[0].id for output in outputs)
+    assert outputs[-1].exit_code == 3
+    assert "out" in "".join(output.stdout or "" for output in outputs)
+    assert "err" in "".join(output.stderr or "" for output in outputs)
+    # The stream no longer listens once the command exited
+    assert bash_service._pub_sub.stats() == {}
+
+
+async def test_stream_ignores_other_commands(bash_service: BashEventService):
+    _, other = await bash_service.start_bash_command(
+        ExecuteBashRequest(command="sleep 0.2; echo other", cwd="/tmp")
+    )
+    request = ExecuteBashRequest(command="echo mine", cwd="/tmp")
+    events = [event async for event in bash_service.stream_bash_command(request)]
+    await other
+
+    assert {getattr(event, "command_id", events[0].id) for event in events} == {
+        events[0].id
+    }
+
+
+def test_stream_endpoint(bash_service: BashEventService):
+    client = TestClient(create_app(Config(session_api_keys=[])))
+    with client.stream(
+        "POST",
+        "/api/bash/execute_bash_command/stream",
+        json={"command": "echo hello", "cwd": "/tmp"},
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [line for line in response.iter_lines() if line]
+
+    events = [BashOutput.model_validate_json(line) for line in lines[1:]]
+    assert BashCommand.model_validate_json(lines[0]).command == "echo hello"
+    assert events[-1].exit_code == 0
+    assert "hello" in "".join(event.stdout or "" for event in events)
+
+
+def test_remote_workspace_streams_output(bash_service: BashEventService):
+    workspace = remote_workspace(TestClient(create_app(Config(session_api_keys=[]))))
+    chunks = []
+
+    result = workspace.execute_command(
+        "echo hello; echo oops >&2; exit 2",
+        on_output=lambda stream, text: chunks.append((stream, text)),
+    )
+
+    assert result.exit_code == 2
+    assert result.stdout == "hello\n"
+    assert result.stderr == "oops\n"
+    assert ("stdout", "hello\n") in chunks
+    assert ("stderr", "oops\n") in chunks
+
+
+def test_remote_workspace_falls_back_to_polling(bash_service: BashEventService):
+    # A server from before the streaming endpoint existed
+    app = FastAPI()
+    app.include_router(bash_router, prefix="/api")
+    app.router.routes = [
+        route
+        for route in app.router.routes
+        if getattr(route, "path", "") != "/api/bash/execute_bash_command/stream"
+    ]
+    # The portal must stay open for the command to run after the request
+    with TestClient(app) as client:
+        result = remote_workspace(client).execute_command("echo polled")
+
+    assert result.exit_code == 0
+    assert result.stdout == "polled\n"
+
+
+def test_remote_workspace_stops_waiting_for_silent_output_at_the_deadline():
+    closed = threading.Event()
+    response = MagicMock(status_code=200)
+    response.close.side_effect = closed.set
+
+    def iter_lines():
+        yield json.dumps({"kind": "BashCommand", "id": "x"})
+        # The command prints nothing; only closing the response ends the read
+        closed.wait(10)
+        raise RuntimeError("response closed")
+
+    response.iter_lines.side_effect = iter_lines
+
+    @contextmanager
+    def stream(*args, **kwargs):
+        yield response
+
+    workspace = RemoteWorkspace(host="http://testserver", working_dir="/tmp")
+    workspace._client = MagicMock(stream=stream)
+
+    start = time.monotonic()
+    result = workspace.execute_command("sleep 60", timeout=0.2)
+
+    assert time.monotonic() - start < 5
+    assert result.timeout_occurred
+    assert closed.is_set()
@@ -0,0 +1,212 @@
+"""Tests for the EventService secondary index used by search and count."""
+
+import random
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from openhands.agent_server.event_index import EventIndex, event_kind
+from openhands.agent_server.event_service import EventService
+from openhands.agent_server.models import EventSortOrder
+from openhands.sdk import Conversation, Message
+from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.conversation.state import ConversationState
+from openhands.sdk.event import Event, PauseEvent
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import InMemoryFileStore
+
+
+MESSAGE_KIND = "openhands.sdk.event.llm_convertible.message.MessageEvent"
+PAUSE_KIND = "openhands.sdk.event.user_action.PauseEvent"
+
+
+def random_events(rng: random.Random, count: int) -> list[Event]:
+    events: list[Event] = []
+    for i in range(count):
+        # Few distinct timestamps, out of order, to exercise ties and sorting
+        timestamp = f"2025-01-01T00:00:{rng.randint(0, 20):02d}"
+        if rng.random() < 0.7:
+            events.append(
+                MessageEvent(
+                    id=f"event{i}",
+                    source="user",
+                    llm_message=Message(role="user"),
+                    timestamp=timestamp,
+                )
+            )
+        else:
+            events.append(PauseEvent(id=f"event{i}", timestamp=timestamp))
+    return events
+
+
+def reference_search(
+    events: list[Event], page_id, limit, kind, descending
+) -> tuple[list[str], str | None]:
+    """Full scan, sort and linear cursor lookup (the pre-index behaviour)."""
+    matching = [e for e in events if kind is None or event_kind(e) == kind]
+    matching.sort(key=lambda e: e.timestamp, reverse=descending)
+    start = 0
+    for i, event in enumerate(matching):
+        if event.id == page_id:
+            start = i
+            break
+    page = matching[start : start + limit]
+    rest = matching[start + limit :]
+    return [e.id for e in page], rest[0].id if rest else None
+
+
+def event_log(events: Sequence[Event]) -> EventLog:
+    log = EventLog(InMemoryFileStore())
+    for event in events:
+        log.append(event)
+    return log
+
+
+def service_for(events) -> EventService:
+    service = EventService(
+        stored=MagicMock(), file_store_path=Path("store"), working_dir=Path("work")
+    )
+    conversation = MagicMock(spec=Conversation)
+    state = MagicMock(spec=ConversationState)
+    state.events = events
+    # Search and count must not take the conversation lock
+    state.__enter__ = MagicMock(side_effect=AssertionError("state lock taken"))
+    conversation._state = state
+    service._conversation = conversation
+    return service
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("kind", [None, MESSAGE_KIND, PAUSE_KIND])
+@pytest.mark.parametrize("descending", [False, True])
+def test_paging_matches_full_scan(seed, kind, descending):
+    rng = random.Random(seed)
+    events = random_events(rng, rng.randint(0, 60))
+    index = EventIndex()
+    index.load(events)
+    limit = rng.randint(1, 7)
+
+    page_id = None
+    seen: list[str] = []
+    while True:
+        positions, next_page_id = index.search(page_id, limit, kind, descending)
+        ids = [events[p].id for p in positions]
+        assert (ids, next_page_id) == reference_search(
+            events, page_id, limit, kind, descending
+        )
+        seen.extend(ids)
+        if next_page_id is None:
+            break
+        page_id = next_page_id
+    assert len(seen) == index.count(kind)
+    assert len(set(seen)) == len(seen)
+
+
+def test_descending_keeps_log_order_for_equal_timestamps():
+    events: list[Event] = [
+        PauseEvent(id=f"event{i}", timestamp=timestamp)
+        for i, timestamp in enumerate(["t1", "t2", "t1", "t2", "t1"])
+    ]
+    index = EventIndex()
+    index.load(events)
+
+    positions, next_page_id = index.search(limit=3, descending=True)
+    assert [events[p].id for p in positions] == ["event1", "event3", "event0"]
+    assert next_page_id == "event2"
+    positions, next_page_id = index.search(next_page_id, limit=3, descending=True)
+    assert [events[p].id for p in positions] == ["event2", "event4"]
+    assert next_page_id is None
+
+
+def test_appended_events_are_indexed_without_reading_the_log():
+    events = random_events(random.Random(0), 53)
+    reads: list[int] = []
+
+    class CountingList(list):
+        def __getitem__(self, idx):
+            reads.append(idx)
+            return super().__getitem__(idx)
+
+    log = CountingList(events[:50])
+    index = EventIndex()
+    index.load(log)
+    assert len(reads) == 50
+
+    reads.clear()
+    for position in range(50, 53):
+        index.append(position, events[position])
+    assert index.count() == 53
+    assert reads == []
+
+
+def test_appends_during_load_are_merged_in_order():
+    events = random_events(random.Random(1), 20)
+    index = EventIndex()
+
+    class AppendingList(list):
+        """Appends (through the hook) while the index is still loading."""
+
+        def __getitem__(self, idx):
+            if idx == 5 and len(self) < len(events):
+                for position in range(len(self), len(events)):
+                    super().append(events[position])
+                    index.append(position, events[position])
+            return super().__getitem__(idx)
+
+    index.load(AppendingList(events[:10]))
+    assert len(index) == 20
+    positions, _ = index.search(limit=100)
+    assert sorted(positions) == list(range(20))
+    # Already indexed events are not added twice
+    index.append(3, events[3])
+    assert index.count() == 20
+
+
+def test_unknown_cursor_starts_from_first_event():
+    events = random_events(random.Random(3), 5)
+    index = EventIndex()
+    index.load(events)
+    assert index.search("missing", 10)[0] == index.search(None, 10)[0]
+
+
+@pytest.mark.asyncio
+async def test_event_service_search_and_count_skip_state_lock():
+    events = random_events(random.Random(4), 30)
+    log = event_log(events)
+    service = service_for(log)
+
+    page = await service.search_events(limit=5, sort_order=EventSortOrder.TIMESTAMP)
+    assert len(page.items) == 5
+    assert page.next_page_id is not None
+    assert await service.count_events() == 30
+    expected_messages = sum(isinstance(e, MessageEvent) for e in events)
+    assert await service.count_events(MESSAGE_KIND) == expected_messages
+
+    log.append(PauseEvent(id="late", timestamp="2030-01-01T00:00:00"))
+    page = await service.search_events(
+        limit=1, sort_order=EventSortOrder.TIMESTAMP_DESC
+    )
+    assert page.items[0].id == "late"
+
+
+@pytest.mark.asyncio
+async def test_search_cost_independent_of_history_length():
+    """Benchmark: once indexed, a page costs O(log n + limit), not O(n)."""
+
+    async def per_search_seconds(count: int) -> float:
+        service = service_for(event_log(random_events(random.Random(5), count)))
+        await service.count_events()  # build the index
+        page_id = None
+        start = time.perf_counter()
+        for _ in range(200):
+            page = await service.search_events(page_id=page_id, limit=20)
+            page_id = page.next_page_id
+        return (time.perf_counter() - start) / 200
+
+    short = min([await per_search_seconds(200) for _ in range(3)])
+    long = min([await per_search_seconds(5000) for _ in range(3)])
+    # Generous bound for noisy CI; a full scan would be ~25x slower
+    assert long < short * 5
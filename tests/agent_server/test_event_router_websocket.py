@@ -1,5 +1,6 @@
 """Tests for websocket functionality in event_router.py"""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -19,7 +20,7 @@ def mock_websocket():
     websocket = MagicMock()
     websocket.accept = AsyncMock()
     websocket.receive_json = AsyncMock()
-    websocket.send_json = AsyncMock()
+    websocket.send_text = AsyncMock()
     websocket.close = AsyncMock()
     websocket.application_state = MagicMock()
     return websocket
@@ -57,14 +58,14 @@ class TestWebSocketSubscriber:
 
         await subscriber(event)
 
-        mock_websocket.send_json.assert_called_once()
-        call_args = mock_websocket.send_json.call_args[0][0]
-        assert call_args["id"] == "test_event"
+        mock_websocket.send_text.assert_called_once()
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
+        assert call_args == event.model_dump()
 
     @pytest.mark.asyncio
     async def test_websocket_subscriber_call_exception(self, mock_websocket):
         """Test exception handling in WebSocket subscriber."""
-        mock_websocket.send_json.side_effect = Exception("Connection error")
+        mock_websocket.send_text.side_effect = Exception("Connection error")
         subscriber = _WebSocketSubscriber(websocket=mock_websocket)
         event = MessageEvent(
             id="test_event",
@@ -75,7 +76,7 @@ class TestWebSocketSubscriber:
         # Should not raise exception, just log it
         await subscriber(event)
 
-        mock_websocket.send_json.assert_called_once()
+        mock_websocket.send_text.assert_called_once()
 
 
 class TestWebSocketDisconnectHandling:
@@ -346,8 +347,10 @@ class TestResendAllFunctionality:
         mock_event_service.search_events.assert_called_once_with(page_id=None)
 
         # All events should be sent through websocket
-        assert mock_websocket.send_json.call_count == 2
-        sent_events = [call[0][0] for call in mock_websocket.send_json.call_args_list]
+        assert mock_websocket.send_text.call_count == 2
+        sent_events = [
+            json.loads(call[0][0]) for call in mock_websocket.send_text.call_args_list
+        ]
         assert sent_events[0]["id"] == "event1"
         assert sent_events[1]["id"] == "event2"
 
@@ -389,10 +392,10 @@ class TestResendAllFunctionality:
         mock_event_service.unsubscribe_from_events.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_resend_all_handles_send_json_exception(
+    async def test_resend_all_handles_send_text_exception(
         self, mock_websocket, mock_event_service, sample_conversation_id
     ):
-        """Test that exceptions during send_json are handled gracefully."""
+        """Test that exceptions during send_text are handled gracefully."""
         # Create mock events to resend
         mock_events = [
             MessageEvent(
@@ -412,8 +415,8 @@ class TestResendAllFunctionality:
         )
         mock_event_service.search_events = AsyncMock(return_value=mock_event_page)
 
-        # Make send_json fail during resend
-        mock_websocket.send_json.side_effect = Exception("Send failed")
+        # Make send_text fail during resend
+        mock_websocket.send_text.side_effect = Exception("Send failed")
         mock_websocket.receive_json.side_effect = WebSocketDisconnect()
 
         with (
@@ -439,8 +442,93 @@ class TestResendAllFunctionality:
 
         # search_events should be called
         mock_event_service.search_events.assert_called_once()
-        # send_json should be called (and fail)
-        mock_websocket.send_json.assert_called_once()
+        # send_text should be called (and fail)
+        mock_websocket.send_text.assert_called_once()
         # WebSocket should still be subscribed and unsubscribed normally
         mock_event_service.subscribe_to_events.assert_called_once()
         mock_event_service.unsubscribe_from_events.assert_called_once()
+
+
+class TestResumeFrom:
+    """Test cases for the resume_from parameter."""
+
+    @pytest.mark.asyncio
+    async def test_resume_from_sends_missed_events_before_live_ones(
+        self, mock_websocket, mock_event_service, sample_conversation_id
+    ):
+        """Missed events come first; live events published meanwhile follow,
+        without duplicates."""
+        from openhands.agent_server.models import EventPage
+        from openhands.agent_server.pub_sub import Envelope
+
+        missed = [
+            MessageEvent(
+                id=f"event{index}", source="user", llm_message=Message(role="user")
+            )
+            for index in range(3, 5)
+        ]
+        live = MessageEvent(
+            id="event5", source="user", llm_message=Message(role="user")
+        )
+        subscribers = []
+
+        async def subscribe(subscriber, overflow_policy=None):
+            subscribers.append(subscriber)
+            return uuid4()
+
+        async def search_events(since_index):
+            # Published while the missed events are being replayed
+            await subscribers[0].deliver(Envelope(missed[1]))
+            await subscribers[0].deliver(Envelope(live))
+            return EventPage(items=list(missed), next_page_id=None)
+
+        mock_event_service.subscribe_to_events = AsyncMock(side_effect=subscribe)
+        mock_event_service.search_events = AsyncMock(side_effect=search_events)
+        mock_websocket.receive_json.side_effect = WebSocketDisconnect()
+
+        with (
+            patch(
+                "openhands.agent_server.sockets.conversation_service"
+            ) as mock_conv_service,
+            patch("openhands.agent_server.sockets.get_default_config") as mock_config,
+        ):
+            mock_config.return_value.session_api_keys = None
+            mock_conv_service.get_event_service = AsyncMock(
+                return_value=mock_event_service
+            )
+
+            from openhands.agent_server.sockets import events_socket
+
+            await events_socket(
+                sample_conversation_id,
+                mock_websocket,
+                session_api_key=None,
+                resume_from=2,
+            )
+
+        mock_event_service.search_events.assert_called_once_with(since_index=2)
+        sent_ids = [
+            json.loads(call[0][0])["id"]
+            for call in mock_websocket.send_text.call_args_list
+        ]
+        assert sent_ids == ["event3", "event4", "event5"]
+
+        # Live again once the missed events were sent
+        await subscribers[0].deliver(Envelope(live))
+        assert mock_websocket.send_text.call_count == 4
+
+
+class TestWebSocketSubscriberClose:
+    """Close codes used for shutdown and for lagging clients."""
+
+    @pytest.mark.asyncio
+    async def test_close_is_a_normal_closure(self, mock_websocket):
+        await _WebSocketSubscriber(mock_websocket).close()
+        assert mock_websocket.close.call_args.kwargs["code"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_disconnect_reports_lagging(self, mock_websocket):
+        await _WebSocketSubscriber(mock_websocket).disconnect()
+        mock_websocket.close.assert_called_once_with(
+            code=1013, reason="Subscriber lagging"
+        )
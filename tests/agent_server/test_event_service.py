@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -12,12 +13,22 @@ from openhands.agent_server.models import (
     StoredConversation,
 )
 from openhands.sdk import LLM, Agent, Conversation, Message
+from openhands.sdk.conversation.event_store import EventLog
 from openhands.sdk.conversation.state import ConversationState
+from openhands.sdk.event import Event
 from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import InMemoryFileStore
 from openhands.sdk.security.confirmation_policy import NeverConfirm
 from openhands.sdk.workspace import LocalWorkspace
 
 
+def event_log(events: Sequence[Event]) -> EventLog:
+    log = EventLog(InMemoryFileStore())
+    for event in events:
+        log.append(event)
+    return log
+
+
 @pytest.fixture
 def sample_stored_conversation():
     """Create a sample StoredConversation for testing."""
@@ -58,7 +69,7 @@ def mock_conversation_with_events():
         for index in range(1, 6)
     ]
 
-    state.events = events
+    state.events = event_log(events)
     state.__enter__ = MagicMock(return_value=state)
     state.__exit__ = MagicMock(return_value=None)
     conversation._state = state
@@ -83,7 +94,7 @@ class TestEventServiceSearchEvents:
         # Mock conversation with empty events
         conversation = MagicMock(spec=Conversation)
         state = MagicMock(spec=ConversationState)
-        state.events = []
+        state.events = event_log([])
         state.__enter__ = MagicMock(return_value=state)
         state.__exit__ = MagicMock(return_value=None)
         conversation._state = state
@@ -274,7 +285,7 @@ class TestEventServiceSearchEvents:
             for index in range(1, 4)
         ]
 
-        state.events = events
+        state.events = event_log(events)
         state.__enter__ = MagicMock(return_value=state)
         state.__exit__ = MagicMock(return_value=None)
         conversation._state = state
@@ -287,6 +298,25 @@ class TestEventServiceSearchEvents:
         assert len(result.items) == 3
         assert result.next_page_id is None  # No more events available
 
+    @pytest.mark.asyncio
+    async def test_search_events_since_index(
+        self, event_service, mock_conversation_with_events
+    ):
+        """Test that since_index pages through the log from a position."""
+        event_service._conversation = mock_conversation_with_events
+
+        result = await event_service.search_events(since_index=1, limit=2)
+        assert [event.id for event in result.items] == ["event2", "event3"]
+        assert result.next_page_id == "event4"
+
+        result = await event_service.search_events(since_index=3, limit=10)
+        assert [event.id for event in result.items] == ["event4", "event5"]
+        assert result.next_page_id is None
+
+        result = await event_service.search_events(since_index=5)
+        assert result.items == []
+        assert result.next_page_id is None
+
 
 class TestEventServiceCountEvents:
     """Test cases for EventService.count_events method."""
@@ -304,7 +334,7 @@ class TestEventServiceCountEvents:
         """Test count_events with no events."""
         conversation = MagicMock(spec=Conversation)
         state = MagicMock(spec=ConversationState)
-        state.events = []
+        state.events = event_log([])
         state.__enter__ = MagicMock(return_value=state)
         state.__exit__ = MagicMock(return_value=None)
         conversation._state = state
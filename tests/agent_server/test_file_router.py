@@ -0,0 +1,243 @@
+"""Tests for streamed, resumable and directory file transfers."""
+
+import hashlib
+import io
+import os
+import tarfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from openhands.agent_server.api import create_app
+from openhands.agent_server.config import Config
+from openhands.sdk.utils.tar_stream import extract_tar, iter_tar
+from openhands.sdk.workspace.remote.base import RemoteWorkspace
+
+
+@pytest.fixture
+def client():
+    return TestClient(create_app(Config(session_api_keys=[])))
+
+
+@pytest.fixture
+def workspace(client: TestClient):
+    workspace = RemoteWorkspace(host="http://testserver", working_dir="/tmp")
+    workspace._client = client
+    return workspace
+
+
+@pytest.fixture
+def payload() -> bytes:
+    return os.urandom(3 * 1024 * 1024 + 17)
+
+
+def test_upload_and_download_round_trip(
+    workspace: RemoteWorkspace, tmp_path: Path, payload: bytes
+):
+    local = tmp_path / "local.bin"
+    local.write_bytes(payload)
+    remote = tmp_path / "remote" / "file.bin"
+    progress = []
+
+    result = workspace.file_upload(
+        local,
+        remote,
+        verify_checksum=True,
+        on_progress=lambda done, total: progress.append((done, total)),
+    )
+    assert result.success, result.error
+    assert result.file_size == len(payload)
+    assert remote.read_bytes() == payload
+    assert progress[-1] == (len(payload), len(payload))
+
+    downloaded = tmp_path / "downloaded.bin"
+    result = workspace.file_download(remote, downloaded, verify_checksum=True)
+    assert result.success, result.error
+    assert downloaded.read_bytes() == payload
+    assert not downloaded.with_name("downloaded.bin.part").exists()
+
+
+def test_resume_upload(workspace: RemoteWorkspace, tmp_path: Path, payload: bytes):
+    local = tmp_path / "local.bin"
+    local.write_bytes(payload)
+    remote = tmp_path / "remote.bin"
+    remote.write_bytes(payload[:1000])
+    sent = []
+
+    result = workspace.file_upload(
+        local, remote, resume=True, on_progress=lambda done, _: sent.append(done)
+    )
+    assert result.success, result.error
+    assert remote.read_bytes() == payload
+    assert sent[0] > 1000
+
+
+def test_resume_download(workspace: RemoteWorkspace, tmp_path: Path, payload: bytes):
+    remote = tmp_path / "remote.bin"
+    remote.write_bytes(payload)
+    local = tmp_path / "local.bin"
+    local.with_name("local.bin.part").write_bytes(payload[:1000])
+    received = []
+
+    result = workspace.file_download(
+        remote,
+        local,
+        resume=True,
+        on_progress=lambda done, total: received.append((done, total)),
+    )
+    assert result.success, result.error
+    assert local.read_bytes() == payload
+    assert received[-1] == (len(payload), len(payload))
+
+    # An already complete partial file is just renamed
+    local.rename(local.with_name("local.bin.part"))
+    assert workspace.file_download(remote, local, resume=True).success
+    assert local.read_bytes() == payload
+
+
+def test_resume_download_restarts_when_remote_shrank(
+    workspace: RemoteWorkspace, tmp_path: Path, payload: bytes
+):
+    remote = tmp_path / "remote.bin"
+    remote.write_bytes(payload[:1000])
+    local = tmp_path / "local.bin"
+    # Left over from an earlier, longer version of the remote file
+    local.with_name("local.bin.part").write_bytes(payload[:5000])
+
+    result = workspace.file_download(remote, local, resume=True)
+    assert result.success, result.error
+    assert result.file_size == 1000
+    assert local.read_bytes() == payload[:1000]
+
+
+def test_resume_download_restarts_when_remote_was_replaced(
+    workspace: RemoteWorkspace, tmp_path: Path, payload: bytes
+):
+    remote = tmp_path / "remote.bin"
+    remote.write_bytes(payload)
+    local = tmp_path / "local.bin"
+    # Same length as a prefix of the remote file, but different content
+    local.with_name("local.bin.part").write_bytes(b"x" * 1000)
+
+    result = workspace.file_download(remote, local, resume=True)
+    assert result.success, result.error
+    assert local.read_bytes() == payload
+
+
+def test_resume_upload_restarts_when_remote_differs(
+    workspace: RemoteWorkspace, tmp_path: Path, payload: bytes
+):
+    local = tmp_path / "local.bin"
+    local.write_bytes(payload)
+    remote = tmp_path / "remote.bin"
+    remote.write_bytes(b"x" * 1000)
+
+    result = workspace.file_upload(local, remote, resume=True)
+    assert result.success, result.error
+    assert remote.read_bytes() == payload
+
+
+def test_download_range_request(client: TestClient, tmp_path: Path):
+    remote = tmp_path / "remote.bin"
+    remote.write_bytes(b"0123456789")
+    response = client.get(f"/api/file/download/{remote}", headers={"Range": "bytes=4-"})
+    assert response.status_code == 206
+    assert response.content == b"456789"
+
+
+def test_checksum_mismatch_is_reported(workspace: RemoteWorkspace, tmp_path: Path):
+    local = tmp_path / "local.bin"
+    local.write_bytes(b"data")
+    with patch("openhands.sdk.workspace.remote.base.sha256_file", return_value="bad"):
+        result = workspace.file_upload(local, tmp_path / "remote.bin", True, True)
+    assert not result.success
+    assert result.error is not None and "Checksum mismatch" in result.error
+
+
+def test_file_info(client: TestClient, tmp_path: Path):
+    remote = tmp_path / "remote.bin"
+    remote.write_bytes(b"data")
+    info = client.get(f"/api/file/info/{remote}", params={"checksum": True}).json()
+    assert info["file_size"] == 4
+    assert info["sha256"] == (
+        "3a6eb0790f39ac87c94f3856b2dd2c5d110e6811602261a9a923d3bb23adc8b7"
+    )
+    prefix = client.get(
+        f"/api/file/info/{remote}", params={"checksum": True, "prefix": 2}
+    ).json()
+    assert prefix["file_size"] == 4
+    assert prefix["sha256"] == hashlib.sha256(b"da").hexdigest()
+    assert client.get(f"/api/file/info/{tmp_path / 'missing'}").status_code == 404
+    assert client.get("/api/file/info/relative/path").status_code == 400
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_directory_round_trip(
+    workspace: RemoteWorkspace, tmp_path: Path, compress: bool
+):
+    source = tmp_path / "source"
+    (source / "nested").mkdir(parents=True)
+    (source / "a.txt").write_text("a" * 5000)
+    (source / "nested" / "b.bin").write_bytes(os.urandom(2000))
+    (source / "empty").mkdir()
+
+    result = workspace.upload_directory(source, tmp_path / "remote", compress)
+    assert result.success, result.error
+    assert result.file_size == 7000
+
+    result = workspace.download_directory(
+        tmp_path / "remote", tmp_path / "back", compress
+    )
+    assert result.success, result.error
+    assert result.file_size == 7000
+    assert (tmp_path / "back" / "a.txt").read_text() == "a" * 5000
+    assert (tmp_path / "back" / "nested" / "b.bin").read_bytes() == (
+        source / "nested" / "b.bin"
+    ).read_bytes()
+    assert (tmp_path / "back" / "empty").is_dir()
+
+
+def test_upload_directory_does_not_use_the_io_pool(
+    workspace: RemoteWorkspace, tmp_path: Path
+):
+    """The extractor runs as long as the upload, so it must not hold (or wait
+    for) one of the few I/O pool workers shared with event reads."""
+    source = tmp_path / "source"
+    source.mkdir()
+    for i in range(8):
+        (source / f"{i}.bin").write_bytes(os.urandom(256 * 1024))
+
+    with patch(
+        "openhands.agent_server.file_router.run_io",
+        side_effect=AssertionError("run_io used"),
+    ):
+        result = workspace.upload_directory(source, tmp_path / "remote")
+
+    assert result.success, result.error
+    assert result.file_size == 8 * 256 * 1024
+
+
+def test_upload_directory_rejects_escaping_members(client: TestClient, tmp_path: Path):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        member = tarfile.TarInfo("../escaped.txt")
+        member.size = 4
+        tar.addfile(member, io.BytesIO(b"evil"))
+
+    response = client.post(
+        f"/api/file/upload_dir/{tmp_path / 'target'}", content=buffer.getvalue()
+    )
+    assert response.status_code == 400
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_iter_tar_can_be_closed_early(tmp_path: Path):
+    for i in range(20):
+        (tmp_path / f"{i}.bin").write_bytes(os.urandom(512 * 1024))
+    chunks = iter_tar(tmp_path)
+    next(chunks)
+    chunks.close()  # must not hang on the archiving thread
+
+    assert extract_tar(iter_tar(tmp_path / "missing"), tmp_path / "out") == 0
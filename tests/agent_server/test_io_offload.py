@@ -0,0 +1,201 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from openhands.agent_server.event_service import EventService
+from openhands.agent_server.io_offload import (
+    AsyncFileStore,
+    LoopLagMonitor,
+    run_io,
+)
+from openhands.agent_server.models import StoredConversation
+from openhands.agent_server.pub_sub import Subscriber
+from openhands.agent_server.server_details_router import get_server_info
+from openhands.sdk import LLM, Agent, Message
+from openhands.sdk.event.conversation_state import ConversationStateUpdateEvent
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import InMemoryFileStore
+from openhands.sdk.workspace import LocalWorkspace
+
+
+class ThreadRecordingEvents:
+    """Minimal event log that records which thread reads from it."""
+
+    def __init__(self, events, delay: float = 0.0):
+        self._events = events
+        self._delay = delay
+        self.reader_threads: set[str] = set()
+
+    def __len__(self):
+        return len(self._events)
+
+    def get_index(self, event_id):
+        for i, event in enumerate(self._events):
+            if event.id == event_id:
+                return i
+        raise KeyError(event_id)
+
+    def set_on_append(self, callback):
+        pass
+
+    def __getitem__(self, idx):
+        self.reader_threads.add(threading.current_thread().name)
+        time.sleep(self._delay)
+        return self._events[idx]
+
+
+@pytest.fixture
+def event_service(tmp_path: Path):
+    return EventService(
+        stored=StoredConversation(
+            id=uuid4(),
+            agent=Agent(llm=LLM(model="gpt-4", service_id="test-llm"), tools=[]),
+            workspace=LocalWorkspace(working_dir=str(tmp_path / "workspace")),
+        ),
+        file_store_path=tmp_path / "conversations",
+        working_dir=tmp_path / "workspace",
+    )
+
+
+def attach_events(service: EventService, events) -> None:
+    conversation = MagicMock()
+    conversation._state.events = events
+    service._conversation = conversation
+
+
+def message_events(count: int) -> list[MessageEvent]:
+    return [
+        MessageEvent(id=f"event{i}", source="user", llm_message=Message(role="user"))
+        for i in range(count)
+    ]
+
+
+async def test_run_io_uses_dedicated_threads():
+    name = await run_io(lambda: threading.current_thread().name)
+    assert name.startswith("agent-server-io")
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await run_io(fail)
+
+
+async def test_async_file_store_round_trip():
+    store = AsyncFileStore(InMemoryFileStore())
+    await store.write("dir/a.json", "{}")
+    assert await store.read("dir/a.json") == "{}"
+    assert await store.list("dir") == ["dir/a.json"]
+    await store.delete("dir/a.json")
+    with pytest.raises(FileNotFoundError):
+        await store.read("dir/a.json")
+
+
+async def test_event_reads_run_off_the_loop(event_service):
+    events = ThreadRecordingEvents(message_events(5))
+    attach_events(event_service, events)
+
+    assert (await event_service.get_event("event3")).id == "event3"
+    assert await event_service.get_event("missing") is None
+    batch = await event_service.batch_get_events(["event1", "missing", "event4"])
+    assert [e.id if e else None for e in batch] == ["event1", None, "event4"]
+    page = await event_service.search_events(limit=2)
+    assert len(page.items) == 2
+    assert await event_service.count_events() == 5
+
+    assert events.reader_threads
+    assert all(name.startswith("agent-server-io") for name in events.reader_threads)
+
+
+async def test_slow_reads_do_not_block_the_loop(event_service):
+    attach_events(event_service, ThreadRecordingEvents(message_events(3), delay=0.2))
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    await event_service.get_event("event1")
+    ticker.cancel()
+    assert ticks >= 5
+
+
+async def test_state_snapshots_wait_for_the_lock_off_the_loop(event_service):
+    attach_events(event_service, [])
+    state = event_service._conversation._state  # type: ignore[union-attr]
+    lock_threads: list[str] = []
+
+    def contended_lock(*args):
+        # Stands in for a lock held by an executor thread (e.g. send_message)
+        lock_threads.append(threading.current_thread().name)
+        time.sleep(0.2)
+
+    state.__enter__.side_effect = contended_lock
+    snapshot = ConversationStateUpdateEvent(key="agent_status", value="idle")
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    received: list = []
+
+    class Collector(Subscriber):
+        async def __call__(self, event):
+            received.append(event)
+
+    ticker = asyncio.create_task(tick())
+    with patch.object(
+        ConversationStateUpdateEvent, "from_conversation_state", return_value=snapshot
+    ):
+        await event_service.subscribe_to_events(Collector())
+        await event_service._publish_state_update()
+    await event_service._pub_sub.join()
+    ticker.cancel()
+
+    assert ticks >= 10
+    assert all(name.startswith("agent-server-io") for name in lock_threads)
+    assert received == [snapshot, snapshot]
+
+
+async def test_meta_round_trip(event_service):
+    attach_events(event_service, [])
+    state = event_service._conversation.state  # type: ignore[union-attr]
+    state.persistence_dir = str(event_service.file_store_path)
+    event_service.stored.max_iterations = 42
+    await event_service.save_meta()
+    event_service.stored.max_iterations = 1
+    await event_service.load_meta()
+    assert event_service.stored.max_iterations == 42
+    assert (event_service.file_store_path / "meta.json").exists()
+
+
+async def test_loop_lag_monitor_detects_blocking():
+    monitor = LoopLagMonitor(interval=0.01)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    time.sleep(0.2)  # block the loop
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    stats = monitor.stats
+    assert not monitor.running
+    assert stats.samples >= 2
+    assert stats.max_lag >= 0.15
+    assert 0 < stats.avg_lag <= stats.max_lag
+
+
+async def test_server_info_reports_loop_lag():
+    info = await get_server_info()
+    assert info.event_loop_lag is not None
+    assert info.event_loop_lag.samples >= 0
@@ -0,0 +1,249 @@
+"""Tests for per-subscriber queues and overflow policies in PubSub."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from openhands.agent_server.config import Config, OverflowPolicy
+from openhands.agent_server.pub_sub import PubSub, Subscriber
+
+
+class GatedSubscriber(Subscriber[int]):
+    """Records events, but only once its gate is open."""
+
+    overflow_policy: OverflowPolicy = "drop_oldest"
+
+    def __init__(self, open_gate: bool = False):
+        self.received: list[int] = []
+        self.gate = asyncio.Event()
+        if open_gate:
+            self.gate.set()
+        self.closed = False
+
+    async def __call__(self, event: int):
+        await self.gate.wait()
+        self.received.append(event)
+
+    async def close(self):
+        self.closed = True
+
+
+class DropOldestSubscriber(GatedSubscriber):
+    overflow_policy: OverflowPolicy = "drop_oldest"
+
+
+class DisconnectSubscriber(GatedSubscriber):
+    overflow_policy: OverflowPolicy = "disconnect"
+
+
+class BlockSubscriber(GatedSubscriber):
+    overflow_policy: OverflowPolicy = "block"
+
+
+def subscribe(pub_sub: PubSub[int], subscriber: GatedSubscriber):
+    """Subscribe with the subscriber's overflow policy and a queue of 2."""
+    return pub_sub.subscribe(subscriber, subscriber.overflow_policy, 2)
+
+
+async def publish(pub_sub: PubSub[int], *events: int) -> None:
+    for event in events:
+        await pub_sub(event)
+
+
+async def test_slow_subscriber_does_not_delay_others():
+    pub_sub = PubSub[int]()
+    stuck = DropOldestSubscriber()
+    fast = DropOldestSubscriber(open_gate=True)
+    subscribe(pub_sub, stuck)
+    fast_id = subscribe(pub_sub, fast)
+
+    for event in range(10):
+        await pub_sub(event)
+        await asyncio.sleep(0)
+
+    assert fast.received == list(range(10))
+    assert stuck.received == []
+    assert pub_sub.stats()[fast_id].delivered == 10
+
+
+async def test_drop_oldest_keeps_newest_events():
+    pub_sub = PubSub[int]()
+    subscriber = DropOldestSubscriber()
+    subscriber_id = subscribe(pub_sub, subscriber)
+
+    await pub_sub(0)
+    await asyncio.sleep(0)  # event 0 is now being delivered
+    await publish(pub_sub, 1, 2, 3, 4)
+    stats = pub_sub.stats()[subscriber_id]
+    assert stats.queued == 2
+    assert stats.dropped == 2
+
+    subscriber.gate.set()
+    await pub_sub.join()
+    assert subscriber.received == [0, 3, 4]
+
+
+async def test_disconnect_removes_and_closes_lagging_subscriber():
+    pub_sub = PubSub[int]()
+    lagging = DisconnectSubscriber()
+    healthy = DisconnectSubscriber(open_gate=True)
+    lagging_id = subscribe(pub_sub, lagging)
+    subscribe(pub_sub, healthy)
+
+    for event in range(4):
+        await pub_sub(event)
+        await asyncio.sleep(0)
+
+    assert lagging.closed
+    assert lagging_id not in pub_sub.stats()
+    assert healthy.received == [0, 1, 2, 3]
+    assert not pub_sub.unsubscribe(lagging_id)
+
+
+async def test_block_waits_for_room():
+    pub_sub = PubSub[int]()
+    subscriber = BlockSubscriber()
+    subscribe(pub_sub, subscriber)
+
+    await pub_sub(0)
+    await asyncio.sleep(0)
+    await publish(pub_sub, 1, 2)
+    blocked = asyncio.create_task(pub_sub(3))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    subscriber.gate.set()
+    await asyncio.wait_for(blocked, 1)
+    await pub_sub.join()
+    assert subscriber.received == [0, 1, 2, 3]
+
+
+async def test_subscribe_defaults_come_from_config():
+    pub_sub = PubSub[int]()
+    config = Config(subscriber_max_queue_size=3)
+    with patch(
+        "openhands.agent_server.pub_sub.get_default_config", return_value=config
+    ):
+        subscriber_id = pub_sub.subscribe(GatedSubscriber())
+        blocking_id = pub_sub.subscribe(GatedSubscriber(), "block", 5)
+
+    subscription = pub_sub._subscriptions[subscriber_id]
+    assert subscription.overflow_policy == "drop_oldest"
+    assert subscription.queue.maxsize == 3
+    blocking = pub_sub._subscriptions[blocking_id]
+    assert blocking.overflow_policy == "block"
+    assert blocking.queue.maxsize == 5
+
+
+async def test_lag_metrics():
+    class SlowSubscriber(Subscriber[int]):
+        async def __call__(self, event: int):
+            await asyncio.sleep(0.02)
+
+    pub_sub = PubSub[int]()
+    subscriber_id = pub_sub.subscribe(SlowSubscriber())
+    await publish(pub_sub, 1, 2, 3)
+    await pub_sub.join()
+
+    stats = pub_sub.stats()[subscriber_id]
+    assert stats.delivered == 3
+    assert stats.queued == 0
+    assert stats.max_lag >= 0.06
+    assert stats.last_lag == stats.max_lag
+
+
+async def test_close_delivers_queued_events_first():
+    pub_sub = PubSub[int]()
+    subscriber = DropOldestSubscriber(open_gate=True)
+    subscribe(pub_sub, subscriber)
+    await publish(pub_sub, 1, 2)
+
+    await pub_sub.close()
+
+    assert subscriber.received == [1, 2]
+    assert subscriber.closed
+    assert pub_sub.stats() == {}
+
+
+async def test_close_gives_up_on_stuck_subscriber():
+    pub_sub = PubSub[int](close_timeout=0.05)
+    subscriber = BlockSubscriber()
+    subscribe(pub_sub, subscriber)
+    await pub_sub(1)
+
+    await asyncio.wait_for(pub_sub.close(), 1)
+    assert subscriber.closed
+    assert subscriber.received == []
+
+
+@pytest.mark.parametrize("count", [1, 20])
+async def test_failing_subscriber_keeps_receiving(count: int):
+    class FailingSubscriber(Subscriber[int]):
+        def __init__(self):
+            self.calls = 0
+
+        async def __call__(self, event: int):
+            self.calls += 1
+            raise RuntimeError("boom")
+
+    pub_sub = PubSub[int]()
+    subscriber = FailingSubscriber()
+    pub_sub.subscribe(subscriber)
+    await publish(pub_sub, *range(count))
+    await pub_sub.join()
+    assert subscriber.calls == count
+
+
+async def test_shutdown_closes_and_lag_disconnects():
+    class RecordingSubscriber(DisconnectSubscriber):
+        def __init__(self, open_gate: bool = False):
+            super().__init__(open_gate)
+            self.disconnected = False
+
+        async def disconnect(self):
+            self.disconnected = True
+
+    pub_sub = PubSub[int]()
+    lagging = RecordingSubscriber()
+    healthy = RecordingSubscriber(open_gate=True)
+    subscribe(pub_sub, lagging)
+    subscribe(pub_sub, healthy)
+    for event in range(4):
+        await pub_sub(event)
+        await asyncio.sleep(0)
+
+    await pub_sub.close()
+    assert lagging.disconnected and not lagging.closed
+    assert healthy.closed and not healthy.disconnected
+
+
+async def test_failing_close_does_not_skip_other_subscribers():
+    class FailingClose(DropOldestSubscriber):
+        async def close(self):
+            raise RuntimeError("boom")
+
+    pub_sub = PubSub[int]()
+    subscribe(pub_sub, FailingClose())
+    other = DropOldestSubscriber()
+    subscribe(pub_sub, other)
+
+    await pub_sub.close()
+    assert other.closed
+
+
+async def test_publish_to_queues_behind_earlier_events():
+    pub_sub = PubSub[int]()
+    subscriber = BlockSubscriber()
+    other = BlockSubscriber(open_gate=True)
+    subscriber_id = subscribe(pub_sub, subscriber)
+    subscribe(pub_sub, other)
+
+    await pub_sub(1)
+    await pub_sub.publish_to(subscriber_id, 100)
+    await pub_sub(2)
+    subscriber.gate.set()
+    await pub_sub.join()
+
+    assert subscriber.received == [1, 100, 2]
+    assert other.received == [1, 2]
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from openhands.agent_server.pub_sub import Envelope, PubSub, Subscriber
+
+
+class CountingEvent:
+    """Event that counts how often it is serialized."""
+
+    encodings = 0
+
+    def model_dump_json(self):
+        CountingEvent.encodings += 1
+        return '{"kind": "CountingEvent"}'
+
+
+class WireSubscriber(Subscriber[CountingEvent]):
+    """Subscriber that sends the shared encoding, like a websocket."""
+
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def __call__(self, event):
+        raise AssertionError("wire subscribers receive the envelope")
+
+    async def deliver(self, envelope: Envelope[CountingEvent]):
+        self.sent.append(envelope.json)
+
+
+class PlainSubscriber(Subscriber[CountingEvent]):
+    def __init__(self):
+        self.received: list[CountingEvent] = []
+
+    async def __call__(self, event):
+        self.received.append(event)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_serializes_each_event_once():
+    pub_sub = PubSub[CountingEvent]()
+    wire = [WireSubscriber() for _ in range(20)]
+    plain = PlainSubscriber()
+    for subscriber in [*wire, plain]:
+        pub_sub.subscribe(subscriber)
+
+    CountingEvent.encodings = 0
+    event = CountingEvent()
+    await pub_sub(event)
+    await pub_sub.join()
+
+    assert CountingEvent.encodings == 1
+    assert all(s.sent == ['{"kind": "CountingEvent"}'] for s in wire)
+    assert plain.received == [event]
+
+
+def test_envelope_encodes_lazily():
+    CountingEvent.encodings = 0
+    envelope = Envelope(CountingEvent())
+    assert CountingEvent.encodings == 0
+    assert envelope.json == envelope.json
+    assert CountingEvent.encodings == 1
+
+
+def test_envelope_falls_back_to_instance_dict():
+    class PlainEvent:
+        def __init__(self):
+            self.type = "plain"
+
+    assert json.loads(Envelope(PlainEvent()).json) == {"type": "plain"}
@@ -0,0 +1,307 @@
+"""Tests for pooled webhook clients, retries and the on-disk spill queue."""
+
+import asyncio
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import patch
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from openhands.agent_server.config import WebhookSpec
+from openhands.agent_server.conversation_service import WebhookSubscriber
+from openhands.agent_server.pub_sub import Envelope
+from openhands.agent_server.webhook_client import (
+    SpillQueue,
+    close_webhook_clients,
+    encode_body,
+    get_webhook_client,
+    retry_delay,
+)
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.llm.message import Message, TextContent
+
+
+class RecordingWebhook:
+    """MockTransport handler that records bodies and fails while `down`."""
+
+    def __init__(self, down: bool = False):
+        self.down = down
+        self.bodies: list[list[dict]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if self.down:
+            return httpx.Response(503)
+        content = request.content
+        if request.headers.get("Content-Encoding") == "gzip":
+            content = gzip.decompress(content)
+        self.bodies.append(json.loads(content))
+        return httpx.Response(200)
+
+
+def make_subscriber(spec: WebhookSpec, spill_dir: Path | None) -> WebhookSubscriber:
+    return WebhookSubscriber(
+        conversation_id=uuid4(),
+        service=None,  # type: ignore[arg-type]
+        spec=spec,
+        spill_dir=spill_dir,
+    )
+
+
+def message_event(text: str) -> MessageEvent:
+    return MessageEvent(
+        source="user",
+        llm_message=Message(role="user", content=[TextContent(text=text)]),
+    )
+
+
+async def queue_events(subscriber: WebhookSubscriber, *texts: str) -> None:
+    subscriber.queue.extend(Envelope(message_event(text)) for text in texts)
+
+
+# Tests patch asyncio.sleep to hold up retries
+_real_sleep = asyncio.sleep
+
+
+async def wait_until(condition) -> None:
+    for _ in range(100):
+        if condition():
+            return
+        await _real_sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+def texts(body: list[dict]) -> list[str]:
+    return [event["llm_message"]["content"][0]["text"] for event in body]
+
+
+@pytest.fixture
+def webhook():
+    webhook = RecordingWebhook()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(webhook))
+    with patch(
+        "openhands.agent_server.conversation_service.get_webhook_client",
+        return_value=client,
+    ):
+        yield webhook
+
+
+async def test_client_is_shared_per_base_url():
+    spec = WebhookSpec(base_url="https://example.com/", max_connections=3)
+    client = get_webhook_client(spec)
+    assert get_webhook_client(WebhookSpec(base_url="https://example.com")) is client
+    assert get_webhook_client(WebhookSpec(base_url="https://other.com")) is not client
+
+    await close_webhook_clients()
+    assert client.is_closed
+    assert get_webhook_client(spec) is not client
+    await close_webhook_clients()
+
+
+def test_retry_delay_is_jittered_exponential():
+    spec = WebhookSpec(base_url="https://example.com", retry_delay=2, max_retry_delay=5)
+    for _ in range(50):
+        assert 1 <= retry_delay(spec, 0) <= 2
+        assert 2 <= retry_delay(spec, 1) <= 4
+        assert 2.5 <= retry_delay(spec, 5) <= 5
+
+
+def test_encode_body_gzip():
+    plain = WebhookSpec(base_url="https://example.com")
+    assert encode_body(plain, "[]") == (b"[]", {})
+    data, headers = encode_body(plain.model_copy(update={"gzip": True}), "[1]")
+    assert headers == {"Content-Encoding": "gzip"}
+    assert gzip.decompress(data) == b"[1]"
+
+
+async def test_gzip_batches_are_posted(webhook: RecordingWebhook):
+    spec = WebhookSpec(base_url="https://example.com", gzip=True)
+    subscriber = make_subscriber(spec, None)
+    await queue_events(subscriber, "a", "b")
+    await subscriber._post_events()
+    assert [texts(body) for body in webhook.bodies] == [["a", "b"]]
+
+
+async def test_failed_batch_is_spilled_and_replayed(
+    webhook: RecordingWebhook, tmp_path: Path
+):
+    spec = WebhookSpec(base_url="https://example.com", num_retries=0)
+    subscriber = make_subscriber(spec, tmp_path)
+    webhook.down = True
+    await queue_events(subscriber, "a", "b")
+    await subscriber._post_events()
+
+    spill = SpillQueue.for_webhook(tmp_path, spec)
+    assert len(spill) == 1
+    assert subscriber.queue == []
+
+    # A new subscriber (e.g. after a restart) delivers the spilled batch
+    webhook.down = False
+    restarted = make_subscriber(spec, tmp_path)
+    restarted.replay_spilled()
+    assert restarted._sender is not None
+    await restarted._sender
+    assert [texts(body) for body in webhook.bodies] == [["a", "b"]]
+    assert len(spill) == 0
+
+
+async def test_spilled_batches_are_posted_before_later_ones(
+    webhook: RecordingWebhook, tmp_path: Path
+):
+    spec = WebhookSpec(base_url="https://example.com", num_retries=0)
+    subscriber = make_subscriber(spec, tmp_path)
+    webhook.down = True
+    for text in ["a", "b"]:
+        await queue_events(subscriber, text)
+        await subscriber._post_events()
+
+    webhook.down = False
+    await queue_events(subscriber, "c")
+    await subscriber._post_events()
+    assert [texts(body) for body in webhook.bodies] == [["a"], ["b"], ["c"]]
+    assert len(SpillQueue.for_webhook(tmp_path, spec)) == 0
+
+
+async def test_deliver_does_not_wait_for_the_webhook(webhook: RecordingWebhook):
+    spec = WebhookSpec(base_url="https://example.com", event_buffer_size=1)
+    subscriber = make_subscriber(spec, None)
+    post_gate = asyncio.Event()
+
+    async def gated_post(body, attempt):
+        await post_gate.wait()
+        return True
+
+    with patch.object(subscriber, "_post_body", gated_post):
+        for text in ["a", "b", "c"]:
+            await asyncio.wait_for(
+                subscriber.deliver(Envelope(message_event(text))), timeout=1
+            )
+        assert len(subscriber._batches) == 3
+
+        post_gate.set()
+        await subscriber.close()
+    assert not subscriber._batches
+
+
+async def test_retried_batch_is_posted_before_later_ones(webhook: RecordingWebhook):
+    spec = WebhookSpec(base_url="https://example.com", num_retries=1)
+    subscriber = make_subscriber(spec, None)
+    retry_gate = asyncio.Event()
+
+    async def gated_sleep(delay):
+        await retry_gate.wait()
+
+    with patch(
+        "openhands.agent_server.conversation_service.asyncio.sleep", gated_sleep
+    ):
+        webhook.down = True
+        await queue_events(subscriber, "a")
+        subscriber._flush()
+        await wait_until(lambda: subscriber._sender_cancellable)
+
+        webhook.down = False
+        await queue_events(subscriber, "b")
+        subscriber._flush()
+        await _real_sleep(0.01)
+        assert webhook.bodies == []
+
+        retry_gate.set()
+        await subscriber.close()
+    assert [texts(body) for body in webhook.bodies] == [["a"], ["b"]]
+
+
+async def test_backlog_is_spilled_in_order(webhook: RecordingWebhook, tmp_path: Path):
+    spec = WebhookSpec(base_url="https://example.com", num_retries=5)
+    subscriber = make_subscriber(spec, tmp_path)
+    retry_gate = asyncio.Event()
+
+    async def gated_sleep(delay):
+        await retry_gate.wait()
+
+    with patch(
+        "openhands.agent_server.conversation_service.asyncio.sleep", gated_sleep
+    ):
+        webhook.down = True
+        await queue_events(subscriber, "0")
+        subscriber._flush()
+        await wait_until(lambda: subscriber._sender_cancellable)
+        for i in range(1, 12):
+            await queue_events(subscriber, str(i))
+            subscriber._flush()
+
+        # The next failure gives up instead of retrying behind 11 batches
+        retry_gate.set()
+        assert subscriber._sender is not None
+        await subscriber._sender
+
+    spill = SpillQueue.for_webhook(tmp_path, spec)
+    assert [texts(json.loads(path.read_text())) for path in spill.paths()] == [
+        [str(i)] for i in range(12)
+    ]
+    assert not subscriber._batches
+
+    webhook.down = False
+    await queue_events(subscriber, "12")
+    await subscriber._post_events()
+    assert [texts(body) for body in webhook.bodies] == [[str(i)] for i in range(13)]
+
+
+async def test_close_spills_retrying_batches_without_waiting(
+    webhook: RecordingWebhook, tmp_path: Path
+):
+    spec = WebhookSpec(base_url="https://example.com", num_retries=3, retry_delay=60)
+    subscriber = make_subscriber(spec, tmp_path)
+    webhook.down = True
+    await queue_events(subscriber, "a")
+    subscriber._flush()
+    await wait_until(lambda: subscriber._sender_cancellable)
+    await queue_events(subscriber, "b")
+
+    await asyncio.wait_for(subscriber.close(), timeout=5)
+
+    spill = SpillQueue.for_webhook(tmp_path, spec)
+    assert [texts(json.loads(path.read_text())) for path in spill.paths()] == [
+        ["a"],
+        ["b"],
+    ]
+    assert not subscriber._batches
+    assert webhook.bodies == []
+
+
+async def test_close_cancels_replay(webhook: RecordingWebhook, tmp_path: Path):
+    spec = WebhookSpec(base_url="https://example.com", num_retries=0)
+    spill = SpillQueue.for_webhook(tmp_path, spec)
+    spill.put('[{"kind": "x"}]')
+    subscriber = make_subscriber(spec, tmp_path)
+    replay_gate = asyncio.Event()
+
+    async def gated_post(body, attempt):
+        await replay_gate.wait()
+        return True
+
+    with patch.object(subscriber, "_post_body", gated_post):
+        subscriber.replay_spilled()
+        await asyncio.sleep(0)
+        await asyncio.wait_for(subscriber.close(), timeout=5)
+
+    assert subscriber._sender is not None
+    assert subscriber._sender.cancelled()
+    assert len(spill) == 1
+
+
+async def test_close_does_not_replay_spilled_batches(
+    webhook: RecordingWebhook, tmp_path: Path
+):
+    spec = WebhookSpec(base_url="https://example.com")
+    spill = SpillQueue.for_webhook(tmp_path, spec)
+    spill.put('[{"kind": "x"}]')
+    subscriber = make_subscriber(spec, tmp_path)
+    await queue_events(subscriber, "a")
+
+    await subscriber.close()
+
+    # Left for the next subscriber, with the new batch behind the old one
+    assert webhook.bodies == []
+    assert len(spill) == 2
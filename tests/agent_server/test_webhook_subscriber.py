@@ -6,6 +6,7 @@ without dependencies on the openhands.sdk module.
 """
 
 import asyncio
+import json
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -19,6 +20,7 @@ from openhands.agent_server.config import WebhookSpec
 from openhands.agent_server.conversation_service import WebhookSubscriber
 from openhands.agent_server.event_service import EventService
 from openhands.agent_server.models import StoredConversation
+from openhands.agent_server.pub_sub import Envelope
 from openhands.agent_server.utils import utc_now
 from openhands.sdk import LLM, Agent
 from openhands.sdk.event.llm_convertible import MessageEvent
@@ -97,6 +99,33 @@ def sample_conversation_id():
     return uuid4()
 
 
+def assert_backoff(delays, base):
+    """Retry delays double from `base` and are jittered down by up to half."""
+    for attempt, delay in enumerate(delays):
+        assert base * 2**attempt / 2 <= delay <= base * 2**attempt
+
+
+def envelopes(events):
+    return [Envelope(event) for event in events]
+
+
+def queued_events(subscriber):
+    return [envelope.event for envelope in subscriber.queue]
+
+
+async def posted(subscriber):
+    """Wait for the background sender to post the batches handed to it."""
+    if subscriber._sender is not None:
+        await subscriber._sender
+
+
+def json_body(events):
+    """Request body for a batch; must decode to the events' model_dump()."""
+    body = "[" + ",".join(event.model_dump_json() for event in events) + "]"
+    assert json.loads(body) == [event.model_dump() for event in events]
+    return body.encode()
+
+
 class TestWebhookSpecValidation:
     """Test cases for WebhookSpec validation."""
 
@@ -207,7 +236,7 @@ class TestWebhookSubscriberCallMethod:
         await subscriber(sample_event)
 
         assert len(subscriber.queue) == 1
-        assert subscriber.queue[0] == sample_event
+        assert subscriber.queue[0].event == sample_event
 
     @pytest.mark.asyncio
     async def test_call_multiple_events_below_buffer_size(
@@ -225,20 +254,20 @@ class TestWebhookSubscriberCallMethod:
             await subscriber(event)
 
         assert len(subscriber.queue) == 2
-        assert subscriber.queue == sample_events[:2]
+        assert queued_events(subscriber) == sample_events[:2]
 
     @pytest.mark.asyncio
-    @patch.object(WebhookSubscriber, "_post_events")
+    @patch.object(WebhookSubscriber, "_flush")
     async def test_call_triggers_post_when_buffer_full(
         self,
-        mock_post_events,
+        mock_flush,
         mock_event_service,
         webhook_spec,
         sample_events,
         sample_conversation_id,
     ):
-        """Test that reaching buffer size triggers _post_events."""
-        mock_post_events.return_value = None
+        """Test that reaching buffer size hands the events to the sender."""
+        mock_flush.return_value = None
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -249,8 +278,8 @@ class TestWebhookSubscriberCallMethod:
         for event in sample_events[:3]:
             await subscriber(event)
 
-        # _post_events should be called once when buffer is full
-        mock_post_events.assert_called_once()
+        # _flush should be called once when buffer is full
+        mock_flush.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_call_triggers_post_multiple_times(
@@ -261,21 +290,21 @@ class TestWebhookSubscriberCallMethod:
         sample_event,
         sample_conversation_id,
     ):
-        """Test that _post_events is called multiple times as buffer fills."""
+        """Test that _flush is called multiple times as buffer fills."""
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
             spec=webhook_spec,
         )
 
-        # Mock the _post_events method to track calls but not actually post
+        # Mock the _flush method to track calls but not actually post
         post_events_calls = []
 
-        async def mock_post_events():
+        def mock_flush():
             post_events_calls.append(len(subscriber.queue))
             subscriber.queue.clear()  # Simulate clearing the queue
 
-        subscriber._post_events = mock_post_events
+        subscriber._flush = mock_flush
 
         # Add 6 events (buffer size is 3, so should trigger twice:
         # at 3 events and at 6 events)
@@ -285,7 +314,7 @@ class TestWebhookSubscriberCallMethod:
         # Add one more event to trigger the second post
         await subscriber(sample_event)
 
-        # _post_events should be called twice (at 3 events and at 6 events)
+        # _flush should be called twice (at 3 events and at 6 events)
         assert len(post_events_calls) == 2
         assert post_events_calls[0] == 3  # First call with 3 events
         assert post_events_calls[1] == 3  # Second call with 3 events
@@ -310,7 +339,7 @@ class TestWebhookSubscriberPostEvents:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -319,7 +348,7 @@ class TestWebhookSubscriberPostEvents:
         )
 
         # Add events to queue
-        subscriber.queue = sample_events[:3]
+        subscriber.queue = envelopes(sample_events[:3])
 
         await subscriber._post_events()
 
@@ -328,7 +357,7 @@ class TestWebhookSubscriberPostEvents:
         mock_client.request.assert_called_once_with(
             method="POST",
             url=expected_url,
-            json=[event.model_dump() for event in sample_events[:3]],
+            content=json_body(sample_events[:3]),
             headers={
                 "Content-Type": "application/json",
                 "Authorization": "Bearer token",
@@ -355,7 +384,7 @@ class TestWebhookSubscriberPostEvents:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -365,7 +394,7 @@ class TestWebhookSubscriberPostEvents:
         )
 
         # Add events to queue
-        subscriber.queue = sample_events[:2]
+        subscriber.queue = envelopes(sample_events[:2])
 
         await subscriber._post_events()
 
@@ -379,7 +408,7 @@ class TestWebhookSubscriberPostEvents:
         mock_client.request.assert_called_once_with(
             method="POST",
             url=expected_url,
-            json=[event.model_dump() for event in sample_events[:2]],
+            content=json_body(sample_events[:2]),
             headers=expected_headers,
             timeout=30.0,
         )
@@ -412,7 +441,7 @@ class TestWebhookSubscriberPostEvents:
         )
 
         # Add events to queue
-        subscriber.queue = sample_events[:2]
+        subscriber.queue = envelopes(sample_events[:2])
 
         # Track retry attempts
         retry_attempts = []
@@ -436,7 +465,7 @@ class TestWebhookSubscriberPostEvents:
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.request = mock_request
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             with patch("asyncio.sleep", side_effect=mock_sleep):
                 await subscriber._post_events()
@@ -444,7 +473,7 @@ class TestWebhookSubscriberPostEvents:
         # Verify retries were attempted
         assert len(retry_attempts) == 3
         assert len(sleep_calls) == 2  # Sleep between retries
-        assert all(delay == webhook_spec.retry_delay for delay in sleep_calls)
+        assert_backoff(sleep_calls, webhook_spec.retry_delay)
 
         # Verify queue is cleared after success
         assert subscriber.queue == []
@@ -462,7 +491,7 @@ class TestWebhookSubscriberPostEvents:
 
         # Add events to queue
         original_events = sample_events[:2]
-        subscriber.queue = original_events.copy()
+        subscriber.queue = envelopes(original_events)
 
         # Track retry attempts
         retry_attempts = []
@@ -481,7 +510,7 @@ class TestWebhookSubscriberPostEvents:
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.request = mock_request
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             with patch("asyncio.sleep", side_effect=mock_sleep):
                 await subscriber._post_events()
@@ -492,7 +521,7 @@ class TestWebhookSubscriberPostEvents:
 
         # Verify events are re-queued after failure
         assert len(subscriber.queue) == 2
-        assert subscriber.queue == original_events
+        assert queued_events(subscriber) == original_events
 
     @pytest.mark.asyncio
     @patch("httpx.AsyncClient")
@@ -509,7 +538,7 @@ class TestWebhookSubscriberPostEvents:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -520,9 +549,10 @@ class TestWebhookSubscriberPostEvents:
         # Create event without model_dump method
         event_without_model_dump = MagicMock()
         del event_without_model_dump.model_dump  # Remove model_dump method
+        del event_without_model_dump.model_dump_json
         event_without_model_dump.__dict__ = {"type": "test", "data": "value"}
 
-        subscriber.queue = [event_without_model_dump]
+        subscriber.queue = [Envelope(event_without_model_dump)]
 
         await subscriber._post_events()
 
@@ -531,7 +561,7 @@ class TestWebhookSubscriberPostEvents:
         mock_client.request.assert_called_once_with(
             method="POST",
             url=expected_url,
-            json=[{"type": "test", "data": "value"}],
+            content=b'[{"type": "test", "data": "value"}]',
             headers={
                 "Content-Type": "application/json",
                 "Authorization": "Bearer token",
@@ -544,17 +574,17 @@ class TestWebhookSubscriberCloseMethod:
     """Test cases for WebhookSubscriber.close method."""
 
     @pytest.mark.asyncio
-    @patch.object(WebhookSubscriber, "_post_events")
+    @patch.object(WebhookSubscriber, "_flush")
     async def test_close_posts_remaining_events(
         self,
-        mock_post_events,
+        mock_flush,
         mock_event_service,
         webhook_spec,
         sample_events,
         sample_conversation_id,
     ):
         """Test that close method posts remaining events in queue."""
-        mock_post_events.return_value = None
+        mock_flush.return_value = None
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -562,20 +592,25 @@ class TestWebhookSubscriberCloseMethod:
         )
 
         # Add events to queue
-        subscriber.queue = sample_events[:2]
+        subscriber.queue = envelopes(sample_events[:2])
 
         await subscriber.close()
 
-        # Verify _post_events was called
-        mock_post_events.assert_called_once()
+        # Verify _flush was called
+        mock_flush.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch.object(WebhookSubscriber, "_post_events")
+    @patch("httpx.AsyncClient")
     async def test_close_with_empty_queue(
-        self, mock_post_events, mock_event_service, webhook_spec, sample_conversation_id
+        self,
+        mock_client_class,
+        mock_event_service,
+        webhook_spec,
+        sample_conversation_id,
     ):
         """Test close method with empty queue."""
-        mock_post_events.return_value = None
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
             service=mock_event_service,
@@ -584,8 +619,9 @@ class TestWebhookSubscriberCloseMethod:
 
         await subscriber.close()
 
-        # _post_events should not be called when queue is empty
-        mock_post_events.assert_not_called()
+        # Nothing should be posted when queue is empty
+        mock_client.request.assert_not_called()
+        assert subscriber._sender is None
 
 
 class TestWebhookSubscriberIntegration:
@@ -607,7 +643,7 @@ class TestWebhookSubscriberIntegration:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -623,9 +659,10 @@ class TestWebhookSubscriberIntegration:
         await subscriber(sample_events[1])
         assert len(subscriber.queue) == 2
 
-        # This should trigger _post_events
+        # This should hand the batch to the sender
         await subscriber(sample_events[2])
         assert len(subscriber.queue) == 0  # Queue should be cleared
+        await posted(subscriber)
 
         # Verify HTTP request was made
         mock_client.request.assert_called_once()
@@ -657,7 +694,7 @@ class TestWebhookSubscriberIntegration:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -668,6 +705,7 @@ class TestWebhookSubscriberIntegration:
         # Process events concurrently
         tasks = [subscriber(event) for event in sample_events]
         await asyncio.gather(*tasks)
+        await posted(subscriber)
 
         # With buffer size 3, we should have posted once and have 2 events remaining
         assert len(subscriber.queue) == 2
@@ -696,7 +734,7 @@ class TestWebhookSubscriberErrorHandling:
         # Setup mock client to raise network error
         mock_client = AsyncMock()
         mock_client.request.side_effect = httpx.NetworkError("Connection failed")
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -704,7 +742,7 @@ class TestWebhookSubscriberErrorHandling:
             spec=webhook_spec,
         )
 
-        subscriber.queue = sample_events[:2]
+        subscriber.queue = envelopes(sample_events[:2])
 
         with patch("asyncio.sleep") as mock_sleep:
             await subscriber._post_events()
@@ -730,7 +768,7 @@ class TestWebhookSubscriberErrorHandling:
         # Setup mock client to raise timeout error
         mock_client = AsyncMock()
         mock_client.request.side_effect = httpx.TimeoutException("Request timed out")
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -738,7 +776,7 @@ class TestWebhookSubscriberErrorHandling:
             spec=webhook_spec,
         )
 
-        subscriber.queue = sample_events[:1]
+        subscriber.queue = envelopes(sample_events[:1])
 
         with patch("asyncio.sleep") as mock_sleep:
             await subscriber._post_events()
@@ -770,7 +808,7 @@ class TestWebhookSubscriberFlushDelay:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -805,7 +843,7 @@ class TestWebhookSubscriberFlushDelay:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -854,7 +892,7 @@ class TestWebhookSubscriberFlushDelay:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -869,6 +907,7 @@ class TestWebhookSubscriberFlushDelay:
 
         # Add one more event to fill buffer (should trigger immediate post)
         await subscriber(sample_events[2])
+        await posted(subscriber)
 
         # Verify immediate post happened
         mock_client.request.assert_called_once()
@@ -896,7 +935,7 @@ class TestWebhookSubscriberFlushDelay:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -958,7 +997,7 @@ class TestWebhookSubscriberFlushDelay:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = WebhookSubscriber(
             conversation_id=sample_conversation_id,
@@ -998,7 +1037,7 @@ class TestConversationWebhookSubscriber:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = ConversationWebhookSubscriber(
             spec=webhook_spec,
@@ -1045,7 +1084,7 @@ class TestConversationWebhookSubscriber:
         mock_response = AsyncMock()
         mock_response.raise_for_status.return_value = None
         mock_client.request.return_value = mock_response
-        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client_class.return_value = mock_client
 
         subscriber = ConversationWebhookSubscriber(
             spec=webhook_spec,
@@ -1125,7 +1164,7 @@ class TestConversationWebhookSubscriber:
         with patch("httpx.AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client.request = mock_request
-            mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client_class.return_value = mock_client
 
             with patch("asyncio.sleep", side_effect=mock_sleep):
                 await subscriber.post_conversation_info(conversation_info)
@@ -1133,4 +1172,4 @@ class TestConversationWebhookSubscriber:
         # Verify retries were attempted
         assert len(retry_attempts) == 3
         assert len(sleep_calls) == 2  # Sleep between retries
-        assert all(delay == webhook_spec.retry_delay for delay in sleep_calls)
+        assert_backoff(sleep_calls, webhook_spec.retry_delay)
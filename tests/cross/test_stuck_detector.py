@@ -400,3 +400,63 @@ def test_reset_after_user_message():
 
     # Still not stuck with just one action after user message
     assert stuck_detector.is_stuck() is False
+
+
+def test_checks_only_read_new_events():
+    """Each check reads just the events appended since the previous one."""
+    llm = LLM(model="gpt-4o-mini", service_id="test-llm")
+    agent = Agent(llm=llm)
+    state = ConversationState.create(
+        id=uuid.uuid4(), agent=agent, workspace=LocalWorkspace(working_dir="/tmp")
+    )
+    stuck_detector = StuckDetector(state)
+    state.events.append(
+        MessageEvent(
+            source="user",
+            llm_message=Message(role="user", content=[TextContent(text="Run ls")]),
+        )
+    )
+
+    reads: list[int] = []
+    events_type = type(state.events)
+    original_getitem = events_type.__getitem__
+
+    def counting_getitem(self, index):
+        reads.append(index)
+        return original_getitem(self, index)
+
+    events_type.__getitem__ = counting_getitem  # type: ignore[method-assign]
+    try:
+        for i in range(4):
+            action = ActionEvent(
+                source="agent",
+                thought=[TextContent(text="I need to run ls command")],
+                action=ExecuteBashAction(command="ls"),
+                tool_name="execute_bash",
+                tool_call_id=f"call_{i}",
+                tool_call=MessageToolCall(
+                    id=f"call_{i}",
+                    name="execute_bash",
+                    arguments='{"command": "ls"}',
+                    origin="completion",
+                ),
+                llm_response_id=f"response_{i}",
+            )
+            state.events.append(action)
+            state.events.append(
+                ObservationEvent(
+                    source="environment",
+                    observation=ExecuteBashObservation(
+                        output="file1.txt", command="ls", exit_code=0
+                    ),
+                    action_id=action.id,
+                    tool_name="execute_bash",
+                    tool_call_id=f"call_{i}",
+                )
+            )
+            # Stuck only once the 4th identical pair is in
+            assert stuck_detector.is_stuck() is (i == 3)
+    finally:
+        events_type.__getitem__ = original_getitem  # type: ignore[method-assign]
+
+    assert sorted(reads) == list(range(len(state.events)))
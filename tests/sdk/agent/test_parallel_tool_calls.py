@@ -0,0 +1,258 @@
+"""Tests for concurrent execution of concurrency-safe tool calls."""
+
+import threading
+import time
+from collections.abc import Sequence
+from unittest.mock import patch
+
+import pytest
+from litellm import ChatCompletionMessageToolCall
+from litellm.types.utils import (
+    Choices,
+    Function,
+    Message as LiteLLMMessage,
+    ModelResponse,
+)
+from pydantic import SecretStr
+
+from openhands.sdk.agent import Agent
+from openhands.sdk.conversation import Conversation
+from openhands.sdk.event import ActionEvent, AgentErrorEvent, ObservationEvent
+from openhands.sdk.event.base import Event
+from openhands.sdk.llm import LLM, ImageContent, TextContent
+from openhands.sdk.tool import (
+    Tool,
+    ToolAnnotations,
+    ToolDefinition,
+    ToolExecutor,
+    register_tool,
+)
+from openhands.sdk.tool.schema import Action, Observation
+
+
+class ParallelTestAction(Action):
+    """Mock action for parallel execution tests."""
+
+    value: str
+
+
+class ParallelTestObservation(Observation):
+    """Mock observation for parallel execution tests."""
+
+    result: str
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.result)]
+
+
+class SlowExecutor(ToolExecutor[ParallelTestAction, ParallelTestObservation]):
+    def __init__(self, log: list[tuple[str, str, float]], delay: float):
+        self.log = log
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, action: ParallelTestAction) -> ParallelTestObservation:
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        self.log.append(("start", action.value, time.perf_counter()))
+        time.sleep(self.delay)
+        self.log.append(("end", action.value, time.perf_counter()))
+        with self._lock:
+            self.running -= 1
+        return ParallelTestObservation(result=action.value)
+
+
+def register(
+    name: str,
+    executor: SlowExecutor,
+    concurrency_safe: bool,
+    annotations: ToolAnnotations | None = None,
+):
+    def _make_tool(conv_state=None, **params) -> Sequence[ToolDefinition]:
+        return [
+            ToolDefinition(
+                name=name,
+                description=name,
+                action_type=ParallelTestAction,
+                observation_type=ParallelTestObservation,
+                executor=executor,
+                annotations=annotations,
+                concurrency_safe=concurrency_safe,
+            )
+        ]
+
+    register_tool(name, _make_tool)
+
+
+def response_with_calls(calls: list[tuple[str, str]]) -> ModelResponse:
+    return ModelResponse(
+        id="resp",
+        choices=[
+            Choices(
+                index=0,
+                finish_reason="tool_calls",
+                message=LiteLLMMessage(
+                    role="assistant",
+                    content="",
+                    tool_calls=[
+                        ChatCompletionMessageToolCall(
+                            id=f"call_{i}",
+                            type="function",
+                            function=Function(
+                                name=name, arguments=f'{{"value": "{value}"}}'
+                            ),
+                        )
+                        for i, (name, value) in enumerate(calls)
+                    ],
+                ),
+            )
+        ],
+        model="gpt-4o",
+    )
+
+
+def run_one_step(agent: Agent, calls: list[tuple[str, str]], tmp_path) -> list[Event]:
+    conversation = Conversation(agent=agent, workspace=str(tmp_path), visualize=False)
+    conversation.send_message("go")
+    with patch(
+        "openhands.sdk.llm.llm.litellm_completion",
+        return_value=response_with_calls(calls),
+    ):
+        conversation.agent.step(
+            conversation.state,
+            on_event=conversation._on_event,  # type: ignore[attr-defined]
+        )
+    return list(conversation.state.events)
+
+
+def make_agent(tools: list[str], max_parallel: int) -> Agent:
+    llm = LLM(model="gpt-4o", api_key=SecretStr("test-key"), service_id="test")
+    return Agent(
+        llm=llm,
+        tools=[Tool(name=n) for n in tools],
+        max_parallel_tool_calls=max_parallel,
+    )
+
+
+def test_safe_calls_run_concurrently_and_observations_keep_order(tmp_path):
+    log: list[tuple[str, str, float]] = []
+    executor = SlowExecutor(log, delay=0.2)
+    register("parallel_reader", executor, concurrency_safe=True)
+
+    agent = make_agent(["parallel_reader"], max_parallel=4)
+    calls = [("parallel_reader", str(i)) for i in range(4)]
+
+    events = run_one_step(agent, calls, tmp_path)
+
+    assert executor.peak == 4
+    # Every call started before any finished
+    last_start = max(t for kind, _, t in log if kind == "start")
+    first_end = min(t for kind, _, t in log if kind == "end")
+    assert last_start < first_end
+    actions = [e for e in events if isinstance(e, ActionEvent)]
+    observations = [e for e in events if isinstance(e, ObservationEvent)]
+    assert [o.action_id for o in observations] == [a.id for a in actions]
+    # All actions are emitted before their (batched) observations
+    first_obs = events.index(observations[0])
+    assert all(events.index(a) < first_obs for a in actions)
+
+
+def test_parallelism_is_bounded(tmp_path):
+    executor = SlowExecutor([], delay=0.05)
+    register("bounded_reader", executor, concurrency_safe=True)
+
+    agent = make_agent(["bounded_reader"], max_parallel=2)
+    run_one_step(agent, [("bounded_reader", str(i)) for i in range(6)], tmp_path)
+
+    assert executor.peak == 2
+
+
+def test_unsafe_calls_are_barriers(tmp_path):
+    log: list[tuple[str, str, float]] = []
+    reader = SlowExecutor(log, delay=0.05)
+    writer = SlowExecutor(log, delay=0.05)
+    register("barrier_reader", reader, concurrency_safe=True)
+    register("barrier_writer", writer, concurrency_safe=False)
+
+    agent = make_agent(["barrier_reader", "barrier_writer"], max_parallel=4)
+    calls = [
+        ("barrier_reader", "r1"),
+        ("barrier_reader", "r2"),
+        ("barrier_writer", "w"),
+        ("barrier_reader", "r3"),
+    ]
+    events = run_one_step(agent, calls, tmp_path)
+
+    times = {(kind, value): t for kind, value, t in log}
+    # The write starts only after both preceding reads end, and the last read
+    # starts only after the write ends
+    assert times[("start", "w")] >= max(times[("end", "r1")], times[("end", "r2")])
+    assert times[("start", "r3")] >= times[("end", "w")]
+    assert reader.peak == 2 and writer.peak == 1
+
+    observations = [e for e in events if isinstance(e, ObservationEvent)]
+    assert [o.observation.result for o in observations] == [  # type: ignore[attr-defined]
+        "r1",
+        "r2",
+        "w",
+        "r3",
+    ]
+
+
+def test_read_only_hint_alone_does_not_run_concurrently(tmp_path):
+    # Read-only tools can still share state (e.g. one browser session)
+    executor = SlowExecutor([], delay=0.02)
+    register(
+        "shared_reader",
+        executor,
+        concurrency_safe=False,
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+
+    agent = make_agent(["shared_reader"], max_parallel=3)
+    run_one_step(agent, [("shared_reader", str(i)) for i in range(3)], tmp_path)
+
+    assert executor.peak == 1
+
+
+def test_default_agent_runs_sequentially(tmp_path):
+    executor = SlowExecutor([], delay=0.01)
+    register("sequential_reader", executor, concurrency_safe=True)
+
+    llm = LLM(model="gpt-4o", api_key=SecretStr("test-key"), service_id="test")
+    agent = Agent(llm=llm, tools=[Tool(name="sequential_reader")])
+    assert agent.max_parallel_tool_calls == 1
+    run_one_step(agent, [("sequential_reader", str(i)) for i in range(3)], tmp_path)
+
+    assert executor.peak == 1
+
+
+@pytest.mark.parametrize("max_parallel", [1, 3])
+def test_failed_call_does_not_drop_sibling_observations(tmp_path, max_parallel):
+    """Sequential and concurrent execution handle a failing call the same way."""
+
+    class FailingExecutor(SlowExecutor):
+        def __call__(self, action: ParallelTestAction) -> ParallelTestObservation:
+            if action.value == "1":
+                raise RuntimeError("boom")
+            return super().__call__(action)
+
+    executor = FailingExecutor([], delay=0.05)
+    register("failing_reader", executor, concurrency_safe=True)
+
+    agent = make_agent(["failing_reader"], max_parallel=max_parallel)
+    events = run_one_step(
+        agent, [("failing_reader", str(i)) for i in range(3)], tmp_path
+    )
+
+    actions = [e for e in events if isinstance(e, ActionEvent)]
+    results = [e for e in events if isinstance(e, ObservationEvent | AgentErrorEvent)]
+    assert [r.tool_call_id for r in results] == [a.tool_call_id for a in actions]
+    assert isinstance(results[1], AgentErrorEvent)
+    assert "boom" in results[1].error
+    assert isinstance(results[0], ObservationEvent)
+    assert isinstance(results[2], ObservationEvent)
@@ -0,0 +1,134 @@
+"""Tests for live output of running tool calls reaching conversation callbacks."""
+
+from collections.abc import Sequence
+from unittest.mock import patch
+
+import pytest
+from litellm import ChatCompletionMessageToolCall
+from litellm.types.utils import (
+    Choices,
+    Function,
+    Message as LiteLLMMessage,
+    ModelResponse,
+)
+from pydantic import SecretStr
+
+from openhands.sdk.agent import Agent
+from openhands.sdk.conversation import Conversation
+from openhands.sdk.event import ActionEvent, ToolOutputDeltaEvent
+from openhands.sdk.event.base import Event
+from openhands.sdk.llm import LLM, ImageContent, TextContent
+from openhands.sdk.tool import (
+    Tool,
+    ToolAnnotations,
+    ToolDefinition,
+    ToolExecutor,
+    get_tool_output_callback,
+    register_tool,
+)
+from openhands.sdk.tool.schema import Action, Observation
+
+
+class OutputTestAction(Action):
+    value: str
+
+
+class OutputTestObservation(Observation):
+    result: str
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.result)]
+
+
+class ChattyExecutor(ToolExecutor[OutputTestAction, OutputTestObservation]):
+    """Publishes two chunks of output before returning."""
+
+    def __call__(self, action: OutputTestAction) -> OutputTestObservation:
+        on_output = get_tool_output_callback()
+        assert on_output is not None
+        on_output(f"{action.value}: halfway\n", 0)
+        on_output(f"{action.value}: done\n", 3)
+        return OutputTestObservation(result=action.value)
+
+
+def _make_tool(conv_state=None, **params) -> Sequence[ToolDefinition]:
+    return [
+        ToolDefinition(
+            name="chatty_tool",
+            description="chatty_tool",
+            action_type=OutputTestAction,
+            observation_type=OutputTestObservation,
+            executor=ChattyExecutor(),
+            annotations=ToolAnnotations(readOnlyHint=True),
+        )
+    ]
+
+
+register_tool("chatty_tool", _make_tool)
+
+
+def response_with_calls(values: list[str]) -> ModelResponse:
+    return ModelResponse(
+        id="resp",
+        choices=[
+            Choices(
+                index=0,
+                finish_reason="tool_calls",
+                message=LiteLLMMessage(
+                    role="assistant",
+                    content="",
+                    tool_calls=[
+                        ChatCompletionMessageToolCall(
+                            id=f"call_{i}",
+                            type="function",
+                            function=Function(
+                                name="chatty_tool",
+                                arguments=f'{{"value": "{value}"}}',
+                            ),
+                        )
+                        for i, value in enumerate(values)
+                    ],
+                ),
+            )
+        ],
+        model="gpt-4o",
+    )
+
+
+@pytest.mark.parametrize("max_parallel", [1, 2])
+def test_tool_output_reaches_callbacks_but_is_not_persisted(tmp_path, max_parallel):
+    llm = LLM(model="gpt-4o", api_key=SecretStr("test-key"), service_id="test")
+    agent = Agent(
+        llm=llm,
+        tools=[Tool(name="chatty_tool")],
+        max_parallel_tool_calls=max_parallel,
+    )
+    received: list[Event] = []
+    conversation = Conversation(
+        agent=agent,
+        workspace=str(tmp_path),
+        callbacks=[received.append],
+        visualize=False,
+    )
+    conversation.send_message("go")
+    with patch(
+        "openhands.sdk.llm.llm.litellm_completion",
+        return_value=response_with_calls(["a", "b"]),
+    ):
+        conversation.agent.step(
+            conversation.state,
+            on_event=conversation._on_event,  # type: ignore[attr-defined]
+        )
+
+    actions = {e.id: e for e in received if isinstance(e, ActionEvent)}
+    deltas = [e for e in received if isinstance(e, ToolOutputDeltaEvent)]
+    assert len(deltas) == 4
+    for delta in deltas:
+        action = actions[delta.action_id]
+        assert delta.tool_call_id == action.tool_call.id
+        assert delta.output.startswith(action.action.value)  # type: ignore[attr-defined]
+    assert {(d.output, d.skipped) for d in deltas} >= {("a: done\n", 3)}
+    assert not any(
+        isinstance(e, ToolOutputDeltaEvent) for e in conversation.state.events
+    )
@@ -0,0 +1,249 @@
+"""Tests for IncrementalView, the append-maintained counterpart of View.from_events."""
+
+import random
+import time
+import uuid
+from collections.abc import Sequence
+
+import pytest
+from pydantic import SecretStr
+
+from openhands.sdk.agent import Agent
+from openhands.sdk.context.view import IncrementalView, View
+from openhands.sdk.conversation.state import ConversationState
+from openhands.sdk.event.base import Event
+from openhands.sdk.event.condenser import (
+    Condensation,
+    CondensationRequest,
+    CondensationSummaryEvent,
+)
+from openhands.sdk.event.llm_convertible import (
+    ActionEvent,
+    AgentErrorEvent,
+    MessageEvent,
+    ObservationEvent,
+    UserRejectObservation,
+)
+from openhands.sdk.event.user_action import PauseEvent
+from openhands.sdk.llm import LLM, ImageContent, Message, MessageToolCall, TextContent
+from openhands.sdk.tool import Action, Observation
+from openhands.sdk.workspace import LocalWorkspace
+
+
+class IncrementalViewMockAction(Action):
+    """Mock action for incremental view tests."""
+
+    command: str
+
+
+class IncrementalViewMockObservation(Observation):
+    """Mock observation for incremental view tests."""
+
+    result: str
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.result)]
+
+
+def message_event(content: str) -> MessageEvent:
+    return MessageEvent(
+        llm_message=Message(role="user", content=[TextContent(text=content)]),
+        source="user",
+    )
+
+
+def action_event(tool_call_id: str) -> ActionEvent:
+    return ActionEvent(
+        source="agent",
+        thought=[],
+        action=IncrementalViewMockAction(command="ls"),
+        tool_name="mock",
+        tool_call_id=tool_call_id,
+        tool_call=MessageToolCall(
+            id=tool_call_id, name="mock", arguments="{}", origin="completion"
+        ),
+        llm_response_id="response",
+    )
+
+
+def observation_event(rng: random.Random, action: ActionEvent) -> Event:
+    kind = rng.choice(["observation", "error", "reject"])
+    if kind == "observation":
+        return ObservationEvent(
+            observation=IncrementalViewMockObservation(result="ok"),
+            action_id=action.id,
+            tool_name=action.tool_name,
+            tool_call_id=action.tool_call_id,
+        )
+    if kind == "error":
+        return AgentErrorEvent(
+            error="boom", tool_name=action.tool_name, tool_call_id=action.tool_call_id
+        )
+    return UserRejectObservation(
+        action_id=action.id,
+        tool_name=action.tool_name,
+        tool_call_id=action.tool_call_id,
+        rejection_reason="no",
+    )
+
+
+def random_history(rng: random.Random, length: int) -> list[Event]:
+    """Generate a history mixing messages, tool calls, condensations and noise."""
+    events: list[Event] = []
+    open_actions: list[ActionEvent] = []
+    for _ in range(length):
+        roll = rng.random()
+        if roll < 0.3:
+            events.append(message_event(f"msg {len(events)}"))
+        elif roll < 0.5:
+            action = action_event(f"call_{uuid.uuid4().hex[:8]}")
+            open_actions.append(action)
+            events.append(action)
+        elif roll < 0.7 and open_actions:
+            action = open_actions.pop(rng.randrange(len(open_actions)))
+            events.append(observation_event(rng, action))
+        elif roll < 0.8:
+            # Forget a random subset of existing (and occasionally unknown) ids
+            candidates = [e.id for e in events]
+            forgotten = rng.sample(candidates, k=rng.randint(0, len(candidates)))
+            if rng.random() < 0.2:
+                forgotten.append(str(uuid.uuid4()))
+            with_summary = rng.random() < 0.5
+            events.append(
+                Condensation(
+                    forgotten_event_ids=forgotten,
+                    summary=f"summary {len(events)}" if with_summary else None,
+                    summary_offset=rng.randint(0, 5) if with_summary else None,
+                )
+            )
+        elif roll < 0.9:
+            events.append(CondensationRequest())
+        else:
+            events.append(PauseEvent())
+    return events
+
+
+def normalized(view: View) -> tuple:
+    """Compare views ignoring the freshly generated ids of summary events."""
+    return (
+        [
+            ("summary", e.summary) if isinstance(e, CondensationSummaryEvent) else e.id
+            for e in view.events
+        ],
+        view.unhandled_condensation_request,
+        [c.id for c in view.condensations],
+        view.summary_event_index,
+    )
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_incremental_view_matches_from_events_on_every_prefix(seed: int) -> None:
+    """Property: for random histories, every prefix gives the same view as
+    View.from_events on that prefix."""
+    rng = random.Random(seed)
+    events = random_history(rng, length=rng.randint(1, 80))
+
+    incremental = IncrementalView()
+    for i in range(1, len(events) + 1):
+        prefix = events[:i]
+        assert normalized(incremental.update(prefix)) == normalized(
+            View.from_events(prefix)
+        )
+    assert len(incremental) == len(events)
+
+
+def test_incremental_view_forgets_events_appended_after_condensation() -> None:
+    late = message_event("late")
+    events: list[Event] = [
+        message_event("early"),
+        Condensation(forgotten_event_ids=[late.id]),
+        late,
+    ]
+    assert normalized(IncrementalView().update(events)) == normalized(
+        View.from_events(events)
+    )
+
+
+def test_incremental_view_rebuilds_when_history_shrinks() -> None:
+    events: list[Event] = [message_event(f"msg {i}") for i in range(5)]
+    incremental = IncrementalView()
+    incremental.update(events)
+
+    shorter = events[:2]
+    assert [e.id for e in incremental.update(shorter).events] == [e.id for e in shorter]
+
+
+def test_incremental_view_reuses_view_until_new_events_arrive() -> None:
+    events: list[Event] = [message_event("a")]
+    incremental = IncrementalView()
+    first = incremental.update(events)
+    assert incremental.update(events) is first
+
+    events.append(message_event("b"))
+    assert incremental.update(events) is not first
+
+
+def test_incremental_view_summary_event_is_stable_across_updates() -> None:
+    """The summary event is created once per condensation, not per access."""
+    events: list[Event] = [
+        message_event("a"),
+        Condensation(forgotten_event_ids=[], summary="s", summary_offset=0),
+    ]
+    incremental = IncrementalView()
+    summary = incremental.update(events).summary_event
+    events.append(message_event("b"))
+    assert incremental.update(events).summary_event is summary
+
+
+def test_conversation_state_view_tracks_appended_events() -> None:
+    llm = LLM(model="gpt-4o-mini", api_key=SecretStr("test-key"), service_id="test")
+    state = ConversationState.create(
+        id=uuid.uuid4(),
+        agent=Agent(llm=llm, tools=[]),
+        workspace=LocalWorkspace(working_dir="/tmp"),
+    )
+    rng = random.Random(7)
+    for event in random_history(rng, length=60):
+        state.events.append(event)
+        assert normalized(state.view) == normalized(View.from_events(state.events))
+
+
+def test_incremental_view_step_cost_independent_of_history_length() -> None:
+    """Benchmark: with a condenser bounding the view, the cost of bringing the
+    view up to date after one step does not grow with the history."""
+
+    def per_step_seconds(history_length: int) -> float:
+        incremental = IncrementalView()
+        events: list[Event] = []
+        # Build a long history that is regularly condensed down to ~20 events
+        for i in range(history_length):
+            events.append(message_event(f"msg {i}"))
+            if len(incremental.update(events)) > 40:
+                view = incremental.view
+                events.append(
+                    Condensation(
+                        forgotten_event_ids=[e.id for e in view.events[1:-20]],
+                        summary="summary",
+                        summary_offset=1,
+                    )
+                )
+        incremental.update(events)
+
+        steps = 200
+        start = time.perf_counter()
+        for i in range(steps):
+            events.append(message_event(f"step {i}"))
+            incremental.update(events)
+            if len(incremental.view) > 40:
+                view = incremental.view
+                events.append(
+                    Condensation(forgotten_event_ids=[e.id for e in view.events[1:-20]])
+                )
+        return (time.perf_counter() - start) / steps
+
+    short = min(per_step_seconds(200) for _ in range(3))
+    long = min(per_step_seconds(5000) for _ in range(3))
+    # Generous bound to stay robust on noisy CI machines; rebuilding from all
+    # events would make the long history ~25x slower per step.
+    assert long < short * 5
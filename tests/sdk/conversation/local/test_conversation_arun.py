@@ -0,0 +1,168 @@
+"""Tests for LocalConversation.arun, the asyncio-native run loop."""
+
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from litellm.types.utils import Choices, Message as LiteLLMMessage, ModelResponse
+from pydantic import SecretStr
+
+from openhands.sdk.agent import Agent
+from openhands.sdk.conversation import Conversation
+from openhands.sdk.conversation.impl.local_conversation import LocalConversation
+from openhands.sdk.conversation.state import AgentExecutionStatus
+from openhands.sdk.event import MessageEvent
+from openhands.sdk.llm import LLM
+
+
+def create_mock_response(content: str) -> ModelResponse:
+    return ModelResponse(
+        id="resp",
+        choices=[
+            Choices(
+                finish_reason="stop",
+                index=0,
+                message=LiteLLMMessage(content=content, role="assistant"),
+            )
+        ],
+        model="gpt-4o",
+    )
+
+
+def make_llm() -> LLM:
+    return LLM(service_id="test-llm", model="gpt-4o", api_key=SecretStr("test_key"))
+
+
+async def test_arun_matches_run(tmp_path):
+    conversation = Conversation(
+        agent=Agent(llm=make_llm(), tools=[]), workspace=str(tmp_path), visualize=False
+    )
+    assert isinstance(conversation, LocalConversation)
+    conversation.send_message("hi")
+
+    with (
+        patch(
+            "openhands.sdk.llm.llm.litellm_acompletion",
+            return_value=create_mock_response("hello"),
+        ) as mock_acompletion,
+        patch("openhands.sdk.llm.llm.litellm_completion") as mock_completion,
+    ):
+        await conversation.arun()
+
+    mock_acompletion.assert_called_once()
+    mock_completion.assert_not_called()
+    assert conversation.state.agent_status == AgentExecutionStatus.FINISHED
+    last = conversation.state.events[-1]
+    assert isinstance(last, MessageEvent)
+    assert last.source == "agent"
+
+
+async def test_many_conversations_share_one_event_loop(tmp_path):
+    """arun awaits the LLM instead of blocking a thread per conversation."""
+    calls_in_flight = 0
+    peak_in_flight = 0
+
+    async def slow_acompletion(**kwargs):
+        nonlocal calls_in_flight, peak_in_flight
+        calls_in_flight += 1
+        peak_in_flight = max(peak_in_flight, calls_in_flight)
+        await asyncio.sleep(0.2)
+        calls_in_flight -= 1
+        return create_mock_response("done")
+
+    conversations: list[LocalConversation] = []
+    for i in range(50):
+        conversation = Conversation(
+            agent=Agent(llm=make_llm(), tools=[]),
+            workspace=str(tmp_path / str(i)),
+            visualize=False,
+        )
+        assert isinstance(conversation, LocalConversation)
+        conversation.send_message("hi")
+        conversations.append(conversation)
+
+    threads_before = threading.active_count()
+    with patch(
+        "openhands.sdk.llm.llm.litellm_acompletion", side_effect=slow_acompletion
+    ):
+        start = time.perf_counter()
+        await asyncio.gather(*(c.arun() for c in conversations))
+        elapsed = time.perf_counter() - start
+
+    assert peak_in_flight == 50
+    # Running the conversations one after another would take 50 x 0.2s
+    assert elapsed < 5
+    # Only the bounded default executor runs the steps' synchronous parts;
+    # no thread is held per conversation while its LLM call is awaited
+    default_executor_size = min(32, (os.cpu_count() or 1) + 4)
+    assert threading.active_count() <= threads_before + default_executor_size
+    for conversation in conversations:
+        assert conversation.state.agent_status == AgentExecutionStatus.FINISHED
+        assert isinstance(conversation.state.events[-1], MessageEvent)
+
+
+async def test_second_arun_raises_while_running(tmp_path):
+    conversation = Conversation(
+        agent=Agent(llm=make_llm(), tools=[]), workspace=str(tmp_path), visualize=False
+    )
+    assert isinstance(conversation, LocalConversation)
+    conversation.send_message("hi")
+    release = asyncio.Event()
+    lock_held_during_call: list[bool] = []
+
+    async def blocked_acompletion(**kwargs):
+        lock_held_during_call.append(conversation.state.locked())
+        await release.wait()
+        return create_mock_response("done")
+
+    with patch(
+        "openhands.sdk.llm.llm.litellm_acompletion", side_effect=blocked_acompletion
+    ):
+        first = asyncio.create_task(conversation.arun())
+        while not lock_held_during_call:
+            await asyncio.sleep(0.01)
+
+        with pytest.raises(ValueError, match="conversation_already_running"):
+            await conversation.arun()
+        # Other threads can take the state lock while the LLM is awaited
+        await asyncio.to_thread(conversation.pause)
+
+        release.set()
+        await first
+
+    assert lock_held_during_call == [False]
+
+
+async def test_arun_does_not_block_the_loop_on_the_state_lock(tmp_path):
+    conversation = Conversation(
+        agent=Agent(llm=make_llm(), tools=[]), workspace=str(tmp_path), visualize=False
+    )
+    assert isinstance(conversation, LocalConversation)
+    conversation.send_message("hi")
+    held = threading.Event()
+    release = threading.Event()
+
+    def hold_lock() -> None:
+        with conversation.state:
+            held.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    held.wait()
+    with patch(
+        "openhands.sdk.llm.llm.litellm_acompletion",
+        return_value=create_mock_response("hello"),
+    ):
+        run = asyncio.create_task(conversation.arun())
+        # The loop keeps running while arun waits for the lock
+        await asyncio.sleep(0.1)
+        assert not run.done()
+        release.set()
+        await run
+    holder.join()
+
+    assert conversation.state.agent_status == AgentExecutionStatus.FINISHED
@@ -10,6 +10,7 @@ from pydantic import SecretStr
 
 from openhands.sdk import Agent, Conversation
 from openhands.sdk.agent.base import AgentBase
+from openhands.sdk.conversation.event_journal import JournalEventLog
 from openhands.sdk.conversation.impl.local_conversation import LocalConversation
 from openhands.sdk.conversation.state import AgentExecutionStatus, ConversationState
 from openhands.sdk.event.llm_convertible import MessageEvent, SystemPromptEvent
@@ -188,6 +189,57 @@ def test_conversation_state_incremental_save():
         assert loaded_state.model_dump(mode="json") == state.model_dump(mode="json")
 
 
+def test_conversation_state_journal_backend_persists_and_resumes():
+    """Test that the journal event backend is persisted and used on resume."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        llm = LLM(
+            model="gpt-4o-mini", api_key=SecretStr("test-key"), service_id="test-llm"
+        )
+        agent = Agent(llm=llm, tools=[])
+
+        conv_id = uuid.UUID("12345678-1234-5678-9abc-123456789013")
+        persist_path_for_state = LocalConversation.get_persistence_dir(
+            temp_dir, conv_id
+        )
+        state = ConversationState.create(
+            workspace=LocalWorkspace(working_dir="/tmp"),
+            persistence_dir=persist_path_for_state,
+            agent=agent,
+            id=conv_id,
+            event_backend="journal",
+        )
+        assert isinstance(state.events, JournalEventLog)
+        state.events.append(
+            MessageEvent(
+                source="user",
+                llm_message=Message(role="user", content=[TextContent(text="hi")]),
+            )
+        )
+
+        # No per-event files are written
+        assert not Path(persist_path_for_state, "events").exists()
+        assert Path(persist_path_for_state, "events_journal", "index.log").exists()
+
+        # Resuming without specifying the backend keeps the journal
+        conversation = Conversation(
+            agent=agent,
+            persistence_dir=temp_dir,
+            workspace=LocalWorkspace(working_dir="/tmp"),
+            conversation_id=conv_id,
+        )
+        assert isinstance(conversation, LocalConversation)
+        assert conversation.state.event_backend == "journal"
+        assert isinstance(conversation.state.events, JournalEventLog)
+        assert len(conversation.state.events) == 1
+
+        # Closing releases the journal locks, so it can be compacted
+        state.close()
+        conversation.close()
+        journal = JournalEventLog(str(Path(persist_path_for_state, "events_journal")))
+        journal.compact()
+        journal.close()
+
+
 def test_conversation_state_event_file_scanning():
     """Test event file scanning and sorting logic through EventLog."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -0,0 +1,122 @@
+"""Tests for RemoteEventsList fetching only the events it is missing."""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import httpx
+
+from openhands.sdk.conversation.impl.remote_conversation import (
+    RemoteEventsList,
+    WebSocketCallbackClient,
+)
+from openhands.sdk.event.conversation_state import ConversationStateUpdateEvent
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.llm import Message
+
+
+CONVERSATION_ID = str(uuid.uuid4())
+
+
+def message(index: int) -> MessageEvent:
+    return MessageEvent(
+        id=f"event{index}", source="user", llm_message=Message(role="user")
+    )
+
+
+class FakeServer:
+    """MockTransport handler serving the event log by position."""
+
+    def __init__(self, count: int, page_size: int = 100):
+        self.events = [message(index) for index in range(count)]
+        self.page_size = page_size
+        self.requests: list[httpx.QueryParams] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url.params)
+        start = int(request.url.params["since_index"])
+        stop = min(start + self.page_size, len(self.events))
+        return httpx.Response(
+            200,
+            json={
+                "items": [event.model_dump() for event in self.events[start:stop]],
+                "next_page_id": (
+                    self.events[stop].id if stop < len(self.events) else None
+                ),
+            },
+        )
+
+
+def events_list(server: FakeServer) -> RemoteEventsList:
+    client = httpx.Client(
+        base_url="http://localhost:3000", transport=httpx.MockTransport(server)
+    )
+    return RemoteEventsList(client, CONVERSATION_ID)
+
+
+def test_initial_sync_pages_through_the_log():
+    server = FakeServer(250)
+    events = events_list(server)
+    assert [event.id for event in events] == [f"event{i}" for i in range(250)]
+    assert [params["since_index"] for params in server.requests] == [
+        "0",
+        "100",
+        "200",
+    ]
+
+
+def test_sync_fetches_only_missing_events():
+    server = FakeServer(1000)
+    events = events_list(server)
+    events.add_event(server.events[1000 - 1])  # already held, ignored
+    server.requests.clear()
+
+    server.events += [message(index) for index in range(1000, 1005)]
+    assert events.sync() == 5
+    assert [params["since_index"] for params in server.requests] == ["1000"]
+    assert len(events) == 1005
+    assert events.sync() == 0
+
+
+def test_snapshots_and_duplicates_do_not_shift_the_log_position():
+    server = FakeServer(3)
+    events = events_list(server)
+    events.add_event(ConversationStateUpdateEvent(key="full_state", value={}))
+    events.add_event(server.events[0])
+    events.add_event(ConversationStateUpdateEvent(key="agent_status", value="idle"))
+    assert len(events) == 4
+
+
+def test_websocket_client_resumes_from_current_position():
+    urls = []
+    position = iter([0, 7])
+    client = WebSocketCallbackClient(
+        host="http://localhost:3000",
+        conversation_id=CONVERSATION_ID,
+        callback=lambda event: None,
+        api_key="secret",
+        resume_from=lambda: next(position),
+    )
+
+    def connect(url):
+        urls.append(url)
+        if len(urls) == 2:
+            client._stop.set()
+        raise OSError("connection refused")
+
+    with (
+        patch(
+            "openhands.sdk.conversation.impl.remote_conversation.websockets.connect",
+            side_effect=connect,
+        ),
+        patch(
+            "openhands.sdk.conversation.impl.remote_conversation.asyncio.sleep",
+            AsyncMock(),
+        ),
+    ):
+        client._run()
+    assert urls == [
+        "ws://localhost:3000/sockets/events/"
+        f"{CONVERSATION_ID}?session_api_key=secret&resume_from=0",
+        "ws://localhost:3000/sockets/events/"
+        f"{CONVERSATION_ID}?session_api_key=secret&resume_from=7",
+    ]
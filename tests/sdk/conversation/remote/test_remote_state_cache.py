@@ -0,0 +1,144 @@
+"""Tests for RemoteState serving reads from its websocket-maintained snapshot."""
+
+import uuid
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from openhands.sdk.conversation.impl.remote_conversation import (
+    RemoteState,
+    WebSocketCallbackClient,
+)
+from openhands.sdk.conversation.state import AgentExecutionStatus
+from openhands.sdk.event.conversation_state import ConversationStateUpdateEvent
+
+
+CONVERSATION_ID = str(uuid.uuid4())
+
+
+class FakeServer:
+    """MockTransport handler counting conversation info requests."""
+
+    def __init__(self):
+        self.info_requests = 0
+        self.agent_status = "idle"
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/events/search"):
+            return httpx.Response(200, json={"items": [], "next_page_id": None})
+        self.info_requests += 1
+        return httpx.Response(
+            200,
+            json={
+                "id": CONVERSATION_ID,
+                "agent_status": self.agent_status,
+                "stats": {"service_to_metrics": {}},
+            },
+        )
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.fixture
+def state(server: FakeServer) -> RemoteState:
+    client = httpx.Client(
+        base_url="http://localhost:3000", transport=httpx.MockTransport(server)
+    )
+    return RemoteState(client, CONVERSATION_ID, max_staleness=60)
+
+
+def full_snapshot(agent_status: str) -> ConversationStateUpdateEvent:
+    return ConversationStateUpdateEvent(
+        key="full_state", value={"id": CONVERSATION_ID, "agent_status": agent_status}
+    )
+
+
+def test_connected_state_makes_no_requests(state: RemoteState, server: FakeServer):
+    state.set_connected(True)
+    state.update_state_from_event(full_snapshot("running"))
+
+    for _ in range(100):
+        assert state.agent_status == AgentExecutionStatus.RUNNING
+    state.update_state_from_event(
+        ConversationStateUpdateEvent(key="agent_status", value="finished")
+    )
+    assert state.agent_status == AgentExecutionStatus.FINISHED
+
+    assert server.info_requests == 0
+    stats = state.stats
+    assert (stats.http_fetches, stats.cache_hits, stats.event_updates) == (0, 101, 2)
+
+
+def test_http_fallback_is_cached_until_stale(state: RemoteState, server: FakeServer):
+    for _ in range(10):
+        assert state.agent_status == AgentExecutionStatus.IDLE
+    assert server.info_requests == 1
+
+    server.agent_status = "running"
+    state.max_staleness = 0
+    assert state.agent_status == AgentExecutionStatus.RUNNING
+    assert server.info_requests == 2
+    assert state.stats.http_fetches == 2
+
+
+def test_disconnect_falls_back_to_http(state: RemoteState, server: FakeServer):
+    state.set_connected(True)
+    state.update_state_from_event(full_snapshot("running"))
+    state.max_staleness = 0
+
+    state.set_connected(False)
+    server.agent_status = "paused"
+    assert state.agent_status == AgentExecutionStatus.PAUSED
+    assert server.info_requests == 1
+
+    # Reconnected, but not trusted until the server's full snapshot arrives
+    state.set_connected(True)
+    assert state.agent_status == AgentExecutionStatus.PAUSED
+    assert server.info_requests == 2
+    state.update_state_from_event(full_snapshot("running"))
+    assert state.agent_status == AgentExecutionStatus.RUNNING
+    assert server.info_requests == 2
+
+
+def test_snapshot_without_connection_is_not_trusted_forever(
+    state: RemoteState, server: FakeServer
+):
+    state.update_state_from_event(full_snapshot("running"))
+    assert state.agent_status == AgentExecutionStatus.RUNNING
+    state.max_staleness = 0
+    assert state.agent_status == AgentExecutionStatus.IDLE
+    assert server.info_requests == 1
+
+
+def test_websocket_client_reports_connection_changes():
+    changes = []
+    client = WebSocketCallbackClient(
+        host="http://localhost:3000",
+        conversation_id=CONVERSATION_ID,
+        callback=lambda event: None,
+        on_connection_change=changes.append,
+    )
+
+    class FakeSocket:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *args):
+            client._stop.set()
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            raise StopAsyncIteration
+
+    with patch(
+        "openhands.sdk.conversation.impl.remote_conversation.websockets.connect",
+        return_value=FakeSocket(),
+    ):
+        client._run()
+    assert changes == [True, False]
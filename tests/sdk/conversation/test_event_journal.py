@@ -0,0 +1,275 @@
+"""Tests for the append-only segmented event journal."""
+
+import json
+import os
+
+import pytest
+
+from openhands.sdk.conversation.event_journal import (
+    INDEX_FILE,
+    JournalEventLog,
+    JournalLockedError,
+    main,
+    migrate_to_journal,
+)
+from openhands.sdk.conversation.event_store import EventLog
+from openhands.sdk.conversation.persistence_const import (
+    BASE_STATE,
+    EVENTS_DIR,
+    EVENTS_JOURNAL_DIR,
+)
+from openhands.sdk.event.llm_convertible import MessageEvent
+from openhands.sdk.io import LocalFileStore
+from openhands.sdk.llm import Message, TextContent
+
+
+def create_test_event(event_id: str, content: str = "Test content") -> MessageEvent:
+    return MessageEvent(
+        id=event_id,
+        llm_message=Message(role="user", content=[TextContent(text=content)]),
+        source="user",
+    )
+
+
+def make_ids(n: int) -> list[str]:
+    return [f"{i:08x}-0000-4000-8000-000000000000" for i in range(n)]
+
+
+def test_journal_append_and_random_access(tmp_path):
+    journal = JournalEventLog(str(tmp_path))
+    ids = make_ids(5)
+    for event_id in ids:
+        journal.append(create_test_event(event_id))
+
+    assert len(journal) == 5
+    assert [e.id for e in journal] == ids
+    assert journal[2].id == ids[2]
+    assert journal[-1].id == ids[-1]
+    assert [e.id for e in journal[1:3]] == ids[1:3]
+    assert journal.get_index(ids[3]) == 3
+    assert journal.get_id(-2) == ids[3]
+
+    with pytest.raises(IndexError):
+        journal[5]
+    with pytest.raises(KeyError, match="Unknown event_id"):
+        journal.get_index("missing")
+
+
+def test_journal_rejects_duplicate_ids(tmp_path):
+    journal = JournalEventLog(str(tmp_path))
+    journal.append(create_test_event("dup-id"))
+    with pytest.raises(ValueError, match="already exists at index 0"):
+        journal.append(create_test_event("dup-id"))
+    assert len(journal) == 1
+
+
+def test_journal_resume_reads_index_not_directory(tmp_path):
+    journal = JournalEventLog(str(tmp_path))
+    ids = make_ids(20)
+    for i, event_id in enumerate(ids):
+        journal.append(create_test_event(event_id, f"content {i}"))
+
+    resumed = JournalEventLog(str(tmp_path))
+    assert len(resumed) == 20
+    assert resumed.get_index(ids[7]) == 7
+    event = resumed[7]
+    assert isinstance(event, MessageEvent)
+    assert event.llm_message.content[0] == TextContent(text="content 7")
+
+    # Appending after resume continues the same journal
+    resumed.append(create_test_event("new-event"))
+    assert [e.id for e in JournalEventLog(str(tmp_path))] == ids + ["new-event"]
+
+
+def test_journal_rotates_segments(tmp_path):
+    journal = JournalEventLog(str(tmp_path), segment_max_bytes=1024)
+    ids = make_ids(30)
+    for event_id in ids:
+        journal.append(create_test_event(event_id, "x" * 200))
+
+    assert journal.segment_count > 1
+    resumed = JournalEventLog(str(tmp_path), segment_max_bytes=1024)
+    assert [e.id for e in resumed] == ids
+
+
+def test_journal_recovers_record_missing_from_index(tmp_path):
+    journal = JournalEventLog(str(tmp_path))
+    ids = make_ids(3)
+    for event_id in ids:
+        journal.append(create_test_event(event_id))
+
+    # Simulate a crash after the record was written but before its index entry
+    index_path = os.path.join(str(tmp_path), INDEX_FILE)
+    with open(index_path, "rb") as f:
+        data = f.read()
+    entry_size = len(data) // 3
+    with open(index_path, "wb") as f:
+        f.write(data[: 2 * entry_size])
+
+    resumed = JournalEventLog(str(tmp_path))
+    assert [e.id for e in resumed] == ids
+    # The recovered entry was written back to the index
+    with open(index_path, "rb") as f:
+        assert f.read() == data
+
+
+def test_journal_truncates_torn_trailing_record(tmp_path):
+    journal = JournalEventLog(str(tmp_path))
+    ids = make_ids(2)
+    for event_id in ids:
+        journal.append(create_test_event(event_id))
+
+    segment_path = os.path.join(str(tmp_path), "segment-00000000.log")
+    size = os.path.getsize(segment_path)
+    with open(segment_path, "ab") as f:
+        f.write(b"\x00\x00\x10\x00partial")
+
+    resumed = JournalEventLog(str(tmp_path))
+    assert [e.id for e in resumed] == ids
+    assert os.path.getsize(segment_path) == size
+
+    resumed.append(create_test_event("after-crash"))
+    assert JournalEventLog(str(tmp_path))[-1].id == "after-crash"
+
+
+def test_journal_compact_merges_segments(tmp_path):
+    journal = JournalEventLog(str(tmp_path), segment_max_bytes=512)
+    ids = make_ids(20)
+    for event_id in ids:
+        journal.append(create_test_event(event_id, "y" * 100))
+    before = journal.segment_count
+    assert before > 1
+
+    journal._segment_max_bytes = 1024 * 1024
+    journal.compact()
+
+    assert journal.segment_count == 1
+    assert [e.id for e in journal] == ids
+    assert [e.id for e in JournalEventLog(str(tmp_path))] == ids
+    assert not os.path.exists(str(tmp_path) + ".compact")
+    assert not os.path.exists(str(tmp_path) + ".old")
+
+
+def test_journal_serves_appended_events_from_cache(tmp_path):
+    journal = JournalEventLog(str(tmp_path))
+    for event_id in make_ids(10):
+        journal.append(create_test_event(event_id))
+
+    list(journal)
+    list(journal)
+    assert journal.cache_stats.misses == 0
+
+
+def test_migrate_per_file_events_to_journal(tmp_path):
+    fs = LocalFileStore(str(tmp_path))
+    legacy = EventLog(fs, dir_path=EVENTS_DIR)
+    ids = make_ids(12)
+    for event_id in ids:
+        legacy.append(create_test_event(event_id))
+    fs.write(BASE_STATE, json.dumps({"id": "x"}))
+
+    assert migrate_to_journal(str(tmp_path), remove_legacy=True) == 12
+
+    journal = JournalEventLog(os.path.join(str(tmp_path), EVENTS_JOURNAL_DIR))
+    assert [e.id for e in journal] == ids
+    assert fs.list(EVENTS_DIR) == []
+    assert json.loads(fs.read(BASE_STATE))["event_backend"] == "journal"
+
+    with pytest.raises(FileExistsError):
+        migrate_to_journal(str(tmp_path))
+
+
+def test_interrupted_migration_can_be_rerun(tmp_path, monkeypatch):
+    fs = LocalFileStore(str(tmp_path))
+    legacy = EventLog(fs, dir_path=EVENTS_DIR)
+    ids = make_ids(6)
+    for event_id in ids:
+        legacy.append(create_test_event(event_id))
+    fs.write(BASE_STATE, json.dumps({"id": "x"}))
+
+    append_raw = JournalEventLog._append_raw
+
+    def crash_after_three(self, evt_id, payload):
+        if len(self) == 3:
+            raise KeyboardInterrupt
+        append_raw(self, evt_id, payload)
+
+    monkeypatch.setattr(JournalEventLog, "_append_raw", crash_after_three)
+    with pytest.raises(KeyboardInterrupt):
+        migrate_to_journal(str(tmp_path))
+    monkeypatch.undo()
+
+    journal_root = os.path.join(str(tmp_path), EVENTS_JOURNAL_DIR)
+    assert not os.path.exists(journal_root)
+    assert "event_backend" not in json.loads(fs.read(BASE_STATE))
+
+    assert migrate_to_journal(str(tmp_path)) == 6
+    assert [e.id for e in JournalEventLog(journal_root)] == ids
+    assert not os.path.exists(journal_root + ".migrate")
+
+
+def test_journal_cli_migrate_and_compact(tmp_path, capsys):
+    fs = LocalFileStore(str(tmp_path))
+    legacy = EventLog(fs, dir_path=EVENTS_DIR)
+    for event_id in make_ids(4):
+        legacy.append(create_test_event(event_id))
+
+    main(["migrate", str(tmp_path)])
+    main(["compact", str(tmp_path)])
+    main(["stats", str(tmp_path)])
+    out = capsys.readouterr().out
+    assert "Migrated 4 events" in out
+    assert "events: 4, segments: 1" in out
+
+
+def test_journal_refuses_to_compact_while_open_elsewhere(tmp_path):
+    root = str(tmp_path / "journal")
+    writer = JournalEventLog(root)
+    ids = make_ids(3)
+    for event_id in ids:
+        writer.append(create_test_event(event_id))
+
+    maintenance = JournalEventLog(root)
+    with pytest.raises(JournalLockedError):
+        maintenance.compact()
+    # The failed attempt keeps the shared lock and the journal usable
+    writer.append(create_test_event("still-writing"))
+    assert [e.id for e in JournalEventLog(root)] == ids + ["still-writing"]
+
+    writer.close()
+    maintenance.compact()
+    assert [e.id for e in maintenance] == ids + ["still-writing"]
+
+
+def test_journal_open_restores_interrupted_compaction_swap(tmp_path):
+    root = str(tmp_path / "journal")
+    journal = JournalEventLog(root)
+    ids = make_ids(4)
+    for event_id in ids:
+        journal.append(create_test_event(event_id))
+    journal.close()
+
+    # Crash after moving the journal aside, before the compacted copy moved in
+    os.replace(root, root + ".old")
+    os.makedirs(root + ".compact")
+
+    resumed = JournalEventLog(root)
+    assert [e.id for e in resumed] == ids
+    assert not os.path.exists(root + ".old")
+    assert not os.path.exists(root + ".compact")
+
+
+def test_journal_open_drops_leftovers_of_completed_compaction(tmp_path):
+    root = str(tmp_path / "journal")
+    journal = JournalEventLog(root)
+    ids = make_ids(2)
+    for event_id in ids:
+        journal.append(create_test_event(event_id))
+    journal.close()
+
+    os.makedirs(root + ".old")
+    with open(os.path.join(root + ".old", INDEX_FILE), "wb") as f:
+        f.write(b"stale")
+
+    assert [e.id for e in JournalEventLog(root)] == ids
+    assert not os.path.exists(root + ".old")
@@ -156,6 +156,12 @@ def test_event_log_missing_event_file():
     path = log._path(0, event_id="test-event")
     fs.delete(path)
 
+    # The appending log still serves the event from its write-through cache
+    assert log[0].id == "test-event"
+
+    # Once evicted, the event has to be read from the file store again
+    log._cache.clear()
+
     # Accessing the event should raise FileNotFoundError
     with pytest.raises(FileNotFoundError):
         log[0]
@@ -271,6 +277,12 @@ def test_event_log_iteration_with_missing_files():
     path = log._path(1, event_id="event-2")
     fs.delete(path)
 
+    # The appending log serves every event from its write-through cache
+    assert [e.id for e in log] == ["event-1", "event-2", "event-3"]
+
+    # Drop the cache so iteration has to go back to the file store
+    log._cache.clear()
+
     # Iteration will fail when it hits the missing file
     # This is expected behavior - the EventLog expects all files to exist
     with pytest.raises(FileNotFoundError):
@@ -290,7 +302,8 @@ def test_event_log_iteration_backfills_missing_mappings():
     assert len(log) == 1
     assert log[0].id == "manual-event"
 
-    # Clear mappings to simulate missing data
+    # Clear the cache and mappings to simulate missing data
+    log._cache.clear()
     log._idx_to_id.clear()
     log._id_to_idx.clear()
 
@@ -343,3 +356,107 @@ def test_event_log_large_index_formatting():
 
     assert log.get_index("large-index-event") == 99999
     assert log.get_id(99999) == "large-index-event"
+
+
+class CountingFileStore(InMemoryFileStore):
+    """InMemoryFileStore that records how many reads were issued."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    def read(self, path: str) -> str:
+        self.reads += 1
+        return super().read(path)
+
+
+def test_event_log_appended_events_are_served_without_file_reads():
+    """Test that steady-state scans of the log never touch the file store."""
+    fs = CountingFileStore()
+    log = EventLog(fs)
+
+    for i in range(50):
+        log.append(create_test_event(f"event-{i}", f"Content {i}"))
+
+    # Simulate several agent steps, each walking the full log in both directions
+    for _ in range(3):
+        assert len(list(log)) == 50
+        assert [e.id for e in reversed(log)][0] == "event-49"
+        assert log[-1].id == "event-49"
+
+    assert fs.reads == 0
+    stats = log.cache_stats
+    assert stats.misses == 0
+    assert stats.hits > 0
+    assert stats.size == 50
+
+
+def test_event_log_cache_warms_on_resume():
+    """Test that a resumed log reads each event file once, then serves from cache."""
+    fs = CountingFileStore()
+    log = EventLog(fs)
+    ids = [f"{i:08x}-0000-0000-0000-000000000000" for i in range(10)]
+    for event_id in ids:
+        log.append(create_test_event(event_id))
+
+    resumed = EventLog(fs)
+    assert [e.id for e in resumed] == ids
+    assert fs.reads == 10
+
+    assert [e.id for e in resumed] == ids
+    assert resumed[3].id == ids[3]
+    assert fs.reads == 10
+    assert resumed.cache_stats.misses == 10
+
+
+def test_event_log_cache_evicts_least_recently_used_by_count():
+    """Test that the cache honours its event budget with LRU eviction."""
+    fs = CountingFileStore()
+    log = EventLog(fs, cache_max_events=3)
+    for i in range(5):
+        log.append(create_test_event(f"event-{i}", f"Content {i}"))
+
+    stats = log.cache_stats
+    assert stats.size == 3
+    assert stats.evictions == 2
+
+    # Most recent events are cached, the oldest ones are read from disk
+    assert log[4].id == "event-4"
+    assert fs.reads == 0
+    assert log[0].id == "event-0"
+    assert fs.reads == 1
+
+    # event-0 was just used, so adding it evicted the least recent entry
+    assert 0 in log._cache
+    assert 2 not in log._cache
+
+
+def test_event_log_cache_respects_byte_budget():
+    """Test that the cache stays under its byte budget."""
+    fs = InMemoryFileStore()
+    big = "x" * 1000
+    log = EventLog(fs, cache_max_bytes=3500)
+    for i in range(10):
+        log.append(create_test_event(f"event-{i}", big))
+
+    stats = log.cache_stats
+    assert stats.bytes <= 3500
+    assert 0 < stats.size < 10
+    assert [e.id for e in log] == [f"event-{i}" for i in range(10)]
+
+
+def test_event_log_cache_can_be_disabled():
+    """Test that a zero budget disables caching entirely."""
+    fs = CountingFileStore()
+    log = EventLog(fs, cache_max_events=0)
+    log.append(create_test_event("event-0"))
+
+    assert log[0].id == "event-0"
+    assert fs.reads == 1
+    assert log.cache_stats.size == 0
+
+
+def test_event_log_rejects_negative_cache_budget():
+    """Test that negative cache budgets are rejected."""
+    with pytest.raises(ValueError, match="non-negative"):
+        EventLog(InMemoryFileStore(), cache_max_bytes=-1)
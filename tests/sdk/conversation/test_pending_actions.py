@@ -0,0 +1,167 @@
+"""Tests for the incrementally maintained pending-action index."""
+
+import random
+import tempfile
+import uuid
+from collections.abc import Sequence
+
+import pytest
+from pydantic import SecretStr
+
+from openhands.sdk.agent import Agent
+from openhands.sdk.conversation.pending_actions import PendingActionIndex
+from openhands.sdk.conversation.state import ConversationState
+from openhands.sdk.event.base import Event
+from openhands.sdk.event.llm_convertible import (
+    ActionEvent,
+    AgentErrorEvent,
+    MessageEvent,
+    ObservationEvent,
+    UserRejectObservation,
+)
+from openhands.sdk.llm import LLM, ImageContent, Message, MessageToolCall, TextContent
+from openhands.sdk.tool import Action, Observation
+from openhands.sdk.workspace import LocalWorkspace
+
+
+class PendingActionsMockAction(Action):
+    """Mock action for pending action tests."""
+
+    command: str
+
+
+class PendingActionsMockObservation(Observation):
+    """Mock observation for pending action tests."""
+
+    result: str
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.result)]
+
+
+def action_event(tool_call_id: str | None = None) -> ActionEvent:
+    tool_call_id = tool_call_id or f"call_{uuid.uuid4().hex[:8]}"
+    return ActionEvent(
+        source="agent",
+        thought=[],
+        action=PendingActionsMockAction(command="ls"),
+        tool_name="mock",
+        tool_call_id=tool_call_id,
+        tool_call=MessageToolCall(
+            id=tool_call_id, name="mock", arguments="{}", origin="completion"
+        ),
+        llm_response_id="response",
+    )
+
+
+def observation(action: ActionEvent) -> ObservationEvent:
+    return ObservationEvent(
+        observation=PendingActionsMockObservation(result="ok"),
+        action_id=action.id,
+        tool_name=action.tool_name,
+        tool_call_id=action.tool_call_id,
+    )
+
+
+def rejection(action: ActionEvent) -> UserRejectObservation:
+    return UserRejectObservation(
+        action_id=action.id,
+        tool_name=action.tool_name,
+        tool_call_id=action.tool_call_id,
+    )
+
+
+def agent_error(action: ActionEvent) -> AgentErrorEvent:
+    return AgentErrorEvent(
+        error="boom", tool_name=action.tool_name, tool_call_id=action.tool_call_id
+    )
+
+
+def message() -> MessageEvent:
+    return MessageEvent(
+        llm_message=Message(role="user", content=[TextContent(text="hi")]),
+        source="user",
+    )
+
+
+def make_state(persistence_dir: str | None = None, conv_id=None) -> ConversationState:
+    llm = LLM(model="gpt-4o-mini", api_key=SecretStr("test-key"), service_id="test")
+    return ConversationState.create(
+        id=conv_id or uuid.uuid4(),
+        agent=Agent(llm=llm, tools=[]),
+        workspace=LocalWorkspace(working_dir="/tmp"),
+        persistence_dir=persistence_dir,
+    )
+
+
+def test_pending_actions_closed_by_each_response_kind():
+    actions = [action_event() for _ in range(4)]
+    events: list[Event] = [
+        *actions,
+        observation(actions[0]),
+        rejection(actions[1]),
+        agent_error(actions[2]),
+        message(),
+    ]
+    index = PendingActionIndex()
+    assert index.update(events) == [actions[3]]
+    assert ConversationState.get_unmatched_actions(events) == [actions[3]]
+    assert len(index) == 1
+
+
+def test_pending_actions_ignore_observation_before_action():
+    action = action_event()
+    events: list[Event] = [observation(action), action]
+    assert PendingActionIndex().update(events) == [action]
+    assert ConversationState.get_unmatched_actions(events) == [action]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_pending_actions_match_full_scan_on_every_prefix(seed: int):
+    rng = random.Random(seed)
+    events: list[Event] = []
+    open_actions: list[ActionEvent] = []
+    for _ in range(rng.randint(1, 60)):
+        roll = rng.random()
+        if roll < 0.4 or not open_actions:
+            action = action_event()
+            open_actions.append(action)
+            events.append(action)
+        elif roll < 0.85:
+            action = open_actions.pop(rng.randrange(len(open_actions)))
+            events.append(rng.choice([observation, rejection, agent_error])(action))
+        else:
+            events.append(message())
+
+    index = PendingActionIndex()
+    for i in range(1, len(events) + 1):
+        prefix = events[:i]
+        expected = [a.id for a in ConversationState.get_unmatched_actions(prefix)]
+        assert [a.id for a in index.update(prefix)] == expected
+
+
+def test_state_pending_actions_track_appends():
+    state = make_state()
+    first, second = action_event(), action_event()
+    state.events.append(first)
+    state.events.append(second)
+    assert state.get_pending_actions() == [first, second]
+
+    state.events.append(observation(first))
+    assert state.get_pending_actions() == [second]
+
+    state.events.append(agent_error(second))
+    assert state.get_pending_actions() == []
+
+
+def test_state_pending_actions_rebuilt_on_resume():
+    conv_id = uuid.uuid4()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        state = make_state(temp_dir, conv_id)
+        done, pending = action_event(), action_event()
+        for event in (done, pending, observation(done)):
+            state.events.append(event)
+
+        resumed = make_state(temp_dir, conv_id)
+        assert [a.id for a in resumed.get_pending_actions()] == [pending.id]
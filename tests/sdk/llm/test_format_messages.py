@@ -0,0 +1,213 @@
+"""Tests for the copy-free, memoized LLM.format_messages_for_llm."""
+
+import copy
+import time
+from collections.abc import Sequence
+from unittest.mock import patch
+
+import pytest
+from pydantic import SecretStr
+
+from openhands.sdk.event import (
+    ActionEvent,
+    MessageEvent,
+    ObservationEvent,
+    SystemPromptEvent,
+)
+from openhands.sdk.event.base import LLMConvertibleEvent
+from openhands.sdk.llm import LLM, ImageContent, Message, MessageToolCall, TextContent
+from openhands.sdk.tool import Action, Observation
+
+
+class FormatMockAction(Action):
+    command: str
+
+
+class FormatMockObservation(Observation):
+    output: str
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.output)]
+
+
+def reference_format(llm: LLM, messages: list[Message]) -> list[dict]:
+    """The previous implementation: deep-copy every message, then mutate."""
+    messages = copy.deepcopy(messages)
+    if llm.is_caching_prompt_active():
+        for i in llm._prompt_caching_breakpoints(messages):
+            messages[i].content[-1].cache_prompt = True
+    for message in messages:
+        message.cache_enabled = llm.is_caching_prompt_active()
+        message.vision_enabled = llm.vision_is_active()
+        message.function_calling_enabled = llm.is_function_calling_active()
+        if "deepseek" in llm.model:
+            message.force_string_serializer = True
+    return [message.to_llm_dict() for message in messages]
+
+
+def history(length: int, output_size: int = 50) -> list[LLMConvertibleEvent]:
+    events: list[LLMConvertibleEvent] = [
+        SystemPromptEvent(
+            source="agent", system_prompt=TextContent(text="You are helpful."), tools=[]
+        ),
+        MessageEvent(
+            source="user",
+            llm_message=Message(
+                role="user",
+                content=[
+                    TextContent(text="Fix the bug"),
+                    ImageContent(image_urls=["data:image/png;base64,AAAA"]),
+                ],
+            ),
+        ),
+    ]
+    while len(events) < length:
+        i = len(events)
+        action = ActionEvent(
+            source="agent",
+            thought=[TextContent(text=f"Step {i}")],
+            action=FormatMockAction(command=f"ls {i}"),
+            tool_name="bash",
+            tool_call_id=f"call_{i}",
+            tool_call=MessageToolCall(
+                id=f"call_{i}",
+                name="bash",
+                arguments=f'{{"command": "ls {i}"}}',
+                origin="completion",
+            ),
+            llm_response_id=f"resp_{i}",
+        )
+        events.append(action)
+        events.append(
+            ObservationEvent(
+                observation=FormatMockObservation(output=f"{i} " + "x" * output_size),
+                action_id=action.id,
+                tool_name="bash",
+                tool_call_id=f"call_{i}",
+            )
+        )
+    return events
+
+
+def make_llm(model: str) -> LLM:
+    return LLM(model=model, api_key=SecretStr("key"), service_id="test")
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        "anthropic/claude-sonnet-4-20250514",  # caching + vision + native FC
+        "gpt-4o",  # vision + native FC, no caching
+        "deepseek/deepseek-chat",  # string serializer
+    ],
+)
+def test_matches_previous_formatting_across_steps(model):
+    llm = make_llm(model)
+    events = history(40)
+    for end in range(3, len(events) + 1, 7):
+        messages = LLMConvertibleEvent.events_to_messages(events[:end])
+        assert llm.format_messages_for_llm(messages) == reference_format(llm, messages)
+
+
+def test_input_messages_are_not_mutated():
+    llm = make_llm("anthropic/claude-sonnet-4-20250514")
+    messages = LLMConvertibleEvent.events_to_messages(history(6))
+    before = [m.model_dump() for m in messages]
+
+    formatted = llm.format_messages_for_llm(messages)
+
+    assert [m.model_dump() for m in messages] == before
+    assert formatted[0]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_messages_from_events_are_formatted_once():
+    llm = make_llm("gpt-4o")
+    events = history(20)
+    llm.format_messages_for_llm(LLMConvertibleEvent.events_to_messages(events))
+
+    events.extend(history(4)[2:])
+    messages = LLMConvertibleEvent.events_to_messages(events)
+    with patch.object(Message, "to_llm_dict", autospec=True) as to_llm_dict:
+        to_llm_dict.return_value = {"role": "tool", "content": []}
+        llm.format_messages_for_llm(messages)
+    assert to_llm_dict.call_count == 2
+
+
+def test_prompt_caching_breakpoint_moves_with_history():
+    llm = make_llm("anthropic/claude-sonnet-4-20250514")
+    events = history(10)
+    first = llm.format_messages_for_llm(
+        LLMConvertibleEvent.events_to_messages(events[:4])
+    )
+    assert first[3].get("cache_control") == {"type": "ephemeral"}
+
+    second = llm.format_messages_for_llm(LLMConvertibleEvent.events_to_messages(events))
+    assert "cache_control" not in second[3]
+    assert second[-1].get("cache_control") == {"type": "ephemeral"}
+
+
+def test_mutating_output_does_not_leak_into_memo():
+    llm = make_llm("gpt-4o")
+    messages = LLMConvertibleEvent.events_to_messages(history(6))
+    formatted = llm.format_messages_for_llm(messages)
+    formatted[2]["content"][0]["text"] = "mutated"
+    formatted[2]["tool_calls"].clear()
+
+    again = llm.format_messages_for_llm(messages)
+    assert again == reference_format(llm, messages)
+
+
+def test_memo_is_shared_by_interleaved_callers():
+    """E.g. the agent and a condenser formatting different views."""
+    llm = make_llm("gpt-4o")
+    events = history(30)
+    views = [events, events[:2] + events[-6:]]
+    for view in views:
+        llm.format_messages_for_llm(LLMConvertibleEvent.events_to_messages(view))
+
+    with patch.object(Message, "to_llm_dict", autospec=True) as to_llm_dict:
+        for view in views:
+            llm.format_messages_for_llm(LLMConvertibleEvent.events_to_messages(view))
+    assert to_llm_dict.call_count == 0
+
+
+def test_memo_is_bounded():
+    llm = make_llm("gpt-4o")
+    events = history(30)
+    with patch("openhands.sdk.llm.llm.FORMATTED_MESSAGES_MEMO_SIZE", 8):
+        llm.format_messages_for_llm(LLMConvertibleEvent.events_to_messages(events))
+        assert len(llm._formatted_messages) == 8
+        # The most recently used messages are the ones kept
+        last = LLMConvertibleEvent.events_to_messages(events)[-8:]
+        assert [key[0] for key in llm._formatted_messages] == [
+            m._event_key for m in last
+        ]
+
+    # Messages without an originating event are formatted but not memoized
+    llm.format_messages_for_llm(
+        [Message(role="user", content=[TextContent(text="hi")])]
+    )
+    assert len(llm._formatted_messages) == 8
+
+
+def test_format_messages_benchmark_500_messages():
+    """Benchmark: a step over a 500-message history with large tool outputs
+    is much cheaper than deep-copying and re-serializing every message."""
+    llm = make_llm("anthropic/claude-sonnet-4-20250514")
+    events = history(500, output_size=20_000)
+    llm.format_messages_for_llm(LLMConvertibleEvent.events_to_messages(events))
+
+    def timed(fn) -> float:
+        best = float("inf")
+        for _ in range(3):
+            messages = LLMConvertibleEvent.events_to_messages(events)
+            start = time.perf_counter()
+            fn(messages)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    previous = timed(lambda m: reference_format(llm, m))
+    current = timed(llm.format_messages_for_llm)
+    # Generous bound to stay robust on noisy CI machines
+    assert current * 3 < previous
@@ -0,0 +1,154 @@
+"""Tests for the async LLM.acompletion path."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, patch
+
+import litellm
+from litellm.exceptions import APIConnectionError
+from litellm.types.utils import (
+    Choices,
+    Delta,
+    Message as LiteLLMMessage,
+    ModelResponse,
+    ModelResponseStream,
+    StreamingChoices,
+    Usage,
+)
+from pydantic import SecretStr
+
+from openhands.sdk.llm import LLM, LLMStreamChunk, Message, TextContent
+from openhands.sdk.tool.schema import Action
+from openhands.sdk.tool.tool import ToolBase, ToolDefinition
+
+
+def create_mock_response(content: str = "Test response", response_id: str = "test-id"):
+    return ModelResponse(
+        id=response_id,
+        choices=[
+            Choices(
+                finish_reason="stop",
+                index=0,
+                message=LiteLLMMessage(content=content, role="assistant"),
+            )
+        ],
+        created=1234567890,
+        model="gpt-4o",
+        object="chat.completion",
+        usage=Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+    )
+
+
+def make_llm(**kwargs) -> LLM:
+    return LLM(
+        service_id="test-llm",
+        model="gpt-4o",
+        api_key=SecretStr("test_key"),
+        num_retries=2,
+        retry_min_wait=0,
+        retry_max_wait=0,
+        **kwargs,
+    )
+
+
+MESSAGES = [Message(role="user", content=[TextContent(text="Hello")])]
+
+
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_matches_completion(mock_acompletion):
+    mock_acompletion.return_value = create_mock_response("async hi")
+    llm = make_llm()
+
+    response = await llm.acompletion(messages=MESSAGES)
+
+    assert response.message.content[0].text == "async hi"  # type: ignore[union-attr]
+    assert response.metrics.accumulated_token_usage is not None
+    assert response.metrics.accumulated_token_usage.prompt_tokens == 10
+    assert len(llm.metrics.response_latencies) == 1
+    assert mock_acompletion.await_args.kwargs["model"] == "gpt-4o"
+
+
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_retries(mock_acompletion):
+    mock_acompletion.side_effect = [
+        APIConnectionError(
+            message="API connection error",
+            llm_provider="test_provider",
+            model="test_model",
+        ),
+        create_mock_response("Retry successful"),
+    ]
+    llm = make_llm()
+
+    response = await llm.acompletion(messages=MESSAGES)
+
+    assert response.message.content[0].text == "Retry successful"  # type: ignore[union-attr]
+    assert mock_acompletion.await_count == 2
+
+
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_prompt_mocked_tool_calls(mock_acompletion):
+    class AsyncTestAction(Action):
+        param: str
+
+    tools: list[ToolBase] = [
+        ToolDefinition(
+            name="test_tool", description="A tool", action_type=AsyncTestAction
+        )
+    ]
+    mock_acompletion.return_value = create_mock_response(
+        "Sure.\n<function=test_tool>\n<parameter=param>x</parameter>\n</function>"
+    )
+    llm = make_llm(native_tool_calling=False)
+
+    response = await llm.acompletion(messages=MESSAGES, tools=tools)
+
+    assert response.message.tool_calls is not None
+    assert response.message.tool_calls[0].name == "test_tool"
+    assert mock_acompletion.await_args.kwargs.get("tools") is None
+
+
+@patch("openhands.sdk.llm.llm.litellm_acompletion", new_callable=AsyncMock)
+async def test_acompletion_streaming(mock_acompletion):
+    async def stream() -> AsyncIterator[ModelResponseStream]:
+        for text in ["a", "b"]:
+            yield ModelResponseStream(
+                id="s",
+                model="gpt-4o",
+                choices=[StreamingChoices(index=0, delta=Delta(content=text))],
+            )
+
+    mock_acompletion.return_value = stream()
+    llm = make_llm()
+    deltas: list[LLMStreamChunk] = []
+
+    response = await llm.acompletion(messages=MESSAGES, on_token=deltas.append)
+
+    assert [d.content for d in deltas] == ["a", "b"]
+    assert response.message.content[0].text == "ab"  # type: ignore[union-attr]
+    assert len(llm.metrics.streaming_latencies) == 1
+
+
+@patch("openhands.sdk.llm.llm.litellm_acompletion")
+async def test_concurrent_calls_keep_their_own_modify_params(mock_acompletion):
+    both_started = asyncio.Barrier(2)
+    seen: dict[str, bool] = {}
+    global_value = litellm.modify_params
+
+    async def acompletion(**kwargs):
+        # Both calls are in flight at once
+        await both_started.wait()
+        seen[kwargs["model"]] = "user_continue_message" in kwargs
+        assert litellm.modify_params == global_value
+        return create_mock_response()
+
+    mock_acompletion.side_effect = acompletion
+    on = LLM(service_id="on", model="on", modify_params=True)
+    off = LLM(service_id="off", model="off", modify_params=False)
+
+    await asyncio.gather(
+        on.acompletion(messages=MESSAGES), off.acompletion(messages=MESSAGES)
+    )
+
+    assert seen == {"on": True, "off": False}
+    assert litellm.modify_params == global_value
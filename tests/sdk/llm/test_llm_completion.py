@@ -87,17 +87,6 @@ def test_llm_completion_basic(mock_completion):
     assert not llm.should_mock_tool_calls(cc_tools)
 
 
-def test_llm_streaming_not_supported(default_config):
-    """Test that streaming is not supported in the basic LLM class."""
-    llm = default_config
-
-    messages = [Message(role="user", content=[TextContent(text="Hello")])]
-
-    # Streaming should raise an error
-    with pytest.raises(ValueError, match="Streaming is not supported"):
-        llm.completion(messages=messages, stream=True)
-
-
 @patch("openhands.sdk.llm.llm.litellm_completion")
 def test_llm_completion_with_tools(mock_completion):
     """Test LLM completion with tools."""
@@ -0,0 +1,275 @@
+"""Tests for streamed LLM completions."""
+
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from litellm.exceptions import APIConnectionError
+from litellm.types.utils import (
+    ChatCompletionDeltaToolCall,
+    Choices,
+    Delta,
+    Function,
+    Message as LiteLLMMessage,
+    ModelResponse,
+    ModelResponseStream,
+    StreamingChoices,
+    Usage,
+)
+from pydantic import SecretStr
+
+from openhands.sdk.agent import Agent
+from openhands.sdk.conversation import Conversation
+from openhands.sdk.event import Event, MessageEvent, StreamingDeltaEvent
+from openhands.sdk.llm import LLM, LLMStreamChunk, Message, TextContent
+from openhands.sdk.llm.streaming import PromptMockStreamParser, StreamAccumulator
+from openhands.sdk.tool.schema import Action
+from openhands.sdk.tool.tool import ToolBase, ToolDefinition
+
+
+class StreamingTestAction(Action):
+    command: str
+
+
+TOOLS: list[ToolBase] = [
+    ToolDefinition(
+        name="run",
+        description="Run a command",
+        action_type=StreamingTestAction,
+    )
+]
+
+
+def chunk(
+    content: str | None = None,
+    tool_calls: list[ChatCompletionDeltaToolCall] | None = None,
+    finish_reason: str | None = None,
+    usage: Usage | None = None,
+) -> ModelResponseStream:
+    kwargs: dict[str, Any] = {"usage": usage} if usage else {}
+    return ModelResponseStream(
+        id="stream-1",
+        model="gpt-4o",
+        choices=[
+            StreamingChoices(
+                index=0,
+                finish_reason=finish_reason,
+                delta=Delta(content=content, tool_calls=tool_calls),
+            )
+        ],
+        **kwargs,
+    )
+
+
+def tool_call_delta(
+    arguments: str, call_id: str | None = None, name: str | None = None
+) -> ChatCompletionDeltaToolCall:
+    return ChatCompletionDeltaToolCall(
+        index=0,
+        id=call_id,
+        type="function" if call_id else None,
+        function=Function(name=name, arguments=arguments),
+    )
+
+
+def make_llm(**kwargs) -> LLM:
+    kwargs.setdefault("num_retries", 0)
+    return LLM(
+        model="gpt-4o",
+        api_key=SecretStr("test_key"),
+        service_id="test-llm",
+        **kwargs,
+    )
+
+
+MESSAGES = [Message(role="user", content=[TextContent(text="List files")])]
+USAGE = Usage(prompt_tokens=12, completion_tokens=7, total_tokens=19)
+
+
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_streaming_assembles_native_tool_calls(mock_completion):
+    mock_completion.return_value = iter(
+        [
+            chunk(content="Let me "),
+            chunk(content="look."),
+            chunk(tool_calls=[tool_call_delta('{"comm', call_id="call_1", name="run")]),
+            chunk(tool_calls=[tool_call_delta('and": "ls"}')]),
+            chunk(finish_reason="tool_calls"),
+            ModelResponseStream(id="stream-1", model="gpt-4o", choices=[], usage=USAGE),
+        ]
+    )
+    llm = make_llm()
+    deltas: list[LLMStreamChunk] = []
+
+    response = llm.completion(messages=MESSAGES, tools=TOOLS, on_token=deltas.append)
+
+    assert [d.content for d in deltas if d.content] == ["Let me ", "look."]
+    call_deltas = [tc for d in deltas for tc in d.tool_calls]
+    assert call_deltas[0].name == "run" and call_deltas[0].id == "call_1"
+    assert "".join(tc.arguments for tc in call_deltas) == '{"command": "ls"}'
+    assert all(d.response_id == "stream-1" for d in deltas)
+
+    assert mock_completion.call_args.kwargs["stream"] is True
+    assert response.id == "stream-1"
+    assert response.message.content[0].text == "Let me look."  # type: ignore[union-attr]
+    assert response.message.tool_calls is not None
+    assert response.message.tool_calls[0].name == "run"
+    assert response.message.tool_calls[0].arguments == '{"command": "ls"}'
+
+    # Usage from the final chunk is accounted exactly as without streaming
+    usage = response.metrics.accumulated_token_usage
+    assert usage is not None
+    assert (usage.prompt_tokens, usage.completion_tokens) == (12, 7)
+    assert len(llm.metrics.streaming_latencies) == 1
+    latency = llm.metrics.streaming_latencies[0]
+    assert latency.response_id == "stream-1"
+    assert latency.time_to_first_token >= 0
+    assert latency.inter_token_latency >= 0
+
+
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_stream_flag_streams_without_callback(mock_completion):
+    mock_completion.return_value = iter(
+        [chunk(content="hi"), chunk(finish_reason="stop", usage=USAGE)]
+    )
+    llm = make_llm(stream=True)
+
+    response = llm.completion(messages=MESSAGES)
+
+    assert response.message.content[0].text == "hi"  # type: ignore[union-attr]
+    assert len(llm.metrics.streaming_latencies) == 1
+
+
+def interrupted_stream():
+    yield chunk(content="Partial ")
+    raise APIConnectionError(
+        message="connection reset", llm_provider="openai", model="gpt-4o"
+    )
+
+
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_retry_marks_first_delta_of_new_attempt_as_reset(mock_completion):
+    mock_completion.side_effect = [
+        interrupted_stream(),
+        iter(
+            [
+                chunk(content="Full "),
+                chunk(content="answer"),
+                chunk(finish_reason="stop", usage=USAGE),
+            ]
+        ),
+    ]
+    llm = make_llm(num_retries=2, retry_min_wait=0, retry_max_wait=0)
+    deltas: list[LLMStreamChunk] = []
+
+    response = llm.completion(messages=MESSAGES, on_token=deltas.append)
+
+    text_deltas = [(d.content, d.reset) for d in deltas if d.content]
+    assert text_deltas == [("Partial ", False), ("Full ", True), ("answer", False)]
+    assert response.message.content[0].text == "Full answer"  # type: ignore[union-attr]
+
+
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_non_streaming_records_no_streaming_latency(mock_completion):
+    mock_completion.return_value = ModelResponse(
+        id="resp-1",
+        choices=[
+            Choices(
+                index=0,
+                finish_reason="stop",
+                message=LiteLLMMessage(role="assistant", content="hi"),
+            )
+        ],
+        model="gpt-4o",
+        usage=USAGE,
+    )
+    llm = make_llm()
+    llm.completion(messages=MESSAGES)
+    assert "stream" not in mock_completion.call_args.kwargs
+    assert llm.metrics.streaming_latencies == []
+
+
+def test_conversation_forwards_but_does_not_persist_deltas():
+    llm = make_llm(stream=True)
+    received: list[Event] = []
+    conversation = Conversation(
+        agent=Agent(llm=llm, tools=[]), callbacks=[received.append], visualize=False
+    )
+
+    with patch(
+        "openhands.sdk.llm.llm.litellm_completion",
+        return_value=iter(
+            [
+                chunk(content="Hello"),
+                chunk(content=" there"),
+                chunk(finish_reason="stop", usage=USAGE),
+            ]
+        ),
+    ):
+        conversation.send_message("hi")
+        conversation.run()
+
+    deltas = [e for e in received if isinstance(e, StreamingDeltaEvent)]
+    assert [d.delta.content for d in deltas] == ["Hello", " there"]
+    assert not any(
+        isinstance(e, StreamingDeltaEvent) for e in conversation.state.events
+    )
+    final = conversation.state.events[-1]
+    assert isinstance(final, MessageEvent)
+    assert final.llm_message.content[0].text == "Hello there"  # type: ignore[union-attr]
+
+
+@patch("openhands.sdk.llm.llm.litellm_completion")
+def test_streaming_with_prompt_mocked_tool_calls(mock_completion):
+    pieces = [
+        "I'll run it.\n<func",
+        "tion=run>\n<parameter=command>",
+        "ls -la</parameter>\n</fun",
+        "ction>",
+    ]
+    mock_completion.return_value = iter(
+        [chunk(content=p) for p in pieces] + [chunk(finish_reason="stop", usage=USAGE)]
+    )
+    llm = make_llm(native_tool_calling=False)
+    deltas: list[LLMStreamChunk] = []
+
+    response = llm.completion(messages=MESSAGES, tools=TOOLS, on_token=deltas.append)
+
+    streamed_text = "".join(d.content for d in deltas)
+    assert streamed_text == "I'll run it.\n"
+    call_deltas = [tc for d in deltas for tc in d.tool_calls]
+    assert call_deltas[0].name == "run"
+    assert "".join(tc.arguments for tc in call_deltas) == (
+        "\n<parameter=command>ls -la</parameter>\n"
+    )
+
+    assert response.message.tool_calls is not None
+    assert response.message.tool_calls[0].name == "run"
+    assert "ls -la" in response.message.tool_calls[0].arguments
+
+
+@pytest.mark.parametrize("split", range(1, 40))
+def test_prompt_mock_parser_is_independent_of_chunking(split: int):
+    text = "a<b <function=run>\n<parameter=x>1</parameter>\n</function> tail"
+    parser = PromptMockStreamParser()
+    content, calls = [], []
+    for i in range(0, len(text), split):
+        c, tc = parser.feed(text[i : i + split])
+        content.append(c)
+        calls.extend(tc)
+    c, tc = parser.flush()
+    content.append(c)
+    calls.extend(tc)
+
+    assert "".join(content) == "a<b  tail"
+    assert [tc.name for tc in calls if tc.name] == ["run"]
+    assert "".join(tc.arguments for tc in calls) == "\n<parameter=x>1</parameter>\n"
+
+
+def test_accumulator_exposes_partial_tool_calls():
+    accumulator = StreamAccumulator()
+    accumulator.add(chunk(tool_calls=[tool_call_delta('{"a"', "call_1", "run")]))
+    accumulator.add(chunk(tool_calls=[tool_call_delta(": 1")]))
+
+    (partial,) = accumulator.tool_calls
+    assert (partial.id, partial.name, partial.arguments) == ("call_1", "run", '{"a": 1')
@@ -0,0 +1,277 @@
+"""Tests for the persistent MCP session shared by MCP tool calls."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import mcp.types
+import pytest
+from fastmcp import FastMCP
+
+from openhands.sdk.mcp.client import MCPClient
+from openhands.sdk.mcp.definition import MCPToolAction, MCPToolObservation
+from openhands.sdk.mcp.tool import MCPToolDefinition, MCPToolExecutor
+from openhands.sdk.mcp.utils import _list_tools, _max_concurrent_requests
+
+
+def make_server() -> tuple[FastMCP, dict]:
+    server = FastMCP("test-server")
+    stats = {"in_flight": 0, "peak": 0}
+
+    @server.tool
+    def echo(text: str) -> str:
+        return text
+
+    @server.tool(annotations={"readOnlyHint": True})
+    def lookup(text: str) -> str:
+        return text
+
+    @server.tool
+    async def slow(seconds: float) -> str:
+        stats["in_flight"] += 1
+        stats["peak"] = max(stats["peak"], stats["in_flight"])
+        await asyncio.sleep(seconds)
+        stats["in_flight"] -= 1
+        return "done"
+
+    return server, stats
+
+
+@pytest.fixture
+def server():
+    return make_server()
+
+
+def load_tools(client: MCPClient) -> dict[str, MCPToolDefinition]:
+    tools = client.call_async_from_sync(_list_tools, timeout=30, client=client)
+    return {t.name: t for t in tools}
+
+
+def call(tool: MCPToolDefinition, **data) -> MCPToolObservation:
+    obs = tool(MCPToolAction(data=data))
+    assert isinstance(obs, MCPToolObservation)
+    return obs
+
+
+def executor_of(tool: MCPToolDefinition) -> MCPToolExecutor:
+    assert isinstance(tool.executor, MCPToolExecutor)
+    return tool.executor
+
+
+def count_connects(client: MCPClient):
+    calls = {"n": 0}
+    original = client._open_session
+
+    async def counting_connect():
+        calls["n"] += 1
+        return await original()
+
+    return calls, patch.object(client, "_open_session", counting_connect)
+
+
+def test_tool_calls_reuse_one_session(server):
+    client = MCPClient(server[0])
+    calls, patcher = count_connects(client)
+    try:
+        with patcher:
+            echo = load_tools(client)["echo"]
+            for i in range(5):
+                obs = call(echo, text=f"hi {i}")
+                assert not obs.is_error
+                assert f"hi {i}" in str(obs.content)
+                assert obs.latency is not None and obs.latency.calls == 1
+                assert obs.latency.call_seconds > 0
+        assert calls["n"] == 1
+        assert client.is_connected()
+        latency = executor_of(echo).latency
+        assert latency.calls == 5
+        assert latency.errors == 0
+        assert latency.call_seconds > 0
+        # The session was opened while listing tools, before the first call
+        assert latency.connect_seconds < latency.call_seconds
+    finally:
+        client.sync_close()
+
+
+def test_dropped_session_is_reopened(server):
+    client = MCPClient(server[0])
+    try:
+        echo = load_tools(client)["echo"]
+        client.call_async_from_sync(client._close_session, timeout=10)
+        assert not client.is_connected()
+
+        obs = call(echo, text="back")
+        assert not obs.is_error
+        assert client.reconnects == 1
+        assert executor_of(echo).latency.connect_seconds > 0
+    finally:
+        client.sync_close()
+
+
+@pytest.mark.parametrize("tool_name, retried", [("lookup", True), ("echo", False)])
+def test_only_safe_calls_are_retried_after_a_mid_call_disconnect(
+    server, tool_name, retried
+):
+    """The server may have run a call before the session dropped, so only
+    read-only or idempotent tools are called again."""
+    client = MCPClient(server[0])
+    original = client.call_tool_mcp
+    attempts = {"n": 0}
+
+    async def dropping_call(*args, **kwargs):
+        attempts["n"] += 1
+        if attempts["n"] == 1:
+            await client._close_session()
+            raise ConnectionError("session dropped")
+        return await original(*args, **kwargs)
+
+    try:
+        tool = load_tools(client)[tool_name]
+        with patch.object(client, "call_tool_mcp", dropping_call):
+            obs = call(tool, text="x")
+        assert obs.is_error is not retried
+        assert attempts["n"] == (2 if retried else 1)
+        assert obs.latency is not None and obs.latency.errors == (0 if retried else 1)
+    finally:
+        client.sync_close()
+
+
+def test_failed_health_check_triggers_reconnect(server):
+    client = MCPClient(server[0], health_check_interval=0.0)
+    try:
+        echo = load_tools(client)["echo"]
+        assert not call(echo, text="a").is_error
+        assert client.reconnects == 0
+
+        async def failing_ping() -> bool:
+            raise ConnectionError("gone")
+
+        with patch.object(client, "ping", failing_ping):
+            assert not call(echo, text="b").is_error
+        assert client.reconnects == 1
+    finally:
+        client.sync_close()
+
+
+def test_error_reply_to_health_check_keeps_session(server):
+    """A server that answers ping with an error (e.g. does not implement it)
+    is alive, so its session is kept."""
+    client = MCPClient(server[0], health_check_interval=0.0)
+    try:
+        echo = load_tools(client)["echo"]
+
+        async def unsupported_ping() -> bool:
+            error = RuntimeError("Method not found")
+            error.error = mcp.types.ErrorData(code=-32601, message="Method not found")  # type: ignore[attr-defined]
+            raise error
+
+        with patch.object(client, "ping", unsupported_ping):
+            assert not call(echo, text="a").is_error
+        assert client.reconnects == 0
+    finally:
+        client.sync_close()
+
+
+def test_connect_retries_with_backoff(server):
+    client = MCPClient(server[0], reconnect_backoff=0.01, max_reconnect_attempts=3)
+    original = client._open_session
+    attempts = {"n": 0}
+
+    async def flaky_connect():
+        attempts["n"] += 1
+        if attempts["n"] < 3:
+            raise RuntimeError("not yet")
+        return await original()
+
+    try:
+        with patch.object(client, "_open_session", flaky_connect):
+            echo = load_tools(client)["echo"]
+        assert attempts["n"] == 3
+        assert not call(echo, text="ok").is_error
+    finally:
+        client.sync_close()
+
+
+def test_connect_gives_up_after_max_attempts(server):
+    client = MCPClient(server[0], reconnect_backoff=0.0, max_reconnect_attempts=2)
+    attempts = {"n": 0}
+
+    async def broken_connect():
+        attempts["n"] += 1
+        raise RuntimeError("down")
+
+    try:
+        with patch.object(client, "_open_session", broken_connect):
+            with pytest.raises(RuntimeError, match="down"):
+                client.call_async_from_sync(client.ensure_session, timeout=10)
+        assert attempts["n"] == 2
+    finally:
+        client.sync_close()
+
+
+@pytest.mark.parametrize("limit", [1, 3])
+def test_concurrent_requests_bounded_by_limit(server, limit):
+    mcp_server, stats = server
+    client = MCPClient(mcp_server, max_concurrent_requests=limit)
+    try:
+        slow = load_tools(client)["slow"]
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(lambda _: call(slow, seconds=0.1), range(6)))
+        assert all(not r.is_error for r in results)
+        assert stats["peak"] == limit
+    finally:
+        client.sync_close()
+
+
+def test_max_concurrent_requests_read_from_server_config():
+    from fastmcp.mcp_config import MCPConfig
+
+    config = MCPConfig.model_validate(
+        {
+            "mcpServers": {
+                "a": {"command": "a", "max_concurrent_requests": 8},
+                "b": {"url": "http://b", "max_concurrent_requests": 4},
+            }
+        }
+    )
+    assert _max_concurrent_requests(config) == 4
+    assert _max_concurrent_requests(MCPConfig(mcpServers={})) == 1
+    single = MCPConfig.model_validate({"mcpServers": {"a": {"command": "a"}}})
+    assert _max_concurrent_requests(single) == 1
+
+
+def test_persistent_session_cuts_per_call_overhead():
+    """Benchmark: reusing the session is cheaper than reconnecting per call."""
+    mcp_server, _ = make_server()
+    n = 30
+
+    client = MCPClient(mcp_server)
+    try:
+        echo = load_tools(client)["echo"]
+        start = time.perf_counter()
+        for _ in range(n):
+            call(echo, text="x")
+        persistent = time.perf_counter() - start
+    finally:
+        client.sync_close()
+
+    per_call_client = MCPClient(mcp_server)
+    try:
+
+        async def connect_per_call():
+            async with per_call_client:
+                await per_call_client.call_tool_mcp(
+                    name="echo", arguments={"text": "x"}
+                )
+
+        start = time.perf_counter()
+        for _ in range(n):
+            per_call_client.call_async_from_sync(connect_per_call, timeout=30)
+        reconnecting = time.perf_counter() - start
+    finally:
+        per_call_client.sync_close()
+
+    assert persistent < reconnecting
+    assert threading.active_count() < 50
@@ -17,6 +17,9 @@ class MockMCPClient(MCPClient):
     def is_connected(self):
         return True
 
+    async def ensure_session(self) -> float:
+        return 0.0
+
     async def call_tool_mcp(  # type: ignore[override]
         self, name: str, arguments: dict
     ):
@@ -0,0 +1,200 @@
+"""Tests for the compiled tool schema cache."""
+
+import copy
+import gc
+import json
+import time
+from collections.abc import Sequence
+from unittest.mock import patch
+
+import mcp.types
+import pytest
+from pydantic import Field, SecretStr
+
+from openhands.sdk.llm import LLM
+from openhands.sdk.llm.message import ImageContent, TextContent
+from openhands.sdk.mcp.tool import MCPToolDefinition
+from openhands.sdk.tool import (
+    Action,
+    Observation,
+    ToolDefinition,
+    schema as schema_module,
+)
+from openhands.sdk.tool.schema import Schema, _process_schema_node
+
+
+class SchemaCacheNested(Action):
+    """Nested model to exercise $ref flattening."""
+
+    path: str = Field(description="A path")
+    recursive: bool | None = Field(default=None, description="Recurse")
+
+
+class SchemaCacheAction(Action):
+    """Action used by schema cache tests."""
+
+    command: str = Field(description="Command to run")
+    targets: list[SchemaCacheNested] = Field(default_factory=list)
+    timeout: float | None = Field(default=None, description="Timeout")
+
+
+class SchemaCacheObservation(Observation):
+    """Observation used by schema cache tests."""
+
+    output: str = ""
+
+    @property
+    def to_llm_content(self) -> Sequence[TextContent | ImageContent]:
+        return [TextContent(text=self.output)]
+
+
+def uncached_schema(cls: type[Action]) -> dict:
+    full = cls.model_json_schema()
+    return _process_schema_node(full, full.get("$defs", {}))
+
+
+def make_tool(name: str) -> ToolDefinition:
+    return ToolDefinition(
+        name=name,
+        description=f"Tool {name}",
+        action_type=SchemaCacheAction,
+        observation_type=SchemaCacheObservation,
+    )
+
+
+def test_cached_schema_matches_fresh_compilation():
+    assert SchemaCacheAction.to_mcp_schema() == uncached_schema(SchemaCacheAction)
+    # Served from the cache the second time
+    assert SchemaCacheAction.to_mcp_schema() == uncached_schema(SchemaCacheAction)
+
+
+def test_schema_compiled_once_per_class():
+    SchemaCacheAction.to_mcp_schema()
+    with patch.object(
+        SchemaCacheAction, "model_json_schema", side_effect=AssertionError
+    ):
+        for _ in range(3):
+            SchemaCacheAction.to_mcp_schema()
+
+
+def test_callers_get_independent_copies():
+    schema = SchemaCacheAction.to_mcp_schema()
+    schema["properties"]["command"]["description"] = "mutated"
+    schema["required"].append("bogus")
+
+    fresh = SchemaCacheAction.to_mcp_schema()
+    assert fresh["properties"]["command"]["description"] == "Command to run"
+    assert "bogus" not in fresh["required"]
+
+
+def test_defining_a_schema_subclass_invalidates_only_its_bases():
+    SchemaCacheNested.to_mcp_schema()
+    SchemaCacheAction.to_mcp_schema()
+
+    class SchemaCacheLateAction(SchemaCacheAction):
+        value: int = 0
+
+    assert SchemaCacheAction not in schema_module._compiled_mcp_schemas
+    assert SchemaCacheNested in schema_module._compiled_mcp_schemas
+    assert SchemaCacheLateAction.to_mcp_schema()["properties"]["value"]
+
+
+def test_cache_does_not_keep_classes_alive():
+    def make_class() -> int:
+        cls = Schema.from_mcp_schema(
+            "SchemaCacheTransientAction",
+            {"type": "object", "properties": {"x": {"type": "string"}}},
+        )
+        cls.to_mcp_schema()
+        assert cls in schema_module._compiled_mcp_schemas
+        return len(schema_module._compiled_mcp_schemas)
+
+    before = make_class()
+    gc.collect()
+    assert len(schema_module._compiled_mcp_schemas) == before - 1
+
+
+def test_frozen_schema_is_shared_and_read_only():
+    frozen = SchemaCacheAction.to_mcp_schema(frozen=True)
+    assert SchemaCacheAction.to_mcp_schema(frozen=True) is frozen
+    assert frozen == SchemaCacheAction.to_mcp_schema()
+
+    with pytest.raises(TypeError, match="read-only"):
+        frozen["properties"]["command"]["description"] = "mutated"
+    with pytest.raises(TypeError, match="read-only"):
+        frozen["required"].append("bogus")
+    with pytest.raises(TypeError, match="read-only"):
+        frozen.pop("required")
+
+    assert json.loads(json.dumps(frozen)) == frozen
+    thawed = copy.deepcopy(frozen)
+    thawed["required"].append("bogus")
+    assert type(thawed) is dict and type(thawed["required"]) is list
+
+
+def test_openai_tool_cached_per_security_risk_flag():
+    tool = make_tool("cached")
+    plain = tool.to_openai_tool()
+    risky = tool.to_openai_tool(add_security_risk_prediction=True)
+
+    plain_params = plain["function"]["parameters"]  # type: ignore[typeddict-item]
+    risky_params = risky["function"]["parameters"]  # type: ignore[typeddict-item]
+    assert "security_risk" not in plain_params["properties"]
+    assert "security_risk" in risky_params["properties"]
+    assert tool.to_openai_tool() == plain
+    assert tool.to_openai_tool(add_security_risk_prediction=True) == risky
+    # Served without decoding or copying
+    assert tool.to_openai_tool()["function"]["parameters"] is plain_params  # type: ignore[typeddict-item]
+
+
+@pytest.mark.parametrize(
+    "model, copied",
+    [("gpt-4o", False), ("gemini/gemini-2.5-pro", True), ("bedrock/claude", True)],
+)
+def test_llm_copies_tools_for_providers_that_edit_them(model, copied):
+    llm = LLM(model=model, api_key=SecretStr("key"), service_id="test")
+    tools = [make_tool("edited").to_openai_tool()]
+    out = llm._normalize_call_kwargs({"tools": tools}, has_tools=True)
+
+    params = out["tools"][0]["function"]["parameters"]
+    assert params == tools[0]["function"]["parameters"]  # type: ignore[typeddict-item]
+    assert (type(params) is dict) is copied
+
+
+def test_mcp_tool_schema_cached():
+    mcp_tool = mcp.types.Tool(
+        name="schema_cache_fetch",
+        description="Fetch a URL",
+        inputSchema={
+            "type": "object",
+            "properties": {"url": {"type": "string", "description": "URL"}},
+            "required": ["url"],
+        },
+    )
+    tool = MCPToolDefinition.create(mcp_tool=mcp_tool, mcp_client=None)[0]  # type: ignore[arg-type]
+    first = tool.to_openai_tool()
+    assert tool.to_openai_tool() == first
+    assert first["function"]["parameters"]["required"] == ["url"]  # type: ignore[typeddict-item]
+
+
+def test_tools_list_preparation_benchmark():
+    """Benchmark: preparing 100 tools is much cheaper once schemas are cached."""
+    tools = [make_tool(f"tool_{i}") for i in range(100)]
+
+    def prepare() -> float:
+        start = time.perf_counter()
+        for tool in tools:
+            tool.to_openai_tool(add_security_risk_prediction=True)
+        return time.perf_counter() - start
+
+    cold = []
+    for _ in range(3):
+        # The tools share an action type, so compile each one from scratch
+        start = time.perf_counter()
+        for tool in tools:
+            schema_module._compiled_mcp_schemas.clear()
+            tool.to_openai_tool(add_security_risk_prediction=True)
+        cold.append(time.perf_counter() - start)
+    warm = min(prepare() for _ in range(3))
+    # Generous bound for noisy CI; the measured speedup is ~50-100x
+    assert warm * 5 < min(cold)
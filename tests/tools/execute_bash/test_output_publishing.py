@@ -0,0 +1,131 @@
+"""Tests for publishing the output of execute_bash commands while they run."""
+
+import tempfile
+import time
+
+import pytest
+
+from openhands.sdk.tool import tool_output_callback
+from openhands.tools.execute_bash.definition import ExecuteBashAction
+from openhands.tools.execute_bash.impl import BashExecutor, _MaskedOutput
+from openhands.tools.execute_bash.terminal.output_stream import TerminalOutputStream
+from openhands.tools.execute_bash.terminal.terminal_session import (
+    _clean_output_chunk,
+    _OutputPublisher,
+)
+
+
+def test_publisher_bounds_rate_and_size():
+    stream = TerminalOutputStream()
+    chunks: list[tuple[str, int]] = []
+    publisher = _OutputPublisher(
+        lambda output, skipped: chunks.append((output, skipped)),
+        stream,
+        stream.cursor,
+        interval=0.05,
+        max_size=10,
+    )
+
+    stream.feed("abc")
+    publisher.publish()
+    assert chunks == []  # the first interval has not passed yet
+
+    time.sleep(0.06)
+    publisher.publish()
+    stream.feed("def")
+    publisher.publish()
+    assert chunks == [("abc", 0)]
+
+    time.sleep(0.06)
+    stream.feed("0123456789" * 3)
+    publisher.publish()
+    assert chunks[-1] == ("0123456789", 23)
+    assert publisher.wake_time() > time.time()
+
+
+def test_clean_output_chunk():
+    prompt = '\n###PS1JSON###\n{"exit_code": "0"}\n###PS1END###\n'
+    assert _clean_output_chunk("\x1b[1;31mred\x1b[0m text\x1b[?2004l") == "red text"
+    assert _clean_output_chunk(f"before{prompt}after") == "before\n\nafter"
+    assert _clean_output_chunk('done\n###PS1JSON###\n{"exit_') == "done\n"
+
+
+def mask(text: str) -> str:
+    return text.replace("hunter2", "<secret-hidden>")
+
+
+def test_secret_split_across_two_feeds_is_masked():
+    stream = TerminalOutputStream()
+    chunks: list[tuple[str, int]] = []
+    publisher = _OutputPublisher(
+        _MaskedOutput(
+            lambda output, skipped: chunks.append((output, skipped)),
+            mask,
+            secret_max_length=lambda: len("hunter2"),
+        ),
+        stream,
+        stream.cursor,
+        interval=0,
+    )
+
+    stream.feed("password: hun")
+    publisher.publish()
+    stream.feed("ter2 accepted\n")
+    publisher.publish()
+
+    published = "".join(output for output, _ in chunks)
+    assert "hun" not in published.replace("<secret-hidden>", "")
+    assert published == "password: <secret-hidden> acc"
+
+
+def test_secret_cut_by_skipped_output_is_not_published():
+    chunks: list[tuple[str, int]] = []
+    masked = _MaskedOutput(
+        lambda output, skipped: chunks.append((output, skipped)),
+        mask,
+        secret_max_length=lambda: len("hunter2"),
+    )
+
+    masked("start hunt", 0)
+    # The head of the next chunk ("er2") follows output that was skipped
+    masked("er2 and more output", 100)
+
+    published = "".join(output for output, _ in chunks)
+    assert "hunt" not in published
+    assert "er2" not in published
+    # Held back "t hunt" and the chunk's first six characters count as skipped
+    assert chunks == [("star", 0), ("d more ", 100 + 6 + 6)]
+
+
+COMMAND = "for i in 1 2 3 4 5; do echo step$i hunter2; sleep 0.5; done"
+
+
+@pytest.mark.parametrize("terminal_type", ["subprocess", "tmux"])
+def test_executor_publishes_masked_output_while_running(terminal_type):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        executor = BashExecutor(
+            working_dir=temp_dir,
+            terminal_type=terminal_type,
+            env_masker=mask,
+            secret_max_length=lambda: len("hunter2"),
+        )
+        chunks: list[tuple[float, str]] = []
+        start = time.monotonic()
+        try:
+            with tool_output_callback(
+                lambda output, _: chunks.append((time.monotonic() - start, output))
+            ):
+                obs = executor(ExecuteBashAction(command=COMMAND))
+        finally:
+            executor.close()
+
+    assert obs.metadata.exit_code == 0
+    assert "step5" in obs.output
+    # Output was published before the command finished, at most once a second
+    assert len(chunks) >= 2
+    assert chunks[0][0] < 2.0
+    assert all(b[0] - a[0] >= 0.9 for a, b in zip(chunks, chunks[1:]))
+    published = "".join(output for _, output in chunks)
+    assert "step1 <secret-hidden>" in published
+    assert "hunter2" not in published
+    assert "###PS1" not in published
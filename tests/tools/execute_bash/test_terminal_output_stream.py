@@ -0,0 +1,93 @@
+"""Tests for the incremental terminal output stream."""
+
+import json
+import random
+import threading
+import time
+
+import pytest
+
+from openhands.tools.execute_bash.constants import (
+    CMD_OUTPUT_PS1_BEGIN,
+    CMD_OUTPUT_PS1_END,
+)
+from openhands.tools.execute_bash.metadata import CmdOutputMetadata
+from openhands.tools.execute_bash.terminal.output_stream import TerminalOutputStream
+
+
+def prompt(exit_code: int = 0) -> str:
+    metadata = json.dumps({"exit_code": str(exit_code), "pid": "1"}, indent=2)
+    return f"{CMD_OUTPUT_PS1_BEGIN}{metadata}{CMD_OUTPUT_PS1_END}\n"
+
+
+OUTPUT = (
+    "starting\n"
+    + prompt()
+    + "echo ###PS1JSON### mid-line\n"
+    + "y\n" * 500
+    + prompt(1)
+    + "no newline after this prompt"
+    + prompt(2)
+    + "###PS1JSON###\n{not json\n###PS1END###\n"
+    + prompt(3)
+)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_prompts_found_across_chunk_boundaries(seed: int):
+    rng = random.Random(seed)
+    stream = TerminalOutputStream()
+    position = 0
+    while position < len(OUTPUT):
+        size = rng.randint(1, 64)
+        stream.feed(OUTPUT[position : position + size])
+        position += size
+
+    assert stream.prompt_count == len(CmdOutputMetadata.matches_ps1_metadata(OUTPUT))
+    assert stream.prompt_count == 4
+    assert stream.cursor == len(OUTPUT)
+    assert stream.ends_with_prompt
+
+
+def test_ends_with_prompt_tracks_latest_output():
+    stream = TerminalOutputStream()
+    stream.feed(prompt())
+    assert stream.ends_with_prompt
+    stream.feed("ls\n")
+    assert not stream.ends_with_prompt
+    assert stream.prompt_count == 1
+
+
+def test_wait_wakes_up_on_output():
+    stream = TerminalOutputStream()
+    threading.Timer(0.05, stream.feed, args=("hello",)).start()
+    start = time.monotonic()
+    assert stream.wait(0, timeout=5)
+    assert time.monotonic() - start < 1
+    assert not stream.wait(stream.cursor, timeout=0.01)
+
+
+def test_wait_until_prompt_and_close():
+    stream = TerminalOutputStream()
+    threading.Timer(0.05, stream.feed, args=("output\n" + prompt(),)).start()
+    assert stream.wait_until(lambda: stream.prompt_count > 0, timeout=5)
+
+    threading.Timer(0.05, stream.close).start()
+    assert stream.wait_until(lambda: False, timeout=5)
+    assert stream.closed
+
+
+def test_read_returns_latest_output_within_limit():
+    stream = TerminalOutputStream()
+    for i in range(20_000):
+        stream.feed(f"line {i}\n")
+
+    # Only the last `limit` characters, with the rest reported as skipped
+    text, skipped = stream.read(0, limit=100)
+    assert text.endswith("line 19999\n") and len(text) == 100
+    assert skipped + len(text) == stream.cursor
+
+    cursor = stream.cursor
+    stream.feed("new output")
+    assert stream.read(cursor) == ("new output", 0)
+    assert stream.read(stream.cursor) == ("", 0)
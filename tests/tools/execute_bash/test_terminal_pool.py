@@ -0,0 +1,122 @@
+"""Tests for handing out pre-warmed terminal sessions."""
+
+import os
+import time
+
+import pytest
+
+from openhands.tools.execute_bash.definition import ExecuteBashAction
+from openhands.tools.execute_bash.impl import BashExecutor
+from openhands.tools.execute_bash.terminal import (
+    TerminalPool,
+    configure_terminal_pool,
+    get_terminal_pool,
+)
+from openhands.tools.execute_bash.terminal.factory import _environment_changes
+
+
+@pytest.fixture
+def pool():
+    pool = TerminalPool(size=1)
+    yield pool
+    pool.close()
+
+
+def wait_for_idle(pool: TerminalPool, count: int = 1) -> None:
+    deadline = time.time() + 30
+    while pool.idle_count(terminal_type="subprocess") < count:
+        assert time.time() < deadline, "pool was not replenished"
+        time.sleep(0.05)
+
+
+def test_prewarmed_session_is_reset_to_work_dir_and_environment(
+    pool: TerminalPool, tmp_path, monkeypatch
+):
+    pool.prewarm(terminal_type="subprocess")
+    wait_for_idle(pool)
+    work_dir = tmp_path / "work dir"
+    work_dir.mkdir()
+    monkeypatch.setenv("POOL_TEST_VALUE", "it's here")
+
+    session = pool.acquire(str(work_dir), terminal_type="subprocess")
+    try:
+        assert (pool.hits, pool.misses) == (1, 0)
+        assert session.cwd == str(work_dir)
+        assert session.work_dir == str(work_dir)
+        observation = session.execute(
+            ExecuteBashAction(command="pwd && echo $POOL_TEST_VALUE")
+        )
+        assert str(work_dir) in observation.output
+        assert "it's here" in observation.output
+    finally:
+        session.close()
+
+    # Replenished in the background
+    wait_for_idle(pool)
+
+
+def test_empty_pool_starts_a_new_session(pool: TerminalPool, tmp_path):
+    session = pool.acquire(str(tmp_path), terminal_type="subprocess")
+    try:
+        assert (pool.hits, pool.misses) == (0, 1)
+        assert session.cwd == str(tmp_path)
+    finally:
+        session.close()
+
+
+def test_dead_session_is_not_handed_out(pool: TerminalPool, tmp_path):
+    pool.prewarm(terminal_type="subprocess")
+    wait_for_idle(pool)
+    warm = pool._idle[("subprocess", None)][0]
+    warm.session.terminal.close()
+    assert warm.session.terminal.output_stream is not None
+    deadline = time.time() + 5
+    while not warm.session.terminal.output_stream.closed:
+        assert time.time() < deadline
+        time.sleep(0.05)
+
+    session = pool.acquire(str(tmp_path), terminal_type="subprocess")
+    try:
+        assert (pool.hits, pool.misses) == (0, 1)
+        assert session is not warm.session
+    finally:
+        session.close()
+
+
+def test_acquire_times_out_waiting_for_a_starting_session(tmp_path):
+    pool = TerminalPool(size=1, acquire_timeout=0.1)
+    # A pooled shell that never finishes starting
+    pool._filling.add(("subprocess", None))
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError, match="pooled subprocess terminal"):
+        pool.acquire(str(tmp_path), terminal_type="subprocess")
+    assert time.monotonic() - start < 5
+    pool.close()
+
+
+def test_bash_executor_uses_configured_pool(tmp_path):
+    configure_terminal_pool(1)
+    try:
+        pool = get_terminal_pool()
+        assert pool is not None
+        executor = BashExecutor(str(tmp_path), terminal_type="subprocess")
+        try:
+            assert pool.misses == 1
+            assert "hello" in executor(ExecuteBashAction(command="echo hello")).output
+        finally:
+            executor.close()
+    finally:
+        configure_terminal_pool(0)
+    assert get_terminal_pool() is None
+
+
+def test_environment_changes():
+    before = {"KEPT": "1", "CHANGED": "old", "REMOVED": "x"}
+    after = {"KEPT": "1", "CHANGED": "new value", "ADDED": "'quoted'"}
+    assert _environment_changes(before, after) == [
+        "unset REMOVED",
+        "export CHANGED='new value'",
+        "export ADDED=''\"'\"'quoted'\"'\"''",
+    ]
+    assert _environment_changes(dict(os.environ), dict(os.environ)) == []
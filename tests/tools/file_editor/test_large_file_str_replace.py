@@ -0,0 +1,101 @@
+"""Tests for str_replace on large files, which are edited through mmap."""
+
+from pathlib import Path
+
+import pytest
+
+from openhands.tools.file_editor.editor import FileEditor
+from openhands.tools.file_editor.exceptions import ToolError
+
+
+CONTENT = "".join(f"line {i}: value = {i * 7}\n" for i in range(200)) + "last line"
+
+
+def make_editors() -> tuple[FileEditor, FileEditor]:
+    regular = FileEditor()
+    large = FileEditor()
+    large._large_file_size = 0  # every file takes the large file path
+    return regular, large
+
+
+@pytest.mark.parametrize(
+    "old_str, new_str",
+    [
+        ("line 3: value = 21\n", "line 3: changed\nand added\n"),
+        ("line 120: value = 840", "line 120: ünïcode"),
+        ("  line 199: value = 1393\nlast line  ", "the end"),  # stripped retry
+        ("line 0: value = 0\n", ""),
+        ("last line", "last line\nafter it\n"),
+    ],
+)
+def test_large_file_path_matches_regular_path(
+    tmp_path: Path, old_str: str, new_str: str
+):
+    regular, large = make_editors()
+    regular_file = tmp_path / "regular.txt"
+    large_file = tmp_path / "large.txt"
+    regular_file.write_text(CONTENT)
+    large_file.write_text(CONTENT)
+
+    expected = regular(
+        command="str_replace", path=str(regular_file), old_str=old_str, new_str=new_str
+    )
+    result = large(
+        command="str_replace", path=str(large_file), old_str=old_str, new_str=new_str
+    )
+
+    assert large_file.read_text() == regular_file.read_text()
+    assert result.output == expected.output.replace(str(regular_file), str(large_file))
+    # No full content in the observation, just a diff of the edited region
+    assert result.old_content is None and result.new_content is None
+    assert result.diff is not None
+    assert not list(tmp_path.glob(".*.tmp"))
+
+    large(command="undo_edit", path=str(large_file))
+    assert large_file.read_text() == CONTENT
+
+
+def test_large_file_errors(tmp_path: Path):
+    _, editor = make_editors()
+    path = tmp_path / "large.txt"
+    path.write_text(CONTENT)
+
+    with pytest.raises(ToolError, match="did not appear verbatim"):
+        editor(command="str_replace", path=str(path), old_str="missing", new_str="x")
+    with pytest.raises(ToolError, match=r"in lines \[3, 21, 22\]"):
+        editor(
+            command="str_replace", path=str(path), old_str=": value = 14", new_str=""
+        )
+    assert path.read_text() == CONTENT
+
+
+def test_large_file_diff_has_file_line_numbers(tmp_path: Path):
+    _, editor = make_editors()
+    path = tmp_path / "large.txt"
+    path.write_text(CONTENT)
+
+    result = editor(
+        command="str_replace",
+        path=str(path),
+        old_str="line 150: value = 1050",
+        new_str="line 150: edited",
+    )
+    assert result.diff is not None
+    assert "@@ -148,8 +148,8 @@" in result.diff
+    assert "-line 150: value = 1050\n+line 150: edited" in result.diff
+    assert "line 150: edited" in result.visualize.plain
+
+
+def test_files_with_carriage_returns_take_the_regular_path(tmp_path: Path):
+    _, editor = make_editors()
+    path = tmp_path / "large.txt"
+    path.write_bytes(CONTENT.replace("\n", "\r\n").encode())
+
+    result = editor(
+        command="str_replace",
+        path=str(path),
+        old_str="line 5: value = 35\nline 6",
+        new_str="line 5 and 6",
+    )
+    assert result.new_content is not None
+    assert "line 5 and 6: value = 42" in path.read_text()
@@ -1,5 +1,6 @@
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
@@ -208,3 +209,21 @@ def test_size_limit_with_empty_key():
 
 
 # Add more tests as needed
+
+
+def test_index_avoids_listing_directory(file_cache):
+    file_cache.set("key1", "value1")
+    file_cache.set("key2", "value2")
+    reopened = FileCache(str(file_cache.directory))
+    assert len(reopened) == 2
+    assert reopened.current_size == file_cache.current_size
+
+    file_cache.size_limit = file_cache.current_size + 10
+    with patch.object(
+        type(file_cache.directory), "glob", side_effect=AssertionError("listed")
+    ):
+        file_cache.get("key1")  # now key2 is the least recently used
+        file_cache.set("key3", "value3")
+        assert len(file_cache) == 2
+    assert "key2" not in file_cache
+    assert file_cache.get("key1") == "value1"
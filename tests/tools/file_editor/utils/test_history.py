@@ -142,3 +142,54 @@ def test_pop_last_history_removes_entry():
         # Try to pop last history when there are no entries
         last_entry = manager.pop_last_history(path)
         assert last_entry is None
+
+
+def edited_versions(count: int) -> list[str]:
+    """A large file and `count` successive small edits of it."""
+    lines = [f"line {i}: {'x' * 40}\n" for i in range(20_000)]
+    versions = ["".join(lines)]
+    for i in range(count):
+        lines[i * 97 % len(lines)] = f"edited {i}\n"
+        versions.append("".join(lines))
+    return versions
+
+
+def test_history_is_stored_as_diffs():
+    """Test that small edits to a large file only store small entries."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "large.txt"
+        manager = FileHistoryManager(
+            max_history_per_file=10, history_dir=Path(temp_dir) / "history"
+        )
+        versions = edited_versions(20)
+        for old, new in zip(versions, versions[1:]):
+            manager.add_history(path, old, new)
+
+        entries = [
+            manager.cache.get(manager._get_history_key(path, counter))
+            for counter in manager.get_metadata(path)["entries"]
+        ]
+        assert [entry["kind"] for entry in entries] == ["full"] + ["diff"] * 9
+        assert all(len(entry["data"]) < 200 for entry in entries[1:])
+        assert sum(len(entry["data"]) for entry in entries) < len(versions[0]) // 2
+
+        assert manager.get_all_history(path) == versions[10:20]
+        # Undo walks back through the versions, one diff at a time
+        for version in reversed(versions[10:20]):
+            assert manager.pop_last_history(path) == version
+        assert manager.pop_last_history(path) is None
+
+
+def test_history_survives_outside_modification():
+    """Test undo when a file was changed outside of the editor between edits."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "test.txt"
+        manager = FileHistoryManager(snapshot_interval=100)
+        manager.add_history(path, "a\nb\nc\n", "a\nB\nc\n")
+        manager.add_history(path, "a\nB\nc\n", "a\nB\nC\n")
+        # The file was rewritten before the next edit
+        manager.add_history(path, "x\nB\nC\n", "x\nB\nC\nd\n")
+
+        assert manager.pop_last_history(path) == "x\nB\nC\n"
+        assert manager.pop_last_history(path) == "a\nB\nc\n"
+        assert manager.pop_last_history(path) == "a\nb\nc\n"